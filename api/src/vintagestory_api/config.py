@@ -4,6 +4,7 @@ import logging
 import os
 import re
 from pathlib import Path
+from typing import Literal
 
 import structlog
 from pydantic import field_validator
@@ -25,6 +26,15 @@ class Settings(BaseSettings):
     console_history_lines: int = 100  # Default history lines sent on WebSocket connect
     disk_space_warning_threshold_gb: float = 1.0  # Warn when available space below this
     mod_cache_max_size_mb: int = 500  # Maximum size of mod cache in MB (0 to disable)
+    download_segments: int = 1  # Parallel range requests for server downloads (1 to disable)
+    mods_watch: Literal["auto", "polling", "off"] = "auto"  # Mods dir watcher (auto = inotify)
+    mod_state_backend: Literal["json", "sqlite"] = "json"  # Mod state store (sqlite = mods.db)
+    http_api_timeout: float = 30.0  # Outbound API call timeout in seconds
+    http_download_timeout: float = 120.0  # Outbound download read timeout (between chunks)
+    http_max_connections_per_host: int = 8  # Concurrent outbound connections per host
+    http2: bool = False  # Negotiate HTTP/2 for outbound requests (needs the h2 package)
+    http_rate_limit: float = 10.0  # Outbound requests per second per host (0 to disable)
+    http_rate_burst: int = 20  # Outbound requests per host allowed in a burst
 
     @field_validator("disk_space_warning_threshold_gb")
     @classmethod
@@ -47,6 +57,62 @@ class Settings(BaseSettings):
             )
         return v
 
+    @field_validator("download_segments")
+    @classmethod
+    def validate_download_segments(cls, v: int) -> int:
+        """Validate the number of parallel download segments.
+
+        Args:
+            v: Number of segments
+
+        Returns:
+            Validated number of segments
+
+        Raises:
+            ValueError: If not between 1 and 16
+        """
+        if not 1 <= v <= 16:
+            raise ValueError("VS_DOWNLOAD_SEGMENTS must be between 1 and 16.")
+        return v
+
+    @field_validator("http_rate_limit")
+    @classmethod
+    def validate_http_rate_limit(cls, v: float) -> float:
+        """Validate that the outbound rate limit is non-negative.
+
+        Args:
+            v: Requests per second per host
+
+        Returns:
+            Validated rate limit
+
+        Raises:
+            ValueError: If rate limit is negative
+        """
+        if v < 0:
+            raise ValueError(
+                "VS_HTTP_RATE_LIMIT must be non-negative. Use 0 to disable rate limiting."
+            )
+        return v
+
+    @field_validator("http_rate_burst")
+    @classmethod
+    def validate_http_rate_burst(cls, v: int) -> int:
+        """Validate that the outbound burst size is at least 1.
+
+        Args:
+            v: Burst size
+
+        Returns:
+            Validated burst size
+
+        Raises:
+            ValueError: If burst size is less than 1
+        """
+        if v < 1:
+            raise ValueError("VS_HTTP_RATE_BURST must be at least 1.")
+        return v
+
     @field_validator("mod_cache_max_size_mb")
     @classmethod
     def validate_mod_cache_max_size(cls, v: int) -> int:
@@ -6,20 +6,91 @@ This job periodically refreshes cached metadata for installed mods by querying
 the VintageStory mod database API. It handles API failures gracefully by
 preserving stale cache data rather than losing information.
 
+The job diffs installed mods against the mod catalog (one conditional
+request) and only fetches details for mods whose catalog lastreleased
+differs from the one recorded at the previous refresh, so its wall time and
+request count track what actually changed. Detail fetches run on a small
+bounded-concurrency pool, and their results (latest compatible release and
+whether it is an update) are recorded in the mod state.
+
 AC 1: Job executes at configured interval (registration in __init__.py)
 AC 2: API failures are logged but don't stop the job, stale cache preserved
 """
 
 from __future__ import annotations
 
+import asyncio
+import time
+from collections.abc import Iterable
+from typing import TYPE_CHECKING
+
 import structlog
 
 from vintagestory_api.jobs.base import safe_job
-from vintagestory_api.services.mod_api import ExternalApiError
+from vintagestory_api.services.mod_api import ExternalApiError, ModDict
 from vintagestory_api.services.mods import get_mod_service
 
+if TYPE_CHECKING:
+    from vintagestory_api.models.mods import ModInfo
+    from vintagestory_api.services.mod_api import ModApiClient
+
 logger = structlog.get_logger()
 
+# Concurrent mod detail requests during a refresh
+MAX_CONCURRENT_FETCHES = 8
+
+
+class _CatalogMatcher:
+    """Finds an installed mod's catalog entry by asset ID or mod ID string."""
+
+    def __init__(self, catalog: Iterable[ModDict]) -> None:
+        self._by_asset_id: dict[int, ModDict] = {}
+        self._by_slug: dict[str, ModDict] = {}
+        for entry in catalog:
+            asset_id = entry.get("assetid")
+            if isinstance(asset_id, int) and asset_id > 0:
+                self._by_asset_id[asset_id] = entry
+            for slug in [*(entry.get("modidstrs") or []), entry.get("urlalias")]:
+                if isinstance(slug, str) and slug:
+                    self._by_slug.setdefault(slug.lower(), entry)
+
+    def match(self, mod: ModInfo) -> ModDict | None:
+        """Get the catalog entry for an installed mod, if listed."""
+        if mod.asset_id > 0 and mod.asset_id in self._by_asset_id:
+            return self._by_asset_id[mod.asset_id]
+        return self._by_slug.get(mod.slug.lower())
+
+
+async def _fetch_catalog(api_client: ModApiClient) -> list[ModDict]:
+    """Fetch (revalidate) the mod catalog; empty if the API is unavailable.
+
+    Without a catalog every installed mod is treated as changed, which
+    degrades to one detail request per mod.
+    """
+    try:
+        catalog = await api_client.get_all_mods(force_refresh=True)
+    except ExternalApiError as e:
+        logger.warning("mod_cache_refresh_catalog_unavailable", error=str(e))
+        return []
+    return catalog if isinstance(catalog, list) else []
+
+
+async def _fetch_mod_details(
+    api_client: ModApiClient,
+    mod: ModInfo,
+    semaphore: asyncio.Semaphore,
+) -> tuple[ModDict | None, Exception | None]:
+    """Fetch details for one mod, bounded by the shared semaphore.
+
+    Returns:
+        (mod data or None if not found, error if the fetch failed).
+    """
+    async with semaphore:
+        try:
+            return await api_client.get_mod(mod.slug), None
+        except Exception as e:
+            return None, e
+
 
 @safe_job("mod_cache_refresh")
 async def refresh_mod_cache() -> None:
@@ -31,9 +102,14 @@ async def refresh_mod_cache() -> None:
 
     The job:
     1. Gets list of installed mods from ModService
-    2. For each mod, attempts to fetch updated data from the mod API
-    3. Logs a summary of successful and failed refreshes
-    4. Never raises exceptions - uses @safe_job decorator
+    2. Fetches the mod catalog once and matches installed mods by asset ID
+       or mod ID string
+    3. Fetches details (concurrently, bounded) only for mods whose catalog
+       lastreleased changed since the last refresh, or that are not listed
+    4. Records lastreleased and update availability in the mod state
+       (one write)
+    5. Logs a summary of unchanged, refreshed and failed mods
+    6. Never raises exceptions - uses @safe_job decorator
 
     Returns:
         None. Results are logged.
@@ -50,66 +126,83 @@ async def refresh_mod_cache() -> None:
         logger.debug("mod_cache_refresh_no_mods")
         return
 
-    # Track refresh statistics
-    refreshed_count = 0
-    failed_count = 0
-    failed_slugs: list[str] = []
+    started = time.perf_counter()
 
     # Get the API client for fetching mod data
     api_client = mod_service.api_client
+    matcher = _CatalogMatcher(await _fetch_catalog(api_client))
 
+    # Only mods whose catalog entry changed (or is missing) need details
+    changed_mods: list[ModInfo] = []
     for mod in installed_mods:
-        try:
-            # Attempt to refresh mod data from API
-            mod_data = await api_client.get_mod(mod.slug)
-
-            if mod_data is not None:
-                # Successfully fetched mod data
-                # Note: In this implementation, we just verify the API is reachable
-                # and the mod still exists. The cached metadata (modinfo.json) is
-                # already stored locally from install time. Future enhancement
-                # could store additional API data (e.g., latest version available).
-                refreshed_count += 1
-                logger.debug(
-                    "mod_cache_refresh_success",
-                    slug=mod.slug,
-                    version=mod.version,
-                )
-            else:
-                # Mod not found in API - might have been removed
-                failed_count += 1
-                failed_slugs.append(mod.slug)
-                logger.warning(
-                    "mod_cache_refresh_not_found",
-                    slug=mod.slug,
-                    version=mod.version,
-                )
-
-        except ExternalApiError as e:
+        listed = matcher.match(mod)
+        if (
+            listed is not None
+            and mod.last_released is not None
+            and listed.get("lastreleased") == mod.last_released
+        ):
+            continue
+        changed_mods.append(mod)
+
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_FETCHES)
+    results = await asyncio.gather(
+        *(_fetch_mod_details(api_client, mod, semaphore) for mod in changed_mods)
+    )
+
+    # Track refresh statistics
+    refreshed_count = 0
+    failed_slugs: list[str] = []
+    details: dict[str, ModDict] = {}
+
+    for mod, (mod_data, error) in zip(changed_mods, results, strict=True):
+        if isinstance(error, ExternalApiError):
             # API unreachable - preserve stale data (AC: 2)
-            failed_count += 1
             failed_slugs.append(mod.slug)
             logger.warning(
                 "mod_cache_refresh_api_error",
                 slug=mod.slug,
-                error=str(e),
+                error=str(error),
             )
-        except Exception as e:
+        elif error is not None:
             # Unexpected error for this mod - continue with others
-            failed_count += 1
             failed_slugs.append(mod.slug)
             logger.warning(
                 "mod_cache_refresh_unexpected_error",
                 slug=mod.slug,
-                error=str(e),
-                error_type=type(e).__name__,
+                error=str(error),
+                error_type=type(error).__name__,
             )
+        elif mod_data is None:
+            # Mod not found in API - might have been removed
+            failed_slugs.append(mod.slug)
+            logger.warning(
+                "mod_cache_refresh_not_found",
+                slug=mod.slug,
+                version=mod.version,
+            )
+        else:
+            refreshed_count += 1
+            if not mod_data.get("lastreleased"):
+                listed = matcher.match(mod) or {}
+                mod_data = {**mod_data, "lastreleased": listed.get("lastreleased")}
+            details[mod.slug] = mod_data
+            logger.debug(
+                "mod_cache_refresh_success",
+                slug=mod.slug,
+                version=mod.version,
+            )
+
+    if details:
+        await mod_service.record_remote_mods(details)
 
     # Log summary
     logger.info(
         "mod_cache_refresh_summary",
         total=len(installed_mods),
+        unchanged=len(installed_mods) - len(changed_mods),
         refreshed=refreshed_count,
-        failed=failed_count,
+        failed=len(failed_slugs),
         failed_slugs=failed_slugs if failed_slugs else None,
+        detail_requests=len(changed_mods),
+        duration_ms=round((time.perf_counter() - started) * 1000, 1),
     )
@@ -141,16 +141,46 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
 
     register_default_jobs(scheduler_service)
 
+    # Start event loop lag monitor / slow-callback detector
+    from vintagestory_api.services.loop_monitor import get_loop_monitor
+
+    loop_monitor = get_loop_monitor()
+    loop_monitor.start()
+
+    # Serve the persisted mod catalog immediately; revalidate it in the background
+    from vintagestory_api.services.mods import get_mod_service
+
+    try:
+        await get_mod_service().api_client.warm_catalog()
+    except Exception as e:
+        logger.warning("browse_catalog_warm_failed", error=str(e))
+
+    # Pick up mods added, replaced or removed while the API was down, then
+    # keep watching the Mods directory
+    from vintagestory_api.services.mod_watcher import ModDirectoryWatcher
+
+    try:
+        await get_mod_service().reconcile_mods(source="startup")
+    except Exception as e:
+        logger.warning("mod_reconcile_failed", error=str(e))
+    mod_watcher = ModDirectoryWatcher(get_mod_service(), mode=settings.mods_watch)
+    mod_watcher.start()
+
     yield
 
     # Shutdown scheduler first (before other cleanup)
     if scheduler_service:
         scheduler_service.shutdown(wait=True)
 
+    await mod_watcher.stop()
+    await loop_monitor.stop()
+
     # Shutdown: close any open resources
+    from vintagestory_api.services.http_client import close_outbound_http
     from vintagestory_api.services.mods import close_mod_service
 
     await close_mod_service()
+    await close_outbound_http()
     logger.info("api_shutting_down")
 
 
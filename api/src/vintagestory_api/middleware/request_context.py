@@ -4,6 +4,7 @@ This middleware:
 - Generates a unique UUID for each request
 - Binds the request_id to structlog context vars
 - Ensures all logs for a request include the same request_id
+- Records per-route latency, in-flight and response size metrics
 
 Security Note:
 - Never log sensitive data (API keys, passwords) in request context
@@ -15,13 +16,45 @@ Runtime Debug Toggle (FR48):
     to enable/disable debug logging at runtime without server restart.
 """
 
+import time
 import uuid
+from collections.abc import AsyncIterator
 
 from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
 from starlette.requests import Request
 from starlette.responses import Response
 from structlog.contextvars import bind_contextvars, clear_contextvars
 
+from vintagestory_api.services.request_metrics import (
+    UNMATCHED_ROUTE,
+    RequestMetrics,
+    get_request_metrics,
+)
+
+
+def _route_template(request: Request) -> str:
+    """Get the templated route path for a request.
+
+    The router stores the matched route in the ASGI scope, which is shared
+    with this middleware. Unmatched requests collapse into a single label
+    so arbitrary URLs can't grow the metrics key space.
+    """
+    route = request.scope.get("route")
+    path = getattr(route, "path", None)
+    return path if isinstance(path, str) else UNMATCHED_ROUTE
+
+
+async def _count_body_bytes(
+    body: AsyncIterator[bytes],
+    metrics: RequestMetrics,
+    method: str,
+    route: str,
+) -> AsyncIterator[bytes]:
+    """Pass through a streamed body while counting its size."""
+    async for chunk in body:
+        metrics.add_response_bytes(method, route, len(chunk))
+        yield chunk
+
 
 class RequestContextMiddleware(BaseHTTPMiddleware):
     """Middleware that adds request correlation ID to all logs.
@@ -30,6 +63,7 @@ class RequestContextMiddleware(BaseHTTPMiddleware):
     1. Clears any stale context vars from previous requests
     2. Generates a new UUID4 request_id
     3. Binds request_id to structlog context vars
+    4. Records latency and size metrics under the templated route path
 
     This ensures all logs within a request share the same request_id,
     making request tracing straightforward.
@@ -63,4 +97,40 @@ class RequestContextMiddleware(BaseHTTPMiddleware):
         # Also store on request.state for access in handlers if needed
         request.state.request_id = request_id
 
-        return await call_next(request)
+        metrics = get_request_metrics()
+        metrics.request_started()
+        start = time.perf_counter()
+        status_code = 500
+        response: Response | None = None
+        try:
+            response = await call_next(request)
+            status_code = response.status_code
+            return response
+        finally:
+            duration_ms = (time.perf_counter() - start) * 1000
+            metrics.request_finished()
+            method = request.method
+            route = _route_template(request)
+
+            response_bytes = 0
+            if response is not None:
+                content_length = response.headers.get("content-length")
+                if content_length is not None and content_length.isdigit():
+                    response_bytes = int(content_length)
+                elif hasattr(response, "body_iterator"):
+                    # Streaming body: count bytes as they are sent
+                    response.body_iterator = _count_body_bytes(  # type: ignore[attr-defined]
+                        response.body_iterator,  # type: ignore[attr-defined]
+                        metrics,
+                        method,
+                        route,
+                    )
+
+            metrics.record(
+                method=method,
+                route=route,
+                status_code=status_code,
+                duration_ms=duration_ms,
+                response_bytes=response_bytes,
+                request_id=request_id,
+            )
@@ -29,6 +29,7 @@ class ErrorCode:
     MOD_STATE_CORRUPT = "MOD_STATE_CORRUPT"
     MOD_FILE_CORRUPT = "MOD_FILE_CORRUPT"
     INVALID_SLUG = "INVALID_SLUG"
+    INVALID_MODPACK_MANIFEST = "INVALID_MODPACK_MANIFEST"
 
     # Config
     INVALID_CONFIG = "INVALID_CONFIG"
@@ -69,6 +70,11 @@ class ErrorCode:
     # Jobs (Epic 7)
     JOB_NOT_FOUND = "JOB_NOT_FOUND"
 
+    # Debug / diagnostics
+    PROFILER_BUSY = "PROFILER_BUSY"
+    HEAP_TRACING_NOT_STARTED = "HEAP_TRACING_NOT_STARTED"
+    HEAP_SNAPSHOT_NOT_FOUND = "HEAP_SNAPSHOT_NOT_FOUND"
+
     # General
     VALIDATION_ERROR = "VALIDATION_ERROR"
     INTERNAL_ERROR = "INTERNAL_ERROR"
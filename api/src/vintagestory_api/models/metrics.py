@@ -68,3 +68,88 @@ class MetricsHistoryResponse(BaseModel):
 
     metrics: list[MetricsSnapshotResponse]
     count: int
+
+
+class RouteLatencyResponse(BaseModel):
+    """Latency histogram and counters for one API route.
+
+    Bucket counts are non-cumulative and align with ``bucketBoundsMs``
+    in the enclosing response; the final count is the +Inf bucket.
+    """
+
+    method: str
+    route: str
+    count: int
+    error_count: int = Field(serialization_alias="errorCount")
+    mean_ms: float = Field(serialization_alias="meanMs")
+    max_ms: float = Field(serialization_alias="maxMs")
+    p50_ms: float | None = Field(serialization_alias="p50Ms")
+    p95_ms: float | None = Field(serialization_alias="p95Ms")
+    p99_ms: float | None = Field(serialization_alias="p99Ms")
+    buckets: list[int]
+    status_classes: dict[str, int] = Field(serialization_alias="statusClasses")
+    response_bytes: int = Field(serialization_alias="responseBytes")
+
+    model_config = {"populate_by_name": True}
+
+
+class SlowRequestResponse(BaseModel):
+    """A recent slow request with its correlation ID."""
+
+    request_id: str = Field(serialization_alias="requestId")
+    method: str
+    route: str
+    status_code: int = Field(serialization_alias="statusCode")
+    duration_ms: float = Field(serialization_alias="durationMs")
+    timestamp: datetime
+
+    model_config = {"populate_by_name": True}
+
+
+class HttpMetricsResponse(BaseModel):
+    """Per-route HTTP latency metrics for the API process."""
+
+    since: datetime
+    in_flight: int = Field(serialization_alias="inFlight")
+    peak_in_flight: int = Field(serialization_alias="peakInFlight")
+    bucket_bounds_ms: list[float] = Field(serialization_alias="bucketBoundsMs")
+    routes: list[RouteLatencyResponse]
+    slow_requests: list[SlowRequestResponse] = Field(serialization_alias="slowRequests")
+
+    model_config = {"populate_by_name": True}
+
+
+class UpstreamHostResponse(BaseModel):
+    """Latency histogram and counters for one outbound (upstream) host.
+
+    Latency is time to response headers. Bucket counts are non-cumulative
+    and align with ``bucketBoundsMs`` in the enclosing response.
+    """
+
+    host: str
+    requests: int
+    in_flight: int = Field(serialization_alias="inFlight")
+    error_count: int = Field(serialization_alias="errorCount")
+    errors: dict[str, int]
+    mean_ms: float = Field(serialization_alias="meanMs")
+    max_ms: float = Field(serialization_alias="maxMs")
+    p50_ms: float | None = Field(serialization_alias="p50Ms")
+    p95_ms: float | None = Field(serialization_alias="p95Ms")
+    p99_ms: float | None = Field(serialization_alias="p99Ms")
+    buckets: list[int]
+    status_classes: dict[str, int] = Field(serialization_alias="statusClasses")
+    bytes_sent: int = Field(serialization_alias="bytesSent")
+    bytes_received: int = Field(serialization_alias="bytesReceived")
+
+    model_config = {"populate_by_name": True}
+
+
+class UpstreamMetricsResponse(BaseModel):
+    """Per-host metrics for outbound HTTP requests."""
+
+    since: datetime
+    http2: bool
+    bucket_bounds_ms: list[float] = Field(serialization_alias="bucketBoundsMs")
+    hosts: list[UpstreamHostResponse]
+
+    model_config = {"populate_by_name": True}
@@ -6,12 +6,18 @@ These models support the mod service layer:
 - ModInfo: Combined local + remote mod information for API responses
 - CompatibilityInfo: Compatibility status with game version
 - ModLookupResponse: Response from mod lookup endpoint
+- UpdateAllResult / BulkInstallResult: Results of batch operations
+- ModpackManifest: Bulk install request and uploaded modpack format
+- ModIntegrity: Installed file integrity against the recorded SHA-256
+- ModReconcileResult: Changes found when reconciling state with the mods directory
+- ModChangeEvent: A reconciliation that changed the state, published to the UI
+- DependencyPlan: Dependency closure, missing and conflicting mods for an install
 """
 
 from datetime import datetime
 from typing import Literal
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field, field_validator
 
 
 class ModMetadata(BaseModel):
@@ -39,6 +45,21 @@ class ModMetadata(BaseModel):
     side: Literal["Both", "Client", "Server"] | None = None
     """Mod side: 'Both', 'Client', or 'Server'. None if not specified in modinfo.json."""
 
+    dependencies: dict[str, str] = {}
+    """Required mods: modid -> minimum version ("" or "*" for any version)."""
+
+    @field_validator("dependencies", mode="before")
+    @classmethod
+    def _normalize_dependencies(cls, value: object) -> dict[str, str]:
+        """Accept loosely written maps; non-string versions mean any version."""
+        if not isinstance(value, dict):
+            return {}
+        return {
+            str(modid): version if isinstance(version, str) else ""
+            for modid, version in value.items()  # type: ignore[union-attr]
+            if modid
+        }
+
 
 class ModState(BaseModel):
     """State index entry for an installed mod.
@@ -68,6 +89,32 @@ class ModState(BaseModel):
     Defaults to 0 for backwards compatibility with existing state files.
     """
 
+    last_released: str | None = None
+    """ModDB lastreleased timestamp as of the last refresh.
+
+    The mod_cache_refresh job only fetches mod details again when the
+    catalog shows a different value. None until the first refresh.
+    """
+
+    latest_version: str | None = None
+    """Newest release compatible with the game version, as of the last refresh."""
+
+    update_available: bool = False
+    """Whether latest_version is newer than the installed version."""
+
+    sha256: str | None = None
+    """SHA-256 of the installed file, for integrity checks.
+
+    None for mods found on disk rather than installed through the API.
+    """
+
+    fingerprint: tuple[int, int, int] | None = None
+    """(inode, size, mtime_ns) of the file when it was last reconciled.
+
+    Reconciliation skips files whose fingerprint is unchanged. None until
+    the first reconciliation after install.
+    """
+
 
 class ModInfo(BaseModel):
     """Combined local and remote mod information for API responses.
@@ -109,6 +156,15 @@ class ModInfo(BaseModel):
     side: Literal["Both", "Client", "Server"] | None = None
     """Mod side: 'Both', 'Client', or 'Server'. None if unknown."""
 
+    last_released: str | None = None
+    """ModDB lastreleased timestamp as of the last refresh, if known."""
+
+    latest_version: str | None = None
+    """Newest compatible release as of the last refresh, if known."""
+
+    update_available: bool = False
+    """Whether a newer compatible release is available."""
+
 
 class CompatibilityInfo(BaseModel):
     """Compatibility status information for a mod version.
@@ -271,6 +327,214 @@ class RemoveResult(BaseModel):
     """Whether a server restart is required for changes to take effect."""
 
 
+class ModUpdate(BaseModel):
+    """A mod updated by an update-all operation."""
+
+    slug: str
+    """The mod slug that was updated."""
+
+    from_version: str
+    """Version installed before the update."""
+
+    to_version: str
+    """Version installed by the update."""
+
+    filename: str
+    """Filename of the installed update."""
+
+
+class ModBatchFailure(BaseModel):
+    """A mod that failed in a batch operation (update-all, bulk install)."""
+
+    slug: str
+    """The mod slug that failed."""
+
+    error: str
+    """Why the operation failed for this mod."""
+
+
+class UpdateAllResult(BaseModel):
+    """Result of updating all mods with available updates."""
+
+    updated: list[ModUpdate] = []
+    """Mods that were updated."""
+
+    failed: list[ModBatchFailure] = []
+    """Mods that could not be updated (their installed version is kept)."""
+
+    pending_restart: bool = False
+    """Whether a server restart is required for changes to take effect."""
+
+
+class ModpackEntry(BaseModel):
+    """A mod to install as part of a bulk install or modpack."""
+
+    slug: str = Field(..., min_length=1, max_length=200)
+    """Mod slug or full mod URL."""
+
+    version: str | None = None
+    """Specific version to install, or None for the latest."""
+
+
+class ModpackManifest(BaseModel):
+    """Bulk install request, also the format of an uploaded modpack manifest.
+
+    Example:
+        {"name": "My pack", "mods": [{"slug": "smithingplus", "version": "1.8.3"}]}
+    """
+
+    name: str | None = None
+    """Optional modpack name (informational)."""
+
+    mods: list[ModpackEntry] = Field(..., min_length=1, max_length=500)
+    """Mods to install."""
+
+
+class InstalledMod(BaseModel):
+    """A mod installed by a bulk install."""
+
+    slug: str
+    """The installed mod slug (modid)."""
+
+    version: str
+    """The installed version."""
+
+    filename: str
+    """Filename of the installed mod."""
+
+    compatibility: Literal["compatible", "not_verified", "incompatible"]
+    """Compatibility status with the game version."""
+
+
+class BulkInstallResult(BaseModel):
+    """Result of a bulk (modpack) install."""
+
+    installed: list[InstalledMod] = []
+    """Mods that were installed."""
+
+    failed: list[ModBatchFailure] = []
+    """Mods that could not be installed."""
+
+    pending_restart: bool = False
+    """Whether a server restart is required for changes to take effect."""
+
+
+class ModIntegrity(BaseModel):
+    """Integrity check result for an installed mod file."""
+
+    slug: str
+    """The mod slug (modid)."""
+
+    filename: str
+    """Filename of the mod in the mods directory."""
+
+    status: Literal["ok", "modified", "missing", "unknown"]
+    """ok/modified: file matches/differs from the recorded SHA-256; missing:
+    file not found; unknown: no hash was recorded for this mod."""
+
+
+class ModReconcileResult(BaseModel):
+    """Changes found when reconciling mod state with the mods directory."""
+
+    added: list[str] = Field(default_factory=list)
+    """Filenames of mod files found on disk that were not in the state."""
+
+    changed: list[str] = Field(default_factory=list)
+    """Filenames whose file was replaced on disk and re-imported."""
+
+    removed: list[str] = Field(default_factory=list)
+    """Filenames in the state whose file no longer exists."""
+
+    unchanged: int = 0
+    """Number of files skipped because their fingerprint did not change."""
+
+    pending_restart: bool = False
+    """Whether a server restart is required to pick up the changes."""
+
+
+class ModChangeEvent(BaseModel):
+    """A change to the installed mods found on disk, for the UI's change feed."""
+
+    sequence: int
+    """Position in the change feed (increasing; the cursor for GET /mods/events)."""
+
+    timestamp: datetime
+    """When the change was recorded."""
+
+    source: Literal["startup", "watcher", "api"]
+    """What triggered the reconciliation."""
+
+    added: list[str] = Field(default_factory=list)
+    """Filenames added."""
+
+    changed: list[str] = Field(default_factory=list)
+    """Filenames replaced on disk."""
+
+    removed: list[str] = Field(default_factory=list)
+    """Filenames removed."""
+
+    pending_restart: bool = False
+    """Whether the change requires a server restart."""
+
+
+class PlannedMod(BaseModel):
+    """A mod in a dependency plan that will be installed."""
+
+    slug: str
+    """Mod slug (the modid for dependencies)."""
+
+    version: str
+    """Release version selected for install."""
+
+    required_by: list[str] = []
+    """Mods that depend on this one; empty for requested mods."""
+
+
+class MissingDependency(BaseModel):
+    """A dependency that could not be found or resolved."""
+
+    modid: str
+    """The required modid."""
+
+    required_by: str | None = None
+    """The mod that declares the dependency; None for a requested mod."""
+
+    error: str
+    """Why the dependency could not be resolved."""
+
+
+class DependencyConflict(BaseModel):
+    """A dependency whose available version is older than required."""
+
+    modid: str
+    """The required modid."""
+
+    required_version: str
+    """Minimum version declared by the dependent mod."""
+
+    available_version: str
+    """Version installed or planned for install."""
+
+    required_by: str
+    """The mod that declares the dependency."""
+
+
+class DependencyPlan(BaseModel):
+    """Dependency closure for a set of mods to install."""
+
+    install: list[PlannedMod] = []
+    """Requested mods and dependencies that are not installed yet."""
+
+    satisfied: list[str] = []
+    """Dependencies already installed at a suitable version."""
+
+    missing: list[MissingDependency] = []
+    """Dependencies that could not be resolved."""
+
+    conflicts: list[DependencyConflict] = []
+    """Dependencies that are installed or planned at too old a version."""
+
+
 class ModBrowseItem(BaseModel):
     """Single mod item in the browse list.
 
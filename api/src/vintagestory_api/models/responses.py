@@ -91,6 +91,23 @@ class DiskSpaceData(BaseModel):
     )
 
 
+class UpstreamHealthData(BaseModel):
+    """Circuit breaker state for an outbound upstream host."""
+
+    host: str = Field(description="Upstream host (e.g., 'mods.vintagestory.at')")
+    state: Literal["closed", "open", "half_open"] = Field(
+        description="closed = requests pass, open = failing fast, half_open = probing",
+    )
+    consecutive_failures: int = Field(
+        default=0,
+        description="Failed requests since the last success",
+    )
+    retry_after_seconds: float | None = Field(
+        default=None,
+        description="Seconds until an open breaker lets a probe through. None unless open.",
+    )
+
+
 class HealthData(BaseModel):
     """Health check response data."""
 
@@ -116,6 +133,10 @@ class HealthData(BaseModel):
         default=None,
         description="Data volume disk space information. None if unavailable.",
     )
+    upstreams: list[UpstreamHealthData] = Field(
+        default_factory=list,
+        description="Circuit breaker state of each upstream host contacted since startup.",
+    )
 
 
 class ReadinessData(BaseModel):
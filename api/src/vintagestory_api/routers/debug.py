@@ -1,19 +1,46 @@
 """Debug configuration endpoints (FR48).
 
 Provides endpoints to view and toggle debug logging at runtime
-without requiring server restart.
+without requiring server restart, plus runtime diagnostics for the
+API process (event loop lag and stalls, sampling CPU profiles, heap
+snapshots and cache sizes).
 
 Security Note:
 - All debug endpoints require admin authentication
 - Debug state changes are logged for audit purposes
 """
 
+import asyncio
+import threading
+from datetime import UTC, datetime
+from typing import Literal
+
 import structlog
-from fastapi import APIRouter
+from fastapi import APIRouter, HTTPException, Query
+from fastapi.responses import PlainTextResponse
 
 from vintagestory_api.config import is_debug_enabled, set_debug_enabled
 from vintagestory_api.middleware.permissions import RequireAdmin
+from vintagestory_api.models.errors import ErrorCode
 from vintagestory_api.models.responses import ApiResponse
+from vintagestory_api.services.heap import (
+    MAX_TRACE_FRAMES,
+    GroupBy,
+    HeapSnapshotNotFoundError,
+    HeapTracingNotStartedError,
+    InvalidSnapshotNameError,
+    SnapshotInfo,
+    get_cache_sizes,
+    get_heap_profiler,
+)
+from vintagestory_api.services.loop_monitor import get_loop_monitor
+from vintagestory_api.services.profiler import (
+    MAX_DURATION_SECONDS,
+    MAX_INTERVAL_MS,
+    MIN_INTERVAL_MS,
+    ProfilerBusyError,
+    get_profiler,
+)
 
 logger = structlog.get_logger()
 
@@ -75,3 +102,373 @@ async def disable_debug_logging(_: RequireAdmin) -> ApiResponse:
             "changed": changed,
         },
     )
+
+
+def _round_ms(value: float | None) -> float | None:
+    """Round a millisecond value for display, preserving None."""
+    return round(value, 3) if value is not None else None
+
+
+@router.get("/loop", response_model=ApiResponse)
+async def get_loop_status(
+    _: RequireAdmin,
+    stall_limit: int = Query(
+        20, ge=0, le=50, description="Number of recent stalls to include (0-50)"
+    ),
+) -> ApiResponse:
+    """Get event loop lag percentiles and recent stalls.
+
+    Lag is the scheduling delay of a periodic probe task. Stalls are
+    periods where the loop did not respond within the slow threshold;
+    each includes the loop thread's stack sampled while it was blocked.
+
+    Args:
+        stall_limit: Number of most recent stalls to include.
+
+    Returns:
+        ApiResponse with lag summary and stall records.
+    """
+    monitor = get_loop_monitor()
+    lag = monitor.get_lag_summary()
+    stalls = monitor.get_stalls()[:stall_limit]
+
+    return ApiResponse(
+        status="ok",
+        data={
+            "running": monitor.is_running,
+            "interval_ms": monitor.interval * 1000,
+            "slow_threshold_ms": monitor.slow_threshold * 1000,
+            "lag": {
+                "samples": lag.samples,
+                "mean_ms": _round_ms(lag.mean_ms),
+                "p50_ms": _round_ms(lag.p50_ms),
+                "p90_ms": _round_ms(lag.p90_ms),
+                "p99_ms": _round_ms(lag.p99_ms),
+                "max_ms": _round_ms(lag.max_ms),
+            },
+            "stall_count": monitor.stall_count,
+            "stalls": [
+                {
+                    "started_at": datetime.fromtimestamp(stall.started_at, UTC).isoformat(),
+                    "duration_ms": _round_ms(stall.duration_ms),
+                    "in_progress": stall.duration_ms is None,
+                    "stack": stall.stack,
+                }
+                for stall in stalls
+            ],
+        },
+    )
+
+
+@router.delete("/loop", response_model=ApiResponse)
+async def clear_loop_status(_: RequireAdmin) -> ApiResponse:
+    """Clear recorded lag samples and stalls.
+
+    Useful for measuring a specific operation from a clean baseline.
+
+    Returns:
+        ApiResponse confirming the clear.
+    """
+    get_loop_monitor().clear()
+    logger.info("loop_monitor_cleared")
+    return ApiResponse(status="ok", data={"cleared": True})
+
+
+@router.post("/profile", response_model=None)
+async def run_cpu_profile(
+    _: RequireAdmin,
+    seconds: float = Query(
+        5.0,
+        gt=0,
+        le=MAX_DURATION_SECONDS,
+        description=f"Sampling duration in seconds (max {MAX_DURATION_SECONDS:g})",
+    ),
+    interval_ms: float = Query(
+        10.0,
+        ge=MIN_INTERVAL_MS,
+        le=MAX_INTERVAL_MS,
+        description="Delay between sampling rounds in milliseconds",
+    ),
+    loop_only: bool = Query(False, description="Only sample the event loop thread"),
+    top: int = Query(25, ge=1, le=200, description="Number of top functions to include"),
+    output: Literal["json", "collapsed"] = Query(
+        "json",
+        alias="format",
+        description="'json' for summary + collapsed stacks, 'collapsed' for folded text only",
+    ),
+) -> ApiResponse | PlainTextResponse:
+    """Sample the API process's thread stacks and return a CPU profile.
+
+    The sampler runs in a worker thread for the requested duration while
+    the event loop keeps serving requests, so the loop thread and executor
+    threads all appear in the samples. Only one profile may run at a time.
+
+    Args:
+        seconds: Sampling duration.
+        interval_ms: Delay between sampling rounds.
+        loop_only: Restrict sampling to the event loop thread.
+        top: Number of top functions to include in the JSON response.
+        output: Response format.
+
+    Returns:
+        ApiResponse with collapsed stacks and a top-functions table, or the
+        collapsed stacks as plain text when format=collapsed.
+
+    Raises:
+        HTTPException: 409 if a profile is already running.
+    """
+    profiler = get_profiler()
+    if profiler.is_running:
+        raise HTTPException(
+            status_code=409,
+            detail={
+                "code": ErrorCode.PROFILER_BUSY,
+                "message": "A CPU profile is already running",
+            },
+        )
+
+    try:
+        result = await asyncio.to_thread(
+            profiler.profile,
+            seconds,
+            interval_ms,
+            threading.get_ident(),
+            loop_only,
+        )
+    except ProfilerBusyError as e:
+        raise HTTPException(
+            status_code=409,
+            detail={"code": ErrorCode.PROFILER_BUSY, "message": str(e)},
+        ) from None
+
+    if output == "collapsed":
+        return PlainTextResponse(result.collapsed() + "\n")
+
+    return ApiResponse(
+        status="ok",
+        data={
+            "duration_seconds": round(result.duration_seconds, 3),
+            "interval_ms": result.interval_ms,
+            "sample_rounds": result.sample_rounds,
+            "total_samples": result.total_samples,
+            "sampling_overhead_ms": round(result.sampling_overhead_ms, 3),
+            "threads": result.threads,
+            "top_functions": [
+                {
+                    "function": fn.function,
+                    "self_samples": fn.self_samples,
+                    "total_samples": fn.total_samples,
+                    "self_percent": round(100 * fn.self_samples / result.total_samples, 2)
+                    if result.total_samples
+                    else 0.0,
+                }
+                for fn in result.top_functions(top)
+            ],
+            "collapsed": result.collapsed(),
+        },
+    )
+
+
+def _snapshot_to_dict(info: SnapshotInfo) -> dict[str, object]:
+    """Serialize heap snapshot metadata for API responses."""
+    return {
+        "name": info.name,
+        "taken_at": datetime.fromtimestamp(info.taken_at, UTC).isoformat(),
+        "traced_bytes": info.traced_bytes,
+        "traced_blocks": info.traced_blocks,
+    }
+
+
+def _heap_status() -> dict[str, object]:
+    """Build the heap tracing status payload."""
+    profiler = get_heap_profiler()
+    current, peak = profiler.get_traced_memory()
+    return {
+        "tracing": profiler.is_tracing,
+        "traced_current_bytes": current,
+        "traced_peak_bytes": peak,
+        "tracemalloc_overhead_bytes": profiler.get_overhead_bytes(),
+        "snapshots": [_snapshot_to_dict(s) for s in profiler.list_snapshots()],
+    }
+
+
+@router.get("/heap", response_model=ApiResponse)
+async def get_heap_status(_: RequireAdmin) -> ApiResponse:
+    """Get heap tracing status and stored snapshots.
+
+    Returns:
+        ApiResponse with tracing state, traced memory and snapshot list.
+    """
+    return ApiResponse(status="ok", data=_heap_status())
+
+
+@router.post("/heap/start", response_model=ApiResponse)
+async def start_heap_tracing(
+    _: RequireAdmin,
+    frames: int = Query(
+        1,
+        ge=1,
+        le=MAX_TRACE_FRAMES,
+        description="Stack frames recorded per allocation (more frames cost more memory)",
+    ),
+) -> ApiResponse:
+    """Start tracemalloc allocation tracing.
+
+    Args:
+        frames: Number of frames stored per traced allocation.
+
+    Returns:
+        ApiResponse with tracing status and whether a change occurred.
+    """
+    changed = get_heap_profiler().start(frames)
+    return ApiResponse(status="ok", data={**_heap_status(), "changed": changed})
+
+
+@router.post("/heap/stop", response_model=ApiResponse)
+async def stop_heap_tracing(_: RequireAdmin) -> ApiResponse:
+    """Stop tracemalloc allocation tracing.
+
+    Stored snapshots are kept and can still be diffed against each other.
+
+    Returns:
+        ApiResponse with tracing status and whether a change occurred.
+    """
+    changed = get_heap_profiler().stop()
+    return ApiResponse(status="ok", data={**_heap_status(), "changed": changed})
+
+
+@router.post("/heap/snapshots/{name}", response_model=ApiResponse)
+async def take_heap_snapshot(name: str, _: RequireAdmin) -> ApiResponse:
+    """Take a named heap snapshot (replaces any snapshot with the same name).
+
+    Args:
+        name: Snapshot name (letters, digits, '_', '-', '.').
+
+    Returns:
+        ApiResponse with the snapshot metadata.
+
+    Raises:
+        HTTPException: 400 for invalid names, 409 if tracing is not started.
+    """
+    try:
+        info = await asyncio.to_thread(get_heap_profiler().take_snapshot, name)
+    except InvalidSnapshotNameError as e:
+        raise HTTPException(
+            status_code=400,
+            detail={"code": ErrorCode.VALIDATION_ERROR, "message": str(e)},
+        ) from None
+    except HeapTracingNotStartedError:
+        raise HTTPException(
+            status_code=409,
+            detail={
+                "code": ErrorCode.HEAP_TRACING_NOT_STARTED,
+                "message": "Start heap tracing before taking snapshots",
+            },
+        ) from None
+    return ApiResponse(status="ok", data=_snapshot_to_dict(info))
+
+
+@router.delete("/heap/snapshots/{name}", response_model=ApiResponse)
+async def delete_heap_snapshot(name: str, _: RequireAdmin) -> ApiResponse:
+    """Delete a stored heap snapshot.
+
+    Raises:
+        HTTPException: 404 if the snapshot does not exist.
+    """
+    try:
+        get_heap_profiler().delete_snapshot(name)
+    except HeapSnapshotNotFoundError as e:
+        raise HTTPException(
+            status_code=404,
+            detail={"code": ErrorCode.HEAP_SNAPSHOT_NOT_FOUND, "message": str(e)},
+        ) from None
+    return ApiResponse(status="ok", data={"name": name, "deleted": True})
+
+
+@router.get("/heap/diff", response_model=ApiResponse)
+async def diff_heap_snapshots(
+    _: RequireAdmin,
+    base: str = Query(..., description="Baseline snapshot name"),
+    target: str | None = Query(
+        None, description="Snapshot to compare (defaults to the live heap)"
+    ),
+    group_by: GroupBy = Query(
+        "lineno", description="'lineno' for file:line, 'filename' for per-file totals"
+    ),
+    limit: int = Query(25, ge=1, le=200, description="Number of entries to return"),
+) -> ApiResponse:
+    """Get the top allocation changes between two heap snapshots.
+
+    Args:
+        base: Baseline snapshot name.
+        target: Comparison snapshot name, or omitted for the live heap.
+        group_by: Grouping of allocation sites.
+        limit: Maximum number of entries.
+
+    Returns:
+        ApiResponse with allocation diffs ordered by absolute size change.
+
+    Raises:
+        HTTPException: 404 if a snapshot is missing, 409 if comparing against
+            the live heap while tracing is stopped.
+    """
+    try:
+        diffs = await asyncio.to_thread(
+            get_heap_profiler().diff, base, target, group_by, limit
+        )
+    except HeapSnapshotNotFoundError as e:
+        raise HTTPException(
+            status_code=404,
+            detail={"code": ErrorCode.HEAP_SNAPSHOT_NOT_FOUND, "message": str(e)},
+        ) from None
+    except HeapTracingNotStartedError:
+        raise HTTPException(
+            status_code=409,
+            detail={
+                "code": ErrorCode.HEAP_TRACING_NOT_STARTED,
+                "message": "Heap tracing must be running to diff against the live heap",
+            },
+        ) from None
+
+    return ApiResponse(
+        status="ok",
+        data={
+            "base": base,
+            "target": target,
+            "group_by": group_by,
+            "total_size_diff_bytes": sum(d.size_diff_bytes for d in diffs),
+            "entries": [
+                {
+                    "location": d.location,
+                    "size_bytes": d.size_bytes,
+                    "size_diff_bytes": d.size_diff_bytes,
+                    "count": d.count,
+                    "count_diff": d.count_diff,
+                }
+                for d in diffs
+            ],
+        },
+    )
+
+
+@router.get("/heap/caches", response_model=ApiResponse)
+async def get_cache_memory(_: RequireAdmin) -> ApiResponse:
+    """Get the deep size in bytes of the API's known in-memory caches.
+
+    Works without tracemalloc. Only caches whose owning service has been
+    created are reported. Measuring walks up to MAX_SIZEOF_OBJECTS objects,
+    so it runs in a worker thread to keep the event loop responsive.
+
+    Returns:
+        ApiResponse with per-cache entry counts and byte sizes.
+    """
+    sizes = await asyncio.to_thread(get_cache_sizes)
+    return ApiResponse(
+        status="ok",
+        data={
+            "total_bytes": sum(s.bytes for s in sizes),
+            "caches": [
+                {"name": s.name, "entries": s.entries, "bytes": s.bytes} for s in sizes
+            ],
+        },
+    )
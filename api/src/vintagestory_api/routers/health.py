@@ -13,8 +13,10 @@ from vintagestory_api.models.responses import (
     HealthData,
     ReadinessData,
     SchedulerHealthData,
+    UpstreamHealthData,
 )
 from vintagestory_api.models.server import ServerState
+from vintagestory_api.services.http_client import get_outbound_http
 from vintagestory_api.services.mods import get_restart_state
 from vintagestory_api.services.server import get_server_service
 
@@ -84,6 +86,31 @@ def get_scheduler():
     return get_scheduler_service()
 
 
+def get_upstream_health_data() -> list[UpstreamHealthData]:
+    """Get circuit breaker state for each upstream host contacted so far.
+
+    Returns:
+        List of UpstreamHealthData sorted by host, or empty list if unavailable.
+    """
+    try:
+        breakers = get_outbound_http().metrics.get_breakers()
+    except Exception as e:
+        logger.warning("upstream_health_check_failed", error=str(e))
+        return []
+    upstreams: list[UpstreamHealthData] = []
+    for host, breaker in breakers.items():
+        state = breaker.state
+        upstreams.append(
+            UpstreamHealthData(
+                host=host,
+                state=state,
+                consecutive_failures=breaker.consecutive_failures,
+                retry_after_seconds=round(breaker.retry_after, 1) if state == "open" else None,
+            )
+        )
+    return upstreams
+
+
 @router.get("/healthz", response_model=ApiResponse)
 async def health_check() -> ApiResponse:
     """Liveness probe - is the API process alive?
@@ -135,6 +162,9 @@ async def health_check() -> ApiResponse:
     # Get disk space data - don't fail health checks if this errors
     disk_space_data = get_disk_space_data()
 
+    # Get upstream circuit breaker states - don't fail health checks if this errors
+    upstreams = get_upstream_health_data()
+
     return ApiResponse(
         status="ok",
         data=HealthData(
@@ -145,6 +175,7 @@ async def health_check() -> ApiResponse:
             game_server_pending_restart=pending_restart,
             scheduler=scheduler_data,
             disk_space=disk_space_data,
+            upstreams=upstreams,
         ).model_dump(),
     )
 
@@ -2,7 +2,9 @@
 
 Story 12.3: Metrics API Endpoints
 
-Provides endpoints for retrieving current and historical server metrics.
+Provides endpoints for retrieving current and historical server metrics,
+per-route HTTP latency metrics for the API itself, and per-host metrics
+for outbound requests (mod database, version API, CDN).
 Metrics are Admin-only (AC: 4) as they contain operational data.
 """
 
@@ -13,12 +15,23 @@ from fastapi import APIRouter, Query
 
 from vintagestory_api.middleware.permissions import RequireAdmin
 from vintagestory_api.models.metrics import (
+    HttpMetricsResponse,
     MetricsHistoryResponse,
     MetricsSnapshot,
     MetricsSnapshotResponse,
+    RouteLatencyResponse,
+    SlowRequestResponse,
+    UpstreamHostResponse,
+    UpstreamMetricsResponse,
 )
 from vintagestory_api.models.responses import ApiResponse
+from vintagestory_api.services.http_client import UpstreamStats, get_outbound_http
 from vintagestory_api.services.metrics import get_metrics_service
+from vintagestory_api.services.request_metrics import (
+    LATENCY_BUCKETS_MS,
+    RouteStats,
+    get_request_metrics,
+)
 
 logger = structlog.get_logger()
 
@@ -127,3 +140,133 @@ async def get_metrics_history(
     response = MetricsHistoryResponse(metrics=metrics, count=len(metrics))
 
     return ApiResponse(status="ok", data=response.model_dump(mode="json", by_alias=True))
+
+
+def _route_stats_to_response(stats: RouteStats) -> RouteLatencyResponse:
+    """Convert internal RouteStats to the API response model."""
+    mean_ms = stats.total_ms / stats.count if stats.count else 0.0
+    return RouteLatencyResponse(
+        method=stats.method,
+        route=stats.route,
+        count=stats.count,
+        error_count=stats.status_classes[5],
+        mean_ms=round(mean_ms, 3),
+        max_ms=round(stats.max_ms, 3),
+        p50_ms=stats.percentile(0.50),
+        p95_ms=stats.percentile(0.95),
+        p99_ms=stats.percentile(0.99),
+        buckets=list(stats.buckets),
+        status_classes={
+            f"{cls}xx": stats.status_classes[cls]
+            for cls in range(1, 6)
+            if stats.status_classes[cls]
+        },
+        response_bytes=stats.response_bytes,
+    )
+
+
+@router.get(
+    "/http",
+    response_model=ApiResponse,
+    summary="Get HTTP request metrics",
+    description="Returns per-route latency histograms, in-flight gauges, "
+    "response size counters, and the slowest recent requests.",
+)
+async def get_http_metrics(
+    _role: RequireAdmin,
+    slow_limit: int = Query(
+        20,
+        ge=0,
+        le=100,
+        description="Number of slowest recent requests to include (0-100)",
+    ),
+) -> ApiResponse:
+    """Get per-route HTTP latency metrics for the API process.
+
+    Requires Admin role.
+
+    Args:
+        slow_limit: Number of slowest recent requests to include.
+
+    Returns:
+        ApiResponse with HttpMetricsResponse. Latency percentiles are
+        estimated from fixed log-spaced histogram buckets.
+    """
+    request_metrics = get_request_metrics()
+    routes = [_route_stats_to_response(s) for s in request_metrics.get_route_stats()]
+    slow_requests = [
+        SlowRequestResponse(
+            request_id=r.request_id,
+            method=r.method,
+            route=r.route,
+            status_code=r.status_code,
+            duration_ms=round(r.duration_ms, 3),
+            timestamp=datetime.fromtimestamp(r.timestamp, UTC),
+        )
+        for r in request_metrics.get_slow_requests(slow_limit)
+    ]
+
+    response = HttpMetricsResponse(
+        since=datetime.fromtimestamp(request_metrics.started_at, UTC),
+        in_flight=request_metrics.in_flight,
+        peak_in_flight=request_metrics.peak_in_flight,
+        bucket_bounds_ms=list(LATENCY_BUCKETS_MS),
+        routes=routes,
+        slow_requests=slow_requests,
+    )
+    logger.debug("metrics_http_returned", route_count=len(routes))
+
+    return ApiResponse(status="ok", data=response.model_dump(mode="json", by_alias=True))
+
+
+def _upstream_stats_to_response(stats: UpstreamStats) -> UpstreamHostResponse:
+    """Convert internal UpstreamStats to the API response model."""
+    mean_ms = stats.total_ms / stats.requests if stats.requests else 0.0
+    return UpstreamHostResponse(
+        host=stats.host,
+        requests=stats.requests,
+        in_flight=stats.in_flight,
+        error_count=stats.error_count,
+        errors=dict(stats.errors),
+        mean_ms=round(mean_ms, 3),
+        max_ms=round(stats.max_ms, 3),
+        p50_ms=stats.percentile(0.50),
+        p95_ms=stats.percentile(0.95),
+        p99_ms=stats.percentile(0.99),
+        buckets=list(stats.buckets),
+        status_classes={
+            f"{cls}xx": stats.status_classes[cls]
+            for cls in range(1, 6)
+            if stats.status_classes[cls]
+        },
+        bytes_sent=stats.bytes_sent,
+        bytes_received=stats.bytes_received,
+    )
+
+
+@router.get(
+    "/upstream",
+    response_model=ApiResponse,
+    summary="Get outbound HTTP metrics",
+    description="Returns per-host latency histograms, error and byte counters "
+    "for requests the API makes to upstream services.",
+)
+async def get_upstream_metrics(_role: RequireAdmin) -> ApiResponse:
+    """Get per-host metrics for outbound HTTP requests.
+
+    Requires Admin role.
+
+    Returns:
+        ApiResponse with UpstreamMetricsResponse.
+    """
+    outbound = get_outbound_http()
+    hosts = [_upstream_stats_to_response(s) for s in outbound.metrics.get_host_stats()]
+    response = UpstreamMetricsResponse(
+        since=datetime.fromtimestamp(outbound.metrics.started_at, UTC),
+        http2=outbound.http2,
+        bucket_bounds_ms=list(LATENCY_BUCKETS_MS),
+        hosts=hosts,
+    )
+    logger.debug("metrics_upstream_returned", host_count=len(hosts))
+
+    return ApiResponse(status="ok", data=response.model_dump(mode="json", by_alias=True))
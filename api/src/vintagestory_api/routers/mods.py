@@ -4,13 +4,18 @@ import math
 from typing import Annotated, Literal
 
 import structlog
-from fastapi import APIRouter, Depends, HTTPException, Path, Query
-from pydantic import BaseModel, Field
+from fastapi import APIRouter, Depends, HTTPException, Path, Query, UploadFile
+from pydantic import BaseModel, Field, ValidationError
 
 from vintagestory_api.middleware.auth import get_current_user
 from vintagestory_api.middleware.permissions import RequireAdmin
 from vintagestory_api.models.errors import ErrorCode
-from vintagestory_api.models.mods import ModBrowseItem, ModBrowseResponse, PaginationMeta
+from vintagestory_api.models.mods import (
+    ModBrowseItem,
+    ModBrowseResponse,
+    ModpackManifest,
+    PaginationMeta,
+)
 from vintagestory_api.models.responses import ApiResponse
 from vintagestory_api.services.mod_api import (
     DownloadError,
@@ -19,13 +24,12 @@ from vintagestory_api.services.mod_api import (
     ModDict,
     ModVersionNotFoundError,
     SortOption,
-    search_mods,
-    sort_mods,
     validate_slug,
 )
 from vintagestory_api.services.mod_api import (
     ModNotFoundError as ApiModNotFoundError,
 )
+from vintagestory_api.services.mod_index import BrowseQuery
 from vintagestory_api.services.mods import (
     InvalidSlugError,
     ModAlreadyInstalledError,
@@ -36,6 +40,9 @@ from vintagestory_api.services.mods import (
 
 logger = structlog.get_logger()
 
+# Longest wait allowed for GET /mods/events
+MAX_EVENTS_WAIT_SECONDS = 60
+
 router = APIRouter(prefix="/mods", tags=["Mods"])
 
 
@@ -129,6 +136,39 @@ def _api_mod_to_browse_item(mod: ModDict) -> ModBrowseItem:
     )
 
 
+@router.get("/events", response_model=ApiResponse, summary="Wait for mod changes")
+async def mod_events(
+    _: RequireAuth,
+    service: ModService = Depends(get_mod_service),
+    since: Annotated[
+        int, Query(ge=0, description="Sequence number of the last event seen")
+    ] = 0,
+    timeout: Annotated[
+        float,
+        Query(ge=0, le=MAX_EVENTS_WAIT_SECONDS, description="Seconds to wait for new events"),
+    ] = 0,
+) -> ApiResponse:
+    """Get mod changes found on disk (long-poll).
+
+    Returns changes picked up by the Mods directory watcher, startup and
+    manual reconciliation after the given cursor. With a timeout, waits
+    for the next change if there is none yet, so the UI can refresh the
+    mod list as soon as files change.
+
+    Returns:
+        ApiResponse with:
+        - events: ModChangeEvent list (sequence, source, added, changed,
+          removed, pending_restart)
+        - cursor: Sequence number to pass as `since` next time
+    """
+    feed = service.change_feed
+    events = await feed.wait(since, timeout)
+    return ApiResponse(
+        status="ok",
+        data={"events": [e.model_dump(mode="json") for e in events], "cursor": feed.cursor},
+    )
+
+
 @router.get("/browse", response_model=ApiResponse, summary="Browse available mods")
 async def browse_mods(
     _: RequireAuth,
@@ -220,8 +260,12 @@ async def browse_mods(
         tags=tags,
     )
 
+    tag_list = [t.strip().lower() for t in tags.split(",") if t.strip()] if tags else []
+
     try:
-        # Get mods - either filtered by version or all
+        # Results are presorted ID lists resolved through the index one page
+        # at a time (version-filtered lists get their own index)
+        version_tagid: int | None = None
         if version:
             # Look up the version tagid
             game_versions = await service.api_client.get_game_versions()
@@ -229,44 +273,15 @@ async def browse_mods(
             if version_tagid is None:
                 raise GameVersionNotFoundError(version)
 
-            # Fetch mods filtered by version (server-side filtering)
-            all_mods = await service.api_client.get_mods_by_version(version_tagid)
-        else:
-            # Get all mods from API (cached)
-            all_mods = await service.api_client.get_all_mods()
-
-        # Filter by search term if provided
-        filtered_mods = search_mods(all_mods, search or "")
-
-        # Filter by side if provided
-        if side:
-            filtered_mods = [
-                m for m in filtered_mods if str(m.get("side", "both")).lower() == side
-            ]
-
-        # Filter by mod_type if provided
-        if mod_type:
-            filtered_mods = [
-                m for m in filtered_mods if str(m.get("type", "mod")).lower() == mod_type
-            ]
-
-        # Filter by tags if provided (OR logic - mod must have at least one matching tag)
-        if tags:
-            tag_list = [t.strip().lower() for t in tags.split(",") if t.strip()]
-            if tag_list:
-                filtered_mods = [
-                    m
-                    for m in filtered_mods
-                    if any(
-                        t.lower() in tag_list for t in m.get("tags", [])
-                    )
-                ]
-
-        # Sort mods
-        sorted_mods = sort_mods(filtered_mods, sort_by=sort)
+        query = BrowseQuery.create(
+            search=search, side=side, mod_type=mod_type, tags=tag_list, sort=sort
+        )
+        index, mod_ids = await service.api_client.query_catalog(
+            query, version_tagid=version_tagid
+        )
+        total_items = len(mod_ids)
 
         # Calculate pagination
-        total_items = len(sorted_mods)
         total_pages = max(1, math.ceil(total_items / page_size))
 
         # Clamp page to valid range
@@ -277,7 +292,7 @@ async def browse_mods(
         end_idx = start_idx + page_size
 
         # Get page slice and convert to models
-        page_mods = sorted_mods[start_idx:end_idx]
+        page_mods = index.get_mods(mod_ids[start_idx:end_idx])
         browse_items = [_api_mod_to_browse_item(mod) for mod in page_mods]
 
         # Build pagination metadata
@@ -643,6 +658,199 @@ async def install_mod(
         )
 
 
+# Upper bound on uploaded modpack manifest size
+MAX_MANIFEST_BYTES = 1024 * 1024
+
+
+@router.post("/bulk", response_model=ApiResponse)
+async def install_mods(
+    manifest: ModpackManifest,
+    _: RequireAdmin,
+    service: ModService = Depends(get_mod_service),
+    include_dependencies: Annotated[
+        bool,
+        Query(description="Also install missing dependencies declared in modinfo.json"),
+    ] = False,
+) -> ApiResponse:
+    """Install several mods at once (e.g., a modpack).
+
+    Releases are resolved and downloaded concurrently and all mods are
+    committed together with a single state write. Failures are reported per
+    item and do not abort the batch.
+
+    Args:
+        manifest: Mods to install (slug or URL, optional version).
+        include_dependencies: Resolve the dependency closure first and
+            install missing dependencies too; missing or too old
+            dependencies are reported in failed.
+
+    Returns:
+        ApiResponse with BulkInstallResult containing:
+        - installed: Installed mods (slug, version, filename, compatibility)
+        - failed: Mods that could not be installed (slug, error)
+        - pending_restart: Whether server restart is required
+
+    Raises:
+        HTTPException: 403 if user is not Admin
+        HTTPException: 422 if the request body is invalid
+    """
+    logger.debug("router_install_mods_start", count=len(manifest.mods), name=manifest.name)
+    result = await service.install_mods(manifest.mods, include_dependencies)
+    logger.debug(
+        "router_install_mods_complete",
+        installed=len(result.installed),
+        failed=len(result.failed),
+    )
+    return ApiResponse(status="ok", data=result.model_dump(mode="json"))
+
+
+@router.post("/bulk/manifest", response_model=ApiResponse)
+async def install_modpack_manifest(
+    file: UploadFile,
+    _: RequireAdmin,
+    service: ModService = Depends(get_mod_service),
+    include_dependencies: Annotated[
+        bool,
+        Query(description="Also install missing dependencies declared in modinfo.json"),
+    ] = False,
+) -> ApiResponse:
+    """Install the mods listed in an uploaded modpack manifest.
+
+    The manifest is a JSON file in the same format as the POST /mods/bulk
+    body: {"name": "...", "mods": [{"slug": "...", "version": "..."}]}.
+
+    Returns:
+        ApiResponse with BulkInstallResult (see POST /mods/bulk).
+
+    Raises:
+        HTTPException: 400 if the manifest is too large or not a valid manifest
+        HTTPException: 403 if user is not Admin
+    """
+    content = await file.read(MAX_MANIFEST_BYTES + 1)
+    if len(content) > MAX_MANIFEST_BYTES:
+        raise HTTPException(
+            status_code=400,
+            detail={
+                "code": ErrorCode.INVALID_MODPACK_MANIFEST,
+                "message": f"Manifest exceeds {MAX_MANIFEST_BYTES} bytes",
+            },
+        )
+    try:
+        manifest = ModpackManifest.model_validate_json(content)
+    except ValidationError as e:
+        raise HTTPException(
+            status_code=400,
+            detail={
+                "code": ErrorCode.INVALID_MODPACK_MANIFEST,
+                "message": f"Invalid modpack manifest: {e.error_count()} error(s)",
+            },
+        )
+    return await install_mods(manifest, _, service, include_dependencies)
+
+
+@router.post("/dependencies", response_model=ApiResponse)
+async def resolve_mod_dependencies(
+    manifest: ModpackManifest,
+    _: RequireAdmin,
+    service: ModService = Depends(get_mod_service),
+) -> ApiResponse:
+    """Preview the dependencies of mods before installing them.
+
+    Builds the dependency closure from the dependencies declared in each
+    mod's modinfo.json (cached for installed mods, downloaded to the cache
+    otherwise). Nothing is installed.
+
+    Args:
+        manifest: Mods to install (slug or URL, optional version).
+
+    Returns:
+        ApiResponse with DependencyPlan containing:
+        - install: Mods that would be installed (slug, version, required_by)
+        - satisfied: Dependencies already installed
+        - missing: Dependencies that cannot be resolved (modid, required_by, error)
+        - conflicts: Dependencies installed or available at too old a version
+
+    Raises:
+        HTTPException: 403 if user is not Admin
+        HTTPException: 422 if the request body is invalid
+    """
+    logger.debug("router_resolve_dependencies_start", count=len(manifest.mods))
+    plan = await service.resolve_dependencies(manifest.mods)
+    return ApiResponse(status="ok", data=plan.model_dump(mode="json"))
+
+
+@router.post("/verify", response_model=ApiResponse)
+async def verify_mods(
+    _: RequireAdmin,
+    service: ModService = Depends(get_mod_service),
+) -> ApiResponse:
+    """Check installed mod files against the SHA-256 recorded at install.
+
+    Returns:
+        ApiResponse with mods: list of ModIntegrity (slug, filename, status),
+        where status is ok, modified, missing or unknown (no hash recorded).
+
+    Raises:
+        HTTPException: 403 if user is not Admin
+    """
+    results = await service.verify_mods()
+    return ApiResponse(status="ok", data={"mods": [r.model_dump(mode="json") for r in results]})
+
+
+@router.post("/reconcile", response_model=ApiResponse)
+async def reconcile_mods(
+    _: RequireAdmin,
+    service: ModService = Depends(get_mod_service),
+) -> ApiResponse:
+    """Reconcile mod state with the files in the mods directory.
+
+    Picks up mods added, replaced or deleted outside the API. Unchanged
+    files are skipped without being opened. Also runs at startup.
+
+    Returns:
+        ApiResponse with ModReconcileResult containing:
+        - added / changed / removed: Affected filenames
+        - unchanged: Number of files skipped
+        - pending_restart: Whether server restart is required
+
+    Raises:
+        HTTPException: 403 if user is not Admin
+    """
+    result = await service.reconcile_mods()
+    return ApiResponse(status="ok", data=result.model_dump(mode="json"))
+
+
+@router.post("/update-all", response_model=ApiResponse)
+async def update_all_mods(
+    _: RequireAdmin,
+    service: ModService = Depends(get_mod_service),
+) -> ApiResponse:
+    """Update every installed mod that has an update available.
+
+    Updates are those recorded by the mod cache refresh (see update_available
+    on GET /mods). All updates are downloaded concurrently, then swapped into
+    the mods directory together with a single state save. Mods that fail to
+    download or import keep their installed version and are reported.
+
+    Returns:
+        ApiResponse with UpdateAllResult containing:
+        - updated: Mods updated (slug, from_version, to_version, filename)
+        - failed: Mods that could not be updated (slug, error)
+        - pending_restart: Whether server restart is required
+
+    Raises:
+        HTTPException: 403 if user is not Admin
+    """
+    logger.debug("router_update_all_mods_start")
+    result = await service.update_all_mods()
+    logger.debug(
+        "router_update_all_mods_complete",
+        updated=len(result.updated),
+        failed=len(result.failed),
+    )
+    return ApiResponse(status="ok", data=result.model_dump(mode="json"))
+
+
 @router.post("/{slug}/enable", response_model=ApiResponse)
 async def enable_mod(
     slug: Annotated[
@@ -689,7 +897,7 @@ async def enable_mod(
 
     logger.debug("router_enable_mod_start", slug=slug)
     try:
-        result = service.enable_mod(slug)
+        result = await service.enable_mod(slug)
         logger.debug(
             "router_enable_mod_complete", slug=slug, pending_restart=result.pending_restart
         )
@@ -755,7 +963,7 @@ async def disable_mod(
 
     logger.debug("router_disable_mod_start", slug=slug)
     try:
-        result = service.disable_mod(slug)
+        result = await service.disable_mod(slug)
         logger.debug(
             "router_disable_mod_complete", slug=slug, pending_restart=result.pending_restart
         )
@@ -817,7 +1025,7 @@ async def remove_mod(
 
     logger.debug("router_remove_mod_start", slug=slug)
     try:
-        result = service.remove_mod(slug)
+        result = await service.remove_mod(slug)
         logger.debug(
             "router_remove_mod_complete", slug=slug, pending_restart=result.pending_restart
         )
@@ -2,8 +2,19 @@
 
 This module provides LRU-based cache eviction for the mod download cache,
 ensuring disk space is managed without manual intervention.
+
+The cache is tracked by an in-memory index of file sizes in access order,
+so recording a download or a cache hit and evicting are O(1) per file and
+never scan the cache directory. Access order is explicit rather than taken
+from atime (which is not updated on noatime mounts). The index is persisted
+to a small sidecar (``<cache>/mods-cache-index.json``) and loaded lazily on
+first use; it is rebuilt from one directory scan, ordered by mtime, only if
+the sidecar is missing or the directory was changed behind its back.
 """
 
+import json
+import threading
+from collections import OrderedDict
 from dataclasses import dataclass
 from pathlib import Path
 
@@ -11,6 +22,9 @@ import structlog
 
 logger = structlog.get_logger()
 
+# Bump when the sidecar format changes
+INDEX_VERSION = 1
+
 
 @dataclass
 class CacheFileInfo:
@@ -23,7 +37,7 @@ class CacheFileInfo:
     """Size of the file in bytes."""
 
     access_time: float
-    """Last access time as Unix timestamp (atime)."""
+    """Last modification time as Unix timestamp (initial LRU order on rebuild)."""
 
 
 @dataclass
@@ -46,17 +60,21 @@ class EvictionResult:
 class CacheEvictionService:
     """LRU-based cache eviction service for mod downloads.
 
-    Implements a Least Recently Used (LRU) eviction strategy based on
-    file access times. When the cache exceeds the configured size limit,
-    the oldest accessed files are evicted until the cache is under the limit.
+    Implements a Least Recently Used (LRU) eviction strategy. Downloads and
+    cache hits are recorded with record(), which moves the file to the most
+    recently used end of the index. When the cache exceeds the configured
+    size limit, the least recently used files are evicted until the cache
+    is under the limit.
 
     Attributes:
         cache_dir: Directory containing cached files.
         max_size_bytes: Maximum cache size in bytes (0 to disable eviction).
     """
 
-    # File patterns to consider for eviction (mod archives)
-    CACHE_FILE_PATTERNS = ("*.zip", "*.cs")
+    # File patterns to consider for eviction (mod archives, partial downloads)
+    CACHE_FILE_PATTERNS = ("*.zip", "*.cs", "*.part")
+
+    INDEX_FILE = "mods-cache-index.json"
 
     def __init__(
         self,
@@ -72,6 +90,11 @@ class CacheEvictionService:
         """
         self._cache_dir = cache_dir
         self._max_size_bytes = max_size_mb * 1024 * 1024  # Convert MB to bytes
+        # Filename -> size, least recently used first (None until loaded)
+        self._index: OrderedDict[str, int] | None = None
+        self._total_bytes = 0
+        self._dirty = False
+        self._lock = threading.Lock()
 
     @property
     def cache_dir(self) -> Path:
@@ -88,20 +111,28 @@ class CacheEvictionService:
         """Check if eviction is enabled."""
         return self._max_size_bytes > 0
 
+    @property
+    def _mods_cache(self) -> Path:
+        # The mods subdirectory where ModApiClient stores downloads
+        return self._cache_dir / "mods"
+
+    @property
+    def _index_file(self) -> Path:
+        return self._cache_dir / self.INDEX_FILE
+
     def _get_cache_files(self) -> list[CacheFileInfo]:
-        """Get information about all files in the cache.
+        """Scan the cache directory for cache files (used to rebuild the index).
 
         Returns:
-            List of CacheFileInfo for all cache files, sorted by access time
-            (oldest first for LRU eviction).
+            List of CacheFileInfo for all cache files, sorted by modification
+            time (oldest first).
         """
         files: list[CacheFileInfo] = []
 
         if not self._cache_dir.exists():
             return files
 
-        # Look in the mods subdirectory where ModApiClient stores downloads
-        mods_cache = self._cache_dir / "mods"
+        mods_cache = self._mods_cache
         if not mods_cache.exists():
             return files
 
@@ -114,7 +145,7 @@ class CacheEvictionService:
                             CacheFileInfo(
                                 path=path,
                                 size_bytes=stat.st_size,
-                                access_time=stat.st_atime,
+                                access_time=stat.st_mtime,
                             )
                         )
                     except OSError as e:
@@ -124,17 +155,122 @@ class CacheEvictionService:
                             error=str(e),
                         )
 
-        # Sort by access time, oldest first (for LRU)
+        # Sort by modification time, oldest first (for LRU)
         files.sort(key=lambda f: f.access_time)
         return files
 
+    def _dir_mtime(self) -> int | None:
+        try:
+            return self._mods_cache.stat().st_mtime_ns
+        except OSError:
+            return None
+
+    def _ensure_index(self) -> OrderedDict[str, int]:
+        """Get the index, loading the sidecar or rebuilding it on first use."""
+        if self._index is not None:
+            return self._index
+        index = self._load_index()
+        if index is None:
+            index = OrderedDict((f.path.name, f.size_bytes) for f in self._get_cache_files())
+            self._index = index
+            self._total_bytes = sum(index.values())
+            logger.debug("cache_index_rebuilt", file_count=len(index))
+            self._save_index()
+        else:
+            self._index = index
+            self._total_bytes = sum(index.values())
+        return index
+
+    def _load_index(self) -> OrderedDict[str, int] | None:
+        """Load the sidecar, or None if missing, invalid or stale."""
+        try:
+            data = json.loads(self._index_file.read_text())
+        except (OSError, json.JSONDecodeError):
+            return None
+        if (
+            not isinstance(data, dict)
+            or data.get("version") != INDEX_VERSION
+            or data.get("dir_mtime_ns") != self._dir_mtime()
+            or not isinstance(data.get("entries"), list)
+        ):
+            return None
+        try:
+            return OrderedDict((str(name), int(size)) for name, size in data["entries"])
+        except (TypeError, ValueError):
+            return None
+
+    def _save_index(self) -> None:
+        """Write the sidecar (best effort; a lost sidecar only costs a rescan)."""
+        self._dirty = False
+        if self._index is None or not self._cache_dir.exists():
+            return
+        data = {
+            "version": INDEX_VERSION,
+            "dir_mtime_ns": self._dir_mtime(),
+            "entries": list(self._index.items()),
+        }
+        temp_file = self._index_file.with_suffix(".tmp")
+        try:
+            temp_file.write_text(json.dumps(data))
+            temp_file.replace(self._index_file)
+        except OSError as e:
+            logger.warning("cache_index_save_failed", error=str(e))
+
+    def _drop(self, index: OrderedDict[str, int], name: str) -> None:
+        size = index.pop(name, None)
+        if size is not None:
+            self._total_bytes -= size
+
+    def record(self, path: Path) -> None:
+        """Record a download or cache hit as the most recently used file.
+
+        Only the in-memory index is updated; the sidecar is written by the
+        next eviction pass (if the process stops first, the changed
+        directory mtime makes the next start rebuild the index).
+
+        Args:
+            path: Cached file (in the mods cache directory).
+        """
+        try:
+            size = path.stat().st_size
+        except OSError:
+            size = None
+        with self._lock:
+            index = self._ensure_index()
+            self._drop(index, path.name)
+            if size is not None:
+                index[path.name] = size
+                self._total_bytes += size
+            self._dirty = True
+
+    def forget(self, path: Path) -> None:
+        """Drop a file that was deleted from the cache by other means.
+
+        Args:
+            path: Cached file.
+        """
+        with self._lock:
+            index = self._ensure_index()
+            if path.name in index:
+                self._drop(index, path.name)
+                self._dirty = True
+
+    def rescan(self) -> None:
+        """Discard the index and rebuild it from the cache directory."""
+        with self._lock:
+            self._index = None
+            self._index_file.unlink(missing_ok=True)
+            self._ensure_index()
+
     def get_cache_size(self) -> int:
         """Get the current total size of the cache in bytes.
 
         Returns:
             Total size of all cached files in bytes.
         """
-        return sum(f.size_bytes for f in self._get_cache_files())
+        with self._lock:
+            self._ensure_index()
+            return self._total_bytes
 
     def get_cache_stats(self) -> dict[str, int]:
         """Get cache statistics.
@@ -143,96 +279,99 @@ class CacheEvictionService:
             Dictionary with 'file_count', 'total_size_bytes', and
             'max_size_bytes' keys.
         """
-        files = self._get_cache_files()
-        return {
-            "file_count": len(files),
-            "total_size_bytes": sum(f.size_bytes for f in files),
-            "max_size_bytes": self._max_size_bytes,
-        }
+        with self._lock:
+            index = self._ensure_index()
+            return {
+                "file_count": len(index),
+                "total_size_bytes": self._total_bytes,
+                "max_size_bytes": self._max_size_bytes,
+            }
+
+    def _unlink(self, name: str, size: int, reason: str) -> bool:
+        """Delete a cache file; True if it is gone (deleted or already missing)."""
+        path = self._mods_cache / name
+        try:
+            path.unlink()
+        except FileNotFoundError:
+            return True
+        except OSError as e:
+            logger.warning(
+                "cache_eviction_failed",
+                file=str(path),
+                error=str(e),
+            )
+            return False
+        logger.info(
+            "cache_evicted",
+            file=name,
+            size_bytes=size,
+            reason=reason,
+        )
+        return True
 
     def evict_if_needed(self) -> EvictionResult:
         """Evict files if cache exceeds size limit.
 
-        Uses LRU strategy - evicts oldest accessed files first until
+        Uses LRU strategy - evicts least recently used files first until
         the cache is under the size limit.
 
         Returns:
             EvictionResult with eviction statistics.
         """
-        if not self.eviction_enabled:
-            files = self._get_cache_files()
-            return EvictionResult(
-                files_evicted=0,
-                bytes_freed=0,
-                files_remaining=len(files),
-                bytes_remaining=sum(f.size_bytes for f in files),
-            )
-
-        files = self._get_cache_files()
-        total_size = sum(f.size_bytes for f in files)
-
-        if total_size <= self._max_size_bytes:
-            logger.debug(
-                "cache_within_limit",
-                current_size_mb=total_size / (1024 * 1024),
-                max_size_mb=self._max_size_bytes / (1024 * 1024),
-            )
-            return EvictionResult(
-                files_evicted=0,
-                bytes_freed=0,
-                files_remaining=len(files),
-                bytes_remaining=total_size,
-            )
-
-        # Need to evict - files are already sorted oldest first (by access time)
-        files_evicted = 0
-        bytes_freed = 0
-        current_size = total_size
-
-        for file_info in files:
-            if current_size <= self._max_size_bytes:
-                # We're under the limit, stop evicting
-                break
+        with self._lock:
+            index = self._ensure_index()
+
+            if not self.eviction_enabled or self._total_bytes <= self._max_size_bytes:
+                if self.eviction_enabled:
+                    logger.debug(
+                        "cache_within_limit",
+                        current_size_mb=self._total_bytes / (1024 * 1024),
+                        max_size_mb=self._max_size_bytes / (1024 * 1024),
+                    )
+                if self._dirty:
+                    self._save_index()
+                return EvictionResult(
+                    files_evicted=0,
+                    bytes_freed=0,
+                    files_remaining=len(index),
+                    bytes_remaining=self._total_bytes,
+                )
 
-            # Still over limit, evict this file (oldest first)
-            try:
-                file_info.path.unlink()
+            files_evicted = 0
+            bytes_freed = 0
+            # Files that could not be deleted stay in the cache, at the LRU end
+            kept: list[tuple[str, int]] = []
+
+            while index and self._total_bytes > self._max_size_bytes:
+                name, size = index.popitem(last=False)
+                self._total_bytes -= size
+                if self._unlink(name, size, "size_limit"):
+                    bytes_freed += size
+                    files_evicted += 1
+                else:
+                    kept.append((name, size))
+
+            for name, size in reversed(kept):
+                index[name] = size
+                index.move_to_end(name, last=False)
+                self._total_bytes += size
+            self._save_index()
+
+            if files_evicted > 0:
                 logger.info(
-                    "cache_evicted",
-                    file=str(file_info.path.name),
-                    size_bytes=file_info.size_bytes,
-                    reason="size_limit",
-                )
-                bytes_freed += file_info.size_bytes
-                current_size -= file_info.size_bytes
-                files_evicted += 1
-            except OSError as e:
-                logger.warning(
-                    "cache_eviction_failed",
-                    file=str(file_info.path),
-                    error=str(e),
+                    "cache_eviction_complete",
+                    files_evicted=files_evicted,
+                    bytes_freed=bytes_freed,
+                    bytes_remaining=self._total_bytes,
                 )
-                # File couldn't be deleted, it remains in cache
 
-        # Calculate remaining files by re-scanning (accounts for failed deletions)
-        remaining_files = self._get_cache_files()
-        bytes_remaining = sum(f.size_bytes for f in remaining_files)
-
-        if files_evicted > 0:
-            logger.info(
-                "cache_eviction_complete",
+            return EvictionResult(
                 files_evicted=files_evicted,
                 bytes_freed=bytes_freed,
-                bytes_remaining=bytes_remaining,
+                files_remaining=len(index),
+                bytes_remaining=self._total_bytes,
             )
 
-        return EvictionResult(
-            files_evicted=files_evicted,
-            bytes_freed=bytes_freed,
-            files_remaining=len(remaining_files),
-            bytes_remaining=bytes_remaining,
-        )
-
     def evict_all(self) -> EvictionResult:
         """Evict all files from the cache.
 
@@ -242,31 +381,21 @@ class CacheEvictionService:
         Returns:
             EvictionResult with eviction statistics.
         """
-        files = self._get_cache_files()
-        files_evicted = 0
-        bytes_freed = 0
-
-        for file_info in files:
-            try:
-                file_info.path.unlink()
-                logger.info(
-                    "cache_evicted",
-                    file=str(file_info.path.name),
-                    size_bytes=file_info.size_bytes,
-                    reason="manual_clear",
-                )
-                bytes_freed += file_info.size_bytes
-                files_evicted += 1
-            except OSError as e:
-                logger.warning(
-                    "cache_eviction_failed",
-                    file=str(file_info.path),
-                    error=str(e),
-                )
+        with self._lock:
+            index = self._ensure_index()
+            files_evicted = 0
+            bytes_freed = 0
+
+            for name, size in list(index.items()):
+                if self._unlink(name, size, "manual_clear"):
+                    self._drop(index, name)
+                    bytes_freed += size
+                    files_evicted += 1
+            self._save_index()
 
-        return EvictionResult(
-            files_evicted=files_evicted,
-            bytes_freed=bytes_freed,
-            files_remaining=len(files) - files_evicted,
-            bytes_remaining=sum(f.size_bytes for f in files) - bytes_freed,
-        )
+            return EvictionResult(
+                files_evicted=files_evicted,
+                bytes_freed=bytes_freed,
+                files_remaining=len(index),
+                bytes_remaining=self._total_bytes,
+            )
@@ -0,0 +1,165 @@
+"""Content-addressed storage for downloaded mod files.
+
+Downloads are stored in the mod download cache under their SHA-256
+(``<cache>/mods/<sha256>.zip``), so identical files are stored once no
+matter how many versions, filenames or re-installs refer to them.
+
+Installed mods are linked from the cache into the mods directory instead of
+copied: a hardlink where possible, a reflink (copy-on-write clone) where
+hardlinks are not allowed but the filesystem supports cloning, and a plain
+copy otherwise (e.g., across filesystems). Cached files are never modified
+in place (the mods directory only renames and deletes them), so sharing the
+inode is safe, and evicting a cache entry leaves installed links intact.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import re
+import shutil
+from pathlib import Path
+from typing import Literal
+
+import structlog
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - not available on Windows
+    fcntl = None
+
+logger = structlog.get_logger()
+
+# Read size when hashing files on disk
+HASH_CHUNK_SIZE = 1024 * 1024
+
+_SHA256_PATTERN = re.compile(r"^[0-9a-f]{64}$")
+
+LinkMethod = Literal["hardlink", "reflink", "copy"]
+
+
+def sha256_file(path: Path) -> str:
+    """Compute the SHA-256 of a file.
+
+    Args:
+        path: File to hash.
+
+    Returns:
+        Lowercase hex digest.
+
+    Raises:
+        OSError: If the file cannot be read.
+    """
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        while chunk := f.read(HASH_CHUNK_SIZE):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _reflink(src: Path, dest: Path) -> bool:
+    """Clone a file with FICLONE (Btrfs, XFS, ...); False if unsupported."""
+    ficlone = getattr(fcntl, "FICLONE", None)
+    if ficlone is None:
+        return False
+    try:
+        with open(src, "rb") as src_file, open(dest, "wb") as dest_file:
+            fcntl.ioctl(dest_file.fileno(), ficlone, src_file.fileno())  # type: ignore[union-attr]
+        shutil.copystat(src, dest)
+    except OSError:
+        dest.unlink(missing_ok=True)
+        return False
+    return True
+
+
+def link_or_copy(src: Path, dest: Path) -> LinkMethod:
+    """Place a cached file at dest without copying its data where possible.
+
+    Tries a hardlink, then a reflink, then falls back to a full copy.
+
+    Args:
+        src: Cached file.
+        dest: Destination path (must not exist).
+
+    Returns:
+        The method used.
+
+    Raises:
+        OSError: If the file cannot be copied either.
+    """
+    try:
+        os.link(src, dest)
+        return "hardlink"
+    except OSError:
+        pass
+    if _reflink(src, dest):
+        return "reflink"
+    shutil.copy2(src, dest)
+    return "copy"
+
+
+class ContentStore:
+    """Stores files under their SHA-256 in a flat directory."""
+
+    SUFFIX = ".zip"
+
+    def __init__(self, root: Path) -> None:
+        """Initialize the store.
+
+        Args:
+            root: Directory holding the stored files (created if missing).
+        """
+        self._root = root
+        self._root.mkdir(parents=True, exist_ok=True)
+
+    @property
+    def root(self) -> Path:
+        """Get the store directory."""
+        return self._root
+
+    def path_for(self, sha256: str) -> Path:
+        """Get the storage path for a digest.
+
+        Raises:
+            ValueError: If sha256 is not a lowercase hex SHA-256 digest.
+        """
+        if not _SHA256_PATTERN.match(sha256):
+            raise ValueError(f"Invalid SHA-256 digest: {sha256!r}")
+        return self._root / f"{sha256}{self.SUFFIX}"
+
+    def add(self, temp_path: Path, sha256: str) -> Path:
+        """Move a fully written file into the store under its digest.
+
+        If the content is already stored, the new file is discarded. The
+        stored file is left untouched: installed mods may be hardlinks to it,
+        and cache recency is tracked by CacheEvictionService.record().
+
+        Args:
+            temp_path: Fully written file in the store directory.
+            sha256: Digest of the file's content.
+
+        Returns:
+            Path of the stored file.
+        """
+        dest = self.path_for(sha256)
+        if dest.exists():
+            temp_path.unlink(missing_ok=True)
+            logger.debug("content_store_deduplicated", sha256=sha256)
+            return dest
+        temp_path.replace(dest)
+        return dest
+
+    def verify(self, path: Path, sha256: str) -> bool:
+        """Check that a file still has the recorded digest.
+
+        Args:
+            path: File to check.
+            sha256: Expected digest.
+
+        Returns:
+            True if the file exists and its content matches.
+        """
+        try:
+            return sha256_file(path) == sha256
+        except OSError:
+            return False
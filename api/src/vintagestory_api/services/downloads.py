@@ -0,0 +1,430 @@
+"""Resumable HTTP file downloads.
+
+Mod files and server tarballs are downloaded with download_file(), which
+keeps partial progress instead of starting over after an error:
+
+- Data is written to ``<dest>.part``. A small sidecar (``<dest>.part.json``)
+  records the URL, the response validator (strong ETag or Last-Modified)
+  and the total size.
+- A later attempt (a retry, or a new call after a restart) continues with
+  ``Range: bytes=<offset>-`` and ``If-Range: <validator>``. If the file
+  changed upstream, the server answers 200 and the download restarts from
+  zero.
+- Transport errors and transient HTTP statuses are retried with jittered
+  exponential backoff.
+- Optionally, large files on servers that accept byte ranges are fetched as
+  several parallel segments written at their offsets into a preallocated
+  ``.part``; per-segment progress is kept in the sidecar so segments resume
+  individually.
+
+When the download is complete the ``.part`` file is renamed to dest.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import random
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+import httpx
+import structlog
+
+from vintagestory_api.services.http_client import UpstreamUnavailableError
+
+logger = structlog.get_logger()
+
+# Streaming read size; large enough to keep per-chunk overhead negligible
+DOWNLOAD_CHUNK_SIZE = 256 * 1024
+
+# Attempts per download (or per segment) before giving up
+DOWNLOAD_MAX_ATTEMPTS = 5
+
+# Backoff between attempts: base * 2^(attempt - 1), capped, with jitter
+RETRY_BASE_DELAY = 0.5
+RETRY_MAX_DELAY = 30.0
+
+# Statuses worth retrying (the rest of 4xx/5xx fail immediately)
+RETRYABLE_STATUS_CODES = frozenset({408, 425, 429, 500, 502, 503, 504})
+
+# Files smaller than segments * MIN_SEGMENT_SIZE use fewer segments
+MIN_SEGMENT_SIZE = 8 * 1024 * 1024
+
+# Segment progress is persisted to the sidecar at least this often
+SIDECAR_SAVE_INTERVAL = 4 * 1024 * 1024
+
+ProgressCallback = Callable[[int, int], None]
+"""Called with (bytes downloaded, total bytes or 0 if unknown)."""
+
+
+@dataclass
+class DownloadStats:
+    """Summary of a completed download."""
+
+    size_bytes: int
+    """Size of the downloaded file."""
+
+    resumed_bytes: int
+    """Bytes already present from an earlier attempt when the call started."""
+
+    attempts: int
+    """HTTP requests made (including retries, across segments)."""
+
+    segments: int
+    """Number of parallel segments used (1 for a single stream)."""
+
+
+class _RestartDownload(Exception):
+    """The partial file cannot be resumed; start the download over."""
+
+
+def part_path_for(dest: Path) -> Path:
+    """Get the partial download path for a destination."""
+    return dest.with_name(f"{dest.name}.part")
+
+
+def _sidecar_path_for(dest: Path) -> Path:
+    return dest.with_name(f"{dest.name}.part.json")
+
+
+def _validator(response: httpx.Response) -> str | None:
+    """Get the validator usable in If-Range (strong ETag, else Last-Modified)."""
+    headers = response.headers
+    etag = headers.get("etag")
+    if isinstance(etag, str) and etag and not etag.startswith("W/"):
+        return etag
+    last_modified = headers.get("last-modified")
+    return last_modified if isinstance(last_modified, str) and last_modified else None
+
+
+def _total_size(response: httpx.Response, offset: int) -> int:
+    """Get the full file size from Content-Range or Content-Length (0 if unknown)."""
+    content_range = response.headers.get("content-range")
+    if isinstance(content_range, str) and "/" in content_range:
+        total = content_range.rsplit("/", 1)[1]
+        if total.isdigit():
+            return int(total)
+    length = response.headers.get("content-length")
+    if isinstance(length, str) and length.isdigit():
+        return int(length) + offset
+    return 0
+
+
+def _retry_delay(attempt: int) -> float:
+    """Jittered exponential backoff delay before the next attempt."""
+    delay = min(RETRY_MAX_DELAY, RETRY_BASE_DELAY * 2 ** (attempt - 1))
+    return delay * random.uniform(0.5, 1.0)
+
+
+def _is_retryable(error: Exception) -> bool:
+    if isinstance(error, UpstreamUnavailableError):
+        # The host's circuit breaker is open: fail fast instead of backing off
+        return False
+    if isinstance(error, httpx.HTTPStatusError):
+        return error.response.status_code in RETRYABLE_STATUS_CODES
+    return isinstance(error, httpx.TransportError)
+
+
+class _Sidecar:
+    """Persisted state of a partial download."""
+
+    def __init__(self, path: Path, url: str) -> None:
+        self.path = path
+        self.url = url
+        self.validator: str | None = None
+        self.total = 0
+        # [start, end (inclusive), bytes written] per segment; empty for a single stream
+        self.segments: list[list[int]] = []
+
+    @classmethod
+    def load(cls, path: Path, url: str) -> _Sidecar:
+        """Load the sidecar for url, or a fresh one if missing or for another URL."""
+        sidecar = cls(path, url)
+        try:
+            data: dict[str, Any] = json.loads(path.read_text())
+        except (OSError, ValueError):
+            return sidecar
+        if data.get("url") != url:
+            return sidecar
+        sidecar.validator = data.get("validator")
+        sidecar.total = int(data.get("total") or 0)
+        sidecar.segments = [list(map(int, s)) for s in data.get("segments") or []]
+        return sidecar
+
+    def save(self) -> None:
+        data = {
+            "url": self.url,
+            "validator": self.validator,
+            "total": self.total,
+            "segments": self.segments,
+        }
+        self.path.write_text(json.dumps(data))
+
+    def reset(self) -> None:
+        self.validator = None
+        self.total = 0
+        self.segments = []
+
+
+async def download_file(
+    client: httpx.AsyncClient,
+    url: str,
+    dest: Path,
+    *,
+    timeout: float | httpx.Timeout | None = None,
+    segments: int = 1,
+    max_attempts: int = DOWNLOAD_MAX_ATTEMPTS,
+    chunk_size: int = DOWNLOAD_CHUNK_SIZE,
+    progress: ProgressCallback | None = None,
+) -> DownloadStats:
+    """Download url to dest, resuming from an earlier partial download.
+
+    Args:
+        client: HTTP client to use.
+        url: File URL.
+        dest: Final path; the partial file is kept at ``<dest>.part``.
+        timeout: Per-request timeout (client default if None).
+        segments: Parallel range requests for large files (1 to disable).
+            Falls back to a single stream if the server does not advertise
+            byte-range support or the size is unknown.
+        max_attempts: Attempts per stream/segment before giving up.
+        chunk_size: Streaming read size.
+        progress: Optional callback(downloaded, total).
+
+    Returns:
+        DownloadStats for the completed download.
+
+    Raises:
+        httpx.HTTPError: If the download still fails after retries (the
+            partial file is kept for a later call).
+        OSError: If the partial file cannot be written.
+    """
+    part = part_path_for(dest)
+    sidecar = _Sidecar.load(_sidecar_path_for(dest), url)
+    if not part.exists():
+        sidecar.reset()
+    downloader = _Download(client, url, part, sidecar, timeout, max_attempts, chunk_size, progress)
+
+    if segments > 1 and not sidecar.segments:
+        await downloader.plan_segments(segments)
+    try:
+        if sidecar.segments:
+            await downloader.run_segments()
+        else:
+            await downloader.run_single()
+    except _RestartDownload:
+        logger.info("download_restarted", url=url)
+        sidecar.reset()
+        part.unlink(missing_ok=True)
+        downloader.written = downloader.resumed_bytes = 0
+        await downloader.run_single()
+
+    part.replace(dest)
+    sidecar.path.unlink(missing_ok=True)
+    stats = DownloadStats(
+        size_bytes=dest.stat().st_size,
+        resumed_bytes=downloader.resumed_bytes,
+        attempts=downloader.attempts,
+        segments=max(1, len(sidecar.segments)),
+    )
+    logger.debug(
+        "download_file_complete",
+        url=url,
+        size_bytes=stats.size_bytes,
+        resumed_bytes=stats.resumed_bytes,
+        attempts=stats.attempts,
+        segments=stats.segments,
+    )
+    return stats
+
+
+class _Download:
+    """State of one download_file() call."""
+
+    def __init__(
+        self,
+        client: httpx.AsyncClient,
+        url: str,
+        part: Path,
+        sidecar: _Sidecar,
+        timeout: float | httpx.Timeout | None,
+        max_attempts: int,
+        chunk_size: int,
+        progress: ProgressCallback | None,
+    ) -> None:
+        self.client = client
+        self.url = url
+        self.part = part
+        self.sidecar = sidecar
+        self.timeout = timeout
+        self.max_attempts = max_attempts
+        self.chunk_size = chunk_size
+        self.progress = progress
+        self.attempts = 0
+        # Bytes in the single-stream .part (appended, so its size on disk)
+        self.written = self._part_size()
+        self.resumed_bytes = self._downloaded()
+
+    def _part_size(self) -> int:
+        try:
+            return self.part.stat().st_size
+        except FileNotFoundError:
+            return 0
+
+    def _downloaded(self) -> int:
+        if self.sidecar.segments:
+            return sum(written for _, _, written in self.sidecar.segments)
+        return self.written
+
+    def _report(self) -> None:
+        if self.progress is not None:
+            self.progress(self._downloaded(), self.sidecar.total)
+
+    def _stream(self, headers: dict[str, str]) -> Any:
+        kwargs: dict[str, Any] = {"headers": headers}
+        if self.timeout is not None:
+            kwargs["timeout"] = self.timeout
+        self.attempts += 1
+        return self.client.stream("GET", self.url, **kwargs)
+
+    async def _with_retries(self, fn: Callable[[], Any], what: str) -> None:
+        """Run fn until it succeeds, retrying transient errors with backoff."""
+        attempt = 0
+        while True:
+            attempt += 1
+            try:
+                await fn()
+                return
+            except (httpx.HTTPError, OSError) as e:
+                if isinstance(e, OSError) or not _is_retryable(e) or attempt >= self.max_attempts:
+                    raise
+                delay = _retry_delay(attempt)
+                logger.warning(
+                    "download_retry",
+                    url=self.url,
+                    part=what,
+                    attempt=attempt,
+                    delay_s=round(delay, 2),
+                    downloaded=self._downloaded(),
+                    error=str(e) or type(e).__name__,
+                )
+                await asyncio.sleep(delay)
+
+    # Single stream
+
+    async def run_single(self) -> None:
+        await self._with_retries(self._single_attempt, "stream")
+
+    async def _single_attempt(self) -> None:
+        self.written = self._part_size()
+        offset = self.written if self.sidecar.validator else 0
+        if offset and self.sidecar.total and offset >= self.sidecar.total:
+            return  # Already complete
+        headers: dict[str, str] = {}
+        if offset and self.sidecar.validator:
+            headers = {"Range": f"bytes={offset}-", "If-Range": self.sidecar.validator}
+
+        async with self._stream(headers) as response:
+            if response.status_code == 416 and offset:
+                raise _RestartDownload()  # Stale partial file
+            response.raise_for_status()
+
+            if response.status_code == 206 and offset:
+                mode = "ab"
+                logger.info("download_resumed", url=self.url, offset=offset)
+            else:
+                offset = 0
+                mode = "wb"
+            self.written = offset
+            self.sidecar.validator = _validator(response)
+            self.sidecar.total = _total_size(response, offset)
+            self.sidecar.save()
+
+            with open(self.part, mode) as f:
+                async for chunk in response.aiter_bytes(chunk_size=self.chunk_size):
+                    f.write(chunk)
+                    self.written += len(chunk)
+                    self._report()
+
+    # Parallel segments
+
+    async def plan_segments(self, segments: int) -> None:
+        """Split the download into segments if the server supports ranges."""
+        try:
+            self.attempts += 1
+            kwargs: dict[str, Any] = {"follow_redirects": True}
+            if self.timeout is not None:
+                kwargs["timeout"] = self.timeout
+            response = await self.client.head(self.url, **kwargs)
+            response.raise_for_status()
+        except httpx.HTTPError as e:
+            logger.debug("download_segments_probe_failed", url=self.url, error=str(e))
+            return
+
+        total = _total_size(response, 0)
+        validator = _validator(response)
+        if response.headers.get("accept-ranges") != "bytes" or not total or not validator:
+            return
+        count = min(segments, max(1, total // MIN_SEGMENT_SIZE))
+        if count < 2:
+            return
+
+        size = -(-total // count)
+        self.sidecar.validator = validator
+        self.sidecar.total = total
+        self.sidecar.segments = [
+            [start, min(start + size, total) - 1, 0] for start in range(0, total, size)
+        ]
+        with open(self.part, "wb") as f:
+            f.truncate(total)
+        self.sidecar.save()
+        self.resumed_bytes = 0
+
+    async def run_segments(self) -> None:
+        tasks = [
+            asyncio.create_task(
+                self._with_retries(lambda s=segment: self._segment_attempt(s), f"segment {i}")
+            )
+            for i, segment in enumerate(self.sidecar.segments)
+            if segment[0] + segment[2] <= segment[1]
+        ]
+        try:
+            await asyncio.gather(*tasks)
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            if self.part.exists():
+                self.sidecar.save()
+
+    async def _segment_attempt(self, segment: list[int]) -> None:
+        start, end, written = segment
+        if start + written > end:
+            return
+        headers = {
+            "Range": f"bytes={start + written}-{end}",
+            "If-Range": self.sidecar.validator or "",
+        }
+        async with self._stream(headers) as response:
+            response.raise_for_status()
+            if response.status_code != 206:
+                raise _RestartDownload()
+
+            unsaved = 0
+            with open(self.part, "r+b") as f:
+                f.seek(start + written)
+                async for chunk in response.aiter_bytes(chunk_size=self.chunk_size):
+                    chunk = chunk[: end + 1 - (start + segment[2])]
+                    f.write(chunk)
+                    segment[2] += len(chunk)
+                    unsaved += len(chunk)
+                    if unsaved >= SIDECAR_SAVE_INTERVAL:
+                        f.flush()
+                        self.sidecar.save()
+                        unsaved = 0
+                    self._report()
+        if start + segment[2] <= end:
+            raise httpx.ReadError("Segment ended early")
@@ -0,0 +1,431 @@
+"""Heap snapshot, diff and cache size accounting for the API process.
+
+Wraps tracemalloc so memory growth can be investigated at runtime:
+
+- Start/stop allocation tracing on demand (tracing has a real CPU and
+  memory cost, so it is off unless explicitly started)
+- Take named snapshots and diff any two of them (or a snapshot against the
+  live heap), grouped by file or by file and line
+- Report the deep size in bytes of the process's known in-memory caches,
+  independent of tracemalloc
+
+Snapshots are filtered to drop tracemalloc's own and importlib frames
+before they are stored, and at most MAX_SNAPSHOTS are retained.
+"""
+
+from __future__ import annotations
+
+import re
+import sys
+import time
+import tracemalloc
+from collections import OrderedDict, deque
+from dataclasses import dataclass
+from types import BuiltinFunctionType, FunctionType, MethodType, ModuleType
+from typing import Any, Literal
+
+import structlog
+
+logger = structlog.get_logger()
+
+GroupBy = Literal["lineno", "filename"]
+
+MAX_SNAPSHOTS = 10
+MAX_TRACE_FRAMES = 25
+SNAPSHOT_NAME_PATTERN = re.compile(r"^[A-Za-z0-9_.-]{1,64}$")
+
+# Upper bound on objects visited by deep_sizeof so a pathological graph
+# cannot stall the event loop
+MAX_SIZEOF_OBJECTS = 1_000_000
+
+# Shared, long-lived objects that are never attributed to a cache
+_NOT_FOLLOWED = (type, ModuleType, FunctionType, BuiltinFunctionType, MethodType)
+
+_SNAPSHOT_FILTERS = (
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+    tracemalloc.Filter(False, "<unknown>"),
+)
+
+
+class HeapTracingNotStartedError(Exception):
+    """Raised when a snapshot is requested while tracemalloc is not tracing."""
+
+
+class HeapSnapshotNotFoundError(Exception):
+    """Raised when a named snapshot does not exist."""
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        super().__init__(f"Heap snapshot '{name}' not found")
+
+
+class InvalidSnapshotNameError(Exception):
+    """Raised when a snapshot name contains unsupported characters."""
+
+
+@dataclass(frozen=True)
+class SnapshotInfo:
+    """Metadata for a stored heap snapshot."""
+
+    name: str
+    taken_at: float
+    traced_bytes: int
+    traced_blocks: int
+
+
+@dataclass(frozen=True)
+class AllocationDiff:
+    """Allocation change for a single file or file:line between snapshots."""
+
+    location: str
+    size_bytes: int
+    size_diff_bytes: int
+    count: int
+    count_diff: int
+
+
+@dataclass(frozen=True)
+class CacheSize:
+    """Deep size of one in-memory cache."""
+
+    name: str
+    entries: int
+    bytes: int
+
+
+def deep_sizeof(obj: object) -> int:
+    """Approximate the total memory held by an object graph, in bytes.
+
+    Follows containers (dict, list, tuple, set, frozenset, deque) and
+    instance attributes (__dict__ and __slots__). Each object is counted
+    once. Classes, modules and functions are not followed. Safe to call
+    from a worker thread while the event loop mutates the graph.
+
+    Args:
+        obj: Root object.
+
+    Returns:
+        Sum of sys.getsizeof() over all reachable objects.
+    """
+    seen: set[int] = set()
+    stack: list[Any] = [obj]
+    total = 0
+    while stack and len(seen) < MAX_SIZEOF_OBJECTS:
+        current = stack.pop()
+        if id(current) in seen or isinstance(current, _NOT_FOLLOWED):
+            continue
+        seen.add(id(current))
+        total += sys.getsizeof(current)
+
+        try:
+            if isinstance(current, dict):
+                stack.extend(current.keys())  # pyright: ignore[reportUnknownMemberType, reportUnknownArgumentType]
+                stack.extend(current.values())  # pyright: ignore[reportUnknownMemberType, reportUnknownArgumentType]
+                continue
+            if isinstance(current, list | tuple | set | frozenset | deque):
+                stack.extend(current)  # pyright: ignore[reportUnknownArgumentType]
+                continue
+        except RuntimeError:
+            # Resized by the event loop while measured from a worker thread;
+            # its contents are skipped (the result is an estimate anyway)
+            continue
+        if isinstance(current, str | bytes | int | float | bool) or current is None:
+            continue
+        if hasattr(current, "__dict__"):
+            stack.append(vars(current))
+        for slot in getattr(type(current), "__slots__", ()):
+            if hasattr(current, slot):
+                stack.append(getattr(current, slot))
+    return total
+
+
+def _cache_size(name: str, value: Any) -> CacheSize:
+    """Measure a cache object, using len() for the entry count when available."""
+    try:
+        entries = len(value) if value is not None else 0
+    except TypeError:
+        entries = 1
+    size = deep_sizeof(value) if value is not None else 0
+    return CacheSize(name=name, entries=entries, bytes=size)
+
+
+def get_cache_sizes() -> list[CacheSize]:
+    """Measure the known in-memory caches of the API process.
+
+    Only caches whose owning singleton already exists are reported;
+    nothing is created as a side effect of measuring.
+
+    Returns:
+        Cache sizes, largest first.
+    """
+    # Import here to avoid import cycles (services import each other lazily)
+    from vintagestory_api.services import mods as mods_module
+    from vintagestory_api.services import server as server_module
+    from vintagestory_api.services import versions_cache as versions_module
+    from vintagestory_api.services import ws_token_service as tokens_module
+
+    sizes: list[CacheSize] = []
+
+    mod_service = mods_module._mod_service  # pyright: ignore[reportPrivateUsage]
+    client = mod_service._mod_api_client if mod_service else None  # pyright: ignore[reportPrivateUsage]
+    if client is not None:
+        sizes.append(
+            _cache_size("mod_api.browse_cache", client._browse_cache)  # pyright: ignore[reportPrivateUsage]
+        )
+        index = client._browse_index  # pyright: ignore[reportPrivateUsage]
+        sizes.append(
+            CacheSize(
+                name="mod_api.browse_index",
+                entries=len(index) if index is not None else 0,
+                # The catalog itself is accounted under browse_cache
+                bytes=deep_sizeof(vars(index)) - deep_sizeof(index.mods) if index else 0,
+            )
+        )
+        sizes.append(
+            _cache_size(
+                "mod_api.browse_results",
+                client._browse_results,  # pyright: ignore[reportPrivateUsage]
+            )
+        )
+        sizes.append(
+            _cache_size(
+                "mod_api.version_cache",
+                client._version_cache,  # pyright: ignore[reportPrivateUsage]
+            )
+        )
+        sizes.append(
+            _cache_size(
+                "mod_api.mod_cache",
+                client._mod_cache,  # pyright: ignore[reportPrivateUsage]
+            )
+        )
+        sizes.append(
+            _cache_size(
+                "mod_api.gameversions_cache",
+                client._gameversions_cache,  # pyright: ignore[reportPrivateUsage]
+            )
+        )
+
+    server_service = server_module._server_service  # pyright: ignore[reportPrivateUsage]
+    if server_service is not None:
+        sizes.append(
+            _cache_size(
+                "console_buffer",
+                server_service.console_buffer._buffer,  # pyright: ignore[reportPrivateUsage]
+            )
+        )
+
+    versions_cache = versions_module._versions_cache  # pyright: ignore[reportPrivateUsage]
+    if versions_cache is not None:
+        lists = versions_cache._version_lists  # pyright: ignore[reportPrivateUsage]
+        size = _cache_size("versions_cache", versions_cache)
+        sizes.append(
+            CacheSize(
+                name=size.name,
+                entries=sum(len(v) for v in lists.values()),
+                bytes=size.bytes,
+            )
+        )
+
+    token_service = tokens_module._ws_token_service  # pyright: ignore[reportPrivateUsage]
+    if token_service is not None:
+        sizes.append(
+            _cache_size("ws_token_store", token_service._tokens)  # pyright: ignore[reportPrivateUsage]
+        )
+
+    return sorted(sizes, key=lambda s: s.bytes, reverse=True)
+
+
+class HeapProfiler:
+    """Controls tracemalloc and stores named snapshots."""
+
+    def __init__(self) -> None:
+        """Initialize with no stored snapshots."""
+        self._snapshots: OrderedDict[str, tuple[SnapshotInfo, tracemalloc.Snapshot]] = (
+            OrderedDict()
+        )
+        self._started_here = False
+
+    @property
+    def is_tracing(self) -> bool:
+        """Whether tracemalloc is currently tracing allocations."""
+        return tracemalloc.is_tracing()
+
+    def start(self, frames: int = 1) -> bool:
+        """Start tracing allocations.
+
+        Args:
+            frames: Number of stack frames recorded per allocation
+                (clamped to 1..MAX_TRACE_FRAMES). More frames cost more memory.
+
+        Returns:
+            True if tracing was started, False if it was already running.
+        """
+        if tracemalloc.is_tracing():
+            return False
+        frames = min(max(frames, 1), MAX_TRACE_FRAMES)
+        tracemalloc.start(frames)
+        self._started_here = True
+        logger.info("heap_tracing_started", frames=frames)
+        return True
+
+    def stop(self) -> bool:
+        """Stop tracing allocations.
+
+        Stored snapshots are kept and remain available for diffs.
+
+        Returns:
+            True if tracing was stopped, False if it was not running.
+        """
+        if not tracemalloc.is_tracing():
+            return False
+        tracemalloc.stop()
+        self._started_here = False
+        logger.info("heap_tracing_stopped")
+        return True
+
+    def get_traced_memory(self) -> tuple[int, int]:
+        """Get (current, peak) traced memory in bytes (0, 0 when not tracing)."""
+        return tracemalloc.get_traced_memory()
+
+    def get_overhead_bytes(self) -> int:
+        """Get memory used by tracemalloc itself to store traces."""
+        return tracemalloc.get_tracemalloc_memory()
+
+    def _take(self) -> tracemalloc.Snapshot:
+        """Take and filter a live snapshot."""
+        if not tracemalloc.is_tracing():
+            raise HeapTracingNotStartedError("Heap tracing is not started")
+        return tracemalloc.take_snapshot().filter_traces(_SNAPSHOT_FILTERS)
+
+    def take_snapshot(self, name: str) -> SnapshotInfo:
+        """Take a named snapshot of the traced heap.
+
+        Re-using a name replaces the previous snapshot. When more than
+        MAX_SNAPSHOTS are stored the oldest is discarded.
+
+        Args:
+            name: Snapshot name (letters, digits, '_', '-', '.'; max 64 chars).
+
+        Returns:
+            Metadata for the stored snapshot.
+
+        Raises:
+            InvalidSnapshotNameError: If the name is not allowed.
+            HeapTracingNotStartedError: If tracing is not running.
+        """
+        if not SNAPSHOT_NAME_PATTERN.match(name):
+            raise InvalidSnapshotNameError(
+                "Snapshot names may only contain letters, digits, '_', '-' and '.'"
+            )
+        snapshot = self._take()
+        stats = snapshot.statistics("filename")
+        info = SnapshotInfo(
+            name=name,
+            taken_at=time.time(),
+            traced_bytes=sum(s.size for s in stats),
+            traced_blocks=sum(s.count for s in stats),
+        )
+        self._snapshots.pop(name, None)
+        self._snapshots[name] = (info, snapshot)
+        while len(self._snapshots) > MAX_SNAPSHOTS:
+            evicted, _ = self._snapshots.popitem(last=False)
+            logger.debug("heap_snapshot_evicted", name=evicted)
+        logger.info("heap_snapshot_taken", name=name, traced_bytes=info.traced_bytes)
+        return info
+
+    def list_snapshots(self) -> list[SnapshotInfo]:
+        """Get metadata for stored snapshots, oldest first."""
+        return [info for info, _ in self._snapshots.values()]
+
+    def delete_snapshot(self, name: str) -> None:
+        """Delete a stored snapshot.
+
+        Raises:
+            HeapSnapshotNotFoundError: If no snapshot has this name.
+        """
+        if self._snapshots.pop(name, None) is None:
+            raise HeapSnapshotNotFoundError(name)
+
+    def _get(self, name: str) -> tracemalloc.Snapshot:
+        entry = self._snapshots.get(name)
+        if entry is None:
+            raise HeapSnapshotNotFoundError(name)
+        return entry[1]
+
+    def diff(
+        self,
+        base: str,
+        target: str | None = None,
+        group_by: GroupBy = "lineno",
+        limit: int = 25,
+    ) -> list[AllocationDiff]:
+        """Compare two snapshots and return the largest allocation changes.
+
+        Args:
+            base: Name of the baseline snapshot.
+            target: Name of the snapshot to compare, or None for the live heap.
+            group_by: "lineno" for file:line, "filename" for per-file totals.
+            limit: Maximum number of entries to return.
+
+        Returns:
+            Allocation changes ordered by absolute size difference.
+
+        Raises:
+            HeapSnapshotNotFoundError: If a named snapshot does not exist.
+            HeapTracingNotStartedError: If target is None and tracing is off.
+        """
+        base_snapshot = self._get(base)
+        target_snapshot = self._get(target) if target is not None else self._take()
+        stats = target_snapshot.compare_to(base_snapshot, group_by)
+        return [
+            AllocationDiff(
+                location=_format_location(stat.traceback, group_by),
+                size_bytes=stat.size,
+                size_diff_bytes=stat.size_diff,
+                count=stat.count,
+                count_diff=stat.count_diff,
+            )
+            for stat in stats[:limit]
+        ]
+
+    def clear(self) -> None:
+        """Drop all stored snapshots."""
+        self._snapshots.clear()
+
+
+def _format_location(traceback: tracemalloc.Traceback, group_by: GroupBy) -> str:
+    """Format the most recent frame of an allocation traceback."""
+    frame = traceback[0]
+    if group_by == "filename":
+        return frame.filename
+    return f"{frame.filename}:{frame.lineno}"
+
+
+# Module-level singleton
+_heap_profiler: HeapProfiler | None = None
+
+
+def get_heap_profiler() -> HeapProfiler:
+    """Get or create the heap profiler singleton.
+
+    Returns:
+        HeapProfiler instance.
+    """
+    global _heap_profiler
+    if _heap_profiler is None:
+        _heap_profiler = HeapProfiler()
+    return _heap_profiler
+
+
+def reset_heap_profiler() -> None:
+    """Reset the heap profiler singleton, stopping tracing if it started it.
+
+    Used for testing to ensure clean state between tests.
+    """
+    global _heap_profiler
+    if _heap_profiler is not None and _heap_profiler._started_here:  # pyright: ignore[reportPrivateUsage]
+        _heap_profiler.stop()
+    _heap_profiler = None
@@ -0,0 +1,550 @@
+"""Shared outbound HTTP client.
+
+ServerService (version API, CDN downloads) and ModApiClient (mods.vintagestory.at)
+share one pooled httpx.AsyncClient instead of each creating its own:
+
+- Connection pooling with keepalive tuning and a per-host connection cap
+  (httpx only limits the pool as a whole)
+- Optional HTTP/2 (VS_HTTP2=true, needs the h2 package)
+- Separate timeouts for API calls (the client default) and bulk downloads
+  (download_timeout, passed per request): a slow CDN transfer gets a long
+  read timeout without letting a hung API call block for minutes
+- Per-host latency histograms, status/error counters and byte counters,
+  reported by GET /metrics/upstream
+- Per-host resilience: a token-bucket rate limit on outbound requests,
+  jittered exponential-backoff retries of idempotent requests (GET/HEAD)
+  on connection failures and 502/503/504, and a circuit breaker that
+  opens after consecutive failures. While a host's breaker is open,
+  requests fail immediately with UpstreamUnavailableError (an
+  httpx.ConnectError, so callers fall back to cached or stale data just
+  as for any other connection failure) instead of each waiting out the
+  timeout. Breaker states are reported on /healthz.
+
+Metrics and resilience state are updated on the event loop thread by the
+transport wrapper, so no locks are needed.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import importlib.util
+import random
+import time
+from bisect import bisect_left
+from collections.abc import AsyncIterator, Callable
+from typing import Literal
+
+import httpx
+import structlog
+
+from vintagestory_api.config import Settings
+from vintagestory_api.services.request_metrics import LATENCY_BUCKETS_MS, estimate_percentile
+
+logger = structlog.get_logger()
+
+# Pool-wide connection limits
+MAX_CONNECTIONS = 50
+MAX_KEEPALIVE_CONNECTIONS = 20
+
+# Idle keepalive connections are closed after this many seconds
+KEEPALIVE_EXPIRY = 30.0
+
+# Time allowed to establish a connection (API calls and downloads)
+CONNECT_TIMEOUT = 10.0
+
+# Time allowed to wait for a free pooled connection
+POOL_TIMEOUT = 30.0
+
+# Consecutive failed requests to a host that open its circuit breaker
+BREAKER_FAILURE_THRESHOLD = 5
+
+# Seconds an open breaker fails fast before letting a probe request through
+BREAKER_RESET_TIMEOUT = 30.0
+
+# Retries of idempotent requests after the first attempt
+MAX_RETRIES = 2
+
+# Backoff before retry n is uniform in [0, min(RETRY_MAX_DELAY, RETRY_BASE_DELAY * 2**n)]
+RETRY_BASE_DELAY = 0.25
+RETRY_MAX_DELAY = 2.0
+
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD"})
+RETRY_STATUS_CODES = frozenset({502, 503, 504})
+RETRY_EXCEPTIONS = (httpx.ConnectError, httpx.ConnectTimeout, httpx.RemoteProtocolError)
+
+BreakerState = Literal["closed", "open", "half_open"]
+
+
+class UpstreamUnavailableError(httpx.ConnectError):
+    """Raised without contacting a host whose circuit breaker is open."""
+
+
+class CircuitBreaker:
+    """Consecutive-failure circuit breaker for one upstream host.
+
+    Closed: requests pass; BREAKER_FAILURE_THRESHOLD consecutive failures
+    open it. Open: requests fail fast until reset_timeout has passed, then
+    one probe request is let through (half-open); its success closes the
+    breaker and its failure opens it again.
+    """
+
+    def __init__(
+        self,
+        host: str,
+        failure_threshold: int = BREAKER_FAILURE_THRESHOLD,
+        reset_timeout: float = BREAKER_RESET_TIMEOUT,
+    ) -> None:
+        """Initialize a closed breaker.
+
+        Args:
+            host: Upstream host (for logging).
+            failure_threshold: Consecutive failures that open the breaker.
+            reset_timeout: Seconds to stay open before probing.
+        """
+        self.host = host
+        self._failure_threshold = failure_threshold
+        self._reset_timeout = reset_timeout
+        self._state: BreakerState = "closed"
+        self._opened_at = 0.0
+        self._probing = False
+        self.consecutive_failures = 0
+
+    @property
+    def state(self) -> BreakerState:
+        """Current state (an open breaker past its timeout reports half_open)."""
+        if self._state == "open" and self.retry_after == 0:
+            return "half_open"
+        return self._state
+
+    @property
+    def retry_after(self) -> float:
+        """Seconds until an open breaker lets a probe through (0 otherwise)."""
+        if self._state != "open":
+            return 0.0
+        return max(0.0, self._opened_at + self._reset_timeout - time.monotonic())
+
+    def allow(self) -> bool:
+        """Whether a request may be sent now (claims the probe when half-open)."""
+        if self.state == "closed":
+            return True
+        if self.state == "half_open" and not self._probing:
+            self._state = "half_open"
+            self._probing = True
+            return True
+        return False
+
+    def release_probe(self) -> None:
+        """Give up a claimed probe without an outcome (e.g., the request was cancelled)."""
+        self._probing = False
+
+    def record_success(self) -> None:
+        """Record a successful request, closing the breaker."""
+        if self._state != "closed":
+            logger.info("upstream_breaker_closed", host=self.host)
+        self._state = "closed"
+        self._probing = False
+        self.consecutive_failures = 0
+
+    def record_failure(self) -> None:
+        """Record a failed request, opening the breaker at the threshold."""
+        self.consecutive_failures += 1
+        self._probing = False
+        if self._state == "half_open" or (
+            self._state == "closed" and self.consecutive_failures >= self._failure_threshold
+        ):
+            self._state = "open"
+            self._opened_at = time.monotonic()
+            logger.warning(
+                "upstream_breaker_opened",
+                host=self.host,
+                consecutive_failures=self.consecutive_failures,
+                reset_timeout=self._reset_timeout,
+            )
+
+
+class TokenBucket:
+    """Token-bucket rate limiter (rate tokens per second, up to burst)."""
+
+    def __init__(self, rate: float, burst: int) -> None:
+        """Initialize a full bucket.
+
+        Args:
+            rate: Tokens added per second.
+            burst: Bucket capacity.
+        """
+        self._rate = rate
+        self._burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+
+    def reserve(self) -> float:
+        """Take a token, returning how long to wait before using it."""
+        now = time.monotonic()
+        self._tokens = min(self._burst, self._tokens + (now - self._updated) * self._rate)
+        self._updated = now
+        self._tokens -= 1
+        return 0.0 if self._tokens >= 0 else -self._tokens / self._rate
+
+    async def acquire(self) -> None:
+        """Wait for a token."""
+        delay = self.reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
+class UpstreamStats:
+    """Latency histogram and counters for one upstream host."""
+
+    __slots__ = (
+        "host",
+        "requests",
+        "in_flight",
+        "total_ms",
+        "max_ms",
+        "buckets",
+        "status_classes",
+        "errors",
+        "bytes_sent",
+        "bytes_received",
+        "retries",
+        "short_circuited",
+    )
+
+    def __init__(self, host: str) -> None:
+        self.host = host
+        self.requests = 0
+        self.in_flight = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        # One slot per bucket bound plus the +Inf bucket (non-cumulative counts)
+        self.buckets = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+        # Index 0 unused; 1=1xx, 2=2xx, 3=3xx, 4=4xx, 5=5xx
+        self.status_classes = [0] * 6
+        # Transport errors (timeouts, connection failures) by exception name
+        self.errors: dict[str, int] = {}
+        self.bytes_sent = 0
+        self.bytes_received = 0
+        # Retried attempts, and requests refused by an open circuit breaker
+        self.retries = 0
+        self.short_circuited = 0
+
+    @property
+    def error_count(self) -> int:
+        """Transport errors plus 5xx responses."""
+        return sum(self.errors.values()) + self.status_classes[5]
+
+    def record(self, duration_ms: float, status_code: int | None) -> None:
+        """Record a request (status None if it failed without a response)."""
+        self.requests += 1
+        self.total_ms += duration_ms
+        if duration_ms > self.max_ms:
+            self.max_ms = duration_ms
+        self.buckets[bisect_left(LATENCY_BUCKETS_MS, duration_ms)] += 1
+        if status_code is not None and 1 <= status_code // 100 <= 5:
+            self.status_classes[status_code // 100] += 1
+
+    def percentile(self, quantile: float) -> float | None:
+        """Estimate a time-to-headers percentile in milliseconds."""
+        return estimate_percentile(self.buckets, self.requests, self.max_ms, quantile)
+
+
+class _MeteredStream(httpx.AsyncByteStream):
+    """Response body wrapper counting received bytes and releasing the host slot."""
+
+    def __init__(
+        self, stream: httpx.AsyncByteStream, stats: UpstreamStats, release: Callable[[], None]
+    ) -> None:
+        self._stream = stream
+        self._stats = stats
+        self._release = release
+        self._closed = False
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        async for chunk in self._stream:
+            self._stats.bytes_received += len(chunk)
+            yield chunk
+
+    async def aclose(self) -> None:
+        try:
+            await self._stream.aclose()
+        finally:
+            if not self._closed:
+                self._closed = True
+                self._release()
+
+
+class MeteredTransport(httpx.AsyncBaseTransport):
+    """Transport wrapper adding per-host limits, resilience and metrics.
+
+    A request holds its host's slot until the response body is closed, so
+    at most max_per_host connections to one host are in use at a time.
+    """
+
+    def __init__(
+        self,
+        transport: httpx.AsyncBaseTransport,
+        metrics: UpstreamMetrics,
+        max_per_host: int,
+        rate_limit: float = 0.0,
+        rate_burst: int = 1,
+    ) -> None:
+        self._transport = transport
+        self._metrics = metrics
+        self._max_per_host = max_per_host
+        self._rate_limit = rate_limit
+        self._rate_burst = rate_burst
+        self._slots: dict[str, asyncio.Semaphore] = {}
+        self._buckets: dict[str, TokenBucket] = {}
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        host = request.url.host
+        stats = self._metrics.for_host(host)
+        breaker = self._metrics.breaker_for(host)
+        probe = breaker.state == "half_open"
+        if not breaker.allow():
+            stats.short_circuited += 1
+            raise UpstreamUnavailableError(
+                f"{host} is unavailable (circuit open, retry in {breaker.retry_after:.0f}s)",
+                request=request,
+            )
+
+        try:
+            response = await self._send_with_retries(request, host, stats)
+        except Exception:
+            breaker.record_failure()
+            raise
+        except BaseException:
+            # Cancelled (e.g., client disconnect) with no outcome: let another probe through
+            if probe:
+                breaker.release_probe()
+            raise
+        if response.status_code >= 500:
+            breaker.record_failure()
+        else:
+            breaker.record_success()
+        return response
+
+    async def _send_with_retries(
+        self, request: httpx.Request, host: str, stats: UpstreamStats
+    ) -> httpx.Response:
+        """Send a request, retrying idempotent ones on transient failures."""
+        retries = MAX_RETRIES if request.method in IDEMPOTENT_METHODS else 0
+        for attempt in range(retries):
+            try:
+                response = await self._send(request, host, stats)
+            except RETRY_EXCEPTIONS as e:
+                await self._backoff(stats, attempt, host, str(e))
+                continue
+            if response.status_code not in RETRY_STATUS_CODES:
+                return response
+            await response.aclose()
+            await self._backoff(stats, attempt, host, f"HTTP {response.status_code}")
+        return await self._send(request, host, stats)
+
+    async def _send(
+        self, request: httpx.Request, host: str, stats: UpstreamStats
+    ) -> httpx.Response:
+        """Send one attempt through the rate limit and host slot, recording metrics."""
+        if self._rate_limit > 0:
+            bucket = self._buckets.get(host)
+            if bucket is None:
+                bucket = self._buckets[host] = TokenBucket(self._rate_limit, self._rate_burst)
+            await bucket.acquire()
+
+        slot = self._slots.get(host)
+        if slot is None:
+            slot = self._slots[host] = asyncio.Semaphore(self._max_per_host)
+
+        await slot.acquire()
+        stats.in_flight += 1
+
+        def release() -> None:
+            stats.in_flight -= 1
+            slot.release()
+
+        stats.bytes_sent += int(request.headers.get("content-length", 0) or 0)
+        started = time.perf_counter()
+        try:
+            response = await self._transport.handle_async_request(request)
+        except Exception as e:
+            stats.record((time.perf_counter() - started) * 1000, None)
+            stats.errors[type(e).__name__] = stats.errors.get(type(e).__name__, 0) + 1
+            release()
+            raise
+        stats.record((time.perf_counter() - started) * 1000, response.status_code)
+        assert isinstance(response.stream, httpx.AsyncByteStream)
+        response.stream = _MeteredStream(response.stream, stats, release)
+        return response
+
+    @staticmethod
+    async def _backoff(stats: UpstreamStats, attempt: int, host: str, reason: str) -> None:
+        """Sleep before a retry (exponential backoff with full jitter)."""
+        stats.retries += 1
+        delay = random.uniform(0, min(RETRY_MAX_DELAY, RETRY_BASE_DELAY * 2**attempt))
+        logger.debug("upstream_retry", host=host, attempt=attempt + 1, reason=reason)
+        await asyncio.sleep(delay)
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
+
+
+class UpstreamMetrics:
+    """Per-host outbound request metrics."""
+
+    def __init__(self) -> None:
+        """Initialize an empty collector."""
+        self._hosts: dict[str, UpstreamStats] = {}
+        self._breakers: dict[str, CircuitBreaker] = {}
+        self._started_at = time.time()
+
+    @property
+    def started_at(self) -> float:
+        """Unix timestamp when collection started (or was last reset)."""
+        return self._started_at
+
+    def for_host(self, host: str) -> UpstreamStats:
+        """Get (or create) the stats for a host."""
+        stats = self._hosts.get(host)
+        if stats is None:
+            stats = self._hosts[host] = UpstreamStats(host)
+        return stats
+
+    def get_host_stats(self) -> list[UpstreamStats]:
+        """Get stats for all hosts, most requested first."""
+        return sorted(self._hosts.values(), key=lambda s: s.requests, reverse=True)
+
+    def breaker_for(self, host: str) -> CircuitBreaker:
+        """Get (or create) the circuit breaker for a host."""
+        breaker = self._breakers.get(host)
+        if breaker is None:
+            breaker = self._breakers[host] = CircuitBreaker(
+                host, BREAKER_FAILURE_THRESHOLD, BREAKER_RESET_TIMEOUT
+            )
+        return breaker
+
+    def get_breakers(self) -> dict[str, CircuitBreaker]:
+        """Get the circuit breakers of all contacted hosts, by host."""
+        return dict(sorted(self._breakers.items()))
+
+
+class OutboundHttp:
+    """The shared outbound httpx client, its timeouts and metrics."""
+
+    def __init__(
+        self,
+        api_timeout: float = 30.0,
+        download_timeout: float = 120.0,
+        max_connections_per_host: int = 8,
+        http2: bool = False,
+        rate_limit: float = 0.0,
+        rate_burst: int = 20,
+    ) -> None:
+        """Initialize the outbound HTTP layer. The client is created on first use.
+
+        Args:
+            api_timeout: Read/write timeout for API calls in seconds.
+            download_timeout: Read/write timeout for downloads in seconds
+                (time allowed between chunks, not for the whole transfer).
+            max_connections_per_host: Concurrent connections per upstream host.
+            http2: Negotiate HTTP/2 where the server supports it (ignored if
+                the h2 package is not installed).
+            rate_limit: Outbound requests per second per host (0 for no limit).
+            rate_burst: Requests per host allowed in a burst above the rate.
+        """
+        self.api_timeout = httpx.Timeout(api_timeout, connect=CONNECT_TIMEOUT, pool=POOL_TIMEOUT)
+        self.download_timeout = httpx.Timeout(
+            download_timeout, connect=CONNECT_TIMEOUT, pool=POOL_TIMEOUT
+        )
+        self._max_per_host = max_connections_per_host
+        self._rate_limit = rate_limit
+        self._rate_burst = rate_burst
+        if http2 and importlib.util.find_spec("h2") is None:
+            logger.warning("http2_unavailable", reason="h2 package not installed")
+            http2 = False
+        self._http2 = http2
+        self.metrics = UpstreamMetrics()
+        self._client: httpx.AsyncClient | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+    @property
+    def http2(self) -> bool:
+        """Whether HTTP/2 is enabled."""
+        return self._http2
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """Get the shared client (created on first use in the running loop)."""
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._client.is_closed or self._loop is not loop:
+            # A client (and its pooled connections) is bound to the loop that
+            # created it; only tests run more than one loop per process
+            transport = httpx.AsyncHTTPTransport(
+                http2=self._http2,
+                limits=httpx.Limits(
+                    max_connections=MAX_CONNECTIONS,
+                    max_keepalive_connections=MAX_KEEPALIVE_CONNECTIONS,
+                    keepalive_expiry=KEEPALIVE_EXPIRY,
+                ),
+            )
+            self._client = httpx.AsyncClient(
+                transport=MeteredTransport(
+                    transport,
+                    self.metrics,
+                    self._max_per_host,
+                    rate_limit=self._rate_limit,
+                    rate_burst=self._rate_burst,
+                ),
+                timeout=self.api_timeout,
+                follow_redirects=True,
+            )
+            self._loop = loop
+            logger.debug("outbound_http_client_created", http2=self._http2)
+        return self._client
+
+    async def aclose(self) -> None:
+        """Close the client and its pooled connections."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+            self._loop = None
+
+
+# Module-level singleton
+_outbound_http: OutboundHttp | None = None
+
+
+def get_outbound_http() -> OutboundHttp:
+    """Get or create the outbound HTTP singleton (configured from Settings).
+
+    Returns:
+        OutboundHttp instance.
+    """
+    global _outbound_http
+    if _outbound_http is None:
+        settings = Settings()
+        _outbound_http = OutboundHttp(
+            api_timeout=settings.http_api_timeout,
+            download_timeout=settings.http_download_timeout,
+            max_connections_per_host=settings.http_max_connections_per_host,
+            http2=settings.http2,
+            rate_limit=settings.http_rate_limit,
+            rate_burst=settings.http_rate_burst,
+        )
+    return _outbound_http
+
+
+async def close_outbound_http() -> None:
+    """Close the shared client. Safe to call if it was never created."""
+    global _outbound_http
+    if _outbound_http is not None:
+        await _outbound_http.aclose()
+        _outbound_http = None
+
+
+def reset_outbound_http() -> None:
+    """Reset the outbound HTTP singleton.
+
+    Used for testing to ensure clean state between tests.
+    """
+    global _outbound_http
+    _outbound_http = None
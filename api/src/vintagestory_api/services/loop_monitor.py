@@ -0,0 +1,296 @@
+"""Event loop lag monitor and slow-callback detector.
+
+Everything in the API shares one asyncio event loop: console capture,
+WebSockets, scheduler jobs and request handlers. Any blocking call on the
+loop (tar extraction, checksums, zip parsing, large file copies) stalls
+all of them. This module makes such stalls visible:
+
+- Lag probe: an asyncio task sleeps for a fixed interval and records how
+  late it wakes up. The distribution of that scheduling delay is reported
+  as percentiles.
+- Slow-callback detector: a watchdog thread posts a heartbeat callback to
+  the loop. If the loop does not run it within the threshold, the thread
+  samples the loop thread's current stack (via sys._current_frames()) so
+  the blocking code path is recorded, then records the stall's total
+  duration once the loop catches up.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import sys
+import threading
+import time
+import traceback
+from collections import deque
+from dataclasses import dataclass, field
+
+import structlog
+
+logger = structlog.get_logger()
+
+
+@dataclass
+class LoopStall:
+    """A period where the event loop was blocked beyond the threshold."""
+
+    started_at: float
+    """Unix timestamp when the unanswered heartbeat was posted."""
+
+    duration_ms: float | None
+    """Total stall duration, or None while the loop is still blocked."""
+
+    stack: list[str] = field(default_factory=list[str])
+    """Loop thread stack captured while blocked, outermost frame first."""
+
+
+@dataclass(frozen=True)
+class LagSummary:
+    """Scheduling delay percentiles over the recent sample window."""
+
+    samples: int
+    mean_ms: float | None
+    p50_ms: float | None
+    p90_ms: float | None
+    p99_ms: float | None
+    max_ms: float | None
+
+
+def _percentile(sorted_values: list[float], quantile: float) -> float | None:
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return None
+    rank = max(0, min(len(sorted_values) - 1, int(quantile * len(sorted_values))))
+    return sorted_values[rank]
+
+
+class LoopMonitor:
+    """Measures event loop scheduling delay and records blocking stalls.
+
+    Attributes:
+        DEFAULT_INTERVAL: Seconds between lag probes.
+        DEFAULT_SLOW_THRESHOLD: Seconds the loop may be unresponsive before a
+            stall is recorded.
+        LAG_WINDOW: Number of lag samples retained for percentiles.
+        MAX_STALLS: Number of stall records retained.
+        MAX_STACK_DEPTH: Maximum frames captured per stall.
+    """
+
+    DEFAULT_INTERVAL = 0.5
+    DEFAULT_SLOW_THRESHOLD = 0.1
+    LAG_WINDOW = 600  # 5 minutes at 0.5s
+    MAX_STALLS = 50
+    MAX_STACK_DEPTH = 30
+
+    def __init__(
+        self,
+        interval: float = DEFAULT_INTERVAL,
+        slow_threshold: float = DEFAULT_SLOW_THRESHOLD,
+    ) -> None:
+        """Initialize the monitor (not started).
+
+        Args:
+            interval: Seconds between lag probes.
+            slow_threshold: Seconds of unresponsiveness that counts as a stall.
+        """
+        self._interval = interval
+        self._slow_threshold = slow_threshold
+        self._lag_samples: deque[float] = deque(maxlen=self.LAG_WINDOW)
+        self._stalls: deque[LoopStall] = deque(maxlen=self.MAX_STALLS)
+        self._stall_count = 0
+
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._loop_thread_id: int | None = None
+        self._probe_task: asyncio.Task[None] | None = None
+        self._watchdog: threading.Thread | None = None
+        self._stop_event = threading.Event()
+
+        # Heartbeat state shared between the watchdog thread and the loop
+        self._lock = threading.Lock()
+        self._beat_posted_at: float | None = None
+        self._beat_posted_wall: float = 0.0
+        self._current_stall: LoopStall | None = None
+
+    @property
+    def interval(self) -> float:
+        """Seconds between lag probes."""
+        return self._interval
+
+    @property
+    def slow_threshold(self) -> float:
+        """Seconds of unresponsiveness that counts as a stall."""
+        return self._slow_threshold
+
+    @property
+    def is_running(self) -> bool:
+        """Whether the probe task is active."""
+        return self._probe_task is not None and not self._probe_task.done()
+
+    @property
+    def stall_count(self) -> int:
+        """Total stalls detected since start (including evicted records)."""
+        return self._stall_count
+
+    def start(self) -> None:
+        """Start the lag probe and watchdog on the running event loop.
+
+        Must be called from within the event loop (e.g., lifespan startup).
+        Calling start() on a running monitor is a no-op.
+        """
+        if self.is_running:
+            return
+
+        self._loop = asyncio.get_running_loop()
+        self._loop_thread_id = threading.get_ident()
+        self._stop_event.clear()
+        # A heartbeat posted to a previous loop is never acked on this one
+        with self._lock:
+            self._beat_posted_at = None
+            self._current_stall = None
+        self._probe_task = self._loop.create_task(self._probe())
+        self._watchdog = threading.Thread(
+            target=self._watch, name="loop-monitor-watchdog", daemon=True
+        )
+        self._watchdog.start()
+        logger.info(
+            "loop_monitor_started",
+            interval_ms=self._interval * 1000,
+            slow_threshold_ms=self._slow_threshold * 1000,
+        )
+
+    async def stop(self) -> None:
+        """Stop the probe task and watchdog thread."""
+        self._stop_event.set()
+        if self._probe_task is not None:
+            self._probe_task.cancel()
+            try:
+                await self._probe_task
+            except asyncio.CancelledError:
+                pass
+            self._probe_task = None
+        if self._watchdog is not None:
+            await asyncio.to_thread(self._watchdog.join, 1.0)
+            self._watchdog = None
+        logger.info("loop_monitor_stopped")
+
+    async def _probe(self) -> None:
+        """Sleep for the interval and record how late the loop wakes up."""
+        while True:
+            expected = time.monotonic() + self._interval
+            await asyncio.sleep(self._interval)
+            lag = max(0.0, time.monotonic() - expected)
+            self._lag_samples.append(lag * 1000)
+
+    def _watch(self) -> None:
+        """Watchdog thread: post heartbeats and sample the stack on stalls."""
+        check_interval = self._slow_threshold / 2
+        while not self._stop_event.wait(check_interval):
+            loop = self._loop
+            if loop is None or loop.is_closed():
+                return
+
+            now = time.monotonic()
+            with self._lock:
+                posted_at = self._beat_posted_at
+                if posted_at is None:
+                    self._beat_posted_at = now
+                    self._beat_posted_wall = time.time()
+                    try:
+                        loop.call_soon_threadsafe(self._ack)
+                    except RuntimeError:
+                        # Loop closed between the check and the post
+                        return
+                    continue
+
+                if self._current_stall is None and now - posted_at >= self._slow_threshold:
+                    self._current_stall = LoopStall(
+                        started_at=self._beat_posted_wall,
+                        duration_ms=None,
+                        stack=self._capture_loop_stack(),
+                    )
+
+    def _ack(self) -> None:
+        """Heartbeat callback run on the loop; closes out any open stall."""
+        with self._lock:
+            posted_at = self._beat_posted_at
+            self._beat_posted_at = None
+            stall = self._current_stall
+            self._current_stall = None
+
+        if stall is not None and posted_at is not None:
+            stall.duration_ms = (time.monotonic() - posted_at) * 1000
+            self._stalls.append(stall)
+            self._stall_count += 1
+            logger.warning(
+                "event_loop_stalled",
+                duration_ms=round(stall.duration_ms, 1),
+                location=stall.stack[-1] if stall.stack else None,
+            )
+
+    def _capture_loop_stack(self) -> list[str]:
+        """Format the loop thread's current stack, outermost frame first."""
+        if self._loop_thread_id is None:
+            return []
+        frame = sys._current_frames().get(self._loop_thread_id)  # pyright: ignore[reportPrivateUsage]
+        if frame is None:
+            return []
+        summary = traceback.extract_stack(frame, limit=self.MAX_STACK_DEPTH)
+        return [f"{f.filename}:{f.lineno} in {f.name}" for f in summary]
+
+    def get_lag_summary(self) -> LagSummary:
+        """Get scheduling delay percentiles over the recent window."""
+        values = sorted(self._lag_samples)
+        if not values:
+            return LagSummary(0, None, None, None, None, None)
+        return LagSummary(
+            samples=len(values),
+            mean_ms=sum(values) / len(values),
+            p50_ms=_percentile(values, 0.50),
+            p90_ms=_percentile(values, 0.90),
+            p99_ms=_percentile(values, 0.99),
+            max_ms=values[-1],
+        )
+
+    def get_stalls(self) -> list[LoopStall]:
+        """Get recorded stalls, most recent first.
+
+        Includes the in-progress stall (duration None) if the loop is
+        currently blocked.
+        """
+        stalls = list(reversed(self._stalls))
+        with self._lock:
+            current = self._current_stall
+        if current is not None:
+            stalls.insert(0, current)
+        return stalls
+
+    def clear(self) -> None:
+        """Clear recorded lag samples and stalls."""
+        self._lag_samples.clear()
+        self._stalls.clear()
+        self._stall_count = 0
+
+
+# Module-level singleton
+_loop_monitor: LoopMonitor | None = None
+
+
+def get_loop_monitor() -> LoopMonitor:
+    """Get or create the loop monitor singleton.
+
+    Returns:
+        LoopMonitor instance.
+    """
+    global _loop_monitor
+    if _loop_monitor is None:
+        _loop_monitor = LoopMonitor()
+    return _loop_monitor
+
+
+def reset_loop_monitor() -> None:
+    """Reset the loop monitor singleton.
+
+    Used for testing to ensure clean state between tests.
+    """
+    global _loop_monitor
+    _loop_monitor = None
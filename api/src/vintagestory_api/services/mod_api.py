@@ -6,7 +6,10 @@ mod database at mods.vintagestory.at, handling mod lookups and downloads.
 
 from __future__ import annotations
 
+import asyncio
+import json
 import re
+from collections.abc import Callable, Sequence
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 from pathlib import Path
@@ -16,11 +19,28 @@ from urllib.parse import urlparse
 import httpx
 import structlog
 
+from vintagestory_api.services.content_store import ContentStore, sha256_file
+from vintagestory_api.services.downloads import download_file
+from vintagestory_api.services.http_client import get_outbound_http
+from vintagestory_api.services.single_flight import SingleFlight
+from vintagestory_api.services.ttl_cache import TtlLruCache
+
 if TYPE_CHECKING:
     from vintagestory_api.services.cache_eviction import CacheEvictionService
+    from vintagestory_api.services.mod_index import (
+        BrowseQuery,
+        ModCatalogIndex,
+        QueryResultCache,
+    )
 
 logger = structlog.get_logger()
 
+# Catalog single-flight keys. The cold disk load is its own flight so a
+# forced refresh never joins it (and gets the stale on-disk list back);
+# all upstream fetches (forced, background and cold) share one flight.
+CATALOG_LOAD_FLIGHT = "catalog:load"
+CATALOG_FETCH_FLIGHT = "catalog:fetch"
+
 # Type alias for compatibility status
 CompatibilityStatus = Literal["compatible", "not_verified", "incompatible"]
 
@@ -51,6 +71,20 @@ class DownloadResult:
     asset_id: int
     """Unique asset ID for constructing reliable moddb URLs."""
 
+    sha256: str | None = None
+    """SHA-256 of the file; path is its content-addressed cache location."""
+
+
+@dataclass(frozen=True)
+class ModLookup:
+    """Cached result of a single mod lookup, with its HTTP validators."""
+
+    mod: ModDict | None
+    """Mod details, or None if the mod was not found."""
+
+    etag: str | None = None
+    last_modified: str | None = None
+
 
 class ModApiError(Exception):
     """Base exception for mod API errors."""
@@ -191,25 +225,94 @@ def check_compatibility(release: ReleaseDict, game_version: str) -> Compatibilit
     return "incompatible"
 
 
+def select_latest_compatible(
+    releases: Sequence[ReleaseDict], game_version: str
+) -> ReleaseDict | None:
+    """Pick the newest release that can run on the installed game version.
+
+    Args:
+        releases: Releases from the mod API (newest first).
+        game_version: Installed game version (e.g., "1.21.3").
+
+    Returns:
+        The newest "compatible" release, else the newest "not_verified"
+        one, else None if every release is incompatible.
+    """
+    not_verified: ReleaseDict | None = None
+    for release in releases:
+        status = check_compatibility(release, game_version)
+        if status == "compatible":
+            return release
+        if status == "not_verified" and not_verified is None:
+            not_verified = release
+    return not_verified
+
+
+def is_newer_release(releases: Sequence[ReleaseDict], candidate: str, installed: str) -> bool:
+    """Check whether a release version is newer than the installed version.
+
+    Uses the API's release order (newest first). If the installed version is
+    not among the releases (e.g., a removed release), any other listed
+    version is treated as newer.
+
+    Args:
+        releases: Releases from the mod API (newest first).
+        candidate: Version string of the candidate release.
+        installed: Installed version string.
+
+    Returns:
+        True if candidate is listed before the installed version.
+    """
+    if candidate == installed:
+        return False
+    versions = [r.get("modversion") for r in releases]
+    if candidate not in versions:
+        return False
+    if installed not in versions:
+        return True
+    return versions.index(candidate) < versions.index(installed)
+
+
 class ModApiClient:
     """Async client for VintageStory mod database API.
 
     Provides methods for looking up mods and downloading mod files
-    from mods.vintagestory.at.
+    from mods.vintagestory.at, over the shared outbound HTTP client
+    (VS_HTTP_API_TIMEOUT and VS_HTTP_DOWNLOAD_TIMEOUT set the timeouts).
 
     Attributes:
         BASE_URL: Base URL for the mod API.
         DOWNLOAD_URL: URL for file downloads.
-        DEFAULT_TIMEOUT: Default timeout for API calls (30s).
-        DOWNLOAD_TIMEOUT: Timeout for file downloads (120s).
-        BROWSE_CACHE_TTL: Cache TTL for browse mod list (5 minutes).
+        DOWNLOAD_MAX_ATTEMPTS: Attempts per file download; interrupted
+            downloads resume from the partial file.
+        BROWSE_CACHE_TTL: Age after which the browse mod list is revalidated
+            in the background (5 minutes).
+        BROWSE_REFRESH_RETRY: Minimum delay between background refresh
+            attempts after a failure (1 minute).
+        VERSION_CACHE_MAX_ENTRIES: Game versions whose mod lists are cached.
+        VERSION_CACHE_MAX_BYTES: Upper bound on cached per-version mod lists,
+            measured as upstream response size (32 MB).
+        MOD_CACHE_TTL: Age after which a cached mod lookup is revalidated
+            (10 minutes).
+        MOD_MISS_TTL: How long a "mod not found" result is remembered
+            (1 minute).
+        MOD_CACHE_MAX_ENTRIES: Mod lookups kept in memory.
+        CATALOG_FILE: Persisted browse mod list, relative to the cache dir.
+        CATALOG_META_FILE: Fetch time and HTTP validators for CATALOG_FILE.
     """
 
     BASE_URL = "https://mods.vintagestory.at/api"
     DOWNLOAD_URL = "https://mods.vintagestory.at/download"
-    DEFAULT_TIMEOUT = 30.0
-    DOWNLOAD_TIMEOUT = 120.0
+    DOWNLOAD_MAX_ATTEMPTS = 3
     BROWSE_CACHE_TTL = timedelta(minutes=5)
+    BROWSE_REFRESH_RETRY = timedelta(minutes=1)
+    VERSION_CACHE_MAX_ENTRIES = 8
+    VERSION_CACHE_MAX_BYTES = 32 * 1024 * 1024
+    MOD_CACHE_TTL = timedelta(minutes=10)
+    MOD_MISS_TTL = timedelta(minutes=1)
+    MOD_CACHE_MAX_ENTRIES = 256
+    CATALOG_FILE = "mod_catalog.json"
+    CATALOG_META_FILE = "mod_catalog.meta.json"
     GAMEVERSIONS_CACHE_TTL = timedelta(hours=1)
 
     def __init__(
@@ -227,35 +330,81 @@ class ModApiClient:
         self._cache_dir = cache_dir
         self._mods_cache = cache_dir / "mods"
         self._mods_cache.mkdir(parents=True, exist_ok=True)
+        self._content_store = ContentStore(self._mods_cache)
         self._client: httpx.AsyncClient | None = None
         self._cache_eviction = cache_eviction_service
 
         # In-memory cache for browse mod list
         self._browse_cache: list[ModDict] | None = None
         self._browse_cache_time: datetime | None = None
+        # HTTP validators for conditional revalidation of the mod list
+        self._browse_etag: str | None = None
+        self._browse_last_modified: str | None = None
+        # Persisted copy of the mod list (loaded once, rewritten on refresh)
+        self._catalog_path = cache_dir / self.CATALOG_FILE
+        self._catalog_meta_path = cache_dir / self.CATALOG_META_FILE
+        self._catalog_loaded = False
+        # Last catalog refresh failure (for retry backoff)
+        self._catalog_refresh_failed_at: datetime | None = None
+
+        # Single-flight groups: concurrent callers for the same key share
+        # one upstream request
+        self._catalog_flight: SingleFlight[str, list[ModDict]] = SingleFlight("mod_catalog")
+        self._gameversions_flight: SingleFlight[str, dict[str, int]] = SingleFlight(
+            "gameversions"
+        )
+        self._mod_flight: SingleFlight[str, ModDict | None] = SingleFlight("mod")
+        self._version_flight: SingleFlight[int, list[ModDict]] = SingleFlight(
+            "mods_by_version"
+        )
+
+        # Per-game-version mod lists (LRU, served stale-while-revalidate) and
+        # their search indexes
+        self._version_cache: TtlLruCache[int, list[ModDict]] = TtlLruCache(
+            "mods_by_version",
+            max_entries=self.VERSION_CACHE_MAX_ENTRIES,
+            max_bytes=self.VERSION_CACHE_MAX_BYTES,
+        )
+        self._version_indexes: dict[int, ModCatalogIndex] = {}
+        # Per-slug mod lookups, including "not found" results
+        self._mod_cache: TtlLruCache[str, ModLookup] = TtlLruCache(
+            "mod_lookup", max_entries=self.MOD_CACHE_MAX_ENTRIES
+        )
+        # Search/facet index over _browse_cache, rebuilt when the list changes.
+        # Each rebuild bumps the generation, which keys the query result cache.
+        self._browse_index: ModCatalogIndex | None = None
+        self._browse_generation = 0
+        self._browse_results: QueryResultCache | None = None
 
         # In-memory cache for game versions list
         self._gameversions_cache: dict[str, int] | None = None
         self._gameversions_cache_time: datetime | None = None
 
     async def _get_client(self) -> httpx.AsyncClient:
-        """Get or create the HTTP client."""
-        if self._client is None:
-            self._client = httpx.AsyncClient(
-                timeout=self.DEFAULT_TIMEOUT,
-                follow_redirects=True,
-            )
+        """Get the shared outbound HTTP client (API timeout by default)."""
+        if self._client is None or self._client.is_closed:
+            self._client = get_outbound_http().client
         return self._client
 
     async def close(self) -> None:
-        """Close the HTTP client."""
-        if self._client is not None:
-            await self._client.aclose()
-            self._client = None
+        """Cancel in-flight upstream calls and release the HTTP client.
+
+        The shared connection pool itself is closed at application shutdown.
+        """
+        await self._catalog_flight.cancel_all()
+        await self._gameversions_flight.cancel_all()
+        await self._mod_flight.cancel_all()
+        await self._version_flight.cancel_all()
+        self._client = None
 
     async def get_mod(self, slug: str) -> ModDict | None:
         """Get mod details by slug.
 
+        Lookups are cached per slug: found mods for MOD_CACHE_TTL and
+        "not found" results for MOD_MISS_TTL. An expired lookup is
+        revalidated with a conditional request, and concurrent lookups for
+        the same slug share one request.
+
         Args:
             slug: URL-friendly mod identifier (e.g., "smithingplus").
 
@@ -273,18 +422,50 @@ class ModApiClient:
             logger.warning("invalid_slug", slug=slug)
             return None
 
+        entry = self._mod_cache.get(slug)
+        if entry is not None and entry.is_fresh():
+            logger.debug("mod_cache_hit", slug=slug, found=entry.value.mod is not None)
+            return entry.value.mod
+
+        cached = entry.value if entry is not None else None
+        return await self._mod_flight.do(slug, lambda: self._fetch_mod(slug, cached))
+
+    async def _fetch_mod(self, slug: str, cached: ModLookup | None = None) -> ModDict | None:
+        """Fetch (or revalidate) mod details for a validated slug and cache them."""
+        headers: dict[str, str] = {}
+        if cached is not None and cached.mod is not None:
+            if cached.etag:
+                headers["If-None-Match"] = cached.etag
+            if cached.last_modified:
+                headers["If-Modified-Since"] = cached.last_modified
+
         client = await self._get_client()
         try:
-            response = await client.get(f"{self.BASE_URL}/mod/{slug}")
+            response = await client.get(f"{self.BASE_URL}/mod/{slug}", headers=headers)
+
+            if response.status_code == 304 and cached is not None and cached.mod is not None:
+                logger.debug("mod_lookup_revalidated", slug=slug)
+                self._cache_mod_lookup(slug, cached, len(response.content))
+                return cached.mod
+
             data = response.json()
 
             # CRITICAL: statuscode is STRING, not int!
             if data.get("statuscode") == "200":
                 logger.debug("mod_lookup_success", slug=slug)
-                return data["mod"]
+                lookup = ModLookup(
+                    mod=data["mod"],
+                    etag=response.headers.get("etag"),
+                    last_modified=response.headers.get("last-modified"),
+                )
+                self._cache_mod_lookup(slug, lookup, len(response.content))
+                return lookup.mod
 
             if data.get("statuscode") == "404":
                 logger.debug("mod_not_found", slug=slug)
+                self._mod_cache.put(
+                    slug, ModLookup(mod=None), ttl=self.MOD_MISS_TTL.total_seconds()
+                )
                 return None
 
             # Unexpected status
@@ -311,21 +492,83 @@ class ModApiClient:
                 f"VintageStory mod API error: {e}"
             ) from e
 
+    def _cache_mod_lookup(self, slug: str, lookup: ModLookup, size_bytes: int) -> None:
+        """Cache a found mod under the requested slug and its known aliases.
+
+        The mod may be requested by urlalias and then installed by
+        modidstrs[0] (what lookup_mod() reports), so both resolve to the
+        same entry. Only the requested slug carries the size.
+        """
+        ttl = self.MOD_CACHE_TTL.total_seconds()
+        self._mod_cache.put(slug, lookup, ttl=ttl, size_bytes=size_bytes)
+        mod = lookup.mod or {}
+        aliases = {mod.get("urlalias"), *(mod.get("modidstrs") or [])}
+        for alias in aliases:
+            if isinstance(alias, str) and alias != slug and validate_slug(alias):
+                self._mod_cache.put(alias, lookup, ttl=ttl)
+
+    def _revalidate_mods_from_catalog(self, mods: list[ModDict]) -> None:
+        """Revalidate cached mod lookups against a freshly fetched catalog.
+
+        The catalog carries each mod's lastreleased time. A cached mod with
+        the same lastreleased cannot have gained a release, so it is marked
+        fresh without a request; one with a newer release is dropped.
+        Cached "not found" results for slugs now in the catalog are dropped.
+        """
+        if not len(self._mod_cache):
+            return
+
+        by_modid: dict[Any, ModDict] = {}
+        slugs: set[str] = set()
+        for mod in mods:
+            by_modid[mod.get("modid")] = mod
+            slugs.add(str(mod.get("urlalias")))
+            slugs.update(str(s) for s in mod.get("modidstrs") or [])
+
+        renewed = dropped = 0
+        ttl = self.MOD_CACHE_TTL.total_seconds()
+        for slug, entry in self._mod_cache.items():
+            cached = entry.value.mod
+            if cached is None:
+                if slug in slugs:
+                    self._mod_cache.pop(slug)
+                    dropped += 1
+                continue
+            listed = by_modid.get(cached.get("modid"))
+            if listed is None or "lastreleased" not in listed:
+                continue
+            if listed["lastreleased"] == cached.get("lastreleased"):
+                self._mod_cache.put(slug, entry.value, ttl=ttl, size_bytes=entry.size_bytes)
+                renewed += 1
+            else:
+                self._mod_cache.pop(slug)
+                dropped += 1
+
+        logger.debug("mod_cache_revalidated_from_catalog", renewed=renewed, dropped=dropped)
+
+    def clear_mod_cache(self) -> None:
+        """Clear cached mod lookups (found and not found)."""
+        self._mod_cache.clear()
+        logger.debug("mod_cache_cleared")
+
     async def download_mod(
         self,
         slug: str,
         version: str | None = None,
+        evict: bool = True,
     ) -> DownloadResult | None:
         """Lookup mod, select release, and download to cache.
 
         This is the full download flow:
         1. Lookup mod by slug
         2. Select release (latest or specific version)
-        3. Download file to cache with atomic write
+        3. Download file to the content-addressed cache (stored by SHA-256)
 
         Args:
             slug: Mod slug (e.g., "smithingplus").
             version: Specific version to download, or None for latest.
+            evict: Run cache eviction after the download. Batch callers
+                pass False and evict once when the batch is done.
 
         Returns:
             DownloadResult with path and metadata, or None on failure.
@@ -361,38 +604,41 @@ class ModApiClient:
                 raise ModVersionNotFoundError(slug, version)
             logger.debug("selected_specific_version", slug=slug, version=version)
 
-        # 3. Download file
+        # 3. Download file (resumes a partial .part from an earlier attempt)
         fileid = release["fileid"]
         filename = release["filename"]
-        dest_path = self._mods_cache / filename
-        temp_path = dest_path.with_suffix(".tmp")
+        download_path = self._mods_cache / filename
 
         client = await self._get_client()
         try:
-            async with client.stream(
-                "GET",
+            stats = await download_file(
+                client,
                 f"{self.DOWNLOAD_URL}?fileid={fileid}",
-                timeout=self.DOWNLOAD_TIMEOUT,
-            ) as response:
-                response.raise_for_status()
-
-                with open(temp_path, "wb") as f:
-                    async for chunk in response.aiter_bytes(chunk_size=8192):
-                        f.write(chunk)
+                download_path,
+                timeout=get_outbound_http().download_timeout,
+                max_attempts=self.DOWNLOAD_MAX_ATTEMPTS,
+            )
 
-            # Atomic rename
-            temp_path.rename(dest_path)
+            # Atomic rename into the content-addressed store
+            sha256 = await asyncio.to_thread(sha256_file, download_path)
+            dest_path = await asyncio.to_thread(self._content_store.add, download_path, sha256)
+            if self._cache_eviction is not None:
+                # New download or deduplicated hit: now the most recently used
+                await asyncio.to_thread(self._cache_eviction.record, dest_path)
 
             logger.info(
                 "mod_download_complete",
                 slug=slug,
                 version=release["modversion"],
                 filename=filename,
+                sha256=sha256,
+                resumed_bytes=stats.resumed_bytes,
+                attempts=stats.attempts,
             )
 
             # Run cache eviction after successful download
-            if self._cache_eviction is not None:
-                eviction_result = self._cache_eviction.evict_if_needed()
+            if evict and self._cache_eviction is not None:
+                eviction_result = await asyncio.to_thread(self._cache_eviction.evict_if_needed)
                 if eviction_result.files_evicted > 0:
                     logger.debug(
                         "cache_eviction_after_download",
@@ -406,26 +652,19 @@ class ModApiClient:
                 version=release["modversion"],
                 release=release,
                 asset_id=int(mod.get("assetid", 0)),
+                sha256=sha256,
             )
 
+        # The partial download is kept so a later attempt can resume it
         except httpx.TimeoutException:
-            # Cleanup partial download
-            if temp_path.exists():
-                temp_path.unlink()
             logger.error("mod_download_timeout", slug=slug, fileid=fileid)
             raise DownloadError(slug, "Download timed out")
 
         except httpx.HTTPError as e:
-            # Cleanup partial download
-            if temp_path.exists():
-                temp_path.unlink()
             logger.error("mod_download_failed", slug=slug, fileid=fileid, error=str(e))
             raise DownloadError(slug, str(e))
 
         except OSError as e:
-            # Cleanup partial download
-            if temp_path.exists():
-                temp_path.unlink()
             logger.error("mod_download_io_error", slug=slug, error=str(e))
             raise DownloadError(slug, f"IO error: {e}")
 
@@ -442,26 +681,108 @@ class ModApiClient:
     async def get_all_mods(self, force_refresh: bool = False) -> list[ModDict]:
         """Get all mods from the VintageStory mod database.
 
-        This method fetches the complete mod list from the API and caches
-        it in memory for 5 minutes to avoid hammering the external API.
+        The mod list is kept in memory and persisted to disk with its fetch
+        time and HTTP validators, and served stale-while-revalidate:
+
+        - Fresh list (younger than BROWSE_CACHE_TTL): returned directly.
+        - Stale list (in memory, or loaded from disk after a restart):
+          returned immediately while a background refresh revalidates it.
+          A failed refresh keeps serving the old list.
+        - No list at all (first run, or after clear_browse_cache()):
+          fetched before returning.
 
         Args:
-            force_refresh: If True, bypass the cache and fetch fresh data.
+            force_refresh: If True, wait for a fresh (revalidated) list.
 
         Returns:
             List of mod dictionaries from the API.
 
         Raises:
-            ExternalApiError: If the mod API is unavailable.
+            ExternalApiError: If the list has to be fetched and the mod API
+                is unavailable.
         """
-        # Return cached data if valid and not forcing refresh
-        if not force_refresh and self._is_browse_cache_valid():
-            logger.debug("browse_cache_hit", count=len(self._browse_cache or []))
-            return self._browse_cache or []
+        if force_refresh:
+            return await self._catalog_flight.do(CATALOG_FETCH_FLIGHT, self._fetch_catalog)
+
+        mods = self._browse_cache
+        if mods is None:
+            # Cold: every concurrent caller shares one disk load / upstream fetch
+            mods = await self._catalog_flight.do(CATALOG_LOAD_FLIGHT, self._load_or_fetch_catalog)
+
+        if self._is_browse_cache_valid():
+            logger.debug("browse_cache_hit", count=len(mods))
+        elif self._should_refresh_in_background():
+            logger.debug("browse_cache_stale", count=len(mods))
+            self._start_catalog_refresh()
+        return mods
+
+    async def warm_catalog(self) -> None:
+        """Load the persisted mod list and revalidate it in the background.
+
+        Called at startup so the first browse request is served from disk
+        instead of waiting on the upstream fetch.
+        """
+        if self._browse_cache is None and not self._catalog_loaded:
+            await self._load_persisted_catalog()
+        if not self._is_browse_cache_valid():
+            self._start_catalog_refresh()
+
+    async def _load_or_fetch_catalog(self) -> list[ModDict]:
+        """Load the persisted mod list on first use, else fetch it upstream."""
+        if not self._catalog_loaded:
+            await self._load_persisted_catalog()
+            if self._browse_cache is not None:
+                return self._browse_cache
+        return await self._catalog_flight.do(CATALOG_FETCH_FLIGHT, self._fetch_catalog)
+
+    def _should_refresh_in_background(self) -> bool:
+        """Whether a stale list should trigger a refresh (respects failure backoff)."""
+        failed_at = self._catalog_refresh_failed_at
+        return failed_at is None or datetime.now() - failed_at >= self.BROWSE_REFRESH_RETRY
+
+    def _start_catalog_refresh(self) -> asyncio.Task[list[ModDict]]:
+        """Start a catalog refresh, or join the one already in flight."""
+        return self._catalog_flight.start(CATALOG_FETCH_FLIGHT, self._fetch_catalog)
+
+    async def _fetch_catalog(self) -> list[ModDict]:
+        """Fetch the mod list, recording failures for the refresh backoff."""
+        try:
+            mods = await self._request_catalog()
+        except ExternalApiError as e:
+            self._catalog_refresh_failed_at = datetime.now()
+            logger.warning(
+                "browse_catalog_refresh_failed",
+                error=str(e),
+                serving_stale=self._browse_cache is not None,
+            )
+            raise
+        self._catalog_refresh_failed_at = None
+        self._revalidate_mods_from_catalog(mods)
+        return mods
+
+    async def _request_catalog(self) -> list[ModDict]:
+        """Fetch (or revalidate) the mod list and persist it.
+
+        Sends If-None-Match / If-Modified-Since when a list is already held,
+        so an unchanged upstream list costs a 304 instead of a full download.
+        """
+        headers: dict[str, str] = {}
+        if self._browse_cache is not None:
+            if self._browse_etag:
+                headers["If-None-Match"] = self._browse_etag
+            if self._browse_last_modified:
+                headers["If-Modified-Since"] = self._browse_last_modified
 
         client = await self._get_client()
         try:
-            response = await client.get(f"{self.BASE_URL}/mods")
+            response = await client.get(f"{self.BASE_URL}/mods", headers=headers)
+
+            if response.status_code == 304 and self._browse_cache is not None:
+                self._browse_cache_time = datetime.now()
+                logger.debug("browse_cache_revalidated", count=len(self._browse_cache))
+                await asyncio.to_thread(self._write_catalog_meta)
+                return self._browse_cache
+
             data = response.json()
 
             # CRITICAL: statuscode is STRING, not int!
@@ -469,7 +790,10 @@ class ModApiClient:
                 mods = data.get("mods", [])
                 self._browse_cache = mods
                 self._browse_cache_time = datetime.now()
+                self._browse_etag = response.headers.get("etag")
+                self._browse_last_modified = response.headers.get("last-modified")
                 logger.debug("browse_cache_refreshed", count=len(mods))
+                await asyncio.to_thread(self._persist_catalog, mods)
                 return mods
 
             # Unexpected status - log and raise
@@ -497,21 +821,199 @@ class ModApiClient:
                 f"VintageStory mod API error: {e}"
             ) from e
 
+        except ValueError as e:
+            logger.error("mod_api_json_error_browse")
+            raise ExternalApiError("VintageStory mod API returned invalid JSON") from e
+
+    async def _load_persisted_catalog(self) -> None:
+        """Load the persisted mod list into memory (at most once)."""
+        self._catalog_loaded = True
+        loaded = await asyncio.to_thread(self._read_catalog)
+        if loaded is None or self._browse_cache is not None:
+            return
+        mods, meta = loaded
+        self._browse_cache = mods
+        fetched_at = meta.get("fetched_at")
+        try:
+            self._browse_cache_time = (
+                datetime.fromisoformat(fetched_at) if isinstance(fetched_at, str) else None
+            )
+        except ValueError:
+            self._browse_cache_time = None
+        self._browse_etag = meta.get("etag")
+        self._browse_last_modified = meta.get("last_modified")
+        logger.info(
+            "browse_catalog_loaded",
+            count=len(mods),
+            fetched_at=fetched_at,
+            stale=not self._is_browse_cache_valid(),
+        )
+
+    def _read_catalog(self) -> tuple[list[ModDict], dict[str, Any]] | None:
+        """Read the persisted mod list and metadata (runs in a worker thread)."""
+        if not self._catalog_path.exists():
+            return None
+        try:
+            mods = json.loads(self._catalog_path.read_text())
+        except (OSError, ValueError) as e:
+            logger.warning("browse_catalog_load_failed", error=str(e))
+            return None
+        if not isinstance(mods, list):
+            logger.warning("browse_catalog_load_failed", error="not a list")
+            return None
+        try:
+            meta = json.loads(self._catalog_meta_path.read_text())
+        except (OSError, ValueError):
+            # Without metadata the list is treated as stale and revalidated
+            meta = {}
+        return mods, meta if isinstance(meta, dict) else {}  # pyright: ignore[reportUnknownVariableType]
+
+    def _persist_catalog(self, mods: list[ModDict]) -> None:
+        """Atomically write the mod list and its metadata (worker thread)."""
+        try:
+            temp_file = self._catalog_path.with_suffix(".tmp")
+            temp_file.write_text(json.dumps(mods))
+            temp_file.replace(self._catalog_path)
+        except OSError as e:
+            logger.warning("browse_catalog_persist_failed", error=str(e))
+            return
+        self._write_catalog_meta()
+
+    def _write_catalog_meta(self) -> None:
+        """Atomically write fetch time and validators (worker thread)."""
+        meta = {
+            "fetched_at": self._browse_cache_time.isoformat()
+            if self._browse_cache_time
+            else None,
+            "etag": self._browse_etag,
+            "last_modified": self._browse_last_modified,
+            "count": len(self._browse_cache or []),
+        }
+        try:
+            temp_file = self._catalog_meta_path.with_suffix(".tmp")
+            temp_file.write_text(json.dumps(meta))
+            temp_file.replace(self._catalog_meta_path)
+        except OSError as e:
+            logger.warning("browse_catalog_persist_failed", error=str(e))
+
+    async def get_catalog_index(
+        self, force_refresh: bool = False, version_tagid: int | None = None
+    ) -> ModCatalogIndex:
+        """Get the search index for the full mod catalog or a version's mods.
+
+        The index (including the presorted permutation for every sort
+        order) is built once per list refresh, in a worker thread so the
+        event loop is not blocked, and reused until the underlying list is
+        replaced.
+
+        Args:
+            force_refresh: If True, refetch the full catalog before indexing.
+            version_tagid: Index the mods for this game version tagid instead
+                of the full catalog.
+
+        Returns:
+            ModCatalogIndex over the current list.
+
+        Raises:
+            ExternalApiError: If the mod API is unavailable.
+        """
+        # Import here to avoid circular import (mod_index uses this module's helpers)
+        from vintagestory_api.services.mod_index import ModCatalogIndex
+
+        if version_tagid is not None:
+            mods = await self.get_mods_by_version(version_tagid)
+            index = self._version_indexes.get(version_tagid)
+        else:
+            mods = await self.get_all_mods(force_refresh=force_refresh)
+            index = self._browse_index
+
+        if index is None or index.mods is not mods:
+            self._browse_generation += 1
+            index = await asyncio.to_thread(ModCatalogIndex, mods, self._browse_generation)
+            # Only publish if the list was not replaced while indexing
+            if version_tagid is not None:
+                entry = self._version_cache.get(version_tagid)
+                if entry is not None and entry.value is mods:
+                    self._version_indexes[version_tagid] = index
+                # Drop indexes whose lists were evicted
+                for tagid in [t for t in self._version_indexes if t not in self._version_cache]:
+                    del self._version_indexes[tagid]
+            elif self._browse_cache is mods:
+                self._browse_index = index
+            logger.debug(
+                "browse_index_built",
+                count=len(index),
+                generation=index.generation,
+                version_tagid=version_tagid,
+            )
+        return index
+
+    async def query_catalog(
+        self, query: BrowseQuery, version_tagid: int | None = None
+    ) -> tuple[ModCatalogIndex, Sequence[int]]:
+        """Run a browse query against the catalog (or a version's) index.
+
+        Sorted result ID lists are kept in a small LRU keyed by catalog
+        generation and normalized query, so paging through the same query
+        only costs the page slice.
+
+        Args:
+            query: Normalized search, facet and sort parameters.
+            version_tagid: Query the mods for this game version tagid
+                instead of the full catalog.
+
+        Returns:
+            Tuple of (index, matching mod IDs in the requested sort order).
+            Resolve IDs with index.get_mods().
+
+        Raises:
+            ExternalApiError: If the mod API is unavailable.
+        """
+        from vintagestory_api.services.mod_index import QueryResultCache
+
+        index = await self.get_catalog_index(version_tagid=version_tagid)
+        if self._browse_results is None:
+            self._browse_results = QueryResultCache()
+
+        mod_ids = self._browse_results.get(index.generation, query)
+        if mod_ids is None:
+            mod_ids = index.query(
+                search=query.search,
+                side=query.side,
+                mod_type=query.mod_type,
+                tags=query.tags or None,
+                sort_by=query.sort,
+            )
+            mod_ids = self._browse_results.put(index.generation, query, mod_ids)
+        return index, mod_ids
+
     def clear_browse_cache(self) -> None:
-        """Clear the browse mod list cache.
+        """Clear the browse mod list caches (full catalog and per version).
 
-        This forces the next call to get_all_mods() to fetch fresh data.
+        This forces the next call to get_all_mods() to fetch fresh data
+        (the persisted copy is not reloaded, and no validators are sent).
         """
         self._browse_cache = None
         self._browse_cache_time = None
+        self._browse_etag = None
+        self._browse_last_modified = None
+        self._catalog_loaded = True
+        self._browse_index = None
+        self._version_cache.clear()
+        self._version_indexes.clear()
+        if self._browse_results is not None:
+            self._browse_results.clear()
         logger.debug("browse_cache_cleared")
 
     async def get_mods_by_version(self, version_tagid: int) -> list[ModDict]:
         """Get mods filtered by game version from the VintageStory mod database.
 
         This method fetches mods compatible with a specific game version using
-        the API's server-side filtering. Results are NOT cached since they vary
-        by version.
+        the API's server-side filtering. Results are kept in a bounded LRU
+        keyed by version tagid and served like the full catalog: fresh lists
+        are returned directly, stale ones are returned immediately while a
+        background refresh revalidates them, and concurrent fetches for the
+        same version are coalesced. A failed refresh keeps the old list.
 
         Args:
             version_tagid: The game version tagid to filter by.
@@ -520,8 +1022,49 @@ class ModApiClient:
             List of mod dictionaries compatible with the specified version.
 
         Raises:
-            ExternalApiError: If the mod API is unavailable.
+            ExternalApiError: If the list is not cached and the mod API is
+                unavailable.
         """
+        entry = self._version_cache.get(version_tagid)
+        if entry is None:
+            return await self._version_flight.do(
+                version_tagid, lambda: self._fetch_mods_by_version(version_tagid)
+            )
+
+        if entry.is_fresh():
+            logger.debug("mods_by_version_cache_hit", version_tagid=version_tagid)
+        else:
+            logger.debug("mods_by_version_cache_stale", version_tagid=version_tagid)
+            self._version_flight.start(
+                version_tagid, lambda: self._refresh_mods_by_version(version_tagid)
+            )
+        return entry.value
+
+    async def _refresh_mods_by_version(self, version_tagid: int) -> list[ModDict]:
+        """Background refresh of a cached version list; failures keep old data."""
+        try:
+            return await self._fetch_mods_by_version(version_tagid)
+        except ExternalApiError as e:
+            entry = self._version_cache.get(version_tagid)
+            if entry is None:
+                raise
+            # Keep serving the old list; retry after the backoff instead of
+            # on every request
+            self._version_cache.put(
+                version_tagid,
+                entry.value,
+                ttl=self.BROWSE_REFRESH_RETRY.total_seconds(),
+                size_bytes=entry.size_bytes,
+            )
+            logger.warning(
+                "mods_by_version_refresh_failed",
+                version_tagid=version_tagid,
+                error=str(e),
+            )
+            return entry.value
+
+    async def _fetch_mods_by_version(self, version_tagid: int) -> list[ModDict]:
+        """Fetch a version's mod list from the API and cache it."""
         client = await self._get_client()
         try:
             response = await client.get(
@@ -553,10 +1096,17 @@ class ModApiClient:
             # CRITICAL: statuscode is STRING, not int!
             if data.get("statuscode") == "200":
                 mods = data.get("mods", [])
+                self._version_cache.put(
+                    version_tagid,
+                    mods,
+                    ttl=self.BROWSE_CACHE_TTL.total_seconds(),
+                    size_bytes=len(response.content),
+                )
                 logger.debug(
                     "mods_by_version_fetched",
                     version_tagid=version_tagid,
                     count=len(mods),
+                    cached_bytes=self._version_cache.total_bytes,
                 )
                 return mods
 
@@ -626,6 +1176,10 @@ class ModApiClient:
             )
             return self._gameversions_cache or {}
 
+        return await self._gameversions_flight.do("gameversions", self._fetch_game_versions)
+
+    async def _fetch_game_versions(self) -> dict[str, int]:
+        """Fetch the game versions list from the API and cache it."""
         client = await self._get_client()
         try:
             response = await client.get(f"{self.BASE_URL}/gameversions")
@@ -714,6 +1268,20 @@ def _get_recent(m: ModDict) -> str:
     return str(m.get("lastreleased", ""))
 
 
+def _get_name(m: ModDict) -> str:
+    """Get lowercase name from mod dict."""
+    return m.get("name", "").lower()
+
+
+# Sort key and direction (reverse=True for descending) for each sort option
+SORT_KEYS: dict[SortOption, tuple[Callable[[ModDict], Any], bool]] = {
+    "downloads": (_get_downloads, True),
+    "trending": (_get_trending, True),
+    "recent": (_get_recent, True),
+    "name": (_get_name, False),
+}
+
+
 def sort_mods(
     mods: list[ModDict],
     sort_by: SortOption = "recent",
@@ -727,14 +1295,8 @@ def sort_mods(
     Returns:
         Sorted list of mods (descending order, except name which is ascending).
     """
-    if sort_by == "downloads":
-        return sorted(mods, key=_get_downloads, reverse=True)
-    elif sort_by == "trending":
-        return sorted(mods, key=_get_trending, reverse=True)
-    elif sort_by == "name":
-        return sorted(mods, key=lambda m: m.get("name", "").lower())
-    else:  # recent
-        return sorted(mods, key=_get_recent, reverse=True)
+    key, reverse = SORT_KEYS.get(sort_by, SORT_KEYS["recent"])
+    return sorted(mods, key=key, reverse=reverse)
 
 
 def search_mods(mods: list[ModDict], search: str) -> list[ModDict]:
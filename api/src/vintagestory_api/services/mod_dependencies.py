@@ -0,0 +1,319 @@
+"""Dependency resolution for mod installs.
+
+VintageStory mods declare the mods they need in modinfo.json as
+``"dependencies": {"<modid>": "<minimum version>"}``. The game only checks
+them at startup, so installing a mod without its library mods costs a full
+restart cycle per missing dependency. DependencyResolver walks the
+dependency closure of the mods being installed before anything is
+installed:
+
+- Installed mods are read from their cached modinfo.json in the state
+  directory.
+- Other mods are looked up in the mod database (lookups are cached), the
+  latest compatible release is downloaded to the download cache and its
+  modinfo.json is read on a worker thread. The downloads are returned so
+  the install can reuse them.
+- Each level of the closure is fetched concurrently (bounded), and parsed
+  dependencies are memoized per (modid, version), so resolving the same
+  mods again only costs the cached release lookups.
+
+Dependency versions are minimums; "" and "*" accept any version. The
+built-in game, survival and creative mods are always present.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import re
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+
+import structlog
+
+from vintagestory_api.models.mods import (
+    DependencyConflict,
+    DependencyPlan,
+    MissingDependency,
+    ModState,
+    PlannedMod,
+)
+from vintagestory_api.services.mod_api import (
+    DownloadResult,
+    ModApiClient,
+    ModNotFoundError,
+    ModVersionNotFoundError,
+    select_latest_compatible,
+)
+from vintagestory_api.services.mod_state import ModStateManager
+
+logger = structlog.get_logger()
+
+# Mods that ship with the game and are always present
+BUILTIN_MODIDS = frozenset({"game", "survival", "creative"})
+
+# Dependency versions that accept any installed version
+ANY_VERSION = frozenset({"", "*"})
+
+# Concurrent lookups/downloads per closure level
+MAX_CONCURRENT_RESOLVES = 8
+
+
+def version_key(version: str) -> tuple[tuple[int, ...], tuple[int, str]]:
+    """Build a sort key for a mod version string.
+
+    Numeric parts are compared numerically ("1.10.0" > "1.9.2", "1.2" ==
+    "1.2.0") and a pre-release suffix sorts before the release
+    ("1.0.0-rc.1" < "1.0.0").
+
+    Args:
+        version: Version string (e.g., "1.8.3", "v2.0.0-pre.1").
+
+    Returns:
+        Comparable key.
+    """
+    main, _, pre = version.strip().lstrip("vV").partition("-")
+    numbers = [int(n) for n in re.findall(r"\d+", main)]
+    while numbers and numbers[-1] == 0:
+        numbers.pop()
+    return tuple(numbers), (0, pre) if pre else (1, "")
+
+
+def satisfies(available: str, required: str) -> bool:
+    """Check whether an available version meets a dependency's minimum.
+
+    Args:
+        available: Installed or planned version.
+        required: Minimum version from modinfo.json ("" or "*" for any).
+
+    Returns:
+        True if the available version is at least the required one.
+    """
+    if required.strip() in ANY_VERSION:
+        return True
+    return version_key(available) >= version_key(required)
+
+
+@dataclass(frozen=True)
+class _ResolvedMod:
+    """A mod release with its declared dependencies."""
+
+    slug: str
+    modid: str
+    version: str
+    dependencies: dict[str, str]
+    installed: bool
+    download: DownloadResult | None = None
+
+
+@dataclass
+class Resolution:
+    """Result of a dependency resolution."""
+
+    plan: DependencyPlan
+    """Mods to install, satisfied, missing and conflicting dependencies."""
+
+    downloads: dict[str, DownloadResult] = field(default_factory=dict[str, DownloadResult])
+    """Releases downloaded while resolving, by slug, for reuse by the install."""
+
+
+class DependencyResolver:
+    """Resolves the dependency closure of mods to install."""
+
+    def __init__(
+        self,
+        api_client: ModApiClient,
+        state_manager: ModStateManager,
+        game_version: str,
+    ) -> None:
+        """Initialize the resolver.
+
+        Args:
+            api_client: Mod database client for lookups and downloads.
+            state_manager: Installed mods and cached modinfo.json.
+            game_version: Installed game version, or "" if unknown, used to
+                pick the release of a dependency.
+        """
+        self._api_client = api_client
+        self._state_manager = state_manager
+        self._game_version = game_version
+        # (modid or slug, version) -> (modid, dependencies)
+        self._memo: dict[tuple[str, str], tuple[str, dict[str, str]]] = {}
+
+    def clear(self) -> None:
+        """Forget memoized dependencies."""
+        self._memo.clear()
+
+    async def resolve(self, requests: Sequence[tuple[str, str | None]]) -> Resolution:
+        """Resolve the dependency closure of the requested mods.
+
+        Args:
+            requests: (slug, version or None for latest compatible) per mod.
+
+        Returns:
+            Resolution with the dependency plan and the downloads made.
+        """
+        installed = {state.slug.lower(): state for state in self._state_manager.list_mods()}
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_RESOLVES)
+
+        planned: dict[str, PlannedMod] = {}
+        resolved_as: dict[str, str] = {}
+        visited: set[str] = set()
+        queued: set[str] = set()
+        edges: list[tuple[str, str, str]] = []
+        missing: list[MissingDependency] = []
+        downloads: dict[str, DownloadResult] = {}
+
+        frontier: list[tuple[str, str | None, str | None]] = []
+        for slug, version in requests:
+            if slug.lower() not in queued:
+                queued.add(slug.lower())
+                frontier.append((slug, version, None))
+
+        while frontier:
+            results = await asyncio.gather(
+                *(
+                    self._resolve_one(slug, version, installed, semaphore)
+                    for slug, version, _ in frontier
+                ),
+                return_exceptions=True,
+            )
+            next_frontier: list[tuple[str, str | None, str | None]] = []
+            for (slug, _, required_by), result in zip(frontier, results, strict=True):
+                if isinstance(result, asyncio.CancelledError):
+                    raise result
+                if isinstance(result, BaseException):
+                    missing.append(
+                        MissingDependency(modid=slug, required_by=required_by, error=str(result))
+                    )
+                    continue
+
+                key = result.modid.lower()
+                resolved_as[slug.lower()] = key
+                if key in visited:
+                    continue  # Same mod reached under another name
+                visited.add(key)
+                queued.add(key)
+                if not result.installed:
+                    planned[key] = PlannedMod(slug=result.slug, version=result.version)
+                    if result.download is not None:
+                        downloads[result.slug] = result.download
+
+                for dep_modid, min_version in result.dependencies.items():
+                    dep_key = dep_modid.lower()
+                    if dep_key in BUILTIN_MODIDS:
+                        continue
+                    edges.append((dep_key, min_version, result.modid))
+                    if dep_key not in queued:
+                        queued.add(dep_key)
+                        next_frontier.append((dep_modid, None, result.modid))
+            frontier = next_frontier
+
+        plan = DependencyPlan(install=list(planned.values()), missing=missing)
+        for dep_key, min_version, required_by in edges:
+            key = resolved_as.get(dep_key, dep_key)
+            if key in planned:
+                available = planned[key].version
+                if required_by not in planned[key].required_by:
+                    planned[key].required_by.append(required_by)
+            elif key in installed:
+                available = installed[key].version
+            else:
+                continue  # Reported as missing
+            if not satisfies(available, min_version):
+                plan.conflicts.append(
+                    DependencyConflict(
+                        modid=dep_key,
+                        required_version=min_version,
+                        available_version=available,
+                        required_by=required_by,
+                    )
+                )
+            elif key not in planned and key not in plan.satisfied:
+                plan.satisfied.append(key)
+
+        logger.info(
+            "mod_dependencies_resolved",
+            requested=len(requests),
+            install=len(plan.install),
+            satisfied=len(plan.satisfied),
+            missing=len(plan.missing),
+            conflicts=len(plan.conflicts),
+        )
+        return Resolution(plan=plan, downloads=downloads)
+
+    async def _resolve_one(
+        self,
+        slug: str,
+        version: str | None,
+        installed: dict[str, ModState],
+        semaphore: asyncio.Semaphore,
+    ) -> _ResolvedMod:
+        """Resolve one mod to a release and its dependencies.
+
+        Raises:
+            ModNotFoundError: If the mod is not installed and not in the
+                mod database.
+            ModVersionNotFoundError: If the requested version does not exist.
+            ExternalApiError / DownloadError: If the mod database fails.
+        """
+        state = installed.get(slug.lower())
+        if state is not None and version in (None, state.version):
+            modid, dependencies = self._installed_dependencies(state.slug, state.version)
+            return _ResolvedMod(
+                slug=state.slug,
+                modid=modid,
+                version=state.version,
+                dependencies=dependencies,
+                installed=True,
+            )
+
+        async with semaphore:
+            mod = await self._api_client.get_mod(slug)
+            if mod is None or not mod.get("releases"):
+                raise ModNotFoundError(slug)
+            releases = mod["releases"]
+            if version is not None:
+                release = next((r for r in releases if r.get("modversion") == version), None)
+                if release is None:
+                    raise ModVersionNotFoundError(slug, version)
+            else:
+                release = select_latest_compatible(releases, self._game_version) or releases[0]
+            release_version = str(release.get("modversion"))
+
+            memo = self._memo.get((slug.lower(), release_version))
+            if memo is not None:
+                modid, dependencies = memo
+                return _ResolvedMod(
+                    slug=slug,
+                    modid=modid,
+                    version=release_version,
+                    dependencies=dependencies,
+                    installed=False,
+                )
+
+            download = await self._api_client.download_mod(slug, release_version, evict=False)
+            if download is None:
+                raise ModNotFoundError(slug)
+
+        metadata = await asyncio.to_thread(self._state_manager.read_metadata, download.path)
+        modid = metadata.modid if metadata is not None else slug
+        dependencies = metadata.dependencies if metadata is not None else {}
+        self._memo[(slug.lower(), release_version)] = (modid, dependencies)
+        self._memo[(modid.lower(), release_version)] = (modid, dependencies)
+        return _ResolvedMod(
+            slug=slug,
+            modid=modid,
+            version=release_version,
+            dependencies=dependencies,
+            installed=False,
+            download=download,
+        )
+
+    def _installed_dependencies(self, modid: str, version: str) -> tuple[str, dict[str, str]]:
+        """Get an installed mod's dependencies from its cached modinfo.json."""
+        memo = self._memo.get((modid.lower(), version))
+        if memo is None:
+            metadata = self._state_manager.get_cached_metadata(modid, version)
+            memo = (modid, metadata.dependencies if metadata is not None else {})
+            self._memo[(modid.lower(), version)] = memo
+        return memo
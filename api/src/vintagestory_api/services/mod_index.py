@@ -0,0 +1,310 @@
+"""Precomputed search index for the mod browse catalog.
+
+The browse endpoint filters the full mod catalog (thousands of entries) by
+search term, side, type and tags on every request. Doing that with a scan
+re-normalizes every field of every mod per request. ModCatalogIndex does
+the normalization once, when the catalog is refreshed, and keeps:
+
+- Per-mod normalized search text (name, author, summary and tags)
+- A trigram inverted index over that text for substring search
+- Precomputed ID lists for the side, type and tag facets
+- A presorted permutation (and rank table) for every sort order
+
+Queries start from the most selective ID list and only touch candidate
+mods, so their cost tracks the result size rather than the catalog size.
+Sorted results are ordered by rank lookups instead of re-sorting mod
+dicts. Results match the scan-based search_mods(), facet filters and
+sort_mods() exactly.
+
+QueryResultCache keeps recent sorted result ID lists keyed by catalog
+generation, so paging through a query only costs the page slice.
+"""
+
+from __future__ import annotations
+
+from array import array
+from collections import OrderedDict
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
+
+from vintagestory_api.services.mod_api import SORT_KEYS, ModDict, SortOption
+
+# Separates normalized fields in a mod's search text. Query terms never
+# contain it (search terms are stripped user input), so a substring match
+# can never span two fields.
+FIELD_SEPARATOR = "\x00"
+
+TRIGRAM_LENGTH = 3
+
+
+def _normalize_search_text(mod: ModDict) -> str:
+    """Build the lowercase search text for a mod (same fields as search_mods)."""
+    fields = [
+        str(mod.get("name", "")).lower(),
+        str(mod.get("author", "")).lower(),
+        str(mod.get("summary") or "").lower(),
+    ]
+    fields.extend(str(tag).lower() for tag in mod.get("tags") or [])
+    return FIELD_SEPARATOR.join(fields)
+
+
+def _trigrams(text: str) -> set[str]:
+    """Get the distinct trigrams of a string."""
+    return {text[i : i + TRIGRAM_LENGTH] for i in range(len(text) - TRIGRAM_LENGTH + 1)}
+
+
+def _ids(values: Iterable[int]) -> array[int]:
+    """Pack mod IDs into a compact unsigned int array."""
+    return array("I", values)
+
+
+@dataclass(frozen=True)
+class BrowseQuery:
+    """Normalized browse query, usable as a cache key."""
+
+    search: str = ""
+    side: str | None = None
+    mod_type: str | None = None
+    tags: tuple[str, ...] = ()
+    sort: SortOption = "recent"
+
+    @classmethod
+    def create(
+        cls,
+        search: str | None = None,
+        side: str | None = None,
+        mod_type: str | None = None,
+        tags: Iterable[str] = (),
+        sort: SortOption = "recent",
+    ) -> BrowseQuery:
+        """Build a query with normalized search and de-duplicated, sorted tags."""
+        return cls(
+            search=(search or "").strip().lower(),
+            side=side,
+            mod_type=mod_type,
+            tags=tuple(sorted({t.strip().lower() for t in tags if t.strip()})),
+            sort=sort,
+        )
+
+
+class ModCatalogIndex:
+    """Immutable search and facet index over a mod catalog snapshot.
+
+    Mod IDs are positions in the catalog list passed to the constructor.
+    All ID lists are kept in ascending order so results preserve catalog
+    order (which keeps sorting by sort_mods() stable and identical to the
+    scan-based path).
+    """
+
+    def __init__(self, mods: Sequence[ModDict], generation: int = 0) -> None:
+        """Build the index.
+
+        Args:
+            mods: Catalog snapshot. Must not be mutated while the index is used.
+            generation: Catalog generation this index belongs to (cache key).
+        """
+        self._mods = mods
+        self._generation = generation
+        self._texts: list[str] = []
+        self._sides: list[str] = []
+        self._types: list[str] = []
+        self._tags: list[frozenset[str]] = []
+
+        postings: dict[str, list[int]] = {}
+        by_side: dict[str, list[int]] = {}
+        by_type: dict[str, list[int]] = {}
+        by_tag: dict[str, list[int]] = {}
+
+        for mod_id, mod in enumerate(mods):
+            text = _normalize_search_text(mod)
+            side = str(mod.get("side", "both")).lower()
+            mod_type = str(mod.get("type", "mod")).lower()
+            tags = frozenset(str(tag).lower() for tag in mod.get("tags") or [])
+
+            self._texts.append(text)
+            self._sides.append(side)
+            self._types.append(mod_type)
+            self._tags.append(tags)
+
+            for trigram in _trigrams(text):
+                postings.setdefault(trigram, []).append(mod_id)
+            by_side.setdefault(side, []).append(mod_id)
+            by_type.setdefault(mod_type, []).append(mod_id)
+            for tag in tags:
+                by_tag.setdefault(tag, []).append(mod_id)
+
+        self._postings = {k: _ids(v) for k, v in postings.items()}
+        self._by_side = {k: _ids(v) for k, v in by_side.items()}
+        self._by_type = {k: _ids(v) for k, v in by_type.items()}
+        self._by_tag = {k: _ids(v) for k, v in by_tag.items()}
+
+        # Presorted permutation and rank table per sort order. Python's sort is
+        # stable (also with reverse=True), so ordering a catalog-ordered subset
+        # by rank gives exactly what sort_mods() would return for it.
+        self._orders: dict[SortOption, array[int]] = {}
+        self._ranks: dict[SortOption, array[int]] = {}
+        for sort_by, (key, reverse) in SORT_KEYS.items():
+            keys = [key(mod) for mod in mods]
+            order = sorted(range(len(mods)), key=keys.__getitem__, reverse=reverse)
+            ranks = array("I", bytes(4 * len(mods)))
+            for rank, mod_id in enumerate(order):
+                ranks[mod_id] = rank
+            self._orders[sort_by] = _ids(order)
+            self._ranks[sort_by] = ranks
+
+    def __len__(self) -> int:
+        return len(self._mods)
+
+    @property
+    def generation(self) -> int:
+        """Catalog generation this index was built for."""
+        return self._generation
+
+    @property
+    def mods(self) -> Sequence[ModDict]:
+        """The catalog snapshot this index was built from."""
+        return self._mods
+
+    def _search_candidates(self, term: str) -> Sequence[int] | None:
+        """Get IDs that may contain the term (None means every mod).
+
+        Uses the rarest trigram's posting list; terms shorter than a
+        trigram cannot be narrowed and return None.
+        """
+        if len(term) < TRIGRAM_LENGTH:
+            return None
+        rarest: array[int] | None = None
+        for trigram in _trigrams(term):
+            posting = self._postings.get(trigram)
+            if posting is None:
+                return ()
+            if rarest is None or len(posting) < len(rarest):
+                rarest = posting
+        return rarest
+
+    def _tag_ids(self, tags: Iterable[str]) -> list[int]:
+        """Union of the ID lists for any of the given tags, ascending."""
+        ids: set[int] = set()
+        for tag in tags:
+            ids.update(self._by_tag.get(tag, ()))
+        return sorted(ids)
+
+    def query(
+        self,
+        search: str = "",
+        side: str | None = None,
+        mod_type: str | None = None,
+        tags: Sequence[str] | None = None,
+        sort_by: SortOption | None = None,
+    ) -> list[int]:
+        """Find mods matching all given filters.
+
+        Args:
+            search: Case-insensitive substring matched against name, author,
+                summary and tags. Empty matches everything.
+            side: Exact side facet ("client", "server", "both").
+            mod_type: Exact type facet ("mod", "externaltool", "other").
+            tags: Lowercase tags; a mod matches if it has any of them.
+            sort_by: Sort order, or None for catalog order.
+
+        Returns:
+            Matching mod IDs, sorted as requested.
+        """
+        term = search.strip().lower()
+        tag_set = frozenset(tags) if tags else None
+
+        if not term and side is None and mod_type is None and tag_set is None:
+            if sort_by is None:
+                return list(range(len(self._mods)))
+            return self._orders[sort_by].tolist()
+
+        # Start from the smallest available candidate list
+        sources: list[Sequence[int]] = []
+        if side is not None:
+            sources.append(self._by_side.get(side, ()))
+        if mod_type is not None:
+            sources.append(self._by_type.get(mod_type, ()))
+        if tag_set is not None:
+            sources.append(self._tag_ids(tag_set))
+        if term:
+            search_ids = self._search_candidates(term)
+            if search_ids is not None:
+                sources.append(search_ids)
+
+        candidates: Iterable[int] = (
+            min(sources, key=len) if sources else range(len(self._mods))
+        )
+
+        texts, sides, types, mod_tags = self._texts, self._sides, self._types, self._tags
+        matches = [
+            mod_id
+            for mod_id in candidates
+            if (side is None or sides[mod_id] == side)
+            and (mod_type is None or types[mod_id] == mod_type)
+            and (tag_set is None or not tag_set.isdisjoint(mod_tags[mod_id]))
+            and (not term or term in texts[mod_id])
+        ]
+        if sort_by is not None:
+            matches.sort(key=self._ranks[sort_by].__getitem__)
+        return matches
+
+    def get_mods(self, mod_ids: Iterable[int]) -> list[ModDict]:
+        """Resolve mod IDs to the catalog's mod dicts."""
+        mods = self._mods
+        return [mods[mod_id] for mod_id in mod_ids]
+
+
+class QueryResultCache:
+    """Small LRU of sorted browse result ID lists.
+
+    Keys include the catalog generation, so entries from a previous catalog
+    can never be returned; they simply age out.
+
+    Attributes:
+        DEFAULT_MAX_ENTRIES: Number of result lists retained.
+    """
+
+    DEFAULT_MAX_ENTRIES = 64
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES) -> None:
+        """Initialize an empty cache.
+
+        Args:
+            max_entries: Maximum number of result lists retained.
+        """
+        self._max_entries = max_entries
+        self._entries: OrderedDict[tuple[int, BrowseQuery], array[int]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, generation: int, query: BrowseQuery) -> array[int] | None:
+        """Get cached result IDs for a query, marking them recently used."""
+        key = (generation, query)
+        result = self._entries.get(key)
+        if result is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return result
+
+    def put(self, generation: int, query: BrowseQuery, mod_ids: Iterable[int]) -> array[int]:
+        """Store result IDs for a query, evicting the least recently used.
+
+        Returns:
+            The stored (compact) ID array.
+        """
+        stored = _ids(mod_ids)
+        key = (generation, query)
+        self._entries[key] = stored
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+        return stored
+
+    def clear(self) -> None:
+        """Drop all cached results."""
+        self._entries.clear()
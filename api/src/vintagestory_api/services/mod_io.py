@@ -0,0 +1,254 @@
+"""Async file I/O for the mod subsystem.
+
+Installing, enabling, disabling and removing mods involves blocking
+filesystem work: zip parsing, linking or copying files, renames, writing
+mods.json and cache eviction scans. Running that inside request handlers
+stalls the event loop (console streaming, every other request) for as long
+as the disk takes.
+
+ModIO runs those steps on a dedicated thread pool (separate from the
+default executor used by asyncio.to_thread, so a burst of mod work cannot
+starve other blocking calls), serializes operations on the same mod with
+a per-slug lock, and logs how long each step took. Operations on the
+whole mods directory (reconciliation) exclude every per-mod operation, so
+they never see a mod half-way through an install or update.
+
+State writes go through a single writer thread: the state index is
+snapshotted on the event loop (a cheap dict copy) and serialized and
+written on the writer, so saves are applied in the order they were
+requested and never race with in-memory updates.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import time
+from collections.abc import AsyncIterator, Callable
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from typing import TYPE_CHECKING
+
+import structlog
+
+if TYPE_CHECKING:
+    from vintagestory_api.services.mod_state import ModStateManager
+
+logger = structlog.get_logger()
+
+# Worker threads for mod file operations
+MOD_IO_WORKERS = 4
+
+# ModOperation.slug of operations on the whole mods directory
+MODS_DIR = "*"
+
+
+class ModOperation:
+    """A running operation on one mod, with per-step timings.
+
+    Created by ModIO.operation(); the mod's lock is held while it is active.
+    """
+
+    def __init__(self, io: ModIO, name: str, slug: str) -> None:
+        self._io = io
+        self.name = name
+        self.slug = slug
+        self.timings: dict[str, float] = {}
+
+    async def run[T](self, step: str, fn: Callable[..., T], *args: object) -> T:
+        """Run a blocking step on the mod I/O pool and record its duration.
+
+        Args:
+            step: Step name used in the timings (e.g., "rename").
+            fn: Blocking callable.
+            *args: Positional arguments for fn.
+
+        Returns:
+            The callable's return value.
+        """
+        started = time.perf_counter()
+        try:
+            return await self._io.run(fn, *args)
+        finally:
+            self._record(step, started)
+
+    async def save_state(self, state_manager: ModStateManager) -> None:
+        """Write the state index on the state writer and record the duration."""
+        started = time.perf_counter()
+        try:
+            await self._io.save_state(state_manager)
+        finally:
+            self._record("save_state", started)
+
+    def _record(self, step: str, started: float) -> None:
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        self.timings[step] = round(self.timings.get(step, 0.0) + elapsed_ms, 3)
+
+
+class ModIO:
+    """Thread pool, locks and timings for mod file operations."""
+
+    def __init__(self, max_workers: int = MOD_IO_WORKERS) -> None:
+        """Initialize the I/O layer.
+
+        Threads are started lazily on first use.
+
+        Args:
+            max_workers: Worker threads for file operations.
+        """
+        self._max_workers = max_workers
+        self._executor: ThreadPoolExecutor | None = None
+        self._state_writer: ThreadPoolExecutor | None = None
+        self._locks: dict[str, asyncio.Lock] = {}
+        # Per-mod operations share the mods directory; directory operations
+        # take it exclusively (and go first once waiting, so a stream of
+        # per-mod operations cannot starve them)
+        self._dir_gate = asyncio.Condition()
+        self._mod_ops = 0
+        self._dir_op_active = False
+        self._dir_ops_waiting = 0
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self._max_workers, thread_name_prefix="mod-io"
+            )
+        return self._executor
+
+    def _get_state_writer(self) -> ThreadPoolExecutor:
+        if self._state_writer is None:
+            self._state_writer = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="mod-state-writer"
+            )
+        return self._state_writer
+
+    def lock_for(self, slug: str) -> asyncio.Lock:
+        """Get the lock serializing operations on a mod."""
+        lock = self._locks.get(slug)
+        if lock is None:
+            lock = self._locks[slug] = asyncio.Lock()
+        return lock
+
+    @asynccontextmanager
+    async def operation(self, name: str, slug: str) -> AsyncIterator[ModOperation]:
+        """Hold a mod's lock for an operation and log its step timings.
+
+        Waits for any running directory operation to finish first.
+
+        Args:
+            name: Operation name (e.g., "enable").
+            slug: The mod being operated on.
+
+        Yields:
+            ModOperation for running and timing the operation's steps.
+        """
+        started = time.perf_counter()
+        async with self.lock_for(slug), self._shared_dir():
+            async with self._timed(name, slug, started) as op:
+                yield op
+
+    @asynccontextmanager
+    async def directory_operation(self, name: str) -> AsyncIterator[ModOperation]:
+        """Run an operation on the whole mods directory and log its step timings.
+
+        Waits until no per-mod operation is running and keeps new ones from
+        starting until it is done.
+
+        Args:
+            name: Operation name (e.g., "reconcile").
+
+        Yields:
+            ModOperation (with slug MODS_DIR) for running and timing the steps.
+        """
+        started = time.perf_counter()
+        async with self._exclusive_dir():
+            async with self._timed(name, MODS_DIR, started) as op:
+                yield op
+
+    @asynccontextmanager
+    async def _timed(self, name: str, slug: str, started: float) -> AsyncIterator[ModOperation]:
+        lock_wait_ms = (time.perf_counter() - started) * 1000
+        op = ModOperation(self, name, slug)
+        try:
+            yield op
+        finally:
+            logger.info(
+                "mod_io_operation_timings",
+                operation=name,
+                slug=slug,
+                lock_wait_ms=round(lock_wait_ms, 3),
+                steps_ms=op.timings,
+                total_ms=round((time.perf_counter() - started) * 1000, 3),
+            )
+
+    @asynccontextmanager
+    async def _shared_dir(self) -> AsyncIterator[None]:
+        async with self._dir_gate:
+            await self._dir_gate.wait_for(
+                lambda: not self._dir_op_active and not self._dir_ops_waiting
+            )
+            self._mod_ops += 1
+        try:
+            yield
+        finally:
+            async with self._dir_gate:
+                self._mod_ops -= 1
+                self._dir_gate.notify_all()
+
+    @asynccontextmanager
+    async def _exclusive_dir(self) -> AsyncIterator[None]:
+        async with self._dir_gate:
+            self._dir_ops_waiting += 1
+            try:
+                await self._dir_gate.wait_for(
+                    lambda: not self._dir_op_active and not self._mod_ops
+                )
+            finally:
+                self._dir_ops_waiting -= 1
+                # Per-mod operations may proceed if this one was cancelled
+                self._dir_gate.notify_all()
+            self._dir_op_active = True
+        try:
+            yield
+        finally:
+            async with self._dir_gate:
+                self._dir_op_active = False
+                self._dir_gate.notify_all()
+
+    async def run[T](self, fn: Callable[..., T], *args: object) -> T:
+        """Run a blocking callable on the mod I/O pool.
+
+        Args:
+            fn: Blocking callable.
+            *args: Positional arguments for fn.
+
+        Returns:
+            The callable's return value.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._get_executor(), functools.partial(fn, *args))
+
+    async def save_state(self, state_manager: ModStateManager) -> None:
+        """Save the state index without blocking the event loop.
+
+        The index is snapshotted here, on the loop, and written by the single
+        state writer thread, so concurrent saves are applied in order.
+
+        Args:
+            state_manager: The state manager to save.
+        """
+        snapshot = state_manager.snapshot()
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(
+            self._get_state_writer(), functools.partial(state_manager.save, snapshot)
+        )
+
+    def shutdown(self) -> None:
+        """Stop the worker threads, waiting for running steps to finish."""
+        for executor in (self._executor, self._state_writer):
+            if executor is not None:
+                executor.shutdown(wait=True)
+        self._executor = None
+        self._state_writer = None
+        self._locks.clear()
+        self._dir_gate = asyncio.Condition()
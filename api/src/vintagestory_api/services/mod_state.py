@@ -1,44 +1,238 @@
 """Mod state persistence and management service.
 
-This service manages the mod state index file (mods.json) which tracks
-installed mods and their enabled/disabled status. It uses atomic writes
-to prevent corruption.
+This service manages the mod state index which tracks installed mods and
+their enabled/disabled status. It is kept in memory and persisted through
+a store (see mod_store): mods.json by default, written atomically, or a
+SQLite database that saves only the entries that changed.
+
+Reconciliation with the mods directory is incremental: each tracked file's
+(inode, size, mtime_ns) fingerprint is stored in its state entry, so files
+that have not changed are skipped without opening them. New and replaced
+zips have their modinfo.json extracted, on a process pool when there are
+enough of them to be worth the worker start-up cost.
 """
 
 import json
+import multiprocessing
+import os
+import re
+import stat
+import threading
 import zipfile
+from collections import OrderedDict
+from collections.abc import Iterable
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from pathlib import Path
 
 import structlog
 
-from vintagestory_api.models.mods import ModMetadata, ModState
+from vintagestory_api.models.mods import ModMetadata, ModReconcileResult, ModState
+from vintagestory_api.services.mod_store import StateBackend, create_mod_store
 
 logger = structlog.get_logger()
 
+# Extract modinfo.json on a process pool when at least this many zips need it
+PROCESS_POOL_MIN_FILES = 16
+
+# Upper bound on extraction worker processes
+MAX_EXTRACT_WORKERS = 8
+
+# Parsed modinfo.json kept per zip fingerprint
+MODINFO_CACHE_SIZE = 1024
+
+MODINFO_NAME = "modinfo.json"
+
+_DRIVE_PREFIX = re.compile(r"^[A-Za-z]:")
+
+# (inode, size, mtime_ns) of a mod file
+FileFingerprint = tuple[int, int, int]
+
+
+def file_fingerprint(st: os.stat_result) -> FileFingerprint:
+    """Build the reconciliation fingerprint of a file from its stat result."""
+    return (st.st_ino, st.st_size, st.st_mtime_ns)
+
+
+def is_safe_zip_path(name: str) -> bool:
+    """Validate that a zip member path is safe (no path traversal).
+
+    A pure string check (no filesystem access) that rejects:
+    - ../etc/passwd (simple parent traversal)
+    - subdir/../../etc/passwd (nested traversal)
+    - /absolute/path (absolute paths)
+    - \\windows\\path and C:\\path (Windows absolute paths)
+
+    Args:
+        name: The zip member name to validate.
+
+    Returns:
+        True if the path is safe, False if it attempts path traversal.
+    """
+    normalized = name.replace("\\", "/")
+    if not normalized or normalized.startswith("/") or _DRIVE_PREFIX.match(normalized):
+        return False
+    depth = 0
+    for part in normalized.split("/"):
+        if part == "..":
+            depth -= 1
+            if depth < 0:
+                return False
+        elif part not in ("", "."):
+            depth += 1
+    return True
+
+
+def find_modinfo_member(names: Iterable[str]) -> str | None:
+    """Pick the modinfo.json member of a zip from its member names.
+
+    A modinfo.json at the root wins; otherwise the shallowest safe one
+    (for zips that wrap the mod in a folder), so a modinfo.json nested in
+    the mod's assets is never picked over the mod's own.
+
+    Args:
+        names: Zip member names.
+
+    Returns:
+        The member name, or None if the zip has no safe modinfo.json.
+    """
+    best: str | None = None
+    best_depth = 0
+    for name in names:
+        normalized = name.replace("\\", "/")
+        if normalized.rsplit("/", 1)[-1].lower() != MODINFO_NAME:
+            continue
+        if not is_safe_zip_path(name):
+            logger.warning("modinfo_path_traversal_attempt", path=name)
+            continue
+        depth = normalized.strip("/").count("/")
+        if best is None or depth < best_depth:
+            best, best_depth = name, depth
+    return best
+
+
+def extract_modinfo(zip_path: Path) -> dict[str, object] | None:
+    """Extract modinfo.json content from a mod zip file.
+
+    The root modinfo.json is looked up by name in the central directory;
+    only zips without one have their member list searched. A module-level
+    function so it can run in extraction worker processes.
+
+    Args:
+        zip_path: Path to the mod zip file.
+
+    Returns:
+        Parsed modinfo.json as dict, or None if not found or corrupt.
+    """
+    try:
+        with zipfile.ZipFile(zip_path, "r") as zf:
+            try:
+                info: zipfile.ZipInfo | str = zf.getinfo(MODINFO_NAME)
+            except KeyError:
+                name = find_modinfo_member(zf.namelist())
+                if name is None:
+                    logger.debug(
+                        "modinfo_not_found_in_zip",
+                        filename=zip_path.name,
+                    )
+                    return None
+                info = name
+            content = zf.read(info).decode("utf-8")
+            data = json.loads(content)
+            return data if isinstance(data, dict) else None
+
+    except (zipfile.BadZipFile, KeyError, json.JSONDecodeError, UnicodeDecodeError, OSError) as e:
+        logger.warning(
+            "modinfo_extraction_failed",
+            filename=zip_path.name,
+            error=str(e),
+        )
+        return None
+
+
+@dataclass(frozen=True)
+class StateSnapshot:
+    """State captured on the event loop for a save on the writer thread.
+
+    Attributes:
+        states: Shallow copy of the state index.
+        dirty: Filenames added, updated or removed since the previous snapshot.
+    """
+
+    states: dict[str, ModState]
+    dirty: frozenset[str]
+
+
+@dataclass
+class DiskChanges:
+    """Differences between the state index and the mods directory.
+
+    Attributes:
+        added: Files on disk not in the state, with their fingerprints.
+        changed: Tracked files whose fingerprint changed.
+        removed: Tracked filenames no longer on disk.
+        adopted: Tracked files without a recorded fingerprint (installed
+            through the API); their fingerprint is recorded as-is.
+        unchanged: Number of tracked files with a matching fingerprint.
+    """
+
+    added: dict[str, FileFingerprint] = field(default_factory=dict)
+    changed: dict[str, FileFingerprint] = field(default_factory=dict)
+    removed: list[str] = field(default_factory=list)
+    adopted: dict[str, FileFingerprint] = field(default_factory=dict)
+    unchanged: int = 0
+
+    @property
+    def to_extract(self) -> list[str]:
+        """Filenames whose modinfo.json needs to be read."""
+        return [*self.added, *self.changed]
+
+    @property
+    def state_changed(self) -> bool:
+        """Whether applying the changes modifies the state index."""
+        return bool(self.added or self.changed or self.removed or self.adopted)
+
 
 class ModStateManager:
-    """Manages mod state persistence to the state index file.
+    """Manages mod state persistence to the state store.
 
-    The state index (mods.json) maps filenames to mod metadata for fast
-    lookup without re-extracting from zip files.
+    The state index (mods.json or mods.db) maps filenames to mod metadata for fast
+    lookup without re-extracting from zip files. In memory, a slug index
+    gives O(1) lookup by slug, and parsed modinfo.json metadata is cached so
+    listing mods does no disk I/O. The generation counter is bumped on every
+    state or metadata change so callers can memoize derived views.
 
     Attributes:
         state_dir: Directory containing state files (/data/vsmanager/state).
         mods_dir: Directory containing mod zip files (/data/serverdata/mods).
-        state_file: Path to the mods.json state index file.
+        state_file: Path to the mods.json state index file (JSON backend).
     """
 
-    def __init__(self, state_dir: Path, mods_dir: Path) -> None:
+    def __init__(self, state_dir: Path, mods_dir: Path, backend: StateBackend = "json") -> None:
         """Initialize the mod state manager.
 
         Args:
-            state_dir: Directory for state files (will contain mods.json).
+            state_dir: Directory for state files (mods.json or mods.db).
             mods_dir: Directory containing installed mod zip files.
+            backend: State store, "json" or "sqlite" (see mod_store).
         """
         self._state_dir = state_dir
         self._mods_dir = mods_dir
+        self._store = create_mod_store(state_dir, backend)
         self._state: dict[str, ModState] = {}
+        self._dirty: set[str] = set()
+        self._slug_index: dict[str, str] = {}
+        self._metadata: dict[tuple[str, str], ModMetadata | None] = {}
+        self._generation = 0
+        # Guards _metadata and _generation: mod I/O workers import and extract
+        # metadata (and bump the generation) while the loop reads and updates them
+        self._metadata_lock = threading.Lock()
+        self._modinfo_by_fingerprint: OrderedDict[FileFingerprint, dict[str, object] | None] = (
+            OrderedDict()
+        )
+        self._modinfo_lock = threading.Lock()
 
     @property
     def state_dir(self) -> Path:
@@ -55,79 +249,80 @@ class ModStateManager:
         """Get the path to the mods.json state file."""
         return self._state_dir / "mods.json"
 
+    @property
+    def generation(self) -> int:
+        """Counter bumped whenever mod state or cached metadata changes."""
+        return self._generation
+
+    def _bump_generation(self) -> None:
+        with self._metadata_lock:
+            self._generation += 1
+
+    def _replace_state(self, state: dict[str, ModState]) -> None:
+        """Replace the whole state index and rebuild the slug index."""
+        self._state = state
+        self._slug_index = {}
+        for filename, mod_state in state.items():
+            self._slug_index.setdefault(mod_state.slug, filename)
+        self._bump_generation()
+
+    def _unindex(self, filename: str, slug: str) -> None:
+        """Drop a filename from the slug index, falling back to another file with the slug."""
+        if self._slug_index.get(slug) != filename:
+            return
+        del self._slug_index[slug]
+        for other, state in self._state.items():
+            if state.slug == slug:
+                self._slug_index[slug] = other
+                break
+
+    def _warm_metadata_cache(self) -> None:
+        """Load cached modinfo.json metadata for every mod in the state."""
+        for state in self._state.values():
+            self.get_cached_metadata(state.slug, state.version)
+
     def load(self) -> None:
-        """Load mod state from the state index file.
+        """Load mod state from the store.
 
-        If the file doesn't exist or is corrupt, starts with empty state.
+        If there is no state, or it is corrupt, starts with empty state.
         """
-        if not self.state_file.exists():
-            logger.debug("mod_state_file_not_found", path=str(self.state_file))
-            self._state = {}
-            return
+        self._replace_state(self._store.load_states())
+        self._dirty.clear()
+        self._warm_metadata_cache()
 
-        try:
-            data = json.loads(self.state_file.read_text())
-            self._state = {
-                filename: ModState.model_validate(state_data)
-                for filename, state_data in data.items()
-            }
-            logger.info(
-                "mod_state_loaded",
-                mod_count=len(self._state),
-                path=str(self.state_file),
-            )
-        except (
-            json.JSONDecodeError,
-            ValueError,
-            AttributeError,
-            TypeError,
-            IsADirectoryError,
-            PermissionError,
-        ) as e:
-            logger.warning(
-                "mod_state_corrupt",
-                error=str(e),
-                path=str(self.state_file),
-            )
-            self._state = {}
-
-    def save(self) -> None:
-        """Save mod state to the state index file.
+    def snapshot(self) -> StateSnapshot:
+        """Capture the state to save off the event loop.
 
-        Uses atomic write (temp file + rename) to prevent corruption.
-        Creates the state directory if it doesn't exist.
+        Takes a shallow copy of the index and the set of filenames changed
+        since the previous snapshot (which is reset).
         """
-        # Ensure state directory exists
-        self._state_dir.mkdir(parents=True, exist_ok=True)
+        snapshot = StateSnapshot(dict(self._state), frozenset(self._dirty))
+        self._dirty.clear()
+        return snapshot
 
-        # Serialize state to JSON
-        data = {
-            filename: state.model_dump(mode="json")
-            for filename, state in self._state.items()
-        }
-        json_content = json.dumps(data, indent=2)
+    def save(self, snapshot: StateSnapshot | None = None) -> None:
+        """Save mod state to the store.
 
-        # Atomic write: write to temp file first, then rename
-        temp_file = self.state_file.with_suffix(".tmp")
+        The JSON store rewrites mods.json atomically; the SQLite store writes
+        only the changed entries in one transaction.
+
+        Args:
+            snapshot: State to write (from snapshot()); defaults to the
+                current in-memory state.
+        """
+        if snapshot is None:
+            snapshot = self.snapshot()
         try:
-            temp_file.write_text(json_content)
-            temp_file.rename(self.state_file)
-            logger.debug(
-                "mod_state_saved",
-                mod_count=len(self._state),
-                path=str(self.state_file),
-            )
-        except OSError as e:
-            logger.error(
-                "mod_state_save_failed",
-                error=str(e),
-                path=str(self.state_file),
-            )
-            # Clean up temp file if it exists
-            if temp_file.exists():
-                temp_file.unlink()
+            self._store.write_states(snapshot.states, snapshot.dirty)
+        except BaseException:
+            # Keep the entries marked so the next save retries them
+            self._dirty.update(snapshot.dirty)
             raise
 
+    def close(self) -> None:
+        """Close the state store."""
+        self._store.close()
+
     def get_mod(self, filename: str) -> ModState | None:
         """Get mod state by filename.
 
@@ -148,10 +343,10 @@ class ModStateManager:
         Returns:
             ModState if found, None otherwise.
         """
-        for state in self._state.values():
-            if state.slug == slug:
-                return state
-        return None
+        filename = self._slug_index.get(slug)
+        if filename is None:
+            return None
+        return self._state.get(filename)
 
     def list_mods(self) -> list[ModState]:
         """Get all mod states.
@@ -168,7 +363,13 @@ class ModStateManager:
             filename: The mod zip filename (key in state index).
             state: The ModState to store.
         """
+        previous = self._state.get(filename)
         self._state[filename] = state
+        self._dirty.add(filename)
+        if previous is not None and previous.slug != state.slug:
+            self._unindex(filename, previous.slug)
+        self._slug_index.setdefault(state.slug, filename)
+        self._bump_generation()
         logger.debug(
             "mod_state_updated",
             filename=filename,
@@ -183,8 +384,10 @@ class ModStateManager:
             filename: The mod zip filename to remove.
         """
         if filename in self._state:
-            slug = self._state[filename].slug
-            del self._state[filename]
+            slug = self._state.pop(filename).slug
+            self._dirty.add(filename)
+            self._unindex(filename, slug)
+            self._bump_generation()
             logger.info("mod_state_removed", filename=filename, slug=slug)
 
     def import_mod(self, zip_path: Path) -> ModMetadata:
@@ -200,31 +403,19 @@ class ModStateManager:
             ModMetadata extracted from modinfo.json, or fallback metadata
             if modinfo.json is missing or corrupt.
         """
-        filename = zip_path.name
-
-        # Try to extract and parse modinfo.json from zip
-        modinfo_data = self._extract_modinfo_from_zip(zip_path)
-
-        if modinfo_data is not None:
-            try:
-                metadata = ModMetadata.model_validate(modinfo_data)
-
-                # Cache the modinfo.json
-                self._cache_modinfo(metadata.modid, metadata.version, modinfo_data)
+        return self._import_modinfo(zip_path.name, self._extract_modinfo_from_zip(zip_path))
 
-                logger.info(
-                    "mod_imported",
-                    filename=filename,
-                    modid=metadata.modid,
-                    version=metadata.version,
-                )
-                return metadata
-            except ValueError as e:
-                logger.warning(
-                    "modinfo_parse_failed",
-                    filename=filename,
-                    error=str(e),
-                )
+    def _import_modinfo(self, filename: str, modinfo_data: dict[str, object] | None) -> ModMetadata:
+        """Parse and cache extracted modinfo.json, falling back to the filename."""
+        metadata = self._parse_modinfo(filename, modinfo_data)
+        if metadata is not None:
+            logger.info(
+                "mod_imported",
+                filename=filename,
+                modid=metadata.modid,
+                version=metadata.version,
+            )
+            return metadata
 
         # Fallback: use filename-derived metadata
         fallback_name = filename.removesuffix(".zip").removesuffix(".disabled")
@@ -240,91 +431,91 @@ class ModStateManager:
         )
         return metadata
 
-    def _is_safe_zip_path(self, name: str) -> bool:
-        """Validate that a zip member path is safe (no path traversal).
-
-        Uses Path.resolve() to detect path traversal attempts including:
-        - ../etc/passwd (simple parent traversal)
-        - subdir/../../etc/passwd (nested traversal)
-        - /absolute/path (absolute paths)
-        - \\windows\\path (Windows absolute paths)
+    def read_metadata(self, zip_path: Path) -> ModMetadata | None:
+        """Read and cache modinfo.json metadata from a mod zip file.
 
         Args:
-            name: The zip member name to validate.
+            zip_path: Path to the mod zip file.
 
         Returns:
-            True if the path is safe, False if it attempts path traversal.
+            ModMetadata, or None if modinfo.json is missing or invalid.
         """
-        # Use a dummy base directory to simulate extraction
-        base_dir = Path("/safe/base")
-        base_resolved = base_dir.resolve()
-
-        # Construct target path and resolve it
-        target_path = (base_dir / name).resolve()
-
-        # Check if resolved path stays within base directory
-        try:
-            target_path.relative_to(base_resolved)
-            return True
-        except ValueError:
-            # Path escapes the base directory
-            return False
+        return self._parse_modinfo(zip_path.name, self._extract_modinfo_from_zip(zip_path))
 
-    def _extract_modinfo_from_zip(self, zip_path: Path) -> dict[str, object] | None:
-        """Extract modinfo.json content from a mod zip file.
-
-        Args:
-            zip_path: Path to the mod zip file.
+    def _parse_modinfo(
+        self, filename: str, modinfo_data: dict[str, object] | None
+    ) -> ModMetadata | None:
+        """Validate extracted modinfo.json and cache it."""
+        if modinfo_data is None:
+            return None
 
-        Returns:
-            Parsed modinfo.json as dict, or None if not found or corrupt.
-        """
         try:
-            with zipfile.ZipFile(zip_path, "r") as zf:
-                # Look for modinfo.json at the root of the zip
-                for name in zf.namelist():
-                    # Handle both root-level and any directory structure
-                    if name.endswith("modinfo.json"):
-                        # Security: validate path doesn't escape using resolve()
-                        # This catches all path traversal attempts including:
-                        # - ../etc/passwd
-                        # - subdir/../../etc/passwd
-                        # - /absolute/path
-                        # - ./leading/dot
-                        if not self._is_safe_zip_path(name):
-                            logger.warning(
-                                "modinfo_path_traversal_attempt",
-                                filename=zip_path.name,
-                                path=name,
-                            )
-                            continue
-
-                        content = zf.read(name).decode("utf-8")
-                        return json.loads(content)
-
-                logger.debug(
-                    "modinfo_not_found_in_zip",
-                    filename=zip_path.name,
-                )
-                return None
-
-        except (zipfile.BadZipFile, KeyError, json.JSONDecodeError) as e:
+            metadata = ModMetadata.model_validate(modinfo_data)
+        except ValueError as e:
             logger.warning(
-                "modinfo_extraction_failed",
-                filename=zip_path.name,
+                "modinfo_parse_failed",
+                filename=filename,
                 error=str(e),
             )
             return None
 
-    def _cache_modinfo(self, slug: str, version: str, modinfo_data: dict[str, object]) -> None:
-        """Cache modinfo.json to the state directory.
+        self._cache_modinfo(metadata.modid, metadata.version, modinfo_data, metadata)
+        return metadata
+
+    def _extract_modinfo_from_zip(self, zip_path: Path) -> dict[str, object] | None:
+        """Extract modinfo.json content from a mod zip file (see extract_modinfo).
 
-        Cache location: state/mods/<slug>/<version>/modinfo.json
+        Results are cached by the zip's fingerprint, so a file that is
+        re-imported unchanged (including after a rename, e.g. disabling it)
+        is not opened again.
+        """
+        try:
+            fingerprint = file_fingerprint(zip_path.stat())
+        except OSError:
+            return extract_modinfo(zip_path)
+        hit, modinfo = self._cached_modinfo(fingerprint)
+        if hit:
+            return modinfo
+        modinfo = extract_modinfo(zip_path)
+        self._remember_modinfo(fingerprint, modinfo)
+        return modinfo
+
+    def _cached_modinfo(
+        self, fingerprint: FileFingerprint
+    ) -> tuple[bool, dict[str, object] | None]:
+        """Look up extracted modinfo.json by zip fingerprint as (hit, modinfo)."""
+        with self._modinfo_lock:
+            if fingerprint not in self._modinfo_by_fingerprint:
+                return False, None
+            self._modinfo_by_fingerprint.move_to_end(fingerprint)
+            return True, self._modinfo_by_fingerprint[fingerprint]
+
+    def _remember_modinfo(
+        self, fingerprint: FileFingerprint, modinfo: dict[str, object] | None
+    ) -> None:
+        """Cache extracted modinfo.json by zip fingerprint (LRU bounded)."""
+        with self._modinfo_lock:
+            self._modinfo_by_fingerprint[fingerprint] = modinfo
+            self._modinfo_by_fingerprint.move_to_end(fingerprint)
+            while len(self._modinfo_by_fingerprint) > MODINFO_CACHE_SIZE:
+                self._modinfo_by_fingerprint.popitem(last=False)
+
+    def _cache_modinfo(
+        self,
+        slug: str,
+        version: str,
+        modinfo_data: dict[str, object],
+        metadata: ModMetadata | None = None,
+    ) -> None:
+        """Cache modinfo.json in the state store and in memory.
+
+        JSON store location: state/mods/<slug>/<version>/modinfo.json
 
         Args:
             slug: The mod slug (modid).
             version: The mod version.
             modinfo_data: The modinfo.json content as a dict.
+            metadata: The already parsed metadata, if available.
         """
         # Validate slug and version don't contain path traversal
         if ".." in slug or "/" in slug or ".." in version or "/" in version:
@@ -335,22 +526,21 @@ class ModStateManager:
             )
             return
 
-        cache_dir = self._state_dir / "mods" / slug / version
-        cache_dir.mkdir(parents=True, exist_ok=True)
-
-        cache_file = cache_dir / "modinfo.json"
-        cache_file.write_text(json.dumps(modinfo_data, indent=2))
-
-        logger.debug(
-            "modinfo_cached",
-            slug=slug,
-            version=version,
-            path=str(cache_file),
-        )
+        self._store.write_metadata(slug, version, modinfo_data)
+        if metadata is None:
+            try:
+                metadata = ModMetadata.model_validate(modinfo_data)
+            except ValueError:
+                metadata = None
+        with self._metadata_lock:
+            self._metadata[(slug, version)] = metadata
+            self._generation += 1
 
     def get_cached_metadata(self, slug: str, version: str) -> ModMetadata | None:
         """Get cached modinfo.json metadata.
 
+        Served from memory after the first read of each slug and version.
+
         Args:
             slug: The mod slug (modid).
             version: The mod version.
@@ -362,22 +552,49 @@ class ModStateManager:
         if ".." in slug or "/" in slug or ".." in version or "/" in version:
             return None
 
-        cache_file = self._state_dir / "mods" / slug / version / "modinfo.json"
+        key = (slug, version)
+        with self._metadata_lock:
+            if key in self._metadata:
+                return self._metadata[key]
 
-        if not cache_file.exists():
-            return None
+        data = self._store.read_metadata(slug, version)
+        metadata: ModMetadata | None = None
+        if data is not None:
+            try:
+                metadata = ModMetadata.model_validate(data)
+            except ValueError as e:
+                logger.warning(
+                    "cached_modinfo_corrupt",
+                    slug=slug,
+                    version=version,
+                    error=str(e),
+                )
+        with self._metadata_lock:
+            # Keep metadata cached by an import that finished meanwhile
+            return self._metadata.setdefault(key, metadata)
 
-        try:
-            data = json.loads(cache_file.read_text())
-            return ModMetadata.model_validate(data)
-        except (json.JSONDecodeError, ValueError) as e:
-            logger.warning(
-                "cached_modinfo_corrupt",
-                slug=slug,
-                version=version,
-                error=str(e),
-            )
-            return None
+    def forget_metadata(self, slug: str) -> None:
+        """Drop in-memory metadata for a mod whose on-disk cache was deleted.
+
+        Args:
+            slug: The mod slug (modid).
+        """
+        with self._metadata_lock:
+            for key in [key for key in self._metadata if key[0] == slug]:
+                del self._metadata[key]
+            self._generation += 1
+
+    def delete_cached_metadata(self, slug: str) -> None:
+        """Delete cached modinfo.json for every version of a mod, in the store and memory.
+
+        Args:
+            slug: The mod slug (modid).
+        """
+        if ".." in slug or "/" in slug:
+            logger.warning("cache_path_traversal_attempt", slug=slug)
+            return
+        self._store.delete_metadata(slug)
+        self.forget_metadata(slug)
 
     def scan_mods_directory(self) -> list[str]:
         """Scan the mods directory for mod zip files.
@@ -406,61 +623,293 @@ class ModStateManager:
         )
         return filenames
 
-    def sync_state_with_disk(self) -> None:
-        """Reconcile state index with actual files in mods directory.
+    def _scan_fingerprints(self) -> dict[str, FileFingerprint]:
+        """Fingerprint every mod zip in the mods directory (one stat per file)."""
+        fingerprints: dict[str, FileFingerprint] = {}
+        try:
+            with os.scandir(self._mods_dir) as entries:
+                for entry in entries:
+                    name = entry.name
+                    if not (name.endswith(".zip") or name.endswith(".zip.disabled")):
+                        continue
+                    try:
+                        if entry.is_file():
+                            fingerprints[name] = file_fingerprint(entry.stat())
+                    except FileNotFoundError:
+                        continue  # Removed while scanning
+        except FileNotFoundError:
+            logger.debug("mods_directory_not_found", path=str(self._mods_dir))
+        return fingerprints
+
+    def _stat_fingerprints(self, filenames: Iterable[str]) -> dict[str, FileFingerprint]:
+        """Fingerprint the given mod files that exist in the mods directory."""
+        fingerprints: dict[str, FileFingerprint] = {}
+        for name in filenames:
+            if not (name.endswith(".zip") or name.endswith(".zip.disabled")):
+                continue
+            try:
+                st = os.stat(self._mods_dir / name)
+            except (FileNotFoundError, NotADirectoryError):
+                continue
+            if stat.S_ISREG(st.st_mode):
+                fingerprints[name] = file_fingerprint(st)
+        return fingerprints
 
-        - For each .zip file on disk not in state: import and add to state
-        - For each state entry without matching file: remove from state
-        - Saves state after making changes
+    def scan_changes(self, filenames: Iterable[str] | None = None) -> DiskChanges:
+        """Compare the mods directory against the state index.
+
+        Only stats files; nothing is opened. Safe to run off the event loop,
+        as it works on a snapshot of the state.
+
+        Args:
+            filenames: Only check these files (e.g., paths reported by a
+                filesystem watcher); None scans the whole directory.
+
+        Returns:
+            DiskChanges describing added, changed, removed and unchanged files.
         """
-        disk_files = set(self.scan_mods_directory())
-        state_files = set(self._state.keys())
+        states = dict(self._state)
+        if filenames is None:
+            disk = self._scan_fingerprints()
+            candidates = set(states)
+        else:
+            candidates = set(filenames)
+            disk = self._stat_fingerprints(candidates)
+        changes = DiskChanges(removed=sorted((candidates & set(states)) - set(disk)))
+        for filename, fingerprint in disk.items():
+            state = states.get(filename)
+            if state is None:
+                changes.added[filename] = fingerprint
+            elif state.fingerprint is None:
+                changes.adopted[filename] = fingerprint
+            elif tuple(state.fingerprint) != fingerprint:
+                changes.changed[filename] = fingerprint
+            else:
+                changes.unchanged += 1
+        return changes
+
+    def extract_metadata(self, filenames: list[str]) -> dict[str, ModMetadata]:
+        """Import metadata for mod files, extracting modinfo.json in parallel.
+
+        Zips whose fingerprint was already read (e.g., renamed files) come
+        from the modinfo cache. With PROCESS_POOL_MIN_FILES or more of the
+        rest, zips are read on a pool of worker processes (zip parsing and
+        JSON decoding are CPU-bound); otherwise, or if the pool cannot be
+        started, they are read here. Metadata is validated and cached as with import_mod().
 
-        changes_made = False
+        Args:
+            filenames: Mod filenames in the mods directory.
 
-        # New files: import and add to state
-        for filename in disk_files - state_files:
-            zip_path = self._mods_dir / filename
-            metadata = self.import_mod(zip_path)
+        Returns:
+            Mapping of filename to metadata (filename-derived if the zip has
+            no valid modinfo.json).
+        """
+        modinfos: dict[str, dict[str, object] | None] = {}
+        misses: dict[str, FileFingerprint | None] = {}
+        for filename in filenames:
+            try:
+                fingerprint = file_fingerprint((self._mods_dir / filename).stat())
+            except OSError:
+                misses[filename] = None
+                continue
+            hit, modinfo = self._cached_modinfo(fingerprint)
+            if hit:
+                modinfos[filename] = modinfo
+            else:
+                misses[filename] = fingerprint
+
+        paths = [self._mods_dir / filename for filename in misses]
+        extracted: list[dict[str, object] | None] | None = None
+        if len(paths) >= PROCESS_POOL_MIN_FILES:
+            workers = min(len(paths), os.cpu_count() or 1, MAX_EXTRACT_WORKERS)
+            try:
+                with ProcessPoolExecutor(
+                    max_workers=workers, mp_context=multiprocessing.get_context("spawn")
+                ) as pool:
+                    chunksize = max(1, len(paths) // (workers * 4))
+                    extracted = list(pool.map(extract_modinfo, paths, chunksize=chunksize))
+            except (BrokenProcessPool, OSError) as e:
+                logger.warning("modinfo_process_pool_failed", error=str(e))
+        if extracted is None:
+            extracted = [extract_modinfo(path) for path in paths]
+        for (filename, fingerprint), modinfo in zip(misses.items(), extracted, strict=True):
+            modinfos[filename] = modinfo
+            if fingerprint is not None:
+                self._remember_modinfo(fingerprint, modinfo)
+
+        return {
+            filename: self._import_modinfo(filename, modinfos[filename]) for filename in filenames
+        }
+
+    def apply_changes(
+        self, changes: DiskChanges, metadata: dict[str, ModMetadata]
+    ) -> ModReconcileResult:
+        """Apply reconciliation changes to the in-memory state index.
+
+        New files are added. Replaced files are re-imported, keeping their
+        install details if they still contain the same mod. Entries for
+        deleted files are removed. Files whose entry was recorded after the
+        scan (e.g., by an install that finished meanwhile) are left as they
+        are. Does not save the state.
+
+        Args:
+            changes: Result of scan_changes().
+            metadata: Result of extract_metadata() for changes.to_extract.
+
+        Returns:
+            ModReconcileResult summarizing the changes.
+        """
+        now = datetime.now(UTC)
+
+        for filename, fingerprint in changes.adopted.items():
+            state = self._state.get(filename)
+            if state is not None:
+                self.set_mod_state(filename, state.model_copy(update={"fingerprint": fingerprint}))
 
+        # The index may have changed since scan_changes() (e.g., an install
+        # recorded its file meanwhile): re-check each entry before writing it
+        added: list[str] = []
+        changed: list[str] = []
+        recorded = 0
+
+        # New files: import and add to state
+        for filename, fingerprint in changes.added.items():
+            mod_metadata = metadata[filename]
+            current = self._state.get(filename)
+            if current is not None:
+                if self._recorded_since_scan(current, fingerprint):
+                    recorded += 1
+                else:
+                    self._replace_file_state(filename, fingerprint, mod_metadata, now)
+                    changed.append(filename)
+                continue
             # Determine if mod is disabled based on filename
             is_disabled = filename.endswith(".disabled")
-
-            state = ModState(
-                filename=filename,
-                slug=metadata.modid,
-                version=metadata.version,
-                enabled=not is_disabled,
-                installed_at=datetime.now(UTC),
+            self.set_mod_state(
+                filename,
+                ModState(
+                    filename=filename,
+                    slug=mod_metadata.modid,
+                    version=mod_metadata.version,
+                    enabled=not is_disabled,
+                    installed_at=now,
+                    fingerprint=fingerprint,
+                ),
             )
-            self._state[filename] = state
-            changes_made = True
-
+            added.append(filename)
             logger.info(
                 "mod_state_added",
                 filename=filename,
-                slug=metadata.modid,
+                slug=mod_metadata.modid,
                 enabled=not is_disabled,
             )
 
-        # Deleted files: remove from state
-        for filename in state_files - disk_files:
-            slug = self._state[filename].slug
-            del self._state[filename]
-            changes_made = True
+        # Replaced files: re-import, keeping install details for the same mod
+        for filename, fingerprint in changes.changed.items():
+            current = self._state.get(filename)
+            if current is not None and self._recorded_since_scan(current, fingerprint):
+                recorded += 1
+                continue
+            self._replace_file_state(filename, fingerprint, metadata[filename], now)
+            changed.append(filename)
 
+        # Deleted files: remove from state
+        for filename in changes.removed:
+            state = self._state.get(filename)
+            if state is None:
+                continue
+            self.remove_mod(filename)
             logger.info(
                 "mod_state_removed_deleted_file",
                 filename=filename,
-                slug=slug,
+                slug=state.slug,
+            )
+
+        return ModReconcileResult(
+            added=sorted(added),
+            changed=sorted(changed),
+            removed=changes.removed,
+            unchanged=changes.unchanged + len(changes.adopted) + recorded,
+        )
+
+    @staticmethod
+    def _recorded_since_scan(state: ModState, fingerprint: FileFingerprint) -> bool:
+        """Whether an entry already describes the scanned file (or a newer one).
+
+        An entry without a fingerprint was written by the API after the scan
+        and is adopted by the next reconcile.
+        """
+        return state.fingerprint is None or tuple(state.fingerprint) == fingerprint
+
+    def _replace_file_state(
+        self,
+        filename: str,
+        fingerprint: FileFingerprint,
+        mod_metadata: ModMetadata,
+        now: datetime,
+    ) -> None:
+        """Re-import a replaced file, keeping install details if it is the same mod."""
+        previous = self._state.get(filename)
+        update: dict[str, object] = {
+            "slug": mod_metadata.modid,
+            "version": mod_metadata.version,
+            "fingerprint": fingerprint,
+            "sha256": None,
+            "update_available": False,
+        }
+        if previous is None or previous.slug != mod_metadata.modid:
+            previous = ModState(
+                filename=filename,
+                slug=mod_metadata.modid,
+                version=mod_metadata.version,
+                enabled=not filename.endswith(".disabled"),
+                installed_at=now,
             )
+        self.set_mod_state(filename, previous.model_copy(update=update))
+        logger.info(
+            "mod_state_file_replaced",
+            filename=filename,
+            slug=mod_metadata.modid,
+            version=mod_metadata.version,
+        )
+
+    def reconcile(self, filenames: Iterable[str] | None = None) -> ModReconcileResult:
+        """Reconcile the state index with the files in the mods directory.
+
+        Unchanged files (same inode, size and mtime) are skipped; new and
+        replaced zips are imported; entries for deleted files are removed.
+        Saves state after making changes.
+
+        Args:
+            filenames: Only reconcile these files; None checks the whole
+                directory.
+
+        Returns:
+            ModReconcileResult summarizing the changes.
+        """
+        changes = self.scan_changes(filenames)
+        metadata = self.extract_metadata(changes.to_extract)
+        result = self.apply_changes(changes, metadata)
 
         # Save if changes were made
-        if changes_made:
+        if changes.state_changed:
             self.save()
             logger.info(
                 "mod_state_synced",
                 total_mods=len(self._state),
-                added=len(disk_files - state_files),
-                removed=len(state_files - disk_files),
+                added=len(result.added),
+                changed=len(result.changed),
+                removed=len(result.removed),
+                unchanged=result.unchanged,
             )
+        return result
+
+    def sync_state_with_disk(self) -> None:
+        """Reconcile state index with actual files in mods directory.
+
+        - For each .zip file on disk not in state: import and add to state
+        - For each replaced file: re-import it
+        - For each state entry without matching file: remove from state
+        - Saves state after making changes
+        """
+        self.reconcile()
@@ -0,0 +1,413 @@
+"""Persistence backends for the mod state index and cached modinfo.json.
+
+ModStateManager keeps the state in memory and writes it through a store:
+
+- JsonModStore (default): the state index in state/mods.json, rewritten in
+  full on every save (temp file + rename), and one
+  state/mods/<slug>/<version>/modinfo.json file per cached mod version.
+- SqliteModStore: a single state/mods.db SQLite database in WAL mode. A
+  save writes only the rows that changed since the previous save, in one
+  transaction, and cached metadata lives in the same database. On first
+  use it migrates an existing JSON layout (mods.json and the modinfo files
+  are renamed to *.migrated afterwards, not deleted).
+
+Stores deal in plain data; validation, path checks and caching stay in
+ModStateManager.
+"""
+
+from __future__ import annotations
+
+import json
+import shutil
+import sqlite3
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Literal, Protocol
+
+import structlog
+
+from vintagestory_api.models.mods import ModState
+
+logger = structlog.get_logger()
+
+StateBackend = Literal["json", "sqlite"]
+
+# Bump when the SQLite schema changes
+SCHEMA_VERSION = 1
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS mods (
+    filename TEXT PRIMARY KEY,
+    slug TEXT NOT NULL,
+    version TEXT NOT NULL,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS mods_slug ON mods (slug);
+CREATE INDEX IF NOT EXISTS mods_version ON mods (version);
+CREATE TABLE IF NOT EXISTS modinfo (
+    slug TEXT NOT NULL,
+    version TEXT NOT NULL,
+    data TEXT NOT NULL,
+    PRIMARY KEY (slug, version)
+);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+
+class ModStore(Protocol):
+    """Storage for mod state entries and cached modinfo.json data."""
+
+    def load_states(self) -> dict[str, ModState]:
+        """Load all state entries (empty if there is no or corrupt state)."""
+        ...
+
+    def write_states(self, states: dict[str, ModState], dirty: frozenset[str]) -> None:
+        """Persist the state.
+
+        Args:
+            states: The complete state index.
+            dirty: Filenames changed since the last write (added, updated or
+                removed). Stores that write incrementally only touch these.
+        """
+        ...
+
+    def read_metadata(self, slug: str, version: str) -> dict[str, object] | None:
+        """Read cached modinfo.json data, or None if not cached or unreadable."""
+        ...
+
+    def write_metadata(self, slug: str, version: str, data: dict[str, object]) -> None:
+        """Cache modinfo.json data for a mod version."""
+        ...
+
+    def delete_metadata(self, slug: str) -> None:
+        """Delete cached modinfo.json data for every version of a mod."""
+        ...
+
+    def close(self) -> None:
+        """Release resources held by the store."""
+        ...
+
+
+class JsonModStore:
+    """State in mods.json and metadata in per-version modinfo.json files."""
+
+    def __init__(self, state_dir: Path) -> None:
+        """Initialize the store.
+
+        Args:
+            state_dir: Directory containing mods.json and the mods/ cache.
+        """
+        self._state_dir = state_dir
+
+    @property
+    def state_file(self) -> Path:
+        """Get the path to the mods.json state file."""
+        return self._state_dir / "mods.json"
+
+    @property
+    def metadata_dir(self) -> Path:
+        """Get the directory holding cached modinfo.json files."""
+        return self._state_dir / "mods"
+
+    def load_states(self) -> dict[str, ModState]:
+        """Load mod state from mods.json.
+
+        If the file doesn't exist or is corrupt, returns empty state.
+        """
+        if not self.state_file.exists():
+            logger.debug("mod_state_file_not_found", path=str(self.state_file))
+            return {}
+
+        try:
+            data = json.loads(self.state_file.read_text())
+            states = {
+                filename: ModState.model_validate(state_data)
+                for filename, state_data in data.items()
+            }
+        except (
+            json.JSONDecodeError,
+            ValueError,
+            AttributeError,
+            TypeError,
+            IsADirectoryError,
+            PermissionError,
+        ) as e:
+            logger.warning(
+                "mod_state_corrupt",
+                error=str(e),
+                path=str(self.state_file),
+            )
+            return {}
+
+        logger.info(
+            "mod_state_loaded",
+            mod_count=len(states),
+            path=str(self.state_file),
+        )
+        return states
+
+    def write_states(self, states: dict[str, ModState], dirty: frozenset[str]) -> None:
+        """Rewrite mods.json with the complete state.
+
+        Uses atomic write (temp file + rename) to prevent corruption.
+        Creates the state directory if it doesn't exist.
+        """
+        # Ensure state directory exists
+        self._state_dir.mkdir(parents=True, exist_ok=True)
+
+        # Serialize state to JSON
+        data = {filename: state.model_dump(mode="json") for filename, state in states.items()}
+        json_content = json.dumps(data, indent=2)
+
+        # Atomic write: write to temp file first, then rename
+        temp_file = self.state_file.with_suffix(".tmp")
+        try:
+            temp_file.write_text(json_content)
+            temp_file.rename(self.state_file)
+            logger.debug(
+                "mod_state_saved",
+                mod_count=len(states),
+                path=str(self.state_file),
+            )
+        except OSError as e:
+            logger.error(
+                "mod_state_save_failed",
+                error=str(e),
+                path=str(self.state_file),
+            )
+            # Clean up temp file if it exists
+            if temp_file.exists():
+                temp_file.unlink()
+            raise
+
+    def read_metadata(self, slug: str, version: str) -> dict[str, object] | None:
+        """Read state/mods/<slug>/<version>/modinfo.json."""
+        cache_file = self.metadata_dir / slug / version / "modinfo.json"
+        if not cache_file.exists():
+            return None
+        try:
+            data = json.loads(cache_file.read_text())
+        except json.JSONDecodeError as e:
+            logger.warning(
+                "cached_modinfo_corrupt",
+                slug=slug,
+                version=version,
+                error=str(e),
+            )
+            return None
+        return data if isinstance(data, dict) else None
+
+    def write_metadata(self, slug: str, version: str, data: dict[str, object]) -> None:
+        """Write state/mods/<slug>/<version>/modinfo.json."""
+        cache_dir = self.metadata_dir / slug / version
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        cache_file = cache_dir / "modinfo.json"
+        cache_file.write_text(json.dumps(data, indent=2))
+        logger.debug(
+            "modinfo_cached",
+            slug=slug,
+            version=version,
+            path=str(cache_file),
+        )
+
+    def delete_metadata(self, slug: str) -> None:
+        """Delete state/mods/<slug>."""
+        cache_dir = self.metadata_dir / slug
+        if cache_dir.exists():
+            shutil.rmtree(cache_dir)
+            logger.debug("mod_cache_deleted", slug=slug, path=str(cache_dir))
+
+    def close(self) -> None:
+        """Nothing to release."""
+
+
+class SqliteModStore:
+    """State and metadata in a single SQLite database (WAL mode).
+
+    One connection is shared by the event loop and worker threads,
+    serialized by a lock. Each write is a single transaction, so a crash
+    leaves either the previous or the new state, never a partial one.
+    """
+
+    def __init__(self, state_dir: Path) -> None:
+        """Initialize the store. The database is opened on first use.
+
+        Args:
+            state_dir: Directory for mods.db (and the JSON layout to migrate).
+        """
+        self._state_dir = state_dir
+        self._conn: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def db_path(self) -> Path:
+        """Get the path to the database file."""
+        return self._state_dir / "mods.db"
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self._state_dir.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.db_path, check_same_thread=False, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            # NORMAL is crash-safe in WAL mode (a commit may be lost on power
+            # failure, but the database is never corrupted)
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(_SCHEMA)
+            self._conn = conn
+            self._migrate_from_json(conn)
+        return self._conn
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        with self._lock:
+            conn = self._connect()
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield conn
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
+
+    def _migrate_from_json(self, conn: sqlite3.Connection) -> None:
+        """Import mods.json and cached modinfo.json files into a new database."""
+        if conn.execute("SELECT 1 FROM meta WHERE key = 'schema_version'").fetchone():
+            return
+
+        json_store = JsonModStore(self._state_dir)
+        states = json_store.load_states()
+        modinfos: list[tuple[str, str, str]] = []
+        if json_store.metadata_dir.is_dir():
+            for cache_file in json_store.metadata_dir.glob("*/*/modinfo.json"):
+                try:
+                    data = json.loads(cache_file.read_text())
+                except (OSError, json.JSONDecodeError):
+                    continue
+                modinfos.append(
+                    (cache_file.parent.parent.name, cache_file.parent.name, json.dumps(data))
+                )
+
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            conn.executemany(
+                "INSERT OR REPLACE INTO mods (filename, slug, version, data) VALUES (?, ?, ?, ?)",
+                [_state_row(filename, state) for filename, state in states.items()],
+            )
+            conn.executemany(
+                "INSERT OR REPLACE INTO modinfo (slug, version, data) VALUES (?, ?, ?)", modinfos
+            )
+            conn.execute(
+                "INSERT INTO meta (key, value) VALUES ('schema_version', ?)",
+                (str(SCHEMA_VERSION),),
+            )
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+
+        # Keep the old layout as a backup, out of the way
+        for path in (json_store.state_file, json_store.metadata_dir):
+            if path.exists():
+                path.rename(path.with_name(f"{path.name}.migrated"))
+        if states or modinfos:
+            logger.info("mod_state_migrated", mods=len(states), modinfo_files=len(modinfos))
+
+    def load_states(self) -> dict[str, ModState]:
+        """Load all state rows; rows that fail validation are skipped."""
+        with self._lock:
+            rows = self._connect().execute("SELECT filename, data FROM mods").fetchall()
+        states: dict[str, ModState] = {}
+        for filename, data in rows:
+            try:
+                states[filename] = ModState.model_validate_json(data)
+            except ValueError as e:
+                logger.warning("mod_state_row_corrupt", filename=filename, error=str(e))
+        logger.info("mod_state_loaded", mod_count=len(states), path=str(self.db_path))
+        return states
+
+    def write_states(self, states: dict[str, ModState], dirty: frozenset[str]) -> None:
+        """Upsert or delete the rows for the changed filenames in one transaction."""
+        if not dirty:
+            return
+        upserts = [_state_row(f, states[f]) for f in dirty if f in states]
+        deletes = [(f,) for f in dirty if f not in states]
+        try:
+            with self._transaction() as conn:
+                conn.executemany(
+                    "INSERT OR REPLACE INTO mods (filename, slug, version, data) "
+                    "VALUES (?, ?, ?, ?)",
+                    upserts,
+                )
+                conn.executemany("DELETE FROM mods WHERE filename = ?", deletes)
+        except sqlite3.Error as e:
+            logger.error("mod_state_save_failed", error=str(e), path=str(self.db_path))
+            raise
+        logger.debug(
+            "mod_state_saved",
+            upserted=len(upserts),
+            deleted=len(deletes),
+            path=str(self.db_path),
+        )
+
+    def read_metadata(self, slug: str, version: str) -> dict[str, object] | None:
+        """Read cached modinfo.json data from the modinfo table."""
+        with self._lock:
+            row = (
+                self._connect()
+                .execute("SELECT data FROM modinfo WHERE slug = ? AND version = ?", (slug, version))
+                .fetchone()
+            )
+        if row is None:
+            return None
+        try:
+            data = json.loads(row[0])
+        except json.JSONDecodeError as e:
+            logger.warning("cached_modinfo_corrupt", slug=slug, version=version, error=str(e))
+            return None
+        return data if isinstance(data, dict) else None
+
+    def write_metadata(self, slug: str, version: str, data: dict[str, object]) -> None:
+        """Insert or replace a modinfo row."""
+        with self._transaction() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO modinfo (slug, version, data) VALUES (?, ?, ?)",
+                (slug, version, json.dumps(data)),
+            )
+        logger.debug("modinfo_cached", slug=slug, version=version, path=str(self.db_path))
+
+    def delete_metadata(self, slug: str) -> None:
+        """Delete the modinfo rows for every version of a mod."""
+        with self._transaction() as conn:
+            conn.execute("DELETE FROM modinfo WHERE slug = ?", (slug,))
+        logger.debug("mod_cache_deleted", slug=slug, path=str(self.db_path))
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+def _state_row(filename: str, state: ModState) -> tuple[str, str, str, str]:
+    return (filename, state.slug, state.version, state.model_dump_json())
+
+
+def create_mod_store(state_dir: Path, backend: StateBackend = "json") -> ModStore:
+    """Create the state store for a backend.
+
+    Args:
+        state_dir: Directory for state files.
+        backend: "json" (mods.json + modinfo files) or "sqlite" (mods.db).
+
+    Returns:
+        The store.
+    """
+    if backend == "sqlite":
+        return SqliteModStore(state_dir)
+    return JsonModStore(state_dir)
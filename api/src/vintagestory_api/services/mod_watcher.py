@@ -0,0 +1,261 @@
+"""Mods directory watcher and change feed.
+
+ModDirectoryWatcher watches serverdata/Mods so mods copied in, replaced or
+deleted by hand (or by rsync, a file manager, ...) show up without a manual
+reconcile. Events are debounced, so a burst such as an rsync dropping 50
+zips becomes a single incremental reconciliation of just the affected
+files. It uses inotify (via watchfiles) where available and falls back to
+polling the directory, which is cheap because reconciliation only stats
+files whose fingerprint is unchanged.
+
+Changes are published on a ModChangeFeed, which the UI long-polls through
+GET /mods/events.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import TYPE_CHECKING, Literal
+
+import structlog
+
+from vintagestory_api.models.mods import ModChangeEvent, ModReconcileResult
+
+try:
+    import watchfiles
+except ImportError:  # pragma: no cover - watchfiles ships with uvicorn[standard]
+    watchfiles = None
+
+if TYPE_CHECKING:
+    from vintagestory_api.services.mods import ModService
+
+logger = structlog.get_logger()
+
+# Quiet period: a burst of filesystem events is reconciled once no new
+# event arrived for this long
+WATCH_QUIET_MS = 1500
+
+# Upper bound on how long a continuous burst is batched before reconciling
+WATCH_MAX_BATCH_MS = 10_000
+
+# Directory scan interval when inotify is unavailable
+POLL_INTERVAL_SECONDS = 5.0
+
+# Change events kept for clients catching up
+MAX_CHANGE_EVENTS = 100
+
+WatchMode = Literal["auto", "polling", "off"]
+
+
+def _is_mod_file(name: str) -> bool:
+    return name.endswith(".zip") or name.endswith(".zip.disabled")
+
+
+class ModChangeFeed:
+    """Recent mod changes, with long-poll waiting for new ones."""
+
+    def __init__(self, max_events: int = MAX_CHANGE_EVENTS) -> None:
+        """Initialize the feed.
+
+        Args:
+            max_events: Number of recent events kept.
+        """
+        self._events: deque[ModChangeEvent] = deque(maxlen=max_events)
+        self._sequence = 0
+        self._waiters: set[asyncio.Future[None]] = set()
+
+    @property
+    def cursor(self) -> int:
+        """Sequence number of the latest event (0 if none)."""
+        return self._sequence
+
+    def publish(
+        self, source: Literal["startup", "watcher", "api"], result: ModReconcileResult
+    ) -> ModChangeEvent:
+        """Record a change and wake up waiting clients.
+
+        Args:
+            source: What triggered the reconciliation.
+            result: The reconciliation result.
+
+        Returns:
+            The published event.
+        """
+        self._sequence += 1
+        event = ModChangeEvent(
+            sequence=self._sequence,
+            timestamp=datetime.now(UTC),
+            source=source,
+            added=result.added,
+            changed=result.changed,
+            removed=result.removed,
+            pending_restart=result.pending_restart,
+        )
+        self._events.append(event)
+        for waiter in self._waiters:
+            if not waiter.done():
+                waiter.set_result(None)
+        logger.debug("mod_change_published", sequence=event.sequence, source=source)
+        return event
+
+    def events_since(self, cursor: int) -> list[ModChangeEvent]:
+        """Get the kept events after a cursor."""
+        return [event for event in self._events if event.sequence > cursor]
+
+    async def wait(self, cursor: int, timeout: float) -> list[ModChangeEvent]:
+        """Get events after a cursor, waiting up to timeout for one to arrive.
+
+        Args:
+            cursor: Sequence number the client has seen.
+            timeout: Seconds to wait if there are no newer events.
+
+        Returns:
+            Events after the cursor (empty on timeout).
+        """
+        events = self.events_since(cursor)
+        if events or timeout <= 0:
+            return events
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.add(waiter)
+        try:
+            await asyncio.wait_for(waiter, timeout)
+        except TimeoutError:
+            pass
+        finally:
+            self._waiters.discard(waiter)
+        return self.events_since(cursor)
+
+
+class ModDirectoryWatcher:
+    """Reconciles mod state when files in the mods directory change."""
+
+    def __init__(
+        self,
+        service: ModService,
+        mode: WatchMode = "auto",
+        quiet_ms: int = WATCH_QUIET_MS,
+        max_batch_ms: int = WATCH_MAX_BATCH_MS,
+        poll_interval: float = POLL_INTERVAL_SECONDS,
+    ) -> None:
+        """Initialize the watcher.
+
+        Args:
+            service: The mod service whose mods directory is watched.
+            mode: "auto" (inotify, falling back to polling), "polling" or "off".
+            quiet_ms: Reconcile a burst of events once none arrived for this long.
+            max_batch_ms: Reconcile a burst that keeps going after this long.
+            poll_interval: Seconds between scans in polling mode.
+        """
+        self._service = service
+        self._mode = mode
+        self._quiet_ms = quiet_ms
+        self._max_batch_ms = max(max_batch_ms, quiet_ms)
+        self._poll_interval = poll_interval
+        self._task: asyncio.Task[None] | None = None
+        self._stop_event: asyncio.Event | None = None
+        self._backend: Literal["inotify", "polling"] | None = None
+
+    @property
+    def mods_dir(self) -> Path:
+        """Get the watched directory."""
+        return self._service.state_manager.mods_dir
+
+    @property
+    def backend(self) -> Literal["inotify", "polling"] | None:
+        """The backend in use, or None if not running."""
+        return self._backend if self.running else None
+
+    @property
+    def running(self) -> bool:
+        """Whether the watcher task is running."""
+        return self._task is not None and not self._task.done()
+
+    def start(self) -> None:
+        """Start watching in a background task (no-op if mode is "off" or running)."""
+        if self._mode == "off" or self.running:
+            return
+        self._stop_event = asyncio.Event()
+        self._task = asyncio.create_task(self._run(), name="mod-directory-watcher")
+        logger.info("mod_watcher_started", mods_dir=str(self.mods_dir), mode=self._mode)
+
+    async def stop(self) -> None:
+        """Stop watching and wait for the task to finish."""
+        if self._task is None:
+            return
+        assert self._stop_event is not None
+        self._stop_event.set()
+        try:
+            await asyncio.wait_for(self._task, timeout=5)
+        except TimeoutError:
+            self._task.cancel()
+        self._task = None
+        logger.info("mod_watcher_stopped")
+
+    async def _run(self) -> None:
+        assert self._stop_event is not None
+        stop = self._stop_event
+        use_inotify = self._mode == "auto" and watchfiles is not None
+        while not stop.is_set():
+            if not self.mods_dir.is_dir():
+                # Server not installed yet; wait for the directory to appear
+                await self._sleep(self._poll_interval)
+                continue
+            if use_inotify:
+                try:
+                    await self._watch_inotify()
+                except (OSError, RuntimeError) as e:
+                    # No inotify (e.g., watch limit reached, unsupported filesystem)
+                    logger.warning("mod_watcher_inotify_unavailable", error=str(e))
+                    use_inotify = False
+                continue
+            await self._poll()
+
+    async def _watch_inotify(self) -> None:
+        """Reconcile the files named in each debounced batch of events."""
+        assert watchfiles is not None and self._stop_event is not None
+        self._backend = "inotify"
+        async for changes in watchfiles.awatch(
+            self.mods_dir,
+            watch_filter=lambda _, path: _is_mod_file(Path(path).name),
+            # watchfiles yields once no event arrived for `step` ms, or after
+            # `debounce` ms of continuous events
+            step=self._quiet_ms,
+            debounce=self._max_batch_ms,
+            stop_event=self._stop_event,
+            recursive=False,
+        ):
+            filenames = {Path(path).name for _, path in changes}
+            await self._reconcile(filenames)
+            if not self.mods_dir.is_dir():
+                return  # Directory removed; wait for it again
+
+    async def _poll(self) -> None:
+        """Scan the whole directory every poll interval."""
+        self._backend = "polling"
+        await self._sleep(self._poll_interval)
+        if self._stop_event is not None and not self._stop_event.is_set():
+            await self._reconcile(None)
+
+    async def _reconcile(self, filenames: set[str] | None) -> None:
+        try:
+            result = await self._service.reconcile_mods(filenames, source="watcher")
+        except Exception as e:
+            logger.warning("mod_watcher_reconcile_failed", error=str(e))
+            return
+        if result.added or result.changed or result.removed:
+            logger.info(
+                "mod_watcher_changes",
+                added=len(result.added),
+                changed=len(result.changed),
+                removed=len(result.removed),
+            )
+
+    async def _sleep(self, seconds: float) -> None:
+        assert self._stop_event is not None
+        try:
+            await asyncio.wait_for(self._stop_event.wait(), timeout=seconds)
+        except TimeoutError:
+            pass
@@ -6,36 +6,59 @@ ModStateManager for state persistence, ModApiClient for external API access,
 and PendingRestartState for restart tracking.
 """
 
-import shutil
-from dataclasses import dataclass
+import asyncio
+import time
+import zipfile
+from collections.abc import Iterable
+from dataclasses import dataclass, replace
 from datetime import UTC, datetime
 from pathlib import Path
+from typing import Literal
 
 import structlog
 
 from vintagestory_api.config import Settings
 from vintagestory_api.models.mods import (
+    BulkInstallResult,
     CompatibilityInfo,
+    DependencyPlan,
     DisableResult,
     EnableResult,
+    InstalledMod,
+    ModBatchFailure,
     ModInfo,
+    ModIntegrity,
     ModLookupResponse,
+    ModMetadata,
+    ModpackEntry,
+    ModReconcileResult,
     ModRelease,
     ModState,
+    ModUpdate,
     RemoveResult,
+    UpdateAllResult,
 )
 from vintagestory_api.services.cache_eviction import CacheEvictionService
+from vintagestory_api.services.content_store import link_or_copy, sha256_file
 from vintagestory_api.services.mod_api import (
     CompatibilityStatus,
+    DownloadResult,
     ModApiClient,
+    ModDict,
     check_compatibility,
     extract_slug,
+    is_newer_release,
+    select_latest_compatible,
     validate_slug,
 )
 from vintagestory_api.services.mod_api import (
     ModNotFoundError as ApiModNotFoundError,
 )
+from vintagestory_api.services.mod_dependencies import DependencyResolver
+from vintagestory_api.services.mod_io import ModIO
 from vintagestory_api.services.mod_state import ModStateManager
+from vintagestory_api.services.mod_store import StateBackend
+from vintagestory_api.services.mod_watcher import ModChangeFeed
 from vintagestory_api.services.pending_restart import PendingRestartState
 
 logger = structlog.get_logger()
@@ -43,6 +66,9 @@ logger = structlog.get_logger()
 # Version placeholder when server is not installed or version unknown
 UNKNOWN_VERSION = "stable"
 
+# Concurrent downloads during batch operations (update-all, bulk install)
+MAX_CONCURRENT_DOWNLOADS = 8
+
 # Module-level service instance (singleton pattern)
 _mod_service: "ModService | None" = None
 
@@ -83,6 +109,7 @@ def get_mod_service() -> "ModService":
             restart_state=get_restart_state(),
             game_version=settings.game_version,
             mod_cache_max_size_mb=settings.mod_cache_max_size_mb,
+            state_backend=settings.mod_state_backend,
         )
 
         # Load existing state
@@ -159,6 +186,19 @@ class InstallResult:
     """Whether a server restart is required."""
 
 
+@dataclass
+class _StagedMod:
+    """A downloaded, verified and imported mod staged in the mods directory."""
+
+    download: DownloadResult
+    metadata: ModMetadata
+    filename: str
+    """Final filename in the mods directory."""
+
+    temp_path: Path
+    """Staged copy, renamed to filename on commit."""
+
+
 class ModService:
     """Orchestrates mod management operations.
 
@@ -180,19 +220,23 @@ class ModService:
         cache_dir: Path | None = None,
         game_version: str = "stable",
         mod_cache_max_size_mb: int = 500,
+        state_backend: StateBackend = "json",
     ) -> None:
         """Initialize the mod service.
 
         Args:
-            state_dir: Directory for state files (mods.json).
+            state_dir: Directory for state files (mods.json or mods.db).
             mods_dir: Directory containing mod zip files.
             restart_state: Shared PendingRestartState for restart tracking.
             cache_dir: Directory for caching downloaded mods. Defaults to
                        state_dir.parent / "cache" if not provided.
             game_version: Game version for compatibility checking (e.g., "1.21.3").
             mod_cache_max_size_mb: Maximum cache size in MB (0 to disable eviction).
+            state_backend: Mod state store, "json" or "sqlite".
         """
-        self._state_manager = ModStateManager(state_dir=state_dir, mods_dir=mods_dir)
+        self._state_manager = ModStateManager(
+            state_dir=state_dir, mods_dir=mods_dir, backend=state_backend
+        )
         self._restart_state = restart_state
         self._server_running = False
 
@@ -210,12 +254,22 @@ class ModService:
 
         self._game_version = game_version
         self._mod_api_client: ModApiClient | None = None
+        self._dependency_resolver: DependencyResolver | None = None
+        self._io = ModIO()
+        self._mod_infos: dict[str, ModInfo] | None = None
+        self._mod_infos_generation = -1
+        self._change_feed = ModChangeFeed()
 
     @property
     def state_manager(self) -> ModStateManager:
         """Get the ModStateManager instance."""
         return self._state_manager
 
+    @property
+    def change_feed(self) -> ModChangeFeed:
+        """Get the feed of mod changes found on disk (long-polled by the UI)."""
+        return self._change_feed
+
     @property
     def restart_state(self) -> PendingRestartState:
         """Get the restart state instance.
@@ -238,41 +292,13 @@ class ModService:
     def list_mods(self) -> list[ModInfo]:
         """List all installed mods with full metadata.
 
+        ModInfo objects are memoized and rebuilt only after the mod state
+        changes, so listing mods does no disk I/O.
+
         Returns:
             List of ModInfo objects with combined state and metadata.
         """
-        mods: list[ModInfo] = []
-        for state in self._state_manager.list_mods():
-            # Get cached metadata for full info
-            metadata = self._state_manager.get_cached_metadata(state.slug, state.version)
-
-            if metadata:
-                mod_info = ModInfo(
-                    filename=state.filename,
-                    slug=state.slug,
-                    version=state.version,
-                    enabled=state.enabled,
-                    installed_at=state.installed_at,
-                    asset_id=state.asset_id,
-                    name=metadata.name,
-                    authors=metadata.authors,
-                    description=metadata.description,
-                    side=metadata.side,
-                )
-            else:
-                # Fallback if no cached metadata
-                mod_info = ModInfo(
-                    filename=state.filename,
-                    slug=state.slug,
-                    version=state.version,
-                    enabled=state.enabled,
-                    installed_at=state.installed_at,
-                    asset_id=state.asset_id,
-                    name=state.slug,  # Use slug as name fallback
-                )
-            mods.append(mod_info)
-
-        return mods
+        return list(self._get_mod_infos().values())
 
     def get_mod(self, slug: str) -> ModInfo | None:
         """Get mod info by slug.
@@ -286,23 +312,33 @@ class ModService:
         state = self._state_manager.get_mod_by_slug(slug)
         if state is None:
             return None
-
+        return self._get_mod_infos().get(state.filename)
+
+    def _get_mod_infos(self) -> dict[str, ModInfo]:
+        """Get memoized ModInfo by filename, rebuilding them if the state changed."""
+        generation = self._state_manager.generation
+        if self._mod_infos is None or self._mod_infos_generation != generation:
+            self._mod_infos = {
+                state.filename: self._build_mod_info(state)
+                for state in self._state_manager.list_mods()
+            }
+            self._mod_infos_generation = generation
+        return self._mod_infos
+
+    def _build_mod_info(self, state: ModState) -> ModInfo:
+        """Combine a mod's state with its cached metadata."""
         metadata = self._state_manager.get_cached_metadata(state.slug, state.version)
-
-        if metadata:
-            return ModInfo(
-                filename=state.filename,
-                slug=state.slug,
-                version=state.version,
-                enabled=state.enabled,
-                installed_at=state.installed_at,
-                asset_id=state.asset_id,
-                name=metadata.name,
-                authors=metadata.authors,
-                description=metadata.description,
-                side=metadata.side,
-            )
-
+        details = (
+            {
+                "name": metadata.name,
+                "authors": metadata.authors,
+                "description": metadata.description,
+                "side": metadata.side,
+            }
+            if metadata
+            # Fallback if no cached metadata: use slug as name
+            else {"name": state.slug}
+        )
         return ModInfo(
             filename=state.filename,
             slug=state.slug,
@@ -310,7 +346,10 @@ class ModService:
             enabled=state.enabled,
             installed_at=state.installed_at,
             asset_id=state.asset_id,
-            name=state.slug,
+            last_released=state.last_released,
+            latest_version=state.latest_version,
+            update_available=state.update_available,
+            **details,
         )
 
     def _build_compatibility_message(
@@ -468,11 +507,13 @@ class ModService:
 
         return result
 
-    def enable_mod(self, slug: str) -> EnableResult:
+    async def enable_mod(self, slug: str) -> EnableResult:
         """Enable a disabled mod.
 
         Renames the mod file from .zip.disabled to .zip and updates state.
-        Sets pending_restart if the server is running.
+        File and state writes run on the mod I/O pool, serialized with other
+        operations on the same mod. Sets pending_restart if the server is
+        running.
 
         Args:
             slug: The mod slug (modid) to enable.
@@ -484,29 +525,31 @@ class ModService:
             ModNotFoundError: If the mod is not found.
         """
         logger.debug("enable_mod_start", slug=slug)
-        state = self._state_manager.get_mod_by_slug(slug)
-        if state is None:
-            logger.debug("enable_mod_not_found", slug=slug)
-            raise ModNotFoundError(slug)
-
-        # Already enabled - idempotent success
-        if state.enabled:
-            logger.debug("mod_already_enabled", slug=slug)
-            return EnableResult(slug=slug, enabled=True, pending_restart=False)
-
-        # Rename file: remove .disabled suffix
-        old_path = self._state_manager.mods_dir / state.filename
-        new_filename = state.filename.removesuffix(".disabled")
-        new_path = self._state_manager.mods_dir / new_filename
-
-        old_path.rename(new_path)
-
-        # Update state
-        self._state_manager.remove_mod(state.filename)
-        state.filename = new_filename
-        state.enabled = True
-        self._state_manager.set_mod_state(new_filename, state)
-        self._state_manager.save()
+        async with self._io.operation("enable", slug) as op:
+            state = self._state_manager.get_mod_by_slug(slug)
+            if state is None:
+                logger.debug("enable_mod_not_found", slug=slug)
+                raise ModNotFoundError(slug)
+
+            # Already enabled - idempotent success
+            if state.enabled:
+                logger.debug("mod_already_enabled", slug=slug)
+                return EnableResult(slug=slug, enabled=True, pending_restart=False)
+
+            # Rename file: remove .disabled suffix
+            old_path = self._state_manager.mods_dir / state.filename
+            new_filename = state.filename.removesuffix(".disabled")
+            new_path = self._state_manager.mods_dir / new_filename
+
+            await op.run("rename", old_path.rename, new_path)
+
+            # Update state
+            self._state_manager.remove_mod(state.filename)
+            self._state_manager.set_mod_state(
+                new_filename,
+                state.model_copy(update={"filename": new_filename, "enabled": True}),
+            )
+            await op.save_state(self._state_manager)
 
         logger.info("mod_enabled", slug=slug, filename=new_filename)
 
@@ -518,11 +561,13 @@ class ModService:
 
         return EnableResult(slug=slug, enabled=True, pending_restart=pending_restart)
 
-    def disable_mod(self, slug: str) -> DisableResult:
+    async def disable_mod(self, slug: str) -> DisableResult:
         """Disable an enabled mod.
 
         Renames the mod file from .zip to .zip.disabled and updates state.
-        Sets pending_restart if the server is running.
+        File and state writes run on the mod I/O pool, serialized with other
+        operations on the same mod. Sets pending_restart if the server is
+        running.
 
         Args:
             slug: The mod slug (modid) to disable.
@@ -534,29 +579,31 @@ class ModService:
             ModNotFoundError: If the mod is not found.
         """
         logger.debug("disable_mod_start", slug=slug)
-        state = self._state_manager.get_mod_by_slug(slug)
-        if state is None:
-            logger.debug("disable_mod_not_found", slug=slug)
-            raise ModNotFoundError(slug)
-
-        # Already disabled - idempotent success
-        if not state.enabled:
-            logger.debug("mod_already_disabled", slug=slug)
-            return DisableResult(slug=slug, enabled=False, pending_restart=False)
-
-        # Rename file: add .disabled suffix
-        old_path = self._state_manager.mods_dir / state.filename
-        new_filename = state.filename + ".disabled"
-        new_path = self._state_manager.mods_dir / new_filename
-
-        old_path.rename(new_path)
-
-        # Update state
-        self._state_manager.remove_mod(state.filename)
-        state.filename = new_filename
-        state.enabled = False
-        self._state_manager.set_mod_state(new_filename, state)
-        self._state_manager.save()
+        async with self._io.operation("disable", slug) as op:
+            state = self._state_manager.get_mod_by_slug(slug)
+            if state is None:
+                logger.debug("disable_mod_not_found", slug=slug)
+                raise ModNotFoundError(slug)
+
+            # Already disabled - idempotent success
+            if not state.enabled:
+                logger.debug("mod_already_disabled", slug=slug)
+                return DisableResult(slug=slug, enabled=False, pending_restart=False)
+
+            # Rename file: add .disabled suffix
+            old_path = self._state_manager.mods_dir / state.filename
+            new_filename = state.filename + ".disabled"
+            new_path = self._state_manager.mods_dir / new_filename
+
+            await op.run("rename", old_path.rename, new_path)
+
+            # Update state
+            self._state_manager.remove_mod(state.filename)
+            self._state_manager.set_mod_state(
+                new_filename,
+                state.model_copy(update={"filename": new_filename, "enabled": False}),
+            )
+            await op.save_state(self._state_manager)
 
         logger.info("mod_disabled", slug=slug, filename=new_filename)
 
@@ -568,11 +615,13 @@ class ModService:
 
         return DisableResult(slug=slug, enabled=False, pending_restart=pending_restart)
 
-    def remove_mod(self, slug: str) -> RemoveResult:
+    async def remove_mod(self, slug: str) -> RemoveResult:
         """Remove an installed mod.
 
         Deletes the mod file from disk, removes it from state, and cleans up
-        cached metadata. Sets pending_restart if the server is running.
+        cached metadata. File and state writes run on the mod I/O pool,
+        serialized with other operations on the same mod. Sets
+        pending_restart if the server is running.
 
         Args:
             slug: The mod slug (modid) to remove.
@@ -584,26 +633,24 @@ class ModService:
             ModNotFoundError: If the mod is not installed.
         """
         logger.debug("remove_mod_start", slug=slug)
-        state = self._state_manager.get_mod_by_slug(slug)
-        if state is None:
-            logger.debug("remove_mod_not_found", slug=slug)
-            raise ModNotFoundError(slug)
-
-        # Delete mod file from disk (handle both enabled and disabled)
-        file_path = self._state_manager.mods_dir / state.filename
-        if file_path.exists():
-            file_path.unlink()
-            logger.debug("mod_file_deleted", filename=state.filename)
-
-        # Remove from state index
-        self._state_manager.remove_mod(state.filename)
-        self._state_manager.save()
-
-        # Clean up cached metadata directory
-        cache_dir = self._state_manager.state_dir / "mods" / slug
-        if cache_dir.exists():
-            shutil.rmtree(cache_dir)
-            logger.debug("mod_cache_deleted", slug=slug, path=str(cache_dir))
+        async with self._io.operation("remove", slug) as op:
+            state = self._state_manager.get_mod_by_slug(slug)
+            if state is None:
+                logger.debug("remove_mod_not_found", slug=slug)
+                raise ModNotFoundError(slug)
+
+            # Delete mod file from disk (handle both enabled and disabled)
+            file_path = self._state_manager.mods_dir / state.filename
+            await op.run("delete_file", self._delete_mod_file, file_path)
+
+            # Remove from state index
+            self._state_manager.remove_mod(state.filename)
+            await op.save_state(self._state_manager)
+
+            # Clean up cached metadata
+            await op.run(
+                "delete_metadata_cache", self._state_manager.delete_cached_metadata, slug
+            )
 
         logger.info("mod_removed", slug=slug, filename=state.filename)
 
@@ -615,6 +662,493 @@ class ModService:
 
         return RemoveResult(slug=slug, pending_restart=pending_restart)
 
+    @staticmethod
+    def _delete_mod_file(file_path: Path) -> None:
+        if file_path.exists():
+            file_path.unlink()
+            logger.debug("mod_file_deleted", filename=file_path.name)
+
+    async def record_remote_mods(self, details: dict[str, ModDict]) -> None:
+        """Record refreshed ModDB details for installed mods.
+
+        Stores each mod's lastreleased timestamp (which the mod_cache_refresh
+        job diffs against the catalog), its newest release compatible with
+        the game version, and whether that release is an update. The state
+        file is written once, on the state writer.
+
+        Args:
+            details: Mapping of mod slug to mod details from the API.
+        """
+        game_version = "" if self._game_version == UNKNOWN_VERSION else self._game_version
+        changed = 0
+        updates_available = 0
+        for state in self._state_manager.list_mods():
+            mod = details.get(state.slug)
+            if mod is None:
+                continue
+            releases = mod.get("releases") or []
+            latest = select_latest_compatible(releases, game_version)
+            latest_version = latest.get("modversion") if latest else None
+            update_available = latest_version is not None and is_newer_release(
+                releases, latest_version, state.version
+            )
+            updated = state.model_copy(
+                update={
+                    "last_released": mod.get("lastreleased") or state.last_released,
+                    "latest_version": latest_version,
+                    "update_available": update_available,
+                }
+            )
+            updates_available += update_available
+            if updated != state:
+                self._state_manager.set_mod_state(state.filename, updated)
+                changed += 1
+
+        if changed:
+            await self._io.save_state(self._state_manager)
+        logger.debug(
+            "mod_remote_info_recorded", changed=changed, updates_available=updates_available
+        )
+
+    async def update_all_mods(self) -> UpdateAllResult:
+        """Update every installed mod that has an update available.
+
+        Downloads all updates into the download cache concurrently (at most
+        MAX_CONCURRENT_DOWNLOADS at a time), then swaps each downloaded file
+        into the mods directory with an atomic rename, holding the mod's lock
+        so the swap is serialized with enable/disable/remove. Nothing in the
+        mods directory changes until every download has finished. State is
+        saved once and a single pending restart is flagged. A mod whose
+        download or import fails keeps its installed version, and a mod
+        removed while its update was downloading is not reinstalled.
+
+        Returns:
+            UpdateAllResult with updated mods, per-mod failures and the
+            pending restart flag.
+        """
+        candidates = [
+            state
+            for state in self._state_manager.list_mods()
+            if state.update_available and state.latest_version
+        ]
+        logger.info("update_all_mods_start", candidates=len(candidates))
+        if not candidates:
+            return UpdateAllResult()
+
+        failed: list[ModBatchFailure] = []
+        staged = await self._download_and_stage(
+            [(state.slug, state.latest_version, state.enabled) for state in candidates],
+            failed,
+        )
+
+        updated: list[ModUpdate] = []
+        for slug, batch_mod in staged.items():
+            async with self._io.operation("update", slug) as op:
+                # Re-read: the mod may have been disabled or removed meanwhile
+                state = self._state_manager.get_mod_by_slug(slug)
+                if state is None:
+                    await op.run("discard", batch_mod.temp_path.unlink, True)
+                    failed.append(ModBatchFailure(slug=slug, error="Removed during update"))
+                    continue
+                filename = batch_mod.download.filename
+                if not state.enabled:
+                    filename += ".disabled"
+                batch_mod = replace(batch_mod, filename=filename)
+                if not await op.run("swap", self._swap_in, batch_mod, failed, state.filename):
+                    continue
+                self._state_manager.remove_mod(state.filename)
+                self._state_manager.set_mod_state(
+                    batch_mod.filename,
+                    state.model_copy(
+                        update={
+                            "filename": batch_mod.filename,
+                            "version": batch_mod.metadata.version,
+                            "installed_at": datetime.now(UTC),
+                            "asset_id": batch_mod.download.asset_id or state.asset_id,
+                            "update_available": False,
+                            "sha256": batch_mod.download.sha256,
+                            # A new file: the next reconcile adopts its fingerprint
+                            "fingerprint": None,
+                        }
+                    ),
+                )
+            updated.append(
+                ModUpdate(
+                    slug=slug,
+                    from_version=state.version,
+                    to_version=batch_mod.metadata.version,
+                    filename=batch_mod.filename,
+                )
+            )
+
+        pending_restart = await self._commit_batch(
+            len(updated), f"{len(updated)} mod(s) were updated"
+        )
+        logger.info(
+            "update_all_mods_complete",
+            updated=len(updated),
+            failed=len(failed),
+            pending_restart=pending_restart,
+        )
+        return UpdateAllResult(updated=updated, failed=failed, pending_restart=pending_restart)
+
+    async def reconcile_mods(
+        self,
+        filenames: Iterable[str] | None = None,
+        source: Literal["startup", "watcher", "api"] = "api",
+    ) -> ModReconcileResult:
+        """Reconcile the mod state with the files in the mods directory.
+
+        Picks up mod zips added, replaced or deleted outside the API (e.g.,
+        copied into the Mods directory by hand). Files whose (inode, size,
+        mtime_ns) fingerprint is unchanged are skipped; new and replaced
+        zips have their modinfo.json extracted on a process pool. Scanning
+        and extraction run on the mod I/O pool, after any install, update or
+        other per-mod operation in progress has finished. Sets pending_restart if the
+        server is running and anything changed, and publishes the changes
+        on the change feed.
+
+        Args:
+            filenames: Only reconcile these files (e.g., from the directory
+                watcher); None checks the whole directory.
+            source: What triggered the reconciliation (for the change feed).
+
+        Returns:
+            ModReconcileResult with added, changed and removed filenames.
+        """
+        async with self._io.directory_operation("reconcile") as op:
+            changes = await op.run("scan", self._state_manager.scan_changes, filenames)
+            metadata = await op.run(
+                "extract", self._state_manager.extract_metadata, changes.to_extract
+            )
+            result = self._state_manager.apply_changes(changes, metadata)
+            if changes.state_changed:
+                await op.save_state(self._state_manager)
+
+        if result.added or result.changed or result.removed:
+            if self._server_running:
+                self._restart_state.require_restart("Mods directory changed on disk")
+                result.pending_restart = True
+            self._change_feed.publish(source, result)
+
+        logger.info(
+            "mods_reconciled",
+            added=len(result.added),
+            changed=len(result.changed),
+            removed=len(result.removed),
+            unchanged=result.unchanged,
+            pending_restart=result.pending_restart,
+        )
+        return result
+
+    async def verify_mods(self) -> list[ModIntegrity]:
+        """Check installed mod files against their recorded SHA-256.
+
+        Files are hashed on the mod I/O pool.
+
+        Returns:
+            ModIntegrity per installed mod.
+        """
+        return await self._io.run(self._verify_mod_files)
+
+    def _verify_mod_files(self) -> list[ModIntegrity]:
+        """Hash installed mod files and compare with the recorded digests."""
+        results: list[ModIntegrity] = []
+        for state in self._state_manager.list_mods():
+            path = self._state_manager.mods_dir / state.filename
+            if state.sha256 is None:
+                status = "unknown" if path.exists() else "missing"
+            else:
+                try:
+                    status = "ok" if sha256_file(path) == state.sha256 else "modified"
+                except FileNotFoundError:
+                    status = "missing"
+            results.append(ModIntegrity(slug=state.slug, filename=state.filename, status=status))
+
+        modified = [r.slug for r in results if r.status == "modified"]
+        logger.info(
+            "mod_integrity_checked",
+            total=len(results),
+            modified=len(modified),
+            modified_slugs=modified or None,
+        )
+        return results
+
+    async def resolve_dependencies(self, entries: list[ModpackEntry]) -> DependencyPlan:
+        """Compute the dependency closure of mods before installing them.
+
+        Args:
+            entries: Mods to install (slug or URL, optional version).
+                Invalid slugs are skipped.
+
+        Returns:
+            DependencyPlan with the mods to install and the satisfied,
+            missing and conflicting dependencies.
+        """
+        requests: list[tuple[str, str | None]] = []
+        for entry in entries:
+            slug = extract_slug(entry.slug)
+            if validate_slug(slug):
+                requests.append((slug, entry.version))
+        resolution = await self.dependency_resolver.resolve(requests)
+        return resolution.plan
+
+    async def install_mods(
+        self,
+        entries: list[ModpackEntry],
+        include_dependencies: bool = False,
+    ) -> BulkInstallResult:
+        """Install several mods (e.g., a modpack) in one batch.
+
+        Releases are resolved and downloaded concurrently (at most
+        MAX_CONCURRENT_DOWNLOADS at a time). Each download is verified as a
+        readable zip and imported on worker threads, then all mods are
+        renamed into the mods directory and committed with a single state
+        write, one cache eviction pass and one pending restart; each rename
+        holds the mod's lock, like a single install. Invalid,
+        duplicate, already installed, missing or broken entries are reported
+        per item and do not stop the rest of the batch.
+
+        With include_dependencies, the dependency closure is resolved first
+        (see DependencyResolver): missing dependencies are added to the
+        batch, reusing the releases downloaded while resolving, and
+        unresolvable or too old dependencies are reported as failures.
+
+        Args:
+            entries: Mods to install (slug or URL, optional version).
+            include_dependencies: Also install the mods they depend on.
+
+        Returns:
+            BulkInstallResult with installed mods, per-item failures and the
+            pending restart flag.
+        """
+        failed: list[ModBatchFailure] = []
+        requested: list[tuple[str, str | None, bool]] = []
+        seen: set[str] = set()
+        for entry in entries:
+            slug = extract_slug(entry.slug)
+            if not validate_slug(slug):
+                failed.append(ModBatchFailure(slug=slug, error=f"Invalid mod slug: '{slug}'"))
+            elif slug in seen:
+                failed.append(ModBatchFailure(slug=slug, error="Duplicate entry"))
+            elif (existing := self._state_manager.get_mod_by_slug(slug)) is not None:
+                failed.append(
+                    ModBatchFailure(
+                        slug=slug,
+                        error=f"Already installed (version {existing.version})",
+                    )
+                )
+            else:
+                requested.append((slug, entry.version, True))
+            seen.add(slug)
+
+        prefetched: dict[str, DownloadResult] = {}
+        if include_dependencies and requested:
+            resolution = await self.dependency_resolver.resolve(
+                [(slug, version) for slug, version, _ in requested]
+            )
+            prefetched = resolution.downloads
+            for planned in resolution.plan.install:
+                if planned.required_by and planned.slug not in seen:
+                    requested.append((planned.slug, planned.version, True))
+                    seen.add(planned.slug)
+            for missing in resolution.plan.missing:
+                if missing.required_by is not None:
+                    failed.append(
+                        ModBatchFailure(
+                            slug=missing.modid,
+                            error=f"Dependency of {missing.required_by}: {missing.error}",
+                        )
+                    )
+            for conflict in resolution.plan.conflicts:
+                failed.append(
+                    ModBatchFailure(
+                        slug=conflict.modid,
+                        error=(
+                            f"{conflict.required_by} requires version "
+                            f"{conflict.required_version}, found {conflict.available_version}"
+                        ),
+                    )
+                )
+
+        logger.info("install_mods_start", requested=len(entries), to_install=len(requested))
+        staged = await self._download_and_stage(requested, failed, prefetched)
+
+        installed: list[InstalledMod] = []
+        for slug, batch_mod in staged.items():
+            modid = batch_mod.metadata.modid
+            async with self._io.operation("install", modid) as op:
+                if self._state_manager.get_mod_by_slug(modid) is not None:
+                    # Requested by alias, or installed meanwhile by another request
+                    await op.run("discard", batch_mod.temp_path.unlink, True)
+                    failed.append(ModBatchFailure(slug=slug, error="Already installed"))
+                    continue
+                if not await op.run("swap", self._swap_in, batch_mod, failed):
+                    continue
+                self._state_manager.set_mod_state(
+                    batch_mod.filename,
+                    ModState(
+                        filename=batch_mod.filename,
+                        slug=modid,
+                        version=batch_mod.metadata.version,
+                        enabled=True,
+                        installed_at=datetime.now(UTC),
+                        asset_id=batch_mod.download.asset_id,
+                        sha256=batch_mod.download.sha256,
+                    ),
+                )
+            installed.append(
+                InstalledMod(
+                    slug=batch_mod.metadata.modid,
+                    version=batch_mod.download.version,
+                    filename=batch_mod.filename,
+                    compatibility=check_compatibility(
+                        batch_mod.download.release, self._game_version
+                    ),
+                )
+            )
+
+        pending_restart = await self._commit_batch(
+            len(installed), f"{len(installed)} mod(s) were installed"
+        )
+        logger.info(
+            "install_mods_complete",
+            installed=len(installed),
+            failed=len(failed),
+            pending_restart=pending_restart,
+        )
+        return BulkInstallResult(
+            installed=installed, failed=failed, pending_restart=pending_restart
+        )
+
+    async def _download_and_stage(
+        self,
+        requests: list[tuple[str, str | None, bool]],
+        failed: list[ModBatchFailure],
+        prefetched: dict[str, DownloadResult] | None = None,
+    ) -> dict[str, _StagedMod]:
+        """Download mods concurrently and stage them next to the mods directory.
+
+        Args:
+            requests: (slug, version or None for latest, enabled) per mod.
+            failed: Receives a ModBatchFailure for each mod that fails.
+            prefetched: Already downloaded releases by slug (not downloaded
+                again).
+
+        Returns:
+            Staged mods by slug, in request order.
+        """
+        api_client = self._get_mod_api_client()
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_DOWNLOADS)
+
+        async def download(slug: str, version: str | None) -> DownloadResult | None:
+            if prefetched and slug in prefetched:
+                return prefetched[slug]
+            async with semaphore:
+                return await api_client.download_mod(slug, version, evict=False)
+
+        downloads = await asyncio.gather(
+            *(download(slug, version) for slug, version, _ in requests),
+            return_exceptions=True,
+        )
+
+        pending: list[tuple[str, DownloadResult, bool]] = []
+        for (slug, _, enabled), result in zip(requests, downloads, strict=True):
+            if isinstance(result, asyncio.CancelledError):
+                raise result
+            if isinstance(result, BaseException):
+                logger.warning("mod_batch_download_failed", slug=slug, error=str(result))
+                failed.append(ModBatchFailure(slug=slug, error=str(result)))
+            elif result is None:
+                failed.append(ModBatchFailure(slug=slug, error="Mod not found"))
+            else:
+                pending.append((slug, result, enabled))
+
+        # Verify and import on worker threads
+        stage_results = await asyncio.gather(
+            *(
+                self._io.run(self._stage_mod, result, enabled)
+                for _, result, enabled in pending
+            ),
+            return_exceptions=True,
+        )
+
+        staged: dict[str, _StagedMod] = {}
+        for (slug, _, _), staged_mod in zip(pending, stage_results, strict=True):
+            if isinstance(staged_mod, asyncio.CancelledError):
+                raise staged_mod
+            if isinstance(staged_mod, BaseException):
+                logger.warning("mod_batch_stage_failed", slug=slug, error=str(staged_mod))
+                failed.append(ModBatchFailure(slug=slug, error=str(staged_mod)))
+            else:
+                staged[slug] = staged_mod
+        return staged
+
+    def _stage_mod(self, result: DownloadResult, enabled: bool) -> _StagedMod:
+        """Verify and import a downloaded mod and copy it next to its destination.
+
+        Raises:
+            zipfile.BadZipFile: If the download is not a readable zip.
+            OSError: If the staged copy cannot be written.
+        """
+        with zipfile.ZipFile(result.path) as zf:
+            bad_member = zf.testzip()
+        if bad_member is not None:
+            raise zipfile.BadZipFile(f"Corrupt zip member: {bad_member}")
+
+        metadata = self._state_manager.import_mod(result.path)
+        filename = result.filename if enabled else f"{result.filename}.disabled"
+        temp_path = self._state_manager.mods_dir / f"{filename}.tmp"
+        self._state_manager.mods_dir.mkdir(parents=True, exist_ok=True)
+        temp_path.unlink(missing_ok=True)
+        try:
+            link_or_copy(result.path, temp_path)
+        except OSError:
+            temp_path.unlink(missing_ok=True)
+            raise
+        return _StagedMod(
+            download=result, metadata=metadata, filename=filename, temp_path=temp_path
+        )
+
+    def _swap_in(
+        self,
+        staged: _StagedMod,
+        failed: list[ModBatchFailure],
+        replaces: str | None = None,
+    ) -> bool:
+        """Rename a staged mod into place, removing the file it replaces.
+
+        Returns:
+            True on success; on failure the staged file is removed and the
+            failure recorded.
+        """
+        mods_dir = self._state_manager.mods_dir
+        try:
+            staged.temp_path.rename(mods_dir / staged.filename)
+            if replaces is not None and replaces != staged.filename:
+                (mods_dir / replaces).unlink(missing_ok=True)
+        except OSError as e:
+            staged.temp_path.unlink(missing_ok=True)
+            logger.warning("mod_batch_swap_failed", filename=staged.filename, error=str(e))
+            failed.append(ModBatchFailure(slug=staged.metadata.modid, error=str(e)))
+            return False
+        return True
+
+    async def _commit_batch(self, changed: int, reason: str) -> bool:
+        """Save state once, evict the download cache once and flag one restart.
+
+        Returns:
+            Whether a pending restart was flagged.
+        """
+        if not changed:
+            return False
+        await self._io.save_state(self._state_manager)
+        await self._io.run(self._cache_eviction.evict_if_needed)
+        if self._server_running:
+            self._restart_state.require_restart(reason)
+            return True
+        return False
+
     @property
     def api_client(self) -> ModApiClient:
         """Get the ModApiClient instance (lazy initialization).
@@ -644,6 +1178,22 @@ class ModService:
         """
         return self._cache_eviction
 
+    @property
+    def dependency_resolver(self) -> DependencyResolver:
+        """Get the DependencyResolver instance (lazy initialization).
+
+        Returns:
+            DependencyResolver using this service's API client and state.
+        """
+        if self._dependency_resolver is None:
+            game_version = "" if self._game_version == UNKNOWN_VERSION else self._game_version
+            self._dependency_resolver = DependencyResolver(
+                api_client=self.api_client,
+                state_manager=self._state_manager,
+                game_version=game_version,
+            )
+        return self._dependency_resolver
+
     def _get_mod_api_client(self) -> ModApiClient:
         """Get or create the ModApiClient instance (lazy initialization).
 
@@ -659,7 +1209,10 @@ class ModService:
         if self._mod_api_client is not None:
             await self._mod_api_client.close()
             self._mod_api_client = None
+            self._dependency_resolver = None
             logger.debug("mod_api_client_closed")
+        await asyncio.to_thread(self._io.shutdown)
+        self._state_manager.close()
 
     async def install_mod(
         self,
@@ -690,87 +1243,68 @@ class ModService:
         slug = extract_slug(slug_or_url)
         logger.debug("install_mod_start", slug=slug, input=slug_or_url, version=version)
 
-        # Check if already installed
-        existing = self._state_manager.get_mod_by_slug(slug)
-        if existing is not None:
-            logger.debug(
-                "install_mod_already_installed", slug=slug, current_version=existing.version
-            )
-            raise ModAlreadyInstalledError(slug, existing.version)
-
-        # Download mod via API client
-        api_client = self._get_mod_api_client()
-        download_result = await api_client.download_mod(slug, version)
-
-        if download_result is None:
-            raise ApiModNotFoundError(slug)
-
-        # Check compatibility with game version
-        compatibility = check_compatibility(download_result.release, self._game_version)
-
-        # Copy from cache to mods directory (atomic write pattern)
-        dest_path = self._state_manager.mods_dir / download_result.filename
-        temp_path = dest_path.with_suffix(".tmp")
-
-        # Ensure mods directory exists
-        self._state_manager.mods_dir.mkdir(parents=True, exist_ok=True)
-
-        # Copy file from cache to mods directory using temp file + rename
-        logger.debug(
-            "mod_file_copy_start",
-            source=str(download_result.path),
-            dest=str(dest_path),
-            temp=str(temp_path),
-        )
-        try:
-            shutil.copy2(download_result.path, temp_path)
-            temp_path.rename(dest_path)
-            logger.debug(
-                "mod_file_copy_complete",
-                filename=download_result.filename,
-                size_bytes=dest_path.stat().st_size,
-            )
-        except OSError:
-            # Cleanup partial file on failure
-            if temp_path.exists():
-                temp_path.unlink()
-            raise
+        async with self._io.operation("install", slug) as op:
+            # Check if already installed
+            existing = self._state_manager.get_mod_by_slug(slug)
+            if existing is not None:
+                logger.debug(
+                    "install_mod_already_installed", slug=slug, current_version=existing.version
+                )
+                raise ModAlreadyInstalledError(slug, existing.version)
+
+            # Download mod via API client (cache eviction runs below, off the loop)
+            api_client = self._get_mod_api_client()
+            started = time.perf_counter()
+            download_result = await api_client.download_mod(slug, version, evict=False)
+            op.timings["download"] = round((time.perf_counter() - started) * 1000, 3)
+
+            if download_result is None:
+                raise ApiModNotFoundError(slug)
+
+            # Check compatibility with game version
+            compatibility = check_compatibility(download_result.release, self._game_version)
+
+            # Link (or copy) from cache to mods directory (atomic write pattern)
+            dest_path = self._state_manager.mods_dir / download_result.filename
+            await op.run("link", self._link_into_mods_dir, download_result.path, dest_path)
+
+            # Import mod and save state - cleanup dest_path and state if anything fails
+            try:
+                # Import mod (extracts modinfo.json and caches metadata)
+                logger.debug("mod_import_start", filename=download_result.filename)
+                metadata = await op.run("import", self._state_manager.import_mod, dest_path)
+                logger.debug(
+                    "mod_import_complete",
+                    filename=download_result.filename,
+                    modid=metadata.modid,
+                    version=metadata.version,
+                )
 
-        # Import mod and save state - cleanup dest_path and state if anything fails
-        try:
-            # Import mod (extracts modinfo.json and caches metadata)
-            logger.debug("mod_import_start", filename=download_result.filename)
-            metadata = self._state_manager.import_mod(dest_path)
-            logger.debug(
-                "mod_import_complete",
-                filename=download_result.filename,
-                modid=metadata.modid,
-                version=metadata.version,
-            )
+                # Create and save mod state
+                mod_state = ModState(
+                    filename=download_result.filename,
+                    slug=metadata.modid,
+                    version=metadata.version,
+                    enabled=True,
+                    installed_at=datetime.now(UTC),
+                    asset_id=download_result.asset_id,
+                    sha256=download_result.sha256,
+                )
+                self._state_manager.set_mod_state(download_result.filename, mod_state)
+                await op.save_state(self._state_manager)
+            except Exception:
+                # Cleanup orphaned mod file on any failure
+                await asyncio.to_thread(dest_path.unlink, missing_ok=True)
+                # Remove from in-memory state if it was added
+                self._state_manager.remove_mod(download_result.filename)
+                logger.warning(
+                    "mod_install_cleanup",
+                    filename=download_result.filename,
+                    reason="import or state save failed",
+                )
+                raise
 
-            # Create and save mod state
-            mod_state = ModState(
-                filename=download_result.filename,
-                slug=metadata.modid,
-                version=metadata.version,
-                enabled=True,
-                installed_at=datetime.now(UTC),
-                asset_id=download_result.asset_id,
-            )
-            self._state_manager.set_mod_state(download_result.filename, mod_state)
-            self._state_manager.save()
-        except Exception:
-            # Cleanup orphaned mod file on any failure
-            if dest_path.exists():
-                dest_path.unlink()
-            # Remove from in-memory state if it was added
-            self._state_manager.remove_mod(download_result.filename)
-            logger.warning(
-                "mod_install_cleanup",
-                filename=download_result.filename,
-                reason="import or state save failed",
-            )
-            raise
+            await op.run("evict_cache", self._cache_eviction.evict_if_needed)
 
         # Determine if restart is needed
         pending_restart = False
@@ -795,3 +1329,34 @@ class ModService:
             compatibility=compatibility,
             pending_restart=pending_restart,
         )
+
+    @staticmethod
+    def _link_into_mods_dir(source: Path, dest_path: Path) -> None:
+        """Link (or copy) a cached file into the mods directory via temp file + rename.
+
+        Raises:
+            OSError: If the file cannot be placed; the temp file is removed.
+        """
+        temp_path = dest_path.with_suffix(".tmp")
+        dest_path.parent.mkdir(parents=True, exist_ok=True)
+        logger.debug(
+            "mod_file_copy_start",
+            source=str(source),
+            dest=str(dest_path),
+            temp=str(temp_path),
+        )
+        try:
+            temp_path.unlink(missing_ok=True)
+            method = link_or_copy(source, temp_path)
+            temp_path.rename(dest_path)
+            logger.debug(
+                "mod_file_copy_complete",
+                filename=dest_path.name,
+                size_bytes=dest_path.stat().st_size,
+                method=method,
+            )
+        except OSError:
+            # Cleanup partial file on failure
+            if temp_path.exists():
+                temp_path.unlink()
+            raise
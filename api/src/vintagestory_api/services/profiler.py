@@ -0,0 +1,277 @@
+"""On-demand sampling CPU profiler for the API process.
+
+Runs a background thread that periodically snapshots every Python thread's
+stack via sys._current_frames() for a bounded duration. Samples are
+aggregated into:
+
+- Collapsed stacks (one "thread;outer;...;inner count" line per unique
+  stack), directly consumable by flamegraph.pl / speedscope / inferno
+- A top-functions table with self (leaf) and total (inclusive) sample counts
+
+Overhead is bounded by the caps below: the sampler only runs while a
+profile is requested, at most one profile runs at a time, the duration and
+sampling rate are clamped, and stacks are truncated to a fixed depth. No
+external dependencies are required.
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass
+from types import FrameType
+
+import structlog
+
+logger = structlog.get_logger()
+
+# Bounds that keep profiler overhead predictable
+MAX_DURATION_SECONDS = 60.0
+MIN_INTERVAL_MS = 1.0
+MAX_INTERVAL_MS = 1000.0
+MAX_STACK_DEPTH = 64
+
+# Thread label used for the event loop thread in collapsed stacks
+LOOP_THREAD_LABEL = "event-loop"
+
+
+class ProfilerBusyError(Exception):
+    """Raised when a profile is requested while another is running."""
+
+
+@dataclass(frozen=True)
+class FunctionStats:
+    """Sample counts for a single function across a profile."""
+
+    function: str
+    self_samples: int
+    total_samples: int
+
+
+@dataclass(frozen=True)
+class ProfileResult:
+    """Aggregated result of a sampling profile run."""
+
+    duration_seconds: float
+    interval_ms: float
+    sample_rounds: int
+    total_samples: int
+    threads: dict[str, int]
+    stacks: Counter[tuple[str, ...]]
+    sampling_overhead_ms: float
+
+    def collapsed(self) -> str:
+        """Render samples in collapsed-stack (folded) flamegraph format.
+
+        Returns:
+            One "frame;frame;... count" line per unique stack, heaviest first.
+        """
+        return "\n".join(
+            f"{';'.join(stack)} {count}" for stack, count in self.stacks.most_common()
+        )
+
+    def top_functions(self, limit: int = 25) -> list[FunctionStats]:
+        """Get the functions with the most self samples.
+
+        Self samples count stacks where the function is the leaf frame;
+        total samples count stacks where it appears anywhere (recursion is
+        counted once per stack).
+
+        Args:
+            limit: Maximum number of functions to return.
+
+        Returns:
+            Functions ordered by self samples, then total samples.
+        """
+        self_counts: Counter[str] = Counter()
+        total_counts: Counter[str] = Counter()
+        for stack, count in self.stacks.items():
+            # stack[0] is the thread label, not a function
+            frames = stack[1:]
+            if not frames:
+                continue
+            self_counts[frames[-1]] += count
+            for function in set(frames):
+                total_counts[function] += count
+
+        ranked = sorted(
+            total_counts,
+            key=lambda fn: (self_counts[fn], total_counts[fn]),
+            reverse=True,
+        )
+        return [
+            FunctionStats(
+                function=fn,
+                self_samples=self_counts[fn],
+                total_samples=total_counts[fn],
+            )
+            for fn in ranked[:limit]
+        ]
+
+
+def _frame_label(frame: FrameType) -> str:
+    """Format a frame as "function (file:firstline)".
+
+    The function's first line (not the current line) is used so samples
+    aggregate per function rather than per line.
+    """
+    code = frame.f_code
+    filename = os.path.basename(code.co_filename)
+    return f"{code.co_qualname} ({filename}:{code.co_firstlineno})"
+
+
+def _walk_stack(frame: FrameType | None) -> tuple[str, ...]:
+    """Walk a frame chain and return labels outermost first (depth-limited)."""
+    labels: list[str] = []
+    while frame is not None and len(labels) < MAX_STACK_DEPTH:
+        labels.append(_frame_label(frame))
+        frame = frame.f_back
+    labels.reverse()
+    return tuple(labels)
+
+
+class SamplingProfiler:
+    """Process-wide stack sampler; only one profile may run at a time."""
+
+    def __init__(self) -> None:
+        """Initialize the profiler (idle)."""
+        self._lock = threading.Lock()
+
+    @property
+    def is_running(self) -> bool:
+        """Whether a profile is currently being collected."""
+        return self._lock.locked()
+
+    def profile(
+        self,
+        duration_seconds: float,
+        interval_ms: float = 10.0,
+        loop_thread_id: int | None = None,
+        loop_only: bool = False,
+    ) -> ProfileResult:
+        """Sample all thread stacks for the given duration (blocking).
+
+        Call from a worker thread (e.g., asyncio.to_thread) so the event
+        loop keeps running and shows up in the samples.
+
+        Args:
+            duration_seconds: How long to sample (clamped to MAX_DURATION_SECONDS).
+            interval_ms: Delay between sampling rounds (clamped to
+                MIN_INTERVAL_MS..MAX_INTERVAL_MS).
+            loop_thread_id: Thread ident of the event loop, labelled
+                LOOP_THREAD_LABEL in the output.
+            loop_only: Only sample the event loop thread.
+
+        Returns:
+            Aggregated ProfileResult.
+
+        Raises:
+            ProfilerBusyError: If another profile is already running.
+        """
+        if not self._lock.acquire(blocking=False):
+            raise ProfilerBusyError("A profile is already running")
+        try:
+            return self._run(
+                min(max(duration_seconds, 0.0), MAX_DURATION_SECONDS),
+                min(max(interval_ms, MIN_INTERVAL_MS), MAX_INTERVAL_MS),
+                loop_thread_id,
+                loop_only,
+            )
+        finally:
+            self._lock.release()
+
+    def _run(
+        self,
+        duration_seconds: float,
+        interval_ms: float,
+        loop_thread_id: int | None,
+        loop_only: bool,
+    ) -> ProfileResult:
+        """Run the sampling loop on the calling thread."""
+        own_id = threading.get_ident()
+        interval = interval_ms / 1000
+        stacks: Counter[tuple[str, ...]] = Counter()
+        threads: Counter[str] = Counter()
+        rounds = 0
+        overhead = 0.0
+
+        logger.info(
+            "cpu_profile_started",
+            duration_seconds=duration_seconds,
+            interval_ms=interval_ms,
+            loop_only=loop_only,
+        )
+        started = time.perf_counter()
+        deadline = started + duration_seconds
+        while True:
+            sample_start = time.perf_counter()
+            if sample_start >= deadline:
+                break
+
+            names = {t.ident: t.name for t in threading.enumerate()}
+            for thread_id, frame in sys._current_frames().items():  # pyright: ignore[reportPrivateUsage]
+                if thread_id == own_id:
+                    continue
+                if thread_id == loop_thread_id:
+                    label = LOOP_THREAD_LABEL
+                elif loop_only:
+                    continue
+                else:
+                    label = names.get(thread_id, f"thread-{thread_id}")
+                stacks[(label, *_walk_stack(frame))] += 1
+                threads[label] += 1
+            rounds += 1
+
+            sample_end = time.perf_counter()
+            overhead += sample_end - sample_start
+            remaining = deadline - sample_end
+            if remaining <= 0:
+                break
+            time.sleep(min(interval, remaining))
+
+        elapsed = time.perf_counter() - started
+        result = ProfileResult(
+            duration_seconds=elapsed,
+            interval_ms=interval_ms,
+            sample_rounds=rounds,
+            total_samples=sum(threads.values()),
+            threads=dict(threads),
+            stacks=stacks,
+            sampling_overhead_ms=overhead * 1000,
+        )
+        logger.info(
+            "cpu_profile_completed",
+            duration_seconds=round(elapsed, 3),
+            sample_rounds=rounds,
+            unique_stacks=len(stacks),
+            sampling_overhead_ms=round(result.sampling_overhead_ms, 1),
+        )
+        return result
+
+
+# Module-level singleton
+_profiler: SamplingProfiler | None = None
+
+
+def get_profiler() -> SamplingProfiler:
+    """Get or create the sampling profiler singleton.
+
+    Returns:
+        SamplingProfiler instance.
+    """
+    global _profiler
+    if _profiler is None:
+        _profiler = SamplingProfiler()
+    return _profiler
+
+
+def reset_profiler() -> None:
+    """Reset the sampling profiler singleton.
+
+    Used for testing to ensure clean state between tests.
+    """
+    global _profiler
+    _profiler = None
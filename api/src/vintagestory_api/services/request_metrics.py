@@ -0,0 +1,295 @@
+"""HTTP request latency metrics for the API process.
+
+Records per-route latency histograms, in-flight request gauges, response
+size counters, and a ring buffer of recent requests from which the N
+slowest can be reported with their request_id.
+
+Recording happens on every request from RequestContextMiddleware, so the
+hot path is kept deliberately small:
+- Routes are keyed by (method, templated path) so cardinality stays bounded
+- Histogram buckets are fixed and preallocated; recording is a bisect plus
+  a few integer increments
+- The recent-request ring buffer stores plain tuples in a bounded deque
+
+All mutation happens on the event loop thread, so no locks are needed.
+Readers (the metrics API) run on the same loop and see a consistent view.
+"""
+
+from __future__ import annotations
+
+import heapq
+import time
+from bisect import bisect_left
+from collections import deque
+from dataclasses import dataclass
+
+import structlog
+
+logger = structlog.get_logger()
+
+# Fixed, log-spaced latency bucket upper bounds in milliseconds (1-2.5-5 series).
+# A final implicit +Inf bucket catches anything slower than the last bound.
+LATENCY_BUCKETS_MS: tuple[float, ...] = (
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    25.0,
+    50.0,
+    100.0,
+    250.0,
+    500.0,
+    1000.0,
+    2500.0,
+    5000.0,
+    10000.0,
+)
+
+# Route label used for requests that did not match any route (e.g., 404s).
+# Raw paths are never used as keys to keep cardinality bounded.
+UNMATCHED_ROUTE = "<unmatched>"
+
+# Recent request tuple layout: (duration_ms, timestamp, method, route, status, request_id)
+RecentRequest = tuple[float, float, str, str, int, str]
+
+
+def estimate_percentile(
+    buckets: list[int], count: int, max_ms: float, quantile: float
+) -> float | None:
+    """Estimate a latency percentile from a LATENCY_BUCKETS_MS histogram.
+
+    Returns the upper bound of the bucket containing the requested
+    quantile (the observed max for the +Inf bucket).
+
+    Args:
+        buckets: Non-cumulative bucket counts (one per bound plus +Inf).
+        count: Total number of samples.
+        max_ms: Largest observed sample.
+        quantile: Quantile in the range 0-1 (e.g., 0.95).
+
+    Returns:
+        Estimated latency in milliseconds, or None if no samples.
+    """
+    if count == 0:
+        return None
+    target = quantile * count
+    seen = 0
+    for index, bucket_count in enumerate(buckets):
+        seen += bucket_count
+        if seen >= target and bucket_count > 0:
+            if index < len(LATENCY_BUCKETS_MS):
+                return min(LATENCY_BUCKETS_MS[index], max_ms)
+            return max_ms
+    return max_ms
+
+
+class RouteStats:
+    """Latency histogram and counters for a single (method, route) pair."""
+
+    __slots__ = (
+        "method",
+        "route",
+        "count",
+        "total_ms",
+        "max_ms",
+        "buckets",
+        "status_classes",
+        "response_bytes",
+    )
+
+    def __init__(self, method: str, route: str) -> None:
+        self.method = method
+        self.route = route
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        # One slot per bucket bound plus the +Inf bucket (non-cumulative counts)
+        self.buckets = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+        # Index 0 unused; 1=1xx, 2=2xx, 3=3xx, 4=4xx, 5=5xx
+        self.status_classes = [0] * 6
+        self.response_bytes = 0
+
+    def record(self, duration_ms: float, status_code: int, response_bytes: int) -> None:
+        """Record a completed request against this route."""
+        self.count += 1
+        self.total_ms += duration_ms
+        if duration_ms > self.max_ms:
+            self.max_ms = duration_ms
+        self.buckets[bisect_left(LATENCY_BUCKETS_MS, duration_ms)] += 1
+        status_class = status_code // 100
+        if 1 <= status_class <= 5:
+            self.status_classes[status_class] += 1
+        self.response_bytes += response_bytes
+
+    def percentile(self, quantile: float) -> float | None:
+        """Estimate a latency percentile from the histogram.
+
+        Returns the upper bound of the bucket containing the requested
+        quantile (the observed max for the +Inf bucket).
+
+        Args:
+            quantile: Quantile in the range 0-1 (e.g., 0.95).
+
+        Returns:
+            Estimated latency in milliseconds, or None if no samples.
+        """
+        return estimate_percentile(self.buckets, self.count, self.max_ms, quantile)
+
+
+@dataclass(frozen=True)
+class SlowRequest:
+    """A single slow request entry from the recent-request ring buffer."""
+
+    request_id: str
+    method: str
+    route: str
+    status_code: int
+    duration_ms: float
+    timestamp: float
+
+
+class RequestMetrics:
+    """Collector for per-route HTTP latency metrics.
+
+    Attributes:
+        DEFAULT_RECENT_CAPACITY: Size of the recent-request ring buffer.
+        DEFAULT_SLOW_LIMIT: Default number of slowest requests to report.
+    """
+
+    DEFAULT_RECENT_CAPACITY = 512
+    DEFAULT_SLOW_LIMIT = 20
+
+    def __init__(self, recent_capacity: int = DEFAULT_RECENT_CAPACITY) -> None:
+        """Initialize an empty collector.
+
+        Args:
+            recent_capacity: Number of recent requests retained for slow-request
+                reporting. Older entries are evicted FIFO.
+        """
+        self._routes: dict[tuple[str, str], RouteStats] = {}
+        self._recent: deque[RecentRequest] = deque(maxlen=recent_capacity)
+        self._in_flight = 0
+        self._peak_in_flight = 0
+        self._started_at = time.time()
+
+    @property
+    def in_flight(self) -> int:
+        """Number of requests currently being processed."""
+        return self._in_flight
+
+    @property
+    def peak_in_flight(self) -> int:
+        """Highest number of concurrent requests observed."""
+        return self._peak_in_flight
+
+    @property
+    def started_at(self) -> float:
+        """Unix timestamp when collection started (or was last reset)."""
+        return self._started_at
+
+    def request_started(self) -> None:
+        """Increment the in-flight gauge when a request begins."""
+        self._in_flight += 1
+        if self._in_flight > self._peak_in_flight:
+            self._peak_in_flight = self._in_flight
+
+    def request_finished(self) -> None:
+        """Decrement the in-flight gauge when a request ends."""
+        self._in_flight -= 1
+
+    def record(
+        self,
+        method: str,
+        route: str,
+        status_code: int,
+        duration_ms: float,
+        response_bytes: int,
+        request_id: str,
+    ) -> None:
+        """Record a completed request.
+
+        Args:
+            method: HTTP method (e.g., "GET").
+            route: Templated route path (e.g., "/api/v1alpha1/mods/{slug}").
+            status_code: Response status code.
+            duration_ms: Time until response headers were ready, in milliseconds.
+            response_bytes: Response body size in bytes (0 if unknown).
+            request_id: Correlation ID bound by RequestContextMiddleware.
+        """
+        key = (method, route)
+        stats = self._routes.get(key)
+        if stats is None:
+            stats = self._routes[key] = RouteStats(method, route)
+        stats.record(duration_ms, status_code, response_bytes)
+        self._recent.append(
+            (duration_ms, time.time(), method, route, status_code, request_id)
+        )
+
+    def add_response_bytes(self, method: str, route: str, size: int) -> None:
+        """Add streamed body bytes to a route's response size counter.
+
+        Used for streaming responses where the body size is not known
+        when the request is recorded.
+        """
+        stats = self._routes.get((method, route))
+        if stats is not None:
+            stats.response_bytes += size
+
+    def get_route_stats(self) -> list[RouteStats]:
+        """Get stats for all routes, most requested first."""
+        return sorted(self._routes.values(), key=lambda s: s.count, reverse=True)
+
+    def get_slow_requests(self, limit: int = DEFAULT_SLOW_LIMIT) -> list[SlowRequest]:
+        """Get the slowest requests from the recent-request ring buffer.
+
+        Args:
+            limit: Maximum number of entries to return.
+
+        Returns:
+            Slow requests ordered slowest first.
+        """
+        slowest = heapq.nlargest(limit, self._recent, key=lambda r: r[0])
+        return [
+            SlowRequest(
+                request_id=request_id,
+                method=method,
+                route=route,
+                status_code=status_code,
+                duration_ms=duration_ms,
+                timestamp=timestamp,
+            )
+            for duration_ms, timestamp, method, route, status_code, request_id in slowest
+        ]
+
+    def reset(self) -> None:
+        """Clear all recorded metrics (in-flight gauge is preserved)."""
+        self._routes.clear()
+        self._recent.clear()
+        self._peak_in_flight = self._in_flight
+        self._started_at = time.time()
+        logger.debug("request_metrics_reset")
+
+
+# Module-level singleton
+_request_metrics: RequestMetrics | None = None
+
+
+def get_request_metrics() -> RequestMetrics:
+    """Get or create the request metrics singleton.
+
+    Returns:
+        RequestMetrics instance.
+    """
+    global _request_metrics
+    if _request_metrics is None:
+        _request_metrics = RequestMetrics()
+    return _request_metrics
+
+
+def reset_request_metrics() -> None:
+    """Reset the request metrics singleton.
+
+    Used for testing to ensure clean state between tests.
+    """
+    global _request_metrics
+    _request_metrics = None
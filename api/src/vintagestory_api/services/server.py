@@ -27,6 +27,8 @@ from vintagestory_api.models.server import (
 )
 from vintagestory_api.services.config_init_service import ConfigInitService
 from vintagestory_api.services.console import ConsoleBuffer
+from vintagestory_api.services.downloads import download_file
+from vintagestory_api.services.http_client import get_outbound_http
 
 # Lazy import to avoid circular dependency - imported at runtime when needed
 _mod_service_module = None
@@ -240,20 +242,18 @@ class ServerService:
             logger.debug("pending_restart_clear_skipped", reason=str(e))
 
     async def _get_http_client(self) -> httpx.AsyncClient:
-        """Get or create HTTP client for API requests.
+        """Get the shared outbound HTTP client.
 
-        Uses a 5-minute timeout for downloads (~40MB server tarball).
+        API calls use its default timeout; downloads pass the download
+        timeout (see services.http_client).
         """
-        if self._http_client is None:
-            # 300s timeout for large file downloads on slow connections
-            self._http_client = httpx.AsyncClient(timeout=300.0)
+        if self._http_client is None or self._http_client.is_closed:
+            self._http_client = get_outbound_http().client
         return self._http_client
 
     async def close(self) -> None:
-        """Close HTTP client connections."""
-        if self._http_client is not None:
-            await self._http_client.aclose()
-            self._http_client = None
+        """Release the HTTP client (the shared pool is closed at shutdown)."""
+        self._http_client = None
 
     def validate_version(self, version: str) -> bool:
         """Validate version string format.
@@ -562,6 +562,11 @@ class ServerService:
     ) -> Path:
         """Download server tarball with streaming and progress tracking.
 
+        The download is resumable: progress is kept in a .part file next to
+        the tarball, transient errors are retried with backoff, and a later
+        install attempt continues where the previous one stopped. With
+        VS_DOWNLOAD_SEGMENTS > 1 the tarball is fetched in parallel ranges.
+
         Args:
             version: Version to download
             channel: Release channel ("stable" or "unstable")
@@ -590,23 +595,30 @@ class ServerService:
 
         logger.info("downloading_server", version=version, url=url)
 
-        async with client.stream("GET", url) as response:
-            response.raise_for_status()
-
-            total = int(response.headers.get("content-length", 0))
-            downloaded = 0
-
-            with tarball_path.open("wb") as f:
-                async for chunk in response.aiter_bytes(chunk_size=8192):
-                    f.write(chunk)
-                    downloaded += len(chunk)
-                    if total > 0:
-                        percentage = downloaded * 100 // total
-                        self._install_percentage = percentage
-                        if progress_callback:
-                            progress_callback(percentage)
+        def on_progress(downloaded: int, total: int) -> None:
+            if total > 0:
+                percentage = downloaded * 100 // total
+                self._install_percentage = percentage
+                if progress_callback:
+                    progress_callback(percentage)
+
+        stats = await download_file(
+            client,
+            url,
+            tarball_path,
+            timeout=get_outbound_http().download_timeout,
+            segments=self._settings.download_segments,
+            progress=on_progress,
+        )
 
-        logger.info("download_complete", version=version, size=downloaded)
+        logger.info(
+            "download_complete",
+            version=version,
+            size=stats.size_bytes,
+            resumed_bytes=stats.resumed_bytes,
+            attempts=stats.attempts,
+            segments=stats.segments,
+        )
         return tarball_path
 
     def verify_checksum(self, file_path: Path, expected_md5: str) -> bool:
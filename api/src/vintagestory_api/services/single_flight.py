@@ -0,0 +1,115 @@
+"""Single-flight request coalescing.
+
+When many callers ask for the same thing at once (e.g., ten browser tabs
+opening the browse page while the mod list is cold), only one upstream
+call should be made. SingleFlight runs at most one task per key; every
+concurrent caller for that key awaits the same task and receives the same
+result or exception. The key is released as soon as the task finishes, so
+later callers start a fresh call (caching is left to the caller).
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable, Hashable
+
+import structlog
+
+logger = structlog.get_logger()
+
+
+class SingleFlight[K: Hashable, V]:
+    """Coalesces concurrent calls for the same key into one in-flight task."""
+
+    def __init__(self, name: str) -> None:
+        """Initialize an empty group.
+
+        Args:
+            name: Group name used in log events.
+        """
+        self._name = name
+        self._in_flight: dict[K, asyncio.Task[V]] = {}
+        self.started = 0
+        self.coalesced = 0
+
+    def __len__(self) -> int:
+        return len(self._in_flight)
+
+    def in_flight(self, key: K) -> bool:
+        """Whether a call for this key is currently running."""
+        task = self._in_flight.get(key)
+        return task is not None and not task.done()
+
+    def get_task(self, key: K) -> asyncio.Task[V] | None:
+        """Get the in-flight task for a key, if any."""
+        return self._in_flight.get(key)
+
+    def start(self, key: K, fn: Callable[[], Awaitable[V]]) -> asyncio.Task[V]:
+        """Start a call for the key, or join the one already in flight.
+
+        The returned task is not awaited, so this can be used to kick off a
+        background refresh that later callers will join.
+
+        Args:
+            key: Coalescing key.
+            fn: Zero-argument coroutine factory, only called if no task is
+                in flight for the key.
+
+        Returns:
+            The in-flight task for the key.
+        """
+        task = self._in_flight.get(key)
+        # A task bound to another (closed) loop can never complete here
+        if task is not None and not task.done() and task.get_loop() is asyncio.get_running_loop():
+            self.coalesced += 1
+            logger.debug("single_flight_joined", group=self._name, key=str(key))
+            return task
+
+        async def run() -> V:
+            return await fn()
+
+        task = asyncio.create_task(run())
+        self._in_flight[key] = task
+        self.started += 1
+        task.add_done_callback(lambda t: self._release(key, t))
+        return task
+
+    async def do(self, key: K, fn: Callable[[], Awaitable[V]]) -> V:
+        """Run fn once for all concurrent callers with the same key.
+
+        A caller that is cancelled while waiting does not cancel the shared
+        call for the other waiters.
+
+        Args:
+            key: Coalescing key.
+            fn: Zero-argument coroutine factory.
+
+        Returns:
+            The shared result.
+
+        Raises:
+            Exception: Whatever the shared call raised.
+        """
+        return await asyncio.shield(self.start(key, fn))
+
+    def _release(self, key: K, task: asyncio.Task[V]) -> None:
+        """Forget a finished task (and mark its exception as retrieved)."""
+        if self._in_flight.get(key) is task:
+            del self._in_flight[key]
+        if not task.cancelled():
+            # Background starts may have no awaiter; avoid "never retrieved" warnings
+            task.exception()
+
+    async def cancel_all(self) -> None:
+        """Cancel every in-flight call and wait for them to finish."""
+        loop = asyncio.get_running_loop()
+        tasks = [
+            task
+            for task in self._in_flight.values()
+            if not task.done() and task.get_loop() is loop
+        ]
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+        self._in_flight.clear()
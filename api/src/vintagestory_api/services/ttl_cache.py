@@ -0,0 +1,142 @@
+"""Bounded LRU cache with per-entry TTLs and size accounting.
+
+Used for upstream responses that vary by key (mods per game version, mod
+details per slug). Entries past their TTL are not evicted on read: callers
+get the stale entry back with is_fresh() False, so they can serve it while
+revalidating (stale-while-revalidate). Eviction is least-recently-used,
+bounded by entry count and, optionally, by the total recorded size.
+"""
+
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from collections.abc import Hashable
+from dataclasses import dataclass
+
+import structlog
+
+logger = structlog.get_logger()
+
+
+@dataclass
+class CacheEntry[V]:
+    """A cached value with its age, TTL and recorded size."""
+
+    value: V
+    stored_at: float
+    """time.monotonic() when the value was stored."""
+
+    ttl: float
+    """Seconds the value is considered fresh."""
+
+    size_bytes: int = 0
+    """Recorded size (e.g., response body length) for size accounting."""
+
+    def is_fresh(self) -> bool:
+        """Whether the entry is younger than its TTL."""
+        return time.monotonic() - self.stored_at < self.ttl
+
+    @property
+    def age(self) -> float:
+        """Seconds since the value was stored."""
+        return time.monotonic() - self.stored_at
+
+
+class TtlLruCache[K: Hashable, V]:
+    """LRU cache bounded by entry count and total size, with per-entry TTLs."""
+
+    def __init__(self, name: str, max_entries: int, max_bytes: int | None = None) -> None:
+        """Initialize an empty cache.
+
+        Args:
+            name: Cache name used in log events.
+            max_entries: Maximum number of entries.
+            max_bytes: Maximum total recorded size, or None for no size bound.
+                The most recently stored entry is always kept, even if it
+                alone exceeds the bound.
+        """
+        self._name = name
+        self._max_entries = max_entries
+        self._max_bytes = max_bytes
+        self._entries: OrderedDict[K, CacheEntry[V]] = OrderedDict()
+        self._total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._entries
+
+    @property
+    def total_bytes(self) -> int:
+        """Sum of the recorded sizes of all entries."""
+        return self._total_bytes
+
+    def get(self, key: K) -> CacheEntry[V] | None:
+        """Get an entry (fresh or stale) and mark it recently used.
+
+        Args:
+            key: Cache key.
+
+        Returns:
+            The entry, or None if the key is not cached.
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry
+
+    def put(self, key: K, value: V, ttl: float, size_bytes: int = 0) -> CacheEntry[V]:
+        """Store a value, evicting least recently used entries over the bounds.
+
+        Args:
+            key: Cache key.
+            value: Value to store.
+            ttl: Seconds the value is fresh.
+            size_bytes: Recorded size of the value.
+
+        Returns:
+            The stored entry.
+        """
+        self.pop(key)
+        entry = CacheEntry(value=value, stored_at=time.monotonic(), ttl=ttl, size_bytes=size_bytes)
+        self._entries[key] = entry
+        self._total_bytes += size_bytes
+
+        while len(self._entries) > 1 and (
+            len(self._entries) > self._max_entries
+            or (self._max_bytes is not None and self._total_bytes > self._max_bytes)
+        ):
+            evicted_key, evicted = self._entries.popitem(last=False)
+            self._total_bytes -= evicted.size_bytes
+            self.evictions += 1
+            logger.debug(
+                "cache_entry_evicted",
+                cache=self._name,
+                key=str(evicted_key),
+                size_bytes=evicted.size_bytes,
+            )
+        return entry
+
+    def items(self) -> list[tuple[K, CacheEntry[V]]]:
+        """Snapshot of all entries, least recently used first (order unchanged)."""
+        return list(self._entries.items())
+
+    def pop(self, key: K) -> CacheEntry[V] | None:
+        """Remove and return an entry, if present."""
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._total_bytes -= entry.size_bytes
+        return entry
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        self._entries.clear()
+        self._total_bytes = 0
@@ -2,7 +2,7 @@
 
 import os
 import sys
-from collections.abc import Generator
+from collections.abc import AsyncGenerator, Generator
 from io import StringIO
 
 # Set VS_DEBUG=true for all tests to expose test_rbac endpoints
@@ -15,6 +15,7 @@ import structlog
 from fastapi.testclient import TestClient
 
 from vintagestory_api.main import app
+from vintagestory_api.services.http_client import close_outbound_http, reset_outbound_http
 
 # Shared test API keys - use these instead of defining locally in test files
 TEST_ADMIN_KEY = "test-admin-key-12345"
@@ -51,6 +52,26 @@ def reset_structlog_for_tests() -> Generator[None, None, None]:
     # No cleanup needed - next test will reconfigure
 
 
+@pytest.fixture(autouse=True)
+def no_download_retry_delay(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Retry failed downloads immediately so retry paths don't slow the suite."""
+    monkeypatch.setattr("vintagestory_api.services.downloads.RETRY_BASE_DELAY", 0.0)
+
+
+@pytest.fixture(autouse=True)
+async def fresh_outbound_http(monkeypatch: pytest.MonkeyPatch) -> AsyncGenerator[None, None]:
+    """Give each test a fresh outbound client and retry upstream requests immediately.
+
+    Circuit breakers and rate limits live on the shared client, so a test that
+    fails requests to a host must not leave its breaker open for later tests.
+    The client is closed afterwards so its connection pool is not leaked.
+    """
+    monkeypatch.setattr("vintagestory_api.services.http_client.RETRY_BASE_DELAY", 0.0)
+    reset_outbound_http()
+    yield
+    await close_outbound_http()
+
+
 @pytest.fixture
 def client() -> TestClient:
     """Create a test client for FastAPI app."""
@@ -142,6 +142,7 @@ class TestModCacheRefreshExecution:
             mock_service.list_mods.return_value = mock_mods
             mock_service.api_client = AsyncMock()
             mock_service.api_client.get_mod = AsyncMock(return_value={"name": "test"})
+            mock_service.record_remote_mods = AsyncMock()
             mock_get_service.return_value = mock_service
 
             capsys.readouterr()  # Clear prior output
@@ -319,6 +320,7 @@ class TestModCacheRefreshErrorHandling:
             mock_service.list_mods.return_value = mock_mods
             mock_service.api_client = AsyncMock()
             mock_service.api_client.get_mod = mock_get_mod
+            mock_service.record_remote_mods = AsyncMock()
             mock_get_service.return_value = mock_service
 
             capsys.readouterr()  # Clear prior output
@@ -392,3 +394,153 @@ class TestModCacheRefreshWithNoMods:
 
             # Should complete successfully even with no mods
             assert "mod_cache_refresh_completed" in captured.out
+
+
+class TestModCacheRefreshCatalogDiff:
+    """Tests for diffing installed mods against the catalog."""
+
+    @staticmethod
+    def _service(
+        mods: list[ModInfo],
+        catalog: list[dict[str, object]],
+        get_mod: AsyncMock,
+    ) -> MagicMock:
+        service = MagicMock()
+        service.list_mods.return_value = mods
+        service.api_client = AsyncMock()
+        service.api_client.get_all_mods = AsyncMock(return_value=catalog)
+        service.api_client.get_mod = get_mod
+        service.record_remote_mods = AsyncMock()
+        return service
+
+    @pytest.mark.asyncio
+    async def test_unchanged_mods_skip_detail_fetch(self) -> None:
+        """Mods whose catalog lastreleased is unchanged are not fetched."""
+        from vintagestory_api.jobs.mod_cache_refresh import refresh_mod_cache
+
+        unchanged = make_mod_info("modA_1.0.0.zip", "modA", "1.0.0")
+        unchanged.last_released = "2025-01-01 00:00:00"
+        changed = make_mod_info("modB_1.0.0.zip", "modB", "1.0.0")
+        changed.last_released = "2025-01-01 00:00:00"
+        catalog: list[dict[str, object]] = [
+            {"modidstrs": ["moda"], "lastreleased": "2025-01-01 00:00:00"},
+            {"modidstrs": ["modb"], "lastreleased": "2025-06-01 00:00:00"},
+        ]
+        get_mod = AsyncMock(return_value={"lastreleased": "2025-06-01 00:00:00"})
+        service = self._service([unchanged, changed], catalog, get_mod)
+
+        with patch(
+            "vintagestory_api.jobs.mod_cache_refresh.get_mod_service",
+            return_value=service,
+        ):
+            await refresh_mod_cache()
+
+        service.api_client.get_all_mods.assert_awaited_once_with(force_refresh=True)
+        get_mod.assert_awaited_once_with("modB")
+        service.record_remote_mods.assert_awaited_once_with(
+            {"modB": {"lastreleased": "2025-06-01 00:00:00"}}
+        )
+
+    @pytest.mark.asyncio
+    async def test_matches_by_asset_id(self) -> None:
+        """Catalog entries are matched by asset ID before mod ID strings."""
+        from vintagestory_api.jobs.mod_cache_refresh import refresh_mod_cache
+
+        mod = make_mod_info("modA_1.0.0.zip", "modA", "1.0.0")
+        mod.asset_id = 42
+        mod.last_released = "2025-01-01 00:00:00"
+        catalog: list[dict[str, object]] = [
+            {"assetid": 42, "modidstrs": ["other"], "lastreleased": "2025-01-01 00:00:00"},
+        ]
+        get_mod = AsyncMock()
+        service = self._service([mod], catalog, get_mod)
+
+        with patch(
+            "vintagestory_api.jobs.mod_cache_refresh.get_mod_service",
+            return_value=service,
+        ):
+            await refresh_mod_cache()
+
+        get_mod.assert_not_awaited()
+        service.record_remote_mods.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_unrecorded_and_unlisted_mods_fetched(self) -> None:
+        """Mods never refreshed, or missing from the catalog, are fetched."""
+        from vintagestory_api.jobs.mod_cache_refresh import refresh_mod_cache
+
+        never_refreshed = make_mod_info("modA_1.0.0.zip", "modA", "1.0.0")
+        unlisted = make_mod_info("modB_1.0.0.zip", "modB", "1.0.0")
+        unlisted.last_released = "2025-01-01 00:00:00"
+        catalog: list[dict[str, object]] = [
+            {"modidstrs": ["moda"], "lastreleased": "2025-01-01 00:00:00"},
+        ]
+        get_mod = AsyncMock(return_value={"name": "x"})
+        service = self._service([never_refreshed, unlisted], catalog, get_mod)
+
+        with patch(
+            "vintagestory_api.jobs.mod_cache_refresh.get_mod_service",
+            return_value=service,
+        ):
+            await refresh_mod_cache()
+
+        assert get_mod.await_count == 2
+        # Detail without lastreleased falls back to the catalog value
+        details = service.record_remote_mods.call_args.args[0]
+        assert details["modA"]["lastreleased"] == "2025-01-01 00:00:00"
+
+    @pytest.mark.asyncio
+    async def test_catalog_unavailable_falls_back_to_detail_fetches(self) -> None:
+        """If the catalog cannot be fetched, every mod is looked up."""
+        from vintagestory_api.jobs.mod_cache_refresh import refresh_mod_cache
+        from vintagestory_api.services.mod_api import ExternalApiError
+
+        mods = [
+            make_mod_info("modA_1.0.0.zip", "modA", "1.0.0"),
+            make_mod_info("modB_1.0.0.zip", "modB", "1.0.0"),
+        ]
+        get_mod = AsyncMock(return_value={"lastreleased": "2025-01-01 00:00:00"})
+        service = self._service(mods, [], get_mod)
+        service.api_client.get_all_mods = AsyncMock(side_effect=ExternalApiError("down"))
+
+        with patch(
+            "vintagestory_api.jobs.mod_cache_refresh.get_mod_service",
+            return_value=service,
+        ):
+            await refresh_mod_cache()
+
+        assert get_mod.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_detail_fetches_bounded(self) -> None:
+        """No more than MAX_CONCURRENT_FETCHES detail requests run at once."""
+        import asyncio
+
+        from vintagestory_api.jobs import mod_cache_refresh
+        from vintagestory_api.jobs.mod_cache_refresh import refresh_mod_cache
+
+        mods = [make_mod_info(f"mod{i}.zip", f"mod{i}", "1.0.0") for i in range(20)]
+        active = 0
+        peak = 0
+
+        async def slow_get_mod(slug: str) -> dict[str, str]:
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+            return {"lastreleased": "2025-01-01 00:00:00"}
+
+        service = self._service(mods, [], AsyncMock(side_effect=slow_get_mod))
+
+        with (
+            patch.object(mod_cache_refresh, "MAX_CONCURRENT_FETCHES", 4),
+            patch(
+                "vintagestory_api.jobs.mod_cache_refresh.get_mod_service",
+                return_value=service,
+            ),
+        ):
+            await refresh_mod_cache()
+
+        assert peak == 4
+        assert len(service.record_remote_mods.call_args.args[0]) == 20
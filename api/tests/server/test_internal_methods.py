@@ -11,6 +11,7 @@ import pytest
 
 from vintagestory_api.config import Settings
 from vintagestory_api.models.server import ServerState
+from vintagestory_api.services.http_client import get_outbound_http
 from vintagestory_api.services.server import ServerService
 
 # pyright: reportPrivateUsage=false
@@ -266,12 +267,15 @@ class TestGetHttpClient:
 
     @pytest.mark.asyncio
     async def test_get_http_client_configures_timeout(self, test_settings: Settings) -> None:
-        """Creates client with 300-second timeout for large downloads."""
+        """Uses the shared client, whose default is the API timeout (downloads pass their own)."""
         service = ServerService(test_settings)
 
         client = await service._get_http_client()
 
-        assert client.timeout.connect == 300.0
+        outbound = get_outbound_http()
+        assert client is outbound.client
+        assert client.timeout.read == outbound.api_timeout.read
+        assert outbound.download_timeout.read == test_settings.http_download_timeout
 
     @pytest.mark.asyncio
     async def test_get_http_client_closes_old_client(self, test_settings: Settings) -> None:
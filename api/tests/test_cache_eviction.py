@@ -151,6 +151,67 @@ class TestEviction:
         assert files[2].exists()
 
 
+class TestCacheIndex:
+    """Tests for the in-memory LRU index and its sidecar."""
+
+    def test_record_sets_access_order(self, cache_dir: Path) -> None:
+        """Access order comes from record(), not atime (noatime mounts)."""
+        older = create_test_file(cache_dir, "older.zip", 600 * 1024)
+        time.sleep(0.01)
+        newer = create_test_file(cache_dir, "newer.zip", 600 * 1024)
+
+        service = CacheEvictionService(cache_dir=cache_dir, max_size_mb=1)
+        service.record(older)  # Cache hit on the older file
+        result = service.evict_if_needed()
+
+        assert result.files_evicted == 1
+        assert older.exists()
+        assert not newer.exists()
+
+    def test_eviction_does_not_scan_directory(self, cache_dir: Path) -> None:
+        """Once the index is built, downloads and eviction never glob the cache."""
+        service = CacheEvictionService(cache_dir=cache_dir, max_size_mb=1)
+        service.get_cache_stats()
+
+        with patch.object(Path, "glob", side_effect=AssertionError("directory scanned")):
+            for i in range(3):
+                service.record(create_test_file(cache_dir, f"mod{i}.zip", 400 * 1024))
+            result = service.evict_if_needed()
+
+        assert result.files_evicted == 1
+        assert result.files_remaining == 2
+        assert result.bytes_remaining == 800 * 1024
+        assert not (cache_dir / "mods" / "mod0.zip").exists()
+
+    def test_sidecar_reused_across_restarts(self, cache_dir: Path) -> None:
+        """The persisted access order is reused without rescanning."""
+        first = create_test_file(cache_dir, "first.zip", 600 * 1024)
+        time.sleep(0.01)
+        second = create_test_file(cache_dir, "second.zip", 600 * 1024)
+        service = CacheEvictionService(cache_dir=cache_dir, max_size_mb=100)
+        service.record(first)
+        service.evict_if_needed()  # Persists the index
+
+        restarted = CacheEvictionService(cache_dir=cache_dir, max_size_mb=1)
+        with patch.object(Path, "glob", side_effect=AssertionError("directory scanned")):
+            result = restarted.evict_if_needed()
+
+        assert result.files_evicted == 1
+        assert first.exists()
+        assert not second.exists()
+
+    def test_stale_sidecar_is_rebuilt(self, cache_dir: Path) -> None:
+        """Files added behind the index's back are picked up on the next start."""
+        service = CacheEvictionService(cache_dir=cache_dir, max_size_mb=100)
+        service.evict_if_needed()
+        time.sleep(0.01)
+        create_test_file(cache_dir, "manual.zip", 1000)
+
+        restarted = CacheEvictionService(cache_dir=cache_dir, max_size_mb=100)
+
+        assert restarted.get_cache_stats()["file_count"] == 1
+
+
 class TestEvictAll:
     """Tests for clearing entire cache."""
 
@@ -247,6 +247,80 @@ class TestModCacheMaxSize:
                 Settings()
 
 
+class TestDownloadSegments:
+    """Tests for the parallel download segments setting."""
+
+    def test_default_single_stream(self) -> None:
+        """Downloads use a single stream by default."""
+        assert Settings().download_segments == 1
+
+    def test_download_segments_from_env(self) -> None:
+        """Segments can be configured via environment variable."""
+        with patch.dict(os.environ, {"VS_DOWNLOAD_SEGMENTS": "4"}):
+            assert Settings().download_segments == 4
+
+    def test_download_segments_out_of_range_rejected(self) -> None:
+        """Zero or too many segments are rejected."""
+        for value in ("0", "17"):
+            with patch.dict(os.environ, {"VS_DOWNLOAD_SEGMENTS": value}):
+                with pytest.raises(ValueError, match="VS_DOWNLOAD_SEGMENTS"):
+                    Settings()
+
+
+class TestModsWatch:
+    """Tests for the Mods directory watcher setting."""
+
+    def test_default_auto(self) -> None:
+        assert Settings().mods_watch == "auto"
+
+    def test_invalid_mode_rejected(self) -> None:
+        with patch.dict(os.environ, {"VS_MODS_WATCH": "sometimes"}):
+            with pytest.raises(ValueError):
+                Settings()
+
+
+class TestModStateBackend:
+    """Tests for the mod state backend setting."""
+
+    def test_default_json(self) -> None:
+        assert Settings().mod_state_backend == "json"
+
+    def test_sqlite_from_env(self) -> None:
+        with patch.dict(os.environ, {"VS_MOD_STATE_BACKEND": "sqlite"}):
+            assert Settings().mod_state_backend == "sqlite"
+
+
+class TestOutboundHttpSettings:
+    """Tests for the outbound HTTP client settings."""
+
+    def test_defaults(self) -> None:
+        settings = Settings()
+        assert settings.http_api_timeout == 30.0
+        assert settings.http_download_timeout == 120.0
+        assert settings.http2 is False
+
+    def test_from_env(self) -> None:
+        with patch.dict(os.environ, {"VS_HTTP2": "true", "VS_HTTP_API_TIMEOUT": "10"}):
+            settings = Settings()
+            assert settings.http2 is True
+            assert settings.http_api_timeout == 10.0
+
+    def test_rate_limit_defaults(self) -> None:
+        settings = Settings()
+        assert settings.http_rate_limit == 10.0
+        assert settings.http_rate_burst == 20
+
+    def test_negative_rate_limit_rejected(self) -> None:
+        with patch.dict(os.environ, {"VS_HTTP_RATE_LIMIT": "-1"}):
+            with pytest.raises(ValueError, match="VS_HTTP_RATE_LIMIT"):
+                Settings()
+
+    def test_zero_rate_burst_rejected(self) -> None:
+        with patch.dict(os.environ, {"VS_HTTP_RATE_BURST": "0"}):
+            with pytest.raises(ValueError, match="VS_HTTP_RATE_BURST"):
+                Settings()
+
+
 class TestDiskSpaceThreshold:
     """Tests for disk space warning threshold validation."""
 
@@ -0,0 +1,114 @@
+"""Tests for the content-addressed mod file store."""
+
+import hashlib
+import os
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from vintagestory_api.services.content_store import ContentStore, link_or_copy, sha256_file
+
+
+def digest(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+class TestSha256File:
+    """Tests for sha256_file()."""
+
+    def test_matches_hashlib(self, tmp_path: Path) -> None:
+        path = tmp_path / "mod.zip"
+        data = os.urandom(3 * 1024 * 1024 + 7)
+        path.write_bytes(data)
+
+        assert sha256_file(path) == digest(data)
+
+
+class TestLinkOrCopy:
+    """Tests for link_or_copy()."""
+
+    def test_hardlinks_on_same_filesystem(self, tmp_path: Path) -> None:
+        src = tmp_path / "src.zip"
+        src.write_bytes(b"content")
+        dest = tmp_path / "dest.zip"
+
+        assert link_or_copy(src, dest) == "hardlink"
+        assert dest.stat().st_ino == src.stat().st_ino
+
+    def test_falls_back_to_copy(self, tmp_path: Path) -> None:
+        """Without hardlink or reflink support the file is copied."""
+        src = tmp_path / "src.zip"
+        src.write_bytes(b"content")
+        dest = tmp_path / "dest.zip"
+
+        with (
+            patch("os.link", side_effect=OSError(18, "Invalid cross-device link")),
+            patch("vintagestory_api.services.content_store._reflink", return_value=False),
+        ):
+            assert link_or_copy(src, dest) == "copy"
+
+        assert dest.read_bytes() == b"content"
+        assert dest.stat().st_ino != src.stat().st_ino
+
+
+class TestContentStore:
+    """Tests for ContentStore."""
+
+    def test_add_stores_under_digest(self, tmp_path: Path) -> None:
+        store = ContentStore(tmp_path / "store")
+        temp = store.root / "download.tmp"
+        temp.write_bytes(b"mod bytes")
+
+        path = store.add(temp, digest(b"mod bytes"))
+
+        assert path == store.root / f"{digest(b'mod bytes')}.zip"
+        assert path.read_bytes() == b"mod bytes"
+        assert not temp.exists()
+
+    def test_add_deduplicates_identical_content(self, tmp_path: Path) -> None:
+        store = ContentStore(tmp_path / "store")
+        first = store.root / "a.tmp"
+        first.write_bytes(b"same")
+        second = store.root / "b.tmp"
+        second.write_bytes(b"same")
+
+        path_a = store.add(first, digest(b"same"))
+        path_b = store.add(second, digest(b"same"))
+
+        assert path_a == path_b
+        assert not second.exists()
+        assert len(list(store.root.iterdir())) == 1
+
+    def test_deduplicated_add_leaves_installed_link_untouched(self, tmp_path: Path) -> None:
+        """Re-adding stored content must not change the shared inode's mtime."""
+        store = ContentStore(tmp_path / "store")
+        first = store.root / "a.tmp"
+        first.write_bytes(b"same")
+        stored = store.add(first, digest(b"same"))
+        installed = tmp_path / "Mods" / "mod.zip"
+        installed.parent.mkdir()
+        link_or_copy(stored, installed)
+        os.utime(installed, ns=(1_000_000_000, 1_000_000_000))
+
+        second = store.root / "b.tmp"
+        second.write_bytes(b"same")
+        store.add(second, digest(b"same"))
+
+        assert installed.stat().st_mtime_ns == 1_000_000_000
+
+    def test_path_for_rejects_invalid_digest(self, tmp_path: Path) -> None:
+        store = ContentStore(tmp_path / "store")
+
+        with pytest.raises(ValueError):
+            store.path_for("../../etc/passwd")
+
+    def test_verify(self, tmp_path: Path) -> None:
+        store = ContentStore(tmp_path / "store")
+        path = tmp_path / "mod.zip"
+        path.write_bytes(b"original")
+
+        assert store.verify(path, digest(b"original"))
+        path.write_bytes(b"tampered")
+        assert not store.verify(path, digest(b"original"))
+        assert not store.verify(tmp_path / "missing.zip", digest(b"original"))
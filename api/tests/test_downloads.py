@@ -0,0 +1,235 @@
+"""Tests for resumable downloads."""
+
+import json
+from collections.abc import AsyncIterator
+from pathlib import Path
+
+import httpx
+import pytest
+import respx
+from httpx import Request, Response
+
+from vintagestory_api.services import downloads
+from vintagestory_api.services.downloads import download_file, part_path_for
+from vintagestory_api.services.http_client import UpstreamUnavailableError
+
+URL = "https://cdn.example.com/file.bin"
+DATA = bytes(range(256)) * 400  # 100 KiB
+ETAG = '"v1"'
+
+
+class FailingStream(httpx.AsyncByteStream):
+    """Response body that sends some bytes, then drops the connection."""
+
+    def __init__(self, data: bytes) -> None:
+        self._data = data
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        yield self._data
+        raise httpx.ReadError("connection reset")
+
+
+def serve(request: Request, data: bytes = DATA, honor_range: bool = True) -> Response:
+    """Serve data, honoring Range/If-Range like a CDN."""
+    headers = {"etag": ETAG, "accept-ranges": "bytes"}
+    range_header = request.headers.get("range")
+    if_range = request.headers.get("if-range")
+    if honor_range and range_header and if_range in (None, ETAG):
+        start_s, _, end_s = range_header.removeprefix("bytes=").partition("-")
+        start = int(start_s)
+        end = int(end_s) if end_s else len(data) - 1
+        if start >= len(data):
+            return Response(416, headers=headers)
+        headers["content-range"] = f"bytes {start}-{end}/{len(data)}"
+        return Response(206, content=data[start : end + 1], headers=headers)
+    return Response(200, content=data, headers=headers)
+
+
+def write_partial(dest: Path, size: int, validator: str = ETAG) -> None:
+    """Leave a partial download of DATA as an interrupted call would."""
+    part_path_for(dest).write_bytes(DATA[:size])
+    dest.with_name(f"{dest.name}.part.json").write_text(
+        json.dumps({"url": URL, "validator": validator, "total": len(DATA), "segments": []})
+    )
+
+
+class TestDownloadFile:
+    """Tests for download_file()."""
+
+    @pytest.mark.asyncio
+    async def test_fresh_download(self, tmp_path: Path) -> None:
+        dest = tmp_path / "file.bin"
+        progress: list[tuple[int, int]] = []
+
+        with respx.mock:
+            respx.get(URL).mock(side_effect=serve)
+            async with httpx.AsyncClient() as client:
+                stats = await download_file(
+                    client, URL, dest, progress=lambda d, t: progress.append((d, t))
+                )
+
+        assert dest.read_bytes() == DATA
+        assert not part_path_for(dest).exists()
+        assert not (tmp_path / "file.bin.part.json").exists()
+        assert (stats.size_bytes, stats.resumed_bytes, stats.attempts) == (len(DATA), 0, 1)
+        assert progress[-1] == (len(DATA), len(DATA))
+
+    @pytest.mark.asyncio
+    async def test_resumes_partial_with_range(self, tmp_path: Path) -> None:
+        """A leftover .part is continued with Range + If-Range."""
+        dest = tmp_path / "file.bin"
+        write_partial(dest, 30_000)
+
+        with respx.mock:
+            route = respx.get(URL).mock(side_effect=serve)
+            async with httpx.AsyncClient() as client:
+                stats = await download_file(client, URL, dest)
+
+        request = route.calls.last.request
+        assert request.headers["range"] == "bytes=30000-"
+        assert request.headers["if-range"] == ETAG
+        assert dest.read_bytes() == DATA
+        assert stats.resumed_bytes == 30_000
+
+    @pytest.mark.asyncio
+    async def test_changed_file_restarts(self, tmp_path: Path) -> None:
+        """If the validator no longer matches, the server sends 200 and we start over."""
+        dest = tmp_path / "file.bin"
+        write_partial(dest, 30_000, validator='"old"')
+
+        with respx.mock:
+            respx.get(URL).mock(side_effect=serve)
+            async with httpx.AsyncClient() as client:
+                await download_file(client, URL, dest)
+
+        assert dest.read_bytes() == DATA
+
+    @pytest.mark.asyncio
+    async def test_retries_and_resumes_after_dropped_connection(self, tmp_path: Path) -> None:
+        dest = tmp_path / "file.bin"
+        responses = iter(
+            [
+                Response(
+                    200,
+                    stream=FailingStream(DATA[:40_000]),
+                    headers={"etag": ETAG, "content-length": str(len(DATA))},
+                )
+            ]
+        )
+
+        def handler(request: Request) -> Response:
+            return next(responses, None) or serve(request)
+
+        with respx.mock:
+            route = respx.get(URL).mock(side_effect=handler)
+            async with httpx.AsyncClient() as client:
+                # Chunks that evenly divide the bytes received before the drop
+                stats = await download_file(client, URL, dest, chunk_size=10_000)
+
+        assert dest.read_bytes() == DATA
+        assert stats.attempts == 2
+        assert route.calls.last.request.headers["range"] == "bytes=40000-"
+
+    @pytest.mark.asyncio
+    async def test_gives_up_after_max_attempts(self, tmp_path: Path) -> None:
+        dest = tmp_path / "file.bin"
+
+        with respx.mock:
+            route = respx.get(URL).mock(return_value=Response(503))
+            async with httpx.AsyncClient() as client:
+                with pytest.raises(httpx.HTTPStatusError):
+                    await download_file(client, URL, dest, max_attempts=3)
+
+        assert route.call_count == 3
+        assert not dest.exists()
+
+    @pytest.mark.asyncio
+    async def test_client_errors_not_retried(self, tmp_path: Path) -> None:
+        dest = tmp_path / "file.bin"
+
+        with respx.mock:
+            route = respx.get(URL).mock(return_value=Response(404))
+            async with httpx.AsyncClient() as client:
+                with pytest.raises(httpx.HTTPStatusError):
+                    await download_file(client, URL, dest)
+
+        assert route.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_open_circuit_not_retried(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """An open circuit breaker fails the download at once, without backoff."""
+        dest = tmp_path / "file.bin"
+        attempts = 0
+
+        async def short_circuited(request: Request) -> Response:
+            nonlocal attempts
+            attempts += 1
+            raise UpstreamUnavailableError("circuit open", request=request)
+
+        monkeypatch.setattr(downloads, "RETRY_BASE_DELAY", 60.0)
+        transport = httpx.MockTransport(short_circuited)
+        async with httpx.AsyncClient(transport=transport) as client:
+            with pytest.raises(UpstreamUnavailableError):
+                await download_file(client, URL, dest)
+
+        assert attempts == 1
+
+    @pytest.mark.asyncio
+    async def test_parallel_segments(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Large files are fetched as parallel byte ranges."""
+        monkeypatch.setattr(downloads, "MIN_SEGMENT_SIZE", 10_000)
+        dest = tmp_path / "file.bin"
+
+        with respx.mock:
+            respx.head(URL).mock(
+                return_value=Response(
+                    200,
+                    headers={
+                        "etag": ETAG,
+                        "accept-ranges": "bytes",
+                        "content-length": str(len(DATA)),
+                    },
+                )
+            )
+            route = respx.get(URL).mock(side_effect=serve)
+            async with httpx.AsyncClient() as client:
+                stats = await download_file(client, URL, dest, segments=4)
+
+        assert dest.read_bytes() == DATA
+        assert stats.segments == 4
+        assert sorted(call.request.headers["range"] for call in route.calls) == [
+            "bytes=0-25599",
+            "bytes=25600-51199",
+            "bytes=51200-76799",
+            "bytes=76800-102399",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_segments_fall_back_when_ranges_ignored(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """A server that answers ranges with 200 gets a single full download."""
+        monkeypatch.setattr(downloads, "MIN_SEGMENT_SIZE", 10_000)
+        dest = tmp_path / "file.bin"
+
+        with respx.mock:
+            respx.head(URL).mock(
+                return_value=Response(
+                    200,
+                    headers={
+                        "etag": ETAG,
+                        "accept-ranges": "bytes",
+                        "content-length": str(len(DATA)),
+                    },
+                )
+            )
+            respx.get(URL).mock(side_effect=lambda request: serve(request, honor_range=False))
+            async with httpx.AsyncClient() as client:
+                stats = await download_file(client, URL, dest, segments=4)
+
+        assert dest.read_bytes() == DATA
+        assert stats.segments == 1
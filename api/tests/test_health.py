@@ -598,6 +598,38 @@ class TestHealthzDiskSpace:
             assert data["data"]["disk_space"] is None
 
 
+class TestHealthzUpstreams:
+    """Tests for upstream circuit breaker states in /healthz."""
+
+    def test_no_upstreams_contacted(self, client: TestClient) -> None:
+        response = client.get("/healthz")
+        assert response.json()["data"]["upstreams"] == []
+
+    def test_reports_breaker_states(self, client: TestClient) -> None:
+        from vintagestory_api.services.http_client import get_outbound_http
+
+        metrics = get_outbound_http().metrics
+        metrics.breaker_for("api.vintagestory.at").record_success()
+        down = metrics.breaker_for("mods.vintagestory.at")
+        for _ in range(5):
+            down.record_failure()
+
+        response = client.get("/healthz")
+
+        assert response.status_code == 200
+        api, mods = response.json()["data"]["upstreams"]
+        assert api == {
+            "host": "api.vintagestory.at",
+            "state": "closed",
+            "consecutive_failures": 0,
+            "retry_after_seconds": None,
+        }
+        assert mods["host"] == "mods.vintagestory.at"
+        assert mods["state"] == "open"
+        assert mods["consecutive_failures"] == 5
+        assert 0 < mods["retry_after_seconds"] <= 30
+
+
 class TestDiskSpaceThresholdValidation:
     """Tests for disk space threshold configuration validation."""
 
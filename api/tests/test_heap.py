@@ -0,0 +1,252 @@
+"""Tests for heap snapshots, diffs and cache size accounting."""
+
+from collections import deque
+from collections.abc import Generator
+from pathlib import Path
+
+import pytest
+from conftest import TEST_ADMIN_KEY, TEST_MONITOR_KEY  # type: ignore[import-not-found]
+from fastapi.testclient import TestClient
+
+import vintagestory_api.services.server as server_module
+from vintagestory_api.config import Settings
+from vintagestory_api.main import app
+from vintagestory_api.middleware.auth import get_settings
+from vintagestory_api.services.heap import (
+    MAX_SNAPSHOTS,
+    HeapProfiler,
+    HeapSnapshotNotFoundError,
+    HeapTracingNotStartedError,
+    InvalidSnapshotNameError,
+    deep_sizeof,
+    get_cache_sizes,
+    reset_heap_profiler,
+)
+from vintagestory_api.services.versions_cache import get_versions_cache, reset_versions_cache
+
+
+@pytest.fixture(autouse=True)
+def reset_heap() -> Generator[None, None, None]:
+    """Reset the heap profiler singleton (stopping tracing it started)."""
+    reset_heap_profiler()
+    yield
+    reset_heap_profiler()
+
+
+@pytest.fixture
+def profiler() -> Generator[HeapProfiler, None, None]:
+    """A heap profiler with tracing started."""
+    heap = HeapProfiler()
+    heap.start()
+    yield heap
+    heap.stop()
+
+
+# Allocations held by the test so they show up in snapshot diffs
+_retained: list[bytes] = []
+
+
+def _allocate_blocks() -> None:
+    _retained.extend(bytes(1024) + bytes([i % 256]) for i in range(500))
+
+
+class TestDeepSizeof:
+    """Tests for deep_sizeof."""
+
+    def test_counts_nested_containers(self) -> None:
+        """Nested containers are larger than their shallow size."""
+        nested = {"a": ["x" * 1000, {"b": "y" * 1000}]}
+        assert deep_sizeof(nested) > 2000
+
+    def test_shared_objects_counted_once(self) -> None:
+        """An object referenced twice is only counted once."""
+        payload = "z" * 10_000
+        once = deep_sizeof([payload])
+        twice = deep_sizeof([payload, payload])
+        assert twice - once < 100
+
+    def test_follows_instance_attributes(self) -> None:
+        """Instance __dict__ contents are included."""
+
+        class Holder:
+            def __init__(self) -> None:
+                self.data = "q" * 5000
+
+        assert deep_sizeof(Holder()) > 5000
+
+    def test_container_resized_during_walk_is_skipped(self) -> None:
+        """A dict changed by another thread mid-walk is skipped, not fatal."""
+
+        class Resizing(dict[str, str]):
+            def keys(self):  # type: ignore[override]
+                raise RuntimeError("dictionary changed size during iteration")
+
+        assert deep_sizeof(["x" * 1000, Resizing(a="b")]) > 1000
+
+
+class TestHeapProfiler:
+    """Tests for HeapProfiler snapshot management."""
+
+    def test_snapshot_requires_tracing(self) -> None:
+        """Snapshots cannot be taken when tracing is off."""
+        heap = HeapProfiler()
+        if heap.is_tracing:
+            pytest.skip("tracemalloc enabled externally")
+        with pytest.raises(HeapTracingNotStartedError):
+            heap.take_snapshot("before")
+
+    def test_invalid_name_rejected(self, profiler: HeapProfiler) -> None:
+        """Names with path separators or spaces are rejected."""
+        with pytest.raises(InvalidSnapshotNameError):
+            profiler.take_snapshot("../etc")
+
+    def test_diff_reports_growth_by_line(self, profiler: HeapProfiler) -> None:
+        """Allocations made between snapshots appear in the diff."""
+        _retained.clear()
+        profiler.take_snapshot("before")
+        _allocate_blocks()
+        profiler.take_snapshot("after")
+
+        diffs = profiler.diff("before", "after", limit=5)
+        _retained.clear()
+
+        assert any(
+            "test_heap.py" in d.location and d.size_diff_bytes >= 500 * 1024 for d in diffs
+        )
+
+    def test_diff_against_live_heap_by_filename(self, profiler: HeapProfiler) -> None:
+        """Omitting target compares against the live heap."""
+        _retained.clear()
+        profiler.take_snapshot("before")
+        _allocate_blocks()
+
+        diffs = profiler.diff("before", group_by="filename", limit=5)
+        _retained.clear()
+
+        assert any(d.location.endswith("test_heap.py") for d in diffs)
+        assert all(":" not in Path(d.location).name for d in diffs)
+
+    def test_missing_snapshot(self, profiler: HeapProfiler) -> None:
+        """Diffing or deleting a missing snapshot raises."""
+        with pytest.raises(HeapSnapshotNotFoundError):
+            profiler.diff("nope")
+        with pytest.raises(HeapSnapshotNotFoundError):
+            profiler.delete_snapshot("nope")
+
+    def test_oldest_snapshots_evicted(self, profiler: HeapProfiler) -> None:
+        """Only MAX_SNAPSHOTS snapshots are retained."""
+        for i in range(MAX_SNAPSHOTS + 2):
+            profiler.take_snapshot(f"s{i}")
+
+        names = [s.name for s in profiler.list_snapshots()]
+        assert len(names) == MAX_SNAPSHOTS
+        assert "s0" not in names and "s1" not in names
+
+
+class TestCacheSizes:
+    """Tests for known cache accounting."""
+
+    @pytest.fixture(autouse=True)
+    def reset_singletons(self) -> Generator[None, None, None]:
+        """Reset singletons that cache sizes are read from."""
+        reset_versions_cache()
+        original_server = server_module._server_service  # pyright: ignore[reportPrivateUsage]
+        server_module._server_service = None  # pyright: ignore[reportPrivateUsage]
+        yield
+        server_module._server_service = original_server  # pyright: ignore[reportPrivateUsage]
+        reset_versions_cache()
+
+    def test_reports_versions_cache(self) -> None:
+        """The versions cache is measured once it exists."""
+        cache = get_versions_cache()
+        cache.set_versions("stable", [{"version": "1.21.0", "notes": "x" * 2000}])
+
+        sizes = {s.name: s for s in get_cache_sizes()}
+
+        assert sizes["versions_cache"].entries == 1
+        assert sizes["versions_cache"].bytes > 2000
+
+    def test_reports_console_buffer(self) -> None:
+        """The console buffer deque is measured with its line count."""
+
+        class FakeBuffer:
+            _buffer = deque(["line " * 100, "other " * 100])
+
+        class FakeServer:
+            console_buffer = FakeBuffer()
+
+        server_module._server_service = FakeServer()  # type: ignore[assignment]  # pyright: ignore[reportPrivateUsage, reportAttributeAccessIssue]
+
+        sizes = {s.name: s for s in get_cache_sizes()}
+        assert sizes["console_buffer"].entries == 2
+        assert sizes["console_buffer"].bytes > 1000
+
+    def test_does_not_create_services(self) -> None:
+        """Measuring never instantiates missing singletons."""
+        get_cache_sizes()
+        assert server_module._server_service is None  # pyright: ignore[reportPrivateUsage]
+
+
+class TestHeapEndpoints:
+    """Tests for the /debug/heap endpoints."""
+
+    @pytest.fixture
+    def client(self) -> Generator[TestClient, None, None]:
+        """Create a test client with admin authentication."""
+        test_settings = Settings(
+            api_key_admin=TEST_ADMIN_KEY,
+            api_key_monitor=TEST_MONITOR_KEY,
+        )
+        app.dependency_overrides[get_settings] = lambda: test_settings
+        yield TestClient(app, headers={"X-API-Key": TEST_ADMIN_KEY})
+        app.dependency_overrides.clear()
+
+    def test_snapshot_diff_workflow(self, client: TestClient) -> None:
+        """Start, snapshot twice, diff and stop through the API."""
+        response = client.post("/api/v1alpha1/debug/heap/start?frames=2")
+        assert response.status_code == 200
+        assert response.json()["data"]["tracing"] is True
+
+        assert client.post("/api/v1alpha1/debug/heap/snapshots/a").status_code == 200
+        _allocate_blocks()
+        assert client.post("/api/v1alpha1/debug/heap/snapshots/b").status_code == 200
+
+        response = client.get("/api/v1alpha1/debug/heap/diff?base=a&target=b&limit=10")
+        _retained.clear()
+        assert response.status_code == 200
+        data = response.json()["data"]
+        assert data["group_by"] == "lineno"
+        assert data["entries"]
+        assert {"location", "size_diff_bytes", "count_diff"} <= set(data["entries"][0])
+
+        status = client.get("/api/v1alpha1/debug/heap").json()["data"]
+        assert [s["name"] for s in status["snapshots"]] == ["a", "b"]
+
+        response = client.post("/api/v1alpha1/debug/heap/stop")
+        assert response.json()["data"]["tracing"] is False
+
+    def test_snapshot_without_tracing_conflict(self, client: TestClient) -> None:
+        """Taking a snapshot with tracing stopped returns 409."""
+        response = client.post("/api/v1alpha1/debug/heap/snapshots/x")
+        assert response.status_code == 409
+        assert response.json()["detail"]["code"] == "HEAP_TRACING_NOT_STARTED"
+
+    def test_diff_missing_snapshot(self, client: TestClient) -> None:
+        """Diffing an unknown snapshot returns 404."""
+        response = client.get("/api/v1alpha1/debug/heap/diff?base=missing")
+        assert response.status_code == 404
+        assert response.json()["detail"]["code"] == "HEAP_SNAPSHOT_NOT_FOUND"
+
+    def test_cache_sizes(self, client: TestClient) -> None:
+        """Cache accounting returns a total and per-cache entries."""
+        response = client.get("/api/v1alpha1/debug/heap/caches")
+        assert response.status_code == 200
+        data = response.json()["data"]
+        assert data["total_bytes"] == sum(c["bytes"] for c in data["caches"])
+
+    def test_monitor_role_forbidden(self, client: TestClient) -> None:
+        """Monitor role cannot access heap diagnostics."""
+        response = client.get(
+            "/api/v1alpha1/debug/heap", headers={"X-API-Key": TEST_MONITOR_KEY}
+        )
+        assert response.status_code == 403
@@ -0,0 +1,310 @@
+"""Tests for the shared outbound HTTP client and GET /metrics/upstream."""
+
+import asyncio
+import time
+from collections.abc import Generator
+
+import httpx
+import pytest
+import respx
+from conftest import TEST_ADMIN_KEY, TEST_MONITOR_KEY  # type: ignore[import-not-found]
+from fastapi.testclient import TestClient
+
+from vintagestory_api.config import Settings
+from vintagestory_api.main import app
+from vintagestory_api.middleware.auth import get_settings
+from vintagestory_api.services.http_client import (
+    MAX_RETRIES,
+    CircuitBreaker,
+    OutboundHttp,
+    TokenBucket,
+    UpstreamUnavailableError,
+    get_outbound_http,
+)
+
+
+class TestOutboundHttp:
+    """Tests for OutboundHttp."""
+
+    @pytest.mark.asyncio
+    async def test_client_shared_and_timeouts_separate(self) -> None:
+        outbound = OutboundHttp(api_timeout=5.0, download_timeout=90.0)
+
+        client = outbound.client
+
+        assert outbound.client is client
+        assert client.timeout.read == 5.0
+        assert outbound.download_timeout.read == 90.0
+        await outbound.aclose()
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_records_latency_status_and_bytes(self) -> None:
+        respx.get("https://mods.example/api/mod/a").mock(
+            return_value=httpx.Response(200, content=b"x" * 100)
+        )
+        respx.get("https://mods.example/api/mod/b").mock(return_value=httpx.Response(500))
+        outbound = OutboundHttp()
+
+        await outbound.client.get("https://mods.example/api/mod/a")
+        await outbound.client.get("https://mods.example/api/mod/b")
+        await outbound.aclose()
+
+        [stats] = outbound.metrics.get_host_stats()
+        assert stats.host == "mods.example"
+        assert stats.requests == 2
+        assert stats.bytes_received == 100
+        assert stats.status_classes[2] == 1
+        assert stats.error_count == 1
+        assert stats.in_flight == 0
+        assert stats.percentile(0.5) is not None
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_records_transport_errors(self) -> None:
+        respx.get("https://cdn.example/file").mock(side_effect=httpx.ConnectTimeout("slow"))
+        outbound = OutboundHttp()
+
+        with pytest.raises(httpx.ConnectTimeout):
+            await outbound.client.get("https://cdn.example/file")
+        await outbound.aclose()
+
+        [stats] = outbound.metrics.get_host_stats()
+        assert stats.errors == {"ConnectTimeout": MAX_RETRIES + 1}
+        assert stats.retries == MAX_RETRIES
+        assert stats.in_flight == 0
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_per_host_connection_cap(self) -> None:
+        """Streams hold their host's slot until closed."""
+        respx.get("https://cdn.example/file").mock(return_value=httpx.Response(200))
+        respx.get("https://other.example/file").mock(return_value=httpx.Response(200))
+        outbound = OutboundHttp(max_connections_per_host=1)
+        client = outbound.client
+
+        async with client.stream("GET", "https://cdn.example/file"):
+            # Another host is not blocked; the same host waits for the slot
+            await client.get("https://other.example/file")
+            with pytest.raises(TimeoutError):
+                await asyncio.wait_for(client.get("https://cdn.example/file"), timeout=0.05)
+        await client.get("https://cdn.example/file")
+        await outbound.aclose()
+
+    def test_http2_ignored_without_h2(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr("importlib.util.find_spec", lambda name: None)
+        assert OutboundHttp(http2=True).http2 is False
+
+
+class TestRetries:
+    """Tests for retrying idempotent requests."""
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_get_retried_on_503(self) -> None:
+        route = respx.get("https://mods.example/api/mods").mock(
+            side_effect=[httpx.Response(503), httpx.Response(200)]
+        )
+        outbound = OutboundHttp()
+
+        response = await outbound.client.get("https://mods.example/api/mods")
+        await outbound.aclose()
+
+        assert response.status_code == 200
+        assert route.call_count == 2
+        [stats] = outbound.metrics.get_host_stats()
+        assert stats.retries == 1
+        assert stats.in_flight == 0
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_post_not_retried(self) -> None:
+        route = respx.post("https://mods.example/api/mods").mock(return_value=httpx.Response(503))
+        outbound = OutboundHttp()
+
+        response = await outbound.client.post("https://mods.example/api/mods")
+        await outbound.aclose()
+
+        assert response.status_code == 503
+        assert route.call_count == 1
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_read_timeout_not_retried(self) -> None:
+        """The request may have reached the server; don't wait out the timeout again."""
+        route = respx.get("https://mods.example/api/mods").mock(
+            side_effect=httpx.ReadTimeout("slow")
+        )
+        outbound = OutboundHttp()
+
+        with pytest.raises(httpx.ReadTimeout):
+            await outbound.client.get("https://mods.example/api/mods")
+        await outbound.aclose()
+
+        assert route.call_count == 1
+
+
+class TestCircuitBreaker:
+    """Tests for the per-host circuit breaker."""
+
+    def test_opens_after_consecutive_failures(self) -> None:
+        breaker = CircuitBreaker("mods.example", failure_threshold=2, reset_timeout=30.0)
+
+        breaker.record_failure()
+        breaker.record_success()
+        breaker.record_failure()
+        assert breaker.state == "closed"
+        breaker.record_failure()
+
+        assert breaker.state == "open"
+        assert breaker.allow() is False
+        assert 29 < breaker.retry_after <= 30
+
+    def test_half_open_allows_one_probe(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        breaker = CircuitBreaker("mods.example", failure_threshold=1, reset_timeout=30.0)
+        breaker.record_failure()
+        now = time.monotonic()
+        monkeypatch.setattr("time.monotonic", lambda: now + 31)
+
+        assert breaker.state == "half_open"
+        assert breaker.allow() is True
+        assert breaker.allow() is False
+
+        breaker.record_failure()
+        assert breaker.state == "open"
+
+        monkeypatch.setattr("time.monotonic", lambda: now + 62)
+        assert breaker.allow() is True
+        breaker.record_success()
+        assert breaker.state == "closed"
+        assert breaker.consecutive_failures == 0
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_open_breaker_fails_fast(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr("vintagestory_api.services.http_client.BREAKER_FAILURE_THRESHOLD", 2)
+        route = respx.get("https://mods.example/api/mods").mock(
+            side_effect=httpx.ConnectError("refused")
+        )
+        outbound = OutboundHttp()
+
+        for _ in range(2):
+            with pytest.raises(httpx.ConnectError):
+                await outbound.client.get("https://mods.example/api/mods")
+        calls = route.call_count
+        # Callers treat it like any other connection failure
+        with pytest.raises(UpstreamUnavailableError):
+            await outbound.client.get("https://mods.example/api/mods")
+        await outbound.aclose()
+
+        assert route.call_count == calls
+        [stats] = outbound.metrics.get_host_stats()
+        assert stats.short_circuited == 1
+        assert outbound.metrics.get_breakers()["mods.example"].state == "open"
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_cancelled_probe_is_released(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """A probe cancelled while backing off lets the next request probe."""
+        monkeypatch.setattr("vintagestory_api.services.http_client.BREAKER_RESET_TIMEOUT", 0.0)
+        monkeypatch.setattr("vintagestory_api.services.http_client.RETRY_BASE_DELAY", 60.0)
+        monkeypatch.setattr("random.uniform", lambda a, b: b)
+        route = respx.get("https://mods.example/api/mods").mock(
+            side_effect=[httpx.Response(503), httpx.Response(200)]
+        )
+        outbound = OutboundHttp()
+        breaker = outbound.metrics.breaker_for("mods.example")
+        for _ in range(5):
+            breaker.record_failure()
+        assert breaker.state == "half_open"
+
+        probe = asyncio.create_task(outbound.client.get("https://mods.example/api/mods"))
+        while not route.call_count:
+            await asyncio.sleep(0)
+        # The probe got a 503 and is now sleeping before its retry
+        probe.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await probe
+
+        response = await outbound.client.get("https://mods.example/api/mods")
+        await outbound.aclose()
+
+        assert response.status_code == 200
+        assert breaker.state == "closed"
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_client_errors_do_not_open_breaker(self) -> None:
+        respx.get("https://mods.example/api/mod/x").mock(return_value=httpx.Response(404))
+        outbound = OutboundHttp()
+
+        for _ in range(10):
+            await outbound.client.get("https://mods.example/api/mod/x")
+        await outbound.aclose()
+
+        assert outbound.metrics.get_breakers()["mods.example"].state == "closed"
+
+
+class TestTokenBucket:
+    """Tests for the outbound rate limiter."""
+
+    def test_burst_then_rate(self) -> None:
+        bucket = TokenBucket(rate=10.0, burst=2)
+
+        assert bucket.reserve() == 0.0
+        assert bucket.reserve() == 0.0
+        assert bucket.reserve() == pytest.approx(0.1, abs=0.01)
+        assert bucket.reserve() == pytest.approx(0.2, abs=0.01)
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_requests_beyond_burst_wait(self) -> None:
+        respx.get("https://mods.example/api/mods").mock(return_value=httpx.Response(200))
+        outbound = OutboundHttp(rate_limit=50.0, rate_burst=1)
+
+        started = time.monotonic()
+        for _ in range(3):
+            await outbound.client.get("https://mods.example/api/mods")
+        await outbound.aclose()
+
+        assert time.monotonic() - started >= 0.035
+
+
+class TestUpstreamMetricsEndpoint:
+    """Tests for GET /metrics/upstream."""
+
+    @pytest.fixture
+    def client(self) -> Generator[TestClient, None, None]:
+        test_settings = Settings(
+            api_key_admin=TEST_ADMIN_KEY,
+            api_key_monitor=TEST_MONITOR_KEY,
+            debug=True,
+        )
+        app.dependency_overrides[get_settings] = lambda: test_settings
+        yield TestClient(app)
+        app.dependency_overrides.clear()
+
+    def test_returns_per_host_metrics(self, client: TestClient) -> None:
+        stats = get_outbound_http().metrics.for_host("mods.vintagestory.at")
+        stats.record(12.0, 200)
+        stats.bytes_received = 2048
+
+        response = client.get(
+            "/api/v1alpha1/metrics/upstream", headers={"X-API-Key": TEST_ADMIN_KEY}
+        )
+
+        assert response.status_code == 200
+        data = response.json()["data"]
+        assert data["http2"] is False
+        [host] = data["hosts"]
+        assert host["host"] == "mods.vintagestory.at"
+        assert host["requests"] == 1
+        assert host["bytesReceived"] == 2048
+        assert host["statusClasses"] == {"2xx": 1}
+
+    def test_requires_admin(self, client: TestClient) -> None:
+        response = client.get(
+            "/api/v1alpha1/metrics/upstream", headers={"X-API-Key": TEST_MONITOR_KEY}
+        )
+
+        assert response.status_code == 403
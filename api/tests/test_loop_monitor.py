@@ -0,0 +1,169 @@
+"""Tests for the event loop lag monitor and slow-callback detector."""
+
+import asyncio
+import time
+from collections.abc import Generator
+
+import pytest
+from conftest import TEST_ADMIN_KEY, TEST_MONITOR_KEY  # type: ignore[import-not-found]
+from fastapi.testclient import TestClient
+
+from vintagestory_api.config import Settings
+from vintagestory_api.main import app
+from vintagestory_api.middleware.auth import get_settings
+from vintagestory_api.services.loop_monitor import (
+    LoopMonitor,
+    LoopStall,
+    get_loop_monitor,
+    reset_loop_monitor,
+)
+
+
+@pytest.fixture(autouse=True)
+def reset_monitor() -> Generator[None, None, None]:
+    """Reset the loop monitor singleton before and after each test."""
+    reset_loop_monitor()
+    yield
+    reset_loop_monitor()
+
+
+def _block_loop(seconds: float) -> None:
+    """Deliberately block the calling thread (the event loop in tests)."""
+    time.sleep(seconds)
+
+
+class TestLoopMonitor:
+    """Tests for LoopMonitor against a real event loop."""
+
+    async def test_records_lag_samples(self) -> None:
+        """Probe task records scheduling delay samples."""
+        monitor = LoopMonitor(interval=0.01, slow_threshold=0.5)
+        monitor.start()
+        try:
+            await asyncio.sleep(0.1)
+        finally:
+            await monitor.stop()
+
+        summary = monitor.get_lag_summary()
+        assert summary.samples > 0
+        assert summary.p50_ms is not None
+        assert summary.max_ms is not None and summary.max_ms >= summary.p50_ms
+
+    async def test_detects_blocking_call_with_stack(self) -> None:
+        """Blocking the loop beyond the threshold records a stall with its stack."""
+        monitor = LoopMonitor(interval=0.01, slow_threshold=0.05)
+        monitor.start()
+        try:
+            await asyncio.sleep(0.1)
+            _block_loop(0.3)
+            await asyncio.sleep(0.1)
+        finally:
+            await monitor.stop()
+
+        stalls = monitor.get_stalls()
+        assert monitor.stall_count >= 1
+        stall = stalls[0]
+        assert stall.duration_ms is not None and stall.duration_ms >= 200
+        assert any("_block_loop" in frame for frame in stall.stack)
+
+    async def test_no_stalls_when_loop_is_responsive(self) -> None:
+        """A responsive loop records no stalls."""
+        monitor = LoopMonitor(interval=0.01, slow_threshold=0.2)
+        monitor.start()
+        try:
+            await asyncio.sleep(0.2)
+        finally:
+            await monitor.stop()
+
+        assert monitor.get_stalls() == []
+
+    async def test_start_is_idempotent(self) -> None:
+        """Calling start twice keeps a single probe running."""
+        monitor = LoopMonitor(interval=0.01)
+        monitor.start()
+        monitor.start()
+        assert monitor.is_running
+        await monitor.stop()
+        assert not monitor.is_running
+
+    async def test_restart_discards_stale_heartbeat(self) -> None:
+        """A heartbeat left over from a previous loop does not block the restarted one."""
+        monitor = LoopMonitor(interval=0.01, slow_threshold=0.05)
+        # As if stop() ran while a heartbeat was still posted to the old loop
+        monitor._beat_posted_at = time.monotonic() - 10  # pyright: ignore[reportPrivateUsage]
+        monitor.start()
+        try:
+            await asyncio.sleep(0.2)
+        finally:
+            await monitor.stop()
+
+        assert monitor.get_stalls() == []
+
+    def test_empty_summary(self) -> None:
+        """Summary with no samples has no percentiles."""
+        summary = LoopMonitor().get_lag_summary()
+        assert summary.samples == 0
+        assert summary.p99_ms is None
+
+    def test_clear_resets_samples_and_stalls(self) -> None:
+        """clear() drops lag samples and stall records."""
+        monitor = LoopMonitor()
+        monitor._lag_samples.append(1.0)  # pyright: ignore[reportPrivateUsage]
+        monitor._stalls.append(LoopStall(started_at=0.0, duration_ms=5.0))  # pyright: ignore[reportPrivateUsage]
+        monitor.clear()
+
+        assert monitor.get_lag_summary().samples == 0
+        assert monitor.get_stalls() == []
+
+
+class TestLoopDebugEndpoint:
+    """Tests for GET/DELETE /api/v1alpha1/debug/loop."""
+
+    @pytest.fixture
+    def client(self) -> Generator[TestClient, None, None]:
+        """Create a test client with known API keys."""
+        test_settings = Settings(
+            api_key_admin=TEST_ADMIN_KEY,
+            api_key_monitor=TEST_MONITOR_KEY,
+        )
+        app.dependency_overrides[get_settings] = lambda: test_settings
+        yield TestClient(app)
+        app.dependency_overrides.clear()
+
+    def test_get_loop_status_admin(self, client: TestClient) -> None:
+        """Admin receives lag summary and stall list."""
+        monitor = get_loop_monitor()
+        monitor._lag_samples.extend([1.0, 2.0, 3.0])  # pyright: ignore[reportPrivateUsage]
+        monitor._stalls.append(  # pyright: ignore[reportPrivateUsage]
+            LoopStall(started_at=time.time(), duration_ms=250.0, stack=["a.py:1 in f"])
+        )
+
+        response = client.get(
+            "/api/v1alpha1/debug/loop", headers={"X-API-Key": TEST_ADMIN_KEY}
+        )
+
+        assert response.status_code == 200
+        data = response.json()["data"]
+        assert data["lag"]["samples"] == 3
+        assert data["lag"]["max_ms"] == 3.0
+        assert data["stalls"][0]["duration_ms"] == 250.0
+        assert data["stalls"][0]["stack"] == ["a.py:1 in f"]
+        assert data["stalls"][0]["in_progress"] is False
+
+    def test_delete_clears_records(self, client: TestClient) -> None:
+        """DELETE clears recorded samples."""
+        get_loop_monitor()._lag_samples.append(1.0)  # pyright: ignore[reportPrivateUsage]
+
+        response = client.delete(
+            "/api/v1alpha1/debug/loop", headers={"X-API-Key": TEST_ADMIN_KEY}
+        )
+
+        assert response.status_code == 200
+        assert get_loop_monitor().get_lag_summary().samples == 0
+
+    def test_monitor_role_forbidden(self, client: TestClient) -> None:
+        """Monitor role cannot access loop diagnostics."""
+        response = client.get(
+            "/api/v1alpha1/debug/loop", headers={"X-API-Key": TEST_MONITOR_KEY}
+        )
+        assert response.status_code == 403
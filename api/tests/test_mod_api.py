@@ -1,5 +1,8 @@
 """Tests for ModApiClient - VintageStory mod database API client."""
 
+import asyncio
+import json
+from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Any
 
@@ -8,7 +11,10 @@ import pytest
 import respx
 from httpx import Response
 
+from vintagestory_api.services.http_client import MAX_RETRIES
 from vintagestory_api.services.mod_api import (
+    CATALOG_FETCH_FLIGHT,
+    CATALOG_LOAD_FLIGHT,
     DownloadError,
     DownloadResult,
     ExternalApiError,
@@ -22,6 +28,7 @@ from vintagestory_api.services.mod_api import (
     sort_mods,
     validate_slug,
 )
+from vintagestory_api.services.mod_index import BrowseQuery
 
 # --- Helper fixtures ---
 
@@ -394,6 +401,180 @@ class TestModApiClientGetMod:
         assert result is None
 
 
+class TestModApiClientModCache:
+    """Tests for the per-slug mod lookup cache."""
+
+    @staticmethod
+    def _expire(client: ModApiClient, slug: str) -> None:
+        """Age a cached lookup past its TTL."""
+        entry = client._mod_cache.get(slug)  # pyright: ignore[reportPrivateUsage]
+        assert entry is not None
+        entry.stored_at -= entry.ttl + 1
+
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_found_mod_cached(self, mod_api_client: ModApiClient) -> None:
+        """Repeat lookups within the TTL make no further requests."""
+        route = respx.get("https://mods.vintagestory.at/api/mod/smithingplus").mock(
+            return_value=Response(200, json={"statuscode": "200", "mod": SMITHINGPLUS_MOD})
+        )
+
+        first = await mod_api_client.get_mod("smithingplus")
+        second = await mod_api_client.get_mod("https://mods.vintagestory.at/smithingplus")
+
+        assert second is first
+        assert route.call_count == 1
+
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_not_found_cached_with_miss_ttl(self, mod_api_client: ModApiClient) -> None:
+        """A 404 is remembered for the (shorter) miss TTL."""
+        route = respx.get("https://mods.vintagestory.at/api/mod/nonexistent").mock(
+            return_value=Response(200, json={"statuscode": "404"})
+        )
+
+        assert await mod_api_client.get_mod("nonexistent") is None
+        assert await mod_api_client.get_mod("nonexistent") is None
+        assert route.call_count == 1
+
+        entry = mod_api_client._mod_cache.get("nonexistent")  # pyright: ignore[reportPrivateUsage]
+        assert entry is not None
+        assert entry.ttl == ModApiClient.MOD_MISS_TTL.total_seconds()
+
+        self._expire(mod_api_client, "nonexistent")
+        await mod_api_client.get_mod("nonexistent")
+        assert route.call_count == 2
+
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_errors_not_cached(self, mod_api_client: ModApiClient) -> None:
+        """Upstream errors are not cached."""
+        route = respx.get("https://mods.vintagestory.at/api/mod/smithingplus").mock(
+            side_effect=[
+                # The shared transport retries connection errors before giving up
+                *[httpx.ConnectError("down")] * (MAX_RETRIES + 1),
+                Response(200, json={"statuscode": "200", "mod": SMITHINGPLUS_MOD}),
+            ]
+        )
+
+        with pytest.raises(ExternalApiError):
+            await mod_api_client.get_mod("smithingplus")
+        assert await mod_api_client.get_mod("smithingplus") is not None
+        assert route.call_count == MAX_RETRIES + 2
+
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_expired_lookup_revalidated_conditionally(
+        self, mod_api_client: ModApiClient
+    ) -> None:
+        """An expired lookup sends its validators and a 304 keeps the cached mod."""
+        route = respx.get("https://mods.vintagestory.at/api/mod/smithingplus").mock(
+            side_effect=[
+                Response(
+                    200,
+                    json={"statuscode": "200", "mod": SMITHINGPLUS_MOD},
+                    headers={"ETag": '"m1"'},
+                ),
+                Response(304),
+            ]
+        )
+
+        original = await mod_api_client.get_mod("smithingplus")
+        self._expire(mod_api_client, "smithingplus")
+        revalidated = await mod_api_client.get_mod("smithingplus")
+
+        assert revalidated is original
+        assert route.calls[1].request.headers["If-None-Match"] == '"m1"'
+        entry = mod_api_client._mod_cache.get("smithingplus")  # pyright: ignore[reportPrivateUsage]
+        assert entry is not None and entry.is_fresh()
+
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_lookup_then_install_single_request(
+        self, mod_api_client: ModApiClient
+    ) -> None:
+        """Installing by modidstrs after a urlalias lookup reuses the lookup."""
+        mod = {**SMITHINGPLUS_MOD, "urlalias": "smithing-plus", "modidstrs": ["smithingplus"]}
+        route = respx.get("https://mods.vintagestory.at/api/mod/smithing-plus").mock(
+            return_value=Response(200, json={"statuscode": "200", "mod": mod})
+        )
+        respx.get("https://mods.vintagestory.at/download?fileid=59176").mock(
+            return_value=Response(200, content=b"zip")
+        )
+
+        await mod_api_client.get_mod("smithing-plus")
+        result = await mod_api_client.download_mod("smithingplus")
+
+        assert result is not None
+        assert route.call_count == 1
+
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_catalog_refresh_revalidates_cached_lookups(
+        self, mod_api_client: ModApiClient
+    ) -> None:
+        """Catalog lastreleased renews unchanged mods and drops changed ones."""
+        unchanged = {**SMITHINGPLUS_MOD, "lastreleased": "2025-10-09 21:28:57"}
+        changed = {
+            **SMITHINGPLUS_MOD,
+            "modid": 1234,
+            "urlalias": "oldpopular",
+            "lastreleased": "2023-01-01 00:00:00",
+        }
+        respx.get("https://mods.vintagestory.at/api/mod/smithingplus").mock(
+            return_value=Response(200, json={"statuscode": "200", "mod": unchanged})
+        )
+        respx.get("https://mods.vintagestory.at/api/mod/oldpopular").mock(
+            return_value=Response(200, json={"statuscode": "200", "mod": changed})
+        )
+        respx.get("https://mods.vintagestory.at/api/mods").mock(
+            return_value=Response(200, json=BROWSE_MODS_RESPONSE)
+        )
+
+        await mod_api_client.get_mod("smithingplus")
+        await mod_api_client.get_mod("oldpopular")
+        self._expire(mod_api_client, "smithingplus")
+
+        await mod_api_client.get_all_mods()
+
+        cache = mod_api_client._mod_cache  # pyright: ignore[reportPrivateUsage]
+        renewed = cache.get("smithingplus")
+        assert renewed is not None and renewed.is_fresh()
+        assert "oldpopular" not in cache
+
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_catalog_refresh_drops_listed_misses(
+        self, mod_api_client: ModApiClient
+    ) -> None:
+        """A cached "not found" is dropped once the slug appears in the catalog."""
+        respx.get("https://mods.vintagestory.at/api/mod/smithingplus").mock(
+            return_value=Response(200, json={"statuscode": "404"})
+        )
+        respx.get("https://mods.vintagestory.at/api/mods").mock(
+            return_value=Response(200, json=BROWSE_MODS_RESPONSE)
+        )
+
+        await mod_api_client.get_mod("smithingplus")
+        await mod_api_client.get_all_mods()
+
+        assert "smithingplus" not in mod_api_client._mod_cache  # pyright: ignore[reportPrivateUsage]
+
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_clear_mod_cache(self, mod_api_client: ModApiClient) -> None:
+        """clear_mod_cache() forces the next lookup upstream."""
+        route = respx.get("https://mods.vintagestory.at/api/mod/smithingplus").mock(
+            return_value=Response(200, json={"statuscode": "200", "mod": SMITHINGPLUS_MOD})
+        )
+
+        await mod_api_client.get_mod("smithingplus")
+        mod_api_client.clear_mod_cache()
+        await mod_api_client.get_mod("smithingplus")
+
+        assert route.call_count == 2
+
+
 # --- Tests for ModApiClient.download_mod ---
 
 
@@ -452,6 +633,33 @@ class TestModApiClientDownloadMod:
         assert result.filename == "smithingplus_1.8.2.zip"
         assert result.path.read_bytes() == b"version 1.8.2 content"
 
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_download_content_addressed(
+        self, mod_api_client: ModApiClient, cache_dir: Path
+    ) -> None:
+        """Downloads are stored under their SHA-256; identical files are stored once."""
+        import hashlib
+
+        respx.get("https://mods.vintagestory.at/api/mod/smithingplus").mock(
+            return_value=Response(200, json={"statuscode": "200", "mod": SMITHINGPLUS_MOD})
+        )
+        respx.get("https://mods.vintagestory.at/download?fileid=59176").mock(
+            return_value=Response(200, content=b"identical content")
+        )
+        respx.get("https://mods.vintagestory.at/download?fileid=57894").mock(
+            return_value=Response(200, content=b"identical content")
+        )
+
+        latest = await mod_api_client.download_mod("smithingplus")
+        older = await mod_api_client.download_mod("smithingplus", version="1.8.2")
+
+        expected = hashlib.sha256(b"identical content").hexdigest()
+        assert latest is not None and older is not None
+        assert latest.sha256 == older.sha256 == expected
+        assert latest.path == older.path == cache_dir / "mods" / f"{expected}.zip"
+        assert [p.name for p in (cache_dir / "mods").iterdir()] == [f"{expected}.zip"]
+
     @respx.mock
     @pytest.mark.asyncio
     async def test_download_mod_not_found(
@@ -511,6 +719,8 @@ class TestModApiClientDownloadMod:
 
         # Mock response object
         mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.headers = {}
         mock_response.raise_for_status = Mock()
         mock_response.aiter_bytes = chunk_iterator
 
@@ -551,6 +761,8 @@ class TestModApiClientDownloadMod:
 
         # Mock response object
         mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.headers = {}
         mock_response.raise_for_status = Mock()
         mock_response.aiter_bytes = chunk_iterator
 
@@ -592,6 +804,8 @@ class TestModApiClientDownloadMod:
 
         # Mock response object
         mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.headers = {}
         mock_response.raise_for_status = Mock()
         mock_response.aiter_bytes = chunk_iterator
 
@@ -653,6 +867,8 @@ class TestModApiClientDownloadMod:
             raise httpx.TimeoutException("timeout during stream")
 
         mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.headers = {}
         mock_response.raise_for_status = Mock()
         mock_response.aiter_bytes = chunk_iterator
 
@@ -693,6 +909,8 @@ class TestModApiClientDownloadMod:
             raise httpx.HTTPError("connection reset by peer")
 
         mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.headers = {}
         mock_response.raise_for_status = Mock()
         mock_response.aiter_bytes = chunk_iterator
 
@@ -731,6 +949,8 @@ class TestModApiClientDownloadMod:
             raise OSError("disk full")
 
         mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.headers = {}
         mock_response.raise_for_status = Mock()
         mock_response.aiter_bytes = chunk_iterator
 
@@ -1186,6 +1406,84 @@ class TestSearchMods:
 # --- Tests for ModApiClient.get_all_mods ---
 
 
+class TestModApiClientGetCatalogIndex:
+    """Tests for ModApiClient.get_catalog_index()."""
+
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_index_reused_until_catalog_changes(
+        self, mod_api_client: ModApiClient
+    ) -> None:
+        """The index is built once per catalog and rebuilt after a refresh."""
+        respx.get("https://mods.vintagestory.at/api/mods").mock(
+            return_value=Response(200, json=BROWSE_MODS_RESPONSE)
+        )
+
+        first = await mod_api_client.get_catalog_index()
+        second = await mod_api_client.get_catalog_index()
+        assert first is second
+        assert len(first) == 3
+        assert first.get_mods(first.query(search="smithing"))[0]["name"] == "Smithing Plus"
+
+        refreshed = await mod_api_client.get_catalog_index(force_refresh=True)
+        assert refreshed is not first
+
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_query_catalog_caches_sorted_results(
+        self, mod_api_client: ModApiClient
+    ) -> None:
+        """query_catalog() returns sorted IDs and reuses them for repeat queries."""
+        respx.get("https://mods.vintagestory.at/api/mods").mock(
+            return_value=Response(200, json=BROWSE_MODS_RESPONSE)
+        )
+        query = BrowseQuery.create(sort="downloads")
+
+        index, mod_ids = await mod_api_client.query_catalog(query)
+        _, again = await mod_api_client.query_catalog(query)
+
+        assert again is mod_ids
+        assert index.get_mods(mod_ids) == sort_mods(list(index.mods), sort_by="downloads")
+
+        # A new catalog generation never serves stale results
+        mod_api_client.clear_browse_cache()
+        _, fresh = await mod_api_client.query_catalog(query)
+        assert fresh is not mod_ids
+
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_query_catalog_for_version(self, mod_api_client: ModApiClient) -> None:
+        """query_catalog() with a version tagid queries that version's own index."""
+        catalog_route = respx.get(
+            "https://mods.vintagestory.at/api/mods", params={"gameversion": "7"}
+        ).mock(return_value=Response(200, json=BROWSE_MODS_RESPONSE))
+        query = BrowseQuery.create(search="smithing")
+
+        index, mod_ids = await mod_api_client.query_catalog(query, version_tagid=7)
+        again, _ = await mod_api_client.query_catalog(query, version_tagid=7)
+
+        assert again is index
+        assert index.mods is await mod_api_client.get_mods_by_version(7)
+        assert [m["name"] for m in index.get_mods(mod_ids)] == ["Smithing Plus"]
+        assert catalog_route.call_count == 1
+        assert mod_api_client._browse_index is None  # pyright: ignore[reportPrivateUsage]
+
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_clear_browse_cache_drops_index(
+        self, mod_api_client: ModApiClient
+    ) -> None:
+        """Clearing the browse cache also discards the index."""
+        respx.get("https://mods.vintagestory.at/api/mods").mock(
+            return_value=Response(200, json=BROWSE_MODS_RESPONSE)
+        )
+
+        first = await mod_api_client.get_catalog_index()
+        mod_api_client.clear_browse_cache()
+
+        assert await mod_api_client.get_catalog_index() is not first
+
+
 class TestModApiClientGetAllMods:
     """Tests for ModApiClient.get_all_mods()."""
 
@@ -1364,6 +1662,147 @@ class TestModApiClientBrowseCache:
         assert result is True
 
 
+
+class TestModApiClientCatalogPersistence:
+    """Tests for the disk-persisted, stale-while-revalidate mod catalog."""
+
+    @staticmethod
+    def _make_stale(client: ModApiClient) -> None:
+        """Age the in-memory catalog past its TTL."""
+        client._browse_cache_time = (  # pyright: ignore[reportPrivateUsage]
+            datetime.now() - ModApiClient.BROWSE_CACHE_TTL - timedelta(seconds=1)
+        )
+
+    @staticmethod
+    async def _wait_for_refresh(client: ModApiClient) -> None:
+        """Wait for the background refresh task (if any) to finish."""
+        task = client._catalog_flight.get_task(CATALOG_FETCH_FLIGHT)  # pyright: ignore[reportPrivateUsage]
+        if task is not None:
+            await asyncio.gather(task, return_exceptions=True)
+
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_forced_refresh_does_not_join_cold_disk_load(self, cache_dir: Path) -> None:
+        """A forced refresh during a cold disk load fetches upstream instead of joining it."""
+        route = respx.get("https://mods.vintagestory.at/api/mods").mock(
+            return_value=Response(200, json=BROWSE_MODS_RESPONSE)
+        )
+        client = ModApiClient(cache_dir=cache_dir)
+        release = asyncio.Event()
+
+        async def slow_disk_load() -> list[dict[str, Any]]:
+            await release.wait()
+            return []
+
+        flight = client._catalog_flight  # pyright: ignore[reportPrivateUsage]
+        load = flight.start(CATALOG_LOAD_FLIGHT, slow_disk_load)
+
+        mods = await client.get_all_mods(force_refresh=True)
+        release.set()
+        await load
+
+        assert len(mods) == 3
+        assert route.call_count == 1
+
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_catalog_persisted_and_served_after_restart(self, cache_dir: Path) -> None:
+        """A new client serves the persisted catalog without an upstream fetch."""
+        route = respx.get("https://mods.vintagestory.at/api/mods").mock(
+            return_value=Response(200, json=BROWSE_MODS_RESPONSE, headers={"ETag": '"v1"'})
+        )
+        await ModApiClient(cache_dir=cache_dir).get_all_mods()
+
+        meta = json.loads((cache_dir / ModApiClient.CATALOG_META_FILE).read_text())
+        assert meta["etag"] == '"v1"'
+        assert meta["count"] == 3
+
+        restarted = ModApiClient(cache_dir=cache_dir)
+        mods = await restarted.get_all_mods()
+
+        assert len(mods) == 3
+        assert route.call_count == 1
+
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_stale_catalog_served_while_revalidating(
+        self, mod_api_client: ModApiClient
+    ) -> None:
+        """Stale data is returned at once and revalidated with If-None-Match."""
+        route = respx.get("https://mods.vintagestory.at/api/mods").mock(
+            side_effect=[
+                Response(200, json=BROWSE_MODS_RESPONSE, headers={"ETag": '"v1"'}),
+                Response(304),
+            ]
+        )
+        original = await mod_api_client.get_all_mods()
+        self._make_stale(mod_api_client)
+
+        served = await mod_api_client.get_all_mods()
+        assert served is original
+        await self._wait_for_refresh(mod_api_client)
+
+        assert route.call_count == 2
+        assert route.calls[1].request.headers["If-None-Match"] == '"v1"'
+        assert await mod_api_client.get_all_mods() is original
+        assert mod_api_client._is_browse_cache_valid()  # pyright: ignore[reportPrivateUsage]
+
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_refresh_failure_keeps_serving_old_data(
+        self, mod_api_client: ModApiClient
+    ) -> None:
+        """A failed background refresh keeps the old list and backs off."""
+        route = respx.get("https://mods.vintagestory.at/api/mods").mock(
+            side_effect=[
+                Response(200, json=BROWSE_MODS_RESPONSE),
+                httpx.ConnectError("connection refused"),
+            ]
+        )
+        original = await mod_api_client.get_all_mods()
+        self._make_stale(mod_api_client)
+
+        await mod_api_client.get_all_mods()
+        await self._wait_for_refresh(mod_api_client)
+
+        # Still served, and no immediate retry while backing off
+        assert await mod_api_client.get_all_mods() is original
+        assert route.call_count == 2
+
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_corrupt_catalog_file_ignored(self, cache_dir: Path) -> None:
+        """An unreadable persisted catalog falls back to a fetch."""
+        (cache_dir / ModApiClient.CATALOG_FILE).write_text("{not json")
+        route = respx.get("https://mods.vintagestory.at/api/mods").mock(
+            return_value=Response(200, json=BROWSE_MODS_RESPONSE)
+        )
+
+        mods = await ModApiClient(cache_dir=cache_dir).get_all_mods()
+
+        assert len(mods) == 3
+        assert route.call_count == 1
+
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_warm_catalog_loads_and_revalidates(self, cache_dir: Path) -> None:
+        """warm_catalog() loads from disk and refreshes a catalog without metadata."""
+        (cache_dir / ModApiClient.CATALOG_FILE).write_text(
+            json.dumps(BROWSE_MODS_RESPONSE["mods"][:1])
+        )
+        route = respx.get("https://mods.vintagestory.at/api/mods").mock(
+            return_value=Response(200, json=BROWSE_MODS_RESPONSE)
+        )
+        client = ModApiClient(cache_dir=cache_dir)
+
+        await client.warm_catalog()
+        assert len(await client.get_all_mods()) == 1
+        await self._wait_for_refresh(client)
+
+        assert route.call_count == 1
+        assert len(await client.get_all_mods()) == 3
+
+
 # --- Test data for game versions ---
 
 GAMEVERSIONS_RESPONSE: dict[str, Any] = {
@@ -1377,6 +1816,85 @@ GAMEVERSIONS_RESPONSE: dict[str, Any] = {
 }
 
 
+
+class TestModApiClientSingleFlight:
+    """Tests for coalescing concurrent identical upstream calls."""
+
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_concurrent_cold_get_all_mods_fetch_once(
+        self, mod_api_client: ModApiClient
+    ) -> None:
+        """Ten concurrent callers on a cold cache trigger one upstream request."""
+        route = respx.get("https://mods.vintagestory.at/api/mods").mock(
+            return_value=Response(200, json=BROWSE_MODS_RESPONSE)
+        )
+
+        results = await asyncio.gather(*(mod_api_client.get_all_mods() for _ in range(10)))
+
+        assert route.call_count == 1
+        assert all(r is results[0] for r in results)
+
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_concurrent_get_game_versions_fetch_once(
+        self, mod_api_client: ModApiClient
+    ) -> None:
+        """Concurrent game version lookups share one request."""
+        route = respx.get("https://mods.vintagestory.at/api/gameversions").mock(
+            return_value=Response(200, json=GAMEVERSIONS_RESPONSE)
+        )
+
+        results = await asyncio.gather(
+            *(mod_api_client.get_game_versions() for _ in range(5))
+        )
+
+        assert route.call_count == 1
+        assert results[0]["1.21.3"] == -281565171286015
+
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_concurrent_get_mod_coalesced_per_slug(
+        self, mod_api_client: ModApiClient
+    ) -> None:
+        """Concurrent get_mod() calls coalesce per slug, not across slugs."""
+        smithing = respx.get("https://mods.vintagestory.at/api/mod/smithingplus").mock(
+            return_value=Response(200, json={"statuscode": "200", "mod": SMITHINGPLUS_MOD})
+        )
+        other = respx.get("https://mods.vintagestory.at/api/mod/othermod").mock(
+            return_value=Response(200, json={"statuscode": "404"})
+        )
+
+        results = await asyncio.gather(
+            mod_api_client.get_mod("smithingplus"),
+            mod_api_client.get_mod("smithingplus"),
+            mod_api_client.get_mod("othermod"),
+        )
+
+        assert smithing.call_count == 1
+        assert other.call_count == 1
+        assert results[0] is not None and results[0] is results[1]
+        assert results[2] is None
+
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_shared_failure_raised_to_every_caller(
+        self, mod_api_client: ModApiClient
+    ) -> None:
+        """Every coalesced caller receives the upstream error."""
+        route = respx.get("https://mods.vintagestory.at/api/mods").mock(
+            side_effect=httpx.ConnectError("connection refused")
+        )
+
+        results = await asyncio.gather(
+            *(mod_api_client.get_all_mods() for _ in range(3)), return_exceptions=True
+        )
+
+        # One upstream request (and its transport retries) for all callers
+        assert route.call_count == MAX_RETRIES + 1
+        assert all(isinstance(r, ExternalApiError) for r in results)
+
+
 # --- Tests for ModApiClient game versions cache ---
 
 
@@ -1584,22 +2102,165 @@ class TestModApiClientModsByVersion:
 
     @respx.mock
     @pytest.mark.asyncio
-    async def test_get_mods_by_version_not_cached(
+    async def test_get_mods_by_version_cached(
         self, mod_api_client: ModApiClient
     ) -> None:
-        """get_mods_by_version() does not use browse cache (each call fetches)."""
+        """get_mods_by_version() serves repeat calls from the version cache."""
         version_tagid = -281565171286015
         route = respx.get(
             "https://mods.vintagestory.at/api/mods",
             params={"gameversion": str(version_tagid)},
         ).mock(return_value=Response(200, json=BROWSE_MODS_RESPONSE))
 
-        # First call
-        await mod_api_client.get_mods_by_version(version_tagid)
+        first = await mod_api_client.get_mods_by_version(version_tagid)
+        second = await mod_api_client.get_mods_by_version(version_tagid)
+
         assert route.call_count == 1
+        assert second is first
+
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_get_mods_by_version_cached_per_version(
+        self, mod_api_client: ModApiClient
+    ) -> None:
+        """Each game version has its own cache entry."""
+        route_a = respx.get(
+            "https://mods.vintagestory.at/api/mods", params={"gameversion": "1"}
+        ).mock(return_value=Response(200, json=BROWSE_MODS_RESPONSE))
+        route_b = respx.get(
+            "https://mods.vintagestory.at/api/mods", params={"gameversion": "2"}
+        ).mock(return_value=Response(200, json={"statuscode": "200", "mods": []}))
+
+        assert len(await mod_api_client.get_mods_by_version(1)) == 3
+        assert await mod_api_client.get_mods_by_version(2) == []
+        assert len(await mod_api_client.get_mods_by_version(1)) == 3
+
+        assert route_a.call_count == 1
+        assert route_b.call_count == 1
+
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_get_mods_by_version_stale_served_while_revalidating(
+        self, mod_api_client: ModApiClient
+    ) -> None:
+        """A stale entry is returned immediately and refreshed in the background."""
+        version_tagid = 7
+        route = respx.get(
+            "https://mods.vintagestory.at/api/mods",
+            params={"gameversion": str(version_tagid)},
+        ).mock(return_value=Response(200, json=BROWSE_MODS_RESPONSE))
+
+        original = await mod_api_client.get_mods_by_version(version_tagid)
+        cache = mod_api_client._version_cache  # pyright: ignore[reportPrivateUsage]
+        entry = cache.get(version_tagid)
+        assert entry is not None
+        entry.stored_at -= entry.ttl + 1
+
+        stale = await mod_api_client.get_mods_by_version(version_tagid)
+        assert stale is original
+
+        flight = mod_api_client._version_flight  # pyright: ignore[reportPrivateUsage]
+        task = flight.get_task(version_tagid)
+        assert task is not None
+        refreshed = await task
+
+        assert route.call_count == 2
+        assert refreshed is not original
+        assert await mod_api_client.get_mods_by_version(version_tagid) is refreshed
+
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_get_mods_by_version_failed_refresh_keeps_stale(
+        self, mod_api_client: ModApiClient
+    ) -> None:
+        """A failed background refresh keeps serving the old list with backoff."""
+        version_tagid = 7
+        route = respx.get(
+            "https://mods.vintagestory.at/api/mods",
+            params={"gameversion": str(version_tagid)},
+        ).mock(
+            side_effect=[
+                Response(200, json=BROWSE_MODS_RESPONSE),
+                *[httpx.ConnectError("down")] * (MAX_RETRIES + 1),
+            ]
+        )
+
+        original = await mod_api_client.get_mods_by_version(version_tagid)
+        cache = mod_api_client._version_cache  # pyright: ignore[reportPrivateUsage]
+        entry = cache.get(version_tagid)
+        assert entry is not None
+        entry.stored_at -= entry.ttl + 1
 
-        # Second call - should fetch again (not cached)
         await mod_api_client.get_mods_by_version(version_tagid)
+        flight = mod_api_client._version_flight  # pyright: ignore[reportPrivateUsage]
+        task = flight.get_task(version_tagid)
+        assert task is not None
+        assert await task is original
+
+        retry = cache.get(version_tagid)
+        assert retry is not None
+        assert retry.is_fresh()
+        assert retry.ttl == ModApiClient.BROWSE_REFRESH_RETRY.total_seconds()
+        assert await mod_api_client.get_mods_by_version(version_tagid) is original
+        assert route.call_count == MAX_RETRIES + 2
+
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_get_mods_by_version_concurrent_calls_coalesced(
+        self, mod_api_client: ModApiClient
+    ) -> None:
+        """Concurrent cold calls for one version make a single request."""
+        version_tagid = 7
+        route = respx.get(
+            "https://mods.vintagestory.at/api/mods",
+            params={"gameversion": str(version_tagid)},
+        ).mock(return_value=Response(200, json=BROWSE_MODS_RESPONSE))
+
+        results = await asyncio.gather(
+            *(mod_api_client.get_mods_by_version(version_tagid) for _ in range(5))
+        )
+
+        assert route.call_count == 1
+        assert all(result is results[0] for result in results)
+
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_get_mods_by_version_lru_eviction(
+        self, mod_api_client: ModApiClient
+    ) -> None:
+        """The least recently used version is evicted past the entry bound."""
+        route = respx.get("https://mods.vintagestory.at/api/mods").mock(
+            return_value=Response(200, json=BROWSE_MODS_RESPONSE)
+        )
+        max_entries = ModApiClient.VERSION_CACHE_MAX_ENTRIES
+
+        for tagid in range(max_entries):
+            await mod_api_client.get_mods_by_version(tagid)
+        # Touch version 0 so version 1 is the least recently used
+        await mod_api_client.get_mods_by_version(0)
+        await mod_api_client.get_mods_by_version(max_entries)
+
+        cache = mod_api_client._version_cache  # pyright: ignore[reportPrivateUsage]
+        assert len(cache) == max_entries
+        assert 0 in cache
+        assert 1 not in cache
+        assert cache.total_bytes > 0
+        assert route.call_count == max_entries + 1
+
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_clear_browse_cache_clears_version_cache(
+        self, mod_api_client: ModApiClient
+    ) -> None:
+        """clear_browse_cache() also drops cached version lists."""
+        route = respx.get(
+            "https://mods.vintagestory.at/api/mods", params={"gameversion": "7"}
+        ).mock(return_value=Response(200, json=BROWSE_MODS_RESPONSE))
+
+        await mod_api_client.get_mods_by_version(7)
+        mod_api_client.clear_browse_cache()
+        await mod_api_client.get_mods_by_version(7)
+
         assert route.call_count == 2
 
     @respx.mock
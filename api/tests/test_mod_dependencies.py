@@ -0,0 +1,222 @@
+"""Tests for mod dependency resolution."""
+
+import io
+import json
+import zipfile
+from pathlib import Path
+
+import pytest
+import respx
+from httpx import Response
+
+from vintagestory_api.models.mods import ModMetadata, ModpackEntry
+from vintagestory_api.services.mod_dependencies import satisfies, version_key
+from vintagestory_api.services.mods import ModService
+from vintagestory_api.services.pending_restart import PendingRestartState
+
+API = "https://mods.vintagestory.at/api/mod"
+DOWNLOAD = "https://mods.vintagestory.at/download"
+
+
+def mod_zip_bytes(modid: str, version: str, dependencies: dict[str, str] | None = None) -> bytes:
+    """Create a mod zip with a modinfo.json declaring dependencies."""
+    modinfo: dict[str, object] = {"modid": modid, "name": modid.title(), "version": version}
+    if dependencies is not None:
+        modinfo["dependencies"] = dependencies
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as zf:
+        zf.writestr("modinfo.json", json.dumps(modinfo))
+    return buffer.getvalue()
+
+
+def mock_mod(
+    modid: str,
+    version: str,
+    fileid: int,
+    dependencies: dict[str, str] | None = None,
+) -> respx.Route:
+    """Mock the lookup and download of a single-release mod; returns the download route."""
+    mod = {
+        "modid": fileid,
+        "name": modid.title(),
+        "urlalias": modid,
+        "releases": [
+            {
+                "modversion": version,
+                "filename": f"{modid}_{version}.zip",
+                "fileid": fileid,
+                "tags": ["1.21.3"],
+            }
+        ],
+    }
+    respx.get(f"{API}/{modid}").mock(
+        return_value=Response(200, json={"statuscode": "200", "mod": mod})
+    )
+    return respx.get(f"{DOWNLOAD}?fileid={fileid}").mock(
+        return_value=Response(200, content=mod_zip_bytes(modid, version, dependencies))
+    )
+
+
+@pytest.fixture
+def mod_service(tmp_path: Path) -> ModService:
+    """Create a ModService with test directories."""
+    (tmp_path / "state").mkdir()
+    (tmp_path / "mods").mkdir()
+    return ModService(
+        state_dir=tmp_path / "state",
+        mods_dir=tmp_path / "mods",
+        cache_dir=tmp_path / "cache",
+        restart_state=PendingRestartState(),
+        game_version="1.21.3",
+    )
+
+
+def install_local(service: ModService, modid: str, version: str, deps: dict[str, str]) -> None:
+    """Put a mod in the mods directory and import it into the state."""
+    path = service.state_manager.mods_dir / f"{modid}_{version}.zip"
+    path.write_bytes(mod_zip_bytes(modid, version, deps))
+    service.state_manager.sync_state_with_disk()
+
+
+class TestVersionComparison:
+    """Tests for version_key() and satisfies()."""
+
+    def test_numeric_ordering(self) -> None:
+        assert version_key("1.10.0") > version_key("1.9.2")
+        assert version_key("1.2") == version_key("1.2.0")
+        assert version_key("v2.0.0") == version_key("2.0.0")
+
+    def test_prerelease_sorts_before_release(self) -> None:
+        assert version_key("1.0.0-rc.1") < version_key("1.0.0")
+        assert version_key("1.0.0-rc.1") > version_key("0.9.9")
+
+    def test_satisfies(self) -> None:
+        assert satisfies("1.8.3", "1.8.0")
+        assert satisfies("1.8.3", "")
+        assert satisfies("0.1.0", "*")
+        assert not satisfies("1.7.9", "1.8.0")
+
+
+class TestModMetadataDependencies:
+    """Tests for the dependencies field of ModMetadata."""
+
+    def test_dependencies_default_empty(self) -> None:
+        metadata = ModMetadata(modid="a", name="A", version="1.0.0")
+        assert metadata.dependencies == {}
+
+    def test_dependencies_normalized(self) -> None:
+        metadata = ModMetadata.model_validate(
+            {
+                "modid": "a",
+                "name": "A",
+                "version": "1.0.0",
+                "dependencies": {"game": "1.21.0", "lib": None, "": "1.0"},
+            }
+        )
+        assert metadata.dependencies == {"game": "1.21.0", "lib": ""}
+
+    def test_invalid_dependencies_ignored(self) -> None:
+        metadata = ModMetadata.model_validate(
+            {"modid": "a", "name": "A", "version": "1.0.0", "dependencies": ["lib"]}
+        )
+        assert metadata.dependencies == {}
+
+
+class TestDependencyResolver:
+    """Tests for DependencyResolver via ModService.resolve_dependencies()."""
+
+    @pytest.mark.asyncio
+    async def test_resolves_transitive_closure(self, mod_service: ModService) -> None:
+        """Dependencies of dependencies are planned; builtins are ignored."""
+        with respx.mock:
+            mock_mod("app", "1.0.0", 1, {"game": "1.21.0", "libone": "1.0.0"})
+            mock_mod("libone", "1.2.0", 2, {"libtwo": ""})
+            mock_mod("libtwo", "0.5.0", 3)
+
+            plan = await mod_service.resolve_dependencies([ModpackEntry(slug="app")])
+
+        planned = {(p.slug, p.version): p.required_by for p in plan.install}
+        assert planned == {
+            ("app", "1.0.0"): [],
+            ("libone", "1.2.0"): ["app"],
+            ("libtwo", "0.5.0"): ["libone"],
+        }
+        assert plan.missing == []
+        assert plan.conflicts == []
+
+    @pytest.mark.asyncio
+    async def test_installed_dependency_satisfied_or_conflicting(
+        self, mod_service: ModService
+    ) -> None:
+        """Installed dependencies are checked against the minimum version."""
+        install_local(mod_service, "libone", "1.0.0", {})
+        install_local(mod_service, "libtwo", "2.0.0", {})
+
+        with respx.mock:
+            mock_mod("app", "1.0.0", 1, {"libone": "1.5.0", "libtwo": "2.0.0"})
+            plan = await mod_service.resolve_dependencies([ModpackEntry(slug="app")])
+
+        assert [p.slug for p in plan.install] == ["app"]
+        assert plan.satisfied == ["libtwo"]
+        assert len(plan.conflicts) == 1
+        conflict = plan.conflicts[0]
+        assert (conflict.modid, conflict.required_version, conflict.available_version) == (
+            "libone",
+            "1.5.0",
+            "1.0.0",
+        )
+        assert conflict.required_by == "app"
+
+    @pytest.mark.asyncio
+    async def test_missing_dependency_reported(self, mod_service: ModService) -> None:
+        """A dependency that is not in the mod database is reported as missing."""
+        with respx.mock:
+            mock_mod("app", "1.0.0", 1, {"ghost": ""})
+            respx.get(f"{API}/ghost").mock(return_value=Response(200, json={"statuscode": "404"}))
+
+            plan = await mod_service.resolve_dependencies([ModpackEntry(slug="app")])
+
+        assert [(m.modid, m.required_by) for m in plan.missing] == [("ghost", "app")]
+
+    @pytest.mark.asyncio
+    async def test_cycles_terminate(self, mod_service: ModService) -> None:
+        """Mutually dependent mods are each planned once."""
+        with respx.mock:
+            mock_mod("left", "1.0.0", 1, {"right": ""})
+            mock_mod("right", "1.0.0", 2, {"left": ""})
+
+            plan = await mod_service.resolve_dependencies([ModpackEntry(slug="left")])
+
+        assert sorted(p.slug for p in plan.install) == ["left", "right"]
+
+    @pytest.mark.asyncio
+    async def test_dependencies_memoized_per_release(self, mod_service: ModService) -> None:
+        """Resolving the same release again does not download it again."""
+        with respx.mock:
+            app_download = mock_mod("app", "1.0.0", 1, {"libone": ""})
+            lib_download = mock_mod("libone", "1.0.0", 2)
+
+            await mod_service.resolve_dependencies([ModpackEntry(slug="app")])
+            plan = await mod_service.resolve_dependencies([ModpackEntry(slug="app")])
+
+        assert app_download.call_count == 1
+        assert lib_download.call_count == 1
+        assert [p.slug for p in plan.install] == ["app", "libone"]
+
+    @pytest.mark.asyncio
+    async def test_install_mods_with_dependencies(self, mod_service: ModService) -> None:
+        """install_mods() installs missing dependencies, reusing the resolver downloads."""
+        with respx.mock:
+            app_download = mock_mod("app", "1.0.0", 1, {"libone": "1.0.0", "ghost": ""})
+            mock_mod("libone", "1.0.0", 2)
+            respx.get(f"{API}/ghost").mock(return_value=Response(200, json={"statuscode": "404"}))
+
+            result = await mod_service.install_mods(
+                [ModpackEntry(slug="app")], include_dependencies=True
+            )
+
+        assert sorted(m.slug for m in result.installed) == ["app", "libone"]
+        assert [f.slug for f in result.failed] == ["ghost"]
+        assert result.failed[0].error.startswith("Dependency of app")
+        assert app_download.call_count == 1
+        assert mod_service.get_mod("libone") is not None
@@ -0,0 +1,197 @@
+"""Tests for the precomputed mod catalog search index."""
+
+import random
+from typing import Any
+
+import pytest
+
+from vintagestory_api.services.mod_api import ModDict, SortOption, search_mods, sort_mods
+from vintagestory_api.services.mod_index import BrowseQuery, ModCatalogIndex, QueryResultCache
+
+CATALOG: list[ModDict] = [
+    {
+        "modid": 1,
+        "name": "Smithing Plus",
+        "author": "jakecool19",
+        "summary": "Expanded smithing mechanics",
+        "tags": ["Crafting", "Utility"],
+        "side": "both",
+        "type": "mod",
+        "downloads": 500,
+        "trendingpoints": 3,
+        "lastreleased": "2025-01-02 10:00:00",
+    },
+    {
+        "modid": 2,
+        "name": "Prospector Info",
+        "author": "Nat",
+        "summary": None,
+        "tags": ["QoL"],
+        "side": "Client",
+        "type": "mod",
+        "downloads": 900,
+        "trendingpoints": 3,
+        "lastreleased": "2024-06-01 08:00:00",
+    },
+    {
+        "modid": 3,
+        "name": "Server Tools",
+        "author": "admin",
+        "summary": "Smith-friendly server utilities",
+        "tags": [],
+        "side": "server",
+        "type": "externaltool",
+        "downloads": 500,
+        "trendingpoints": 10,
+        "lastreleased": "2025-03-01 12:00:00",
+    },
+    {
+        "modid": 4,
+        "name": "Bare",
+        # Missing author/summary/tags/side/type use the same defaults as the scan
+    },
+]
+
+
+def _scan(
+    mods: list[ModDict],
+    search: str = "",
+    side: str | None = None,
+    mod_type: str | None = None,
+    tags: list[str] | None = None,
+) -> list[ModDict]:
+    """Reference implementation mirroring the pre-index browse filters."""
+    result = search_mods(mods, search)
+    if side:
+        result = [m for m in result if str(m.get("side", "both")).lower() == side]
+    if mod_type:
+        result = [m for m in result if str(m.get("type", "mod")).lower() == mod_type]
+    if tags:
+        result = [m for m in result if any(t.lower() in tags for t in m.get("tags", []))]
+    return result
+
+
+@pytest.fixture
+def index() -> ModCatalogIndex:
+    """Index over the sample catalog."""
+    return ModCatalogIndex(CATALOG)
+
+
+class TestModCatalogIndex:
+    """Tests for ModCatalogIndex queries."""
+
+    def test_empty_query_returns_all_in_order(self, index: ModCatalogIndex) -> None:
+        """No filters returns every mod in catalog order."""
+        assert index.query() == [0, 1, 2, 3]
+
+    def test_substring_search_across_fields(self, index: ModCatalogIndex) -> None:
+        """Search matches name, summary, author and tags case-insensitively."""
+        assert index.query(search="SMITH") == [0, 2]
+        assert index.query(search="cool") == [0]
+        assert index.query(search="qol") == [1]
+
+    def test_short_terms_scan_normalized_text(self, index: ModCatalogIndex) -> None:
+        """Terms shorter than a trigram still match."""
+        assert index.query(search="na") == [1]
+
+    def test_unknown_trigram_returns_nothing(self, index: ModCatalogIndex) -> None:
+        """A term containing an unindexed trigram matches nothing."""
+        assert index.query(search="zzzz") == []
+
+    def test_search_does_not_span_fields(self, index: ModCatalogIndex) -> None:
+        """A match cannot straddle the boundary between two fields."""
+        # "plus" ends the name and "jake" starts the author
+        assert index.query(search="plusjake") == []
+
+    def test_facets_combine(self, index: ModCatalogIndex) -> None:
+        """Side, type and tag facets are ANDed; tags are ORed."""
+        assert index.query(side="client") == [1]
+        assert index.query(side="both") == [0, 3]
+        assert index.query(mod_type="externaltool") == [2]
+        assert index.query(tags=["utility", "qol"]) == [0, 1]
+        assert index.query(search="smith", side="server") == [2]
+        assert index.query(tags=["missing"]) == []
+
+    def test_sorted_queries_use_presorted_order(self, index: ModCatalogIndex) -> None:
+        """Sorted results follow each sort order, ties in catalog order."""
+        assert index.query(sort_by="downloads") == [1, 0, 2, 3]
+        assert index.query(sort_by="trending") == [2, 0, 1, 3]
+        assert index.query(sort_by="recent") == [2, 0, 1, 3]
+        assert index.query(sort_by="name") == [3, 1, 2, 0]
+        assert index.query(search="smith", sort_by="recent") == [2, 0]
+
+    def test_get_mods_resolves_ids(self, index: ModCatalogIndex) -> None:
+        """IDs resolve to the original catalog dicts."""
+        assert index.get_mods([2, 0]) == [CATALOG[2], CATALOG[0]]
+
+    def test_matches_scan_on_random_catalog(self) -> None:
+        """Index results are identical to the scan for random queries."""
+        rng = random.Random(1234)
+        words = ["iron", "smith", "ore", "plus", "map", "tool", "farm", "ui"]
+
+        def random_mod(i: int) -> dict[str, Any]:
+            return {
+                "modid": i,
+                "name": " ".join(rng.sample(words, 2)).title(),
+                "author": rng.choice(["Ann", "bob", "Cy"]),
+                "summary": rng.choice([None, " ".join(rng.sample(words, 3))]),
+                "tags": rng.sample(["QoL", "Crafting", "Worldgen"], rng.randint(0, 2)),
+                "side": rng.choice(["both", "client", "Server"]),
+                "type": rng.choice(["mod", "other"]),
+                "downloads": rng.randint(0, 20),
+                "trendingpoints": rng.randint(0, 5),
+                "lastreleased": f"2025-01-{rng.randint(1, 9):02d}",
+            }
+
+        mods = [random_mod(i) for i in range(300)]
+        index = ModCatalogIndex(mods)
+        for _ in range(200):
+            search = rng.choice(["", "sm", "smith", "ore pl", "AnN", "craft", "xyz"])
+            side = rng.choice([None, "both", "client", "server"])
+            mod_type = rng.choice([None, "mod", "other"])
+            tags = rng.choice([None, ["qol"], ["crafting", "worldgen"]])
+            sort_by: SortOption = rng.choice(["downloads", "trending", "recent", "name"])
+            expected = _scan(mods, search, side, mod_type, tags)
+
+            assert index.get_mods(index.query(search, side, mod_type, tags)) == expected
+            assert index.get_mods(
+                index.query(search, side, mod_type, tags, sort_by=sort_by)
+            ) == sort_mods(expected, sort_by=sort_by)
+
+
+class TestBrowseQuery:
+    """Tests for BrowseQuery normalization."""
+
+    def test_equivalent_queries_are_equal(self) -> None:
+        """Whitespace, case and tag order do not change the cache key."""
+        a = BrowseQuery.create(search=" Smith ", tags=["QoL", "crafting", "qol"])
+        b = BrowseQuery.create(search="smith", tags=["crafting", "qol"])
+        assert a == b
+        assert hash(a) == hash(b)
+
+
+class TestQueryResultCache:
+    """Tests for the browse result LRU."""
+
+    def test_hit_and_miss_counting(self) -> None:
+        """Stored results are returned for the same generation only."""
+        cache = QueryResultCache()
+        query = BrowseQuery.create(search="x")
+        cache.put(1, query, [3, 1, 2])
+
+        assert list(cache.get(1, query) or []) == [3, 1, 2]
+        assert cache.get(2, query) is None
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_least_recently_used_evicted(self) -> None:
+        """Exceeding max_entries evicts the least recently used result."""
+        cache = QueryResultCache(max_entries=2)
+        q1, q2, q3 = (BrowseQuery.create(search=s) for s in ("a", "b", "c"))
+        cache.put(1, q1, [1])
+        cache.put(1, q2, [2])
+        cache.get(1, q1)
+        cache.put(1, q3, [3])
+
+        assert cache.get(1, q2) is None
+        assert cache.get(1, q1) is not None
+        assert len(cache) == 2
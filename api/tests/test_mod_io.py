@@ -0,0 +1,114 @@
+"""Tests for the mod subsystem's async I/O layer."""
+
+import asyncio
+import threading
+from datetime import UTC, datetime
+from pathlib import Path
+
+import pytest
+
+from vintagestory_api.models.mods import ModState
+from vintagestory_api.services.mod_io import ModIO
+from vintagestory_api.services.mod_state import ModStateManager
+
+
+class TestModIO:
+    """Tests for ModIO."""
+
+    @pytest.mark.asyncio
+    async def test_run_uses_dedicated_threads(self) -> None:
+        io = ModIO()
+        try:
+            name = await io.run(lambda: threading.current_thread().name)
+        finally:
+            io.shutdown()
+
+        assert name.startswith("mod-io")
+
+    @pytest.mark.asyncio
+    async def test_operations_on_same_mod_are_serialized(self) -> None:
+        io = ModIO()
+        events: list[str] = []
+
+        async def operate(slug: str, tag: str) -> None:
+            async with io.operation("test", slug):
+                events.append(f"{tag}-start")
+                await asyncio.sleep(0.01)
+                events.append(f"{tag}-end")
+
+        await asyncio.gather(operate("mod", "a"), operate("mod", "b"))
+        io.shutdown()
+
+        assert events == ["a-start", "a-end", "b-start", "b-end"]
+
+    @pytest.mark.asyncio
+    async def test_operations_on_different_mods_overlap(self) -> None:
+        io = ModIO()
+        events: list[str] = []
+
+        async def operate(slug: str) -> None:
+            async with io.operation("test", slug):
+                events.append(f"{slug}-start")
+                await asyncio.sleep(0.01)
+                events.append(f"{slug}-end")
+
+        await asyncio.gather(operate("a"), operate("b"))
+        io.shutdown()
+
+        assert events[:2] == ["a-start", "b-start"]
+
+    @pytest.mark.asyncio
+    async def test_directory_operation_excludes_mod_operations(self) -> None:
+        """A directory operation waits for running mod operations and blocks new ones."""
+        io = ModIO()
+        events: list[str] = []
+
+        async def operate(slug: str) -> None:
+            async with io.operation("test", slug):
+                events.append(f"{slug}-start")
+                await asyncio.sleep(0.01)
+                events.append(f"{slug}-end")
+
+        async def reconcile() -> None:
+            async with io.directory_operation("reconcile"):
+                events.append("dir-start")
+                await asyncio.sleep(0.01)
+                events.append("dir-end")
+
+        first = asyncio.create_task(operate("a"))
+        await asyncio.sleep(0)
+        await asyncio.gather(reconcile(), operate("b"), first)
+        io.shutdown()
+
+        assert events == ["a-start", "a-end", "dir-start", "dir-end", "b-start", "b-end"]
+
+    @pytest.mark.asyncio
+    async def test_step_timings_recorded(self) -> None:
+        io = ModIO()
+        async with io.operation("test", "mod") as op:
+            await op.run("first", lambda: None)
+            await op.run("second", lambda: None)
+        io.shutdown()
+
+        assert set(op.timings) == {"first", "second"}
+        assert all(ms >= 0 for ms in op.timings.values())
+
+    @pytest.mark.asyncio
+    async def test_save_state_writes_snapshot(self, tmp_path: Path) -> None:
+        """The state is snapshotted before the write, so later changes are not included."""
+        manager = ModStateManager(state_dir=tmp_path / "state", mods_dir=tmp_path / "mods")
+        manager.set_mod_state(
+            "a.zip",
+            ModState(filename="a.zip", slug="a", version="1.0.0", installed_at=datetime.now(UTC)),
+        )
+        io = ModIO()
+
+        save = asyncio.create_task(io.save_state(manager))
+        await asyncio.sleep(0)  # Snapshot taken, write pending on the writer thread
+        manager.remove_mod("a.zip")
+        await save
+        io.shutdown()
+
+        reloaded = ModStateManager(state_dir=tmp_path / "state", mods_dir=tmp_path / "mods")
+        reloaded.load()
+        assert reloaded.get_mod("a.zip") is not None
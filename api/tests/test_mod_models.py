@@ -153,6 +153,11 @@ class TestModState:
             "enabled": True,
             "installed_at": "2025-12-29T10:30:00Z",
             "asset_id": 15312,
+            "last_released": None,
+            "latest_version": None,
+            "update_available": False,
+            "sha256": None,
+            "fingerprint": None,
         }
 
 
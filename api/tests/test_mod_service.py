@@ -2,12 +2,14 @@
 
 import json
 import zipfile
+from collections.abc import Awaitable, Callable
 from pathlib import Path
+from typing import Any
 from unittest.mock import patch
 
 import pytest
 
-from vintagestory_api.models.mods import ModInfo, ModLookupResponse
+from vintagestory_api.models.mods import ModInfo, ModLookupResponse, UpdateAllResult
 from vintagestory_api.services.mods import (
     InvalidSlugError,
     ModNotFoundError,
@@ -197,10 +199,11 @@ class TestModServiceListMods:
 
         mod_service.state_manager.sync_state_with_disk()
 
-        # Delete the cached metadata to simulate missing cache
+        # Delete the cached metadata (on disk and in memory) to simulate missing cache
         cache_dir = state_dir / "mods" / "testmod"
         if cache_dir.exists():
             shutil.rmtree(cache_dir)
+        mod_service.state_manager.forget_metadata("testmod")
 
         mods = mod_service.list_mods()
 
@@ -212,6 +215,32 @@ class TestModServiceListMods:
         assert mod.description is None
 
 
+    def test_list_mods_memoized_until_state_changes(
+        self, mod_service: ModService, temp_dirs: tuple[Path, Path]
+    ) -> None:
+        """list_mods() reuses ModInfo objects until the state changes."""
+        _, mods_dir = temp_dirs
+        create_mod_zip(
+            mods_dir / "memo_1.0.0.zip",
+            {"modid": "memo", "name": "Memo", "version": "1.0.0"},
+        )
+        mod_service.state_manager.sync_state_with_disk()
+
+        first = mod_service.list_mods()
+        second = mod_service.list_mods()
+        assert first[0] is second[0]
+
+        state = mod_service.state_manager.get_mod_by_slug("memo")
+        assert state is not None
+        mod_service.state_manager.set_mod_state(
+            state.filename, state.model_copy(update={"update_available": True})
+        )
+
+        third = mod_service.list_mods()
+        assert third[0] is not first[0]
+        assert third[0].update_available is True
+
+
 class TestModServiceGetMod:
     """Tests for get_mod() function."""
 
@@ -253,10 +282,11 @@ class TestModServiceGetMod:
 
         mod_service.state_manager.sync_state_with_disk()
 
-        # Delete the cached metadata
+        # Delete the cached metadata (on disk and in memory)
         cache_dir = state_dir / "mods" / "testmod"
         if cache_dir.exists():
             shutil.rmtree(cache_dir)
+        mod_service.state_manager.forget_metadata("testmod")
 
         result = mod_service.get_mod("testmod")
 
@@ -270,7 +300,8 @@ class TestModServiceGetMod:
 class TestModServiceEnableMod:
     """Tests for enable_mod() function."""
 
-    def test_enable_mod_removes_disabled_suffix(
+    @pytest.mark.asyncio
+    async def test_enable_mod_removes_disabled_suffix(
         self, mod_service: ModService, temp_dirs: tuple[Path, Path]
     ) -> None:
         """enable_mod() renames .zip.disabled to .zip."""
@@ -288,13 +319,14 @@ class TestModServiceEnableMod:
         mod_service.state_manager.sync_state_with_disk()
 
         # Enable the mod
-        mod_service.enable_mod("disabledmod")
+        await mod_service.enable_mod("disabledmod")
 
         # File should be renamed back to .zip
         assert (mods_dir / "disabledmod_1.0.0.zip").exists()
         assert not disabled_path.exists()
 
-    def test_enable_mod_updates_state(
+    @pytest.mark.asyncio
+    async def test_enable_mod_updates_state(
         self, mod_service: ModService, temp_dirs: tuple[Path, Path]
     ) -> None:
         """enable_mod() updates mod state to enabled=True."""
@@ -312,14 +344,15 @@ class TestModServiceEnableMod:
         assert disabled_state is not None
         assert disabled_state.enabled is False
 
-        mod_service.enable_mod("enableme")
+        await mod_service.enable_mod("enableme")
 
         # State should reflect new filename and enabled status
         new_state = mod_service.state_manager.get_mod("enableme_1.0.0.zip")
         assert new_state is not None
         assert new_state.enabled is True
 
-    def test_enable_mod_sets_pending_restart(
+    @pytest.mark.asyncio
+    async def test_enable_mod_sets_pending_restart(
         self,
         mod_service: ModService,
         temp_dirs: tuple[Path, Path],
@@ -340,13 +373,14 @@ class TestModServiceEnableMod:
         # Simulate server running
         mod_service.set_server_running(True)
 
-        mod_service.enable_mod("restartmod")
+        await mod_service.enable_mod("restartmod")
 
         assert restart_state.pending_restart is True
         assert len(restart_state.pending_changes) == 1
         assert "restartmod" in restart_state.pending_changes[0]
 
-    def test_enable_already_enabled_mod_no_op(
+    @pytest.mark.asyncio
+    async def test_enable_already_enabled_mod_no_op(
         self, mod_service: ModService, temp_dirs: tuple[Path, Path]
     ) -> None:
         """enable_mod() on already enabled mod returns success with no state change."""
@@ -360,7 +394,7 @@ class TestModServiceEnableMod:
         mod_service.state_manager.sync_state_with_disk()
 
         # Should return success (idempotent)
-        result = mod_service.enable_mod("alreadyenabled")
+        result = await mod_service.enable_mod("alreadyenabled")
 
         assert result.slug == "alreadyenabled"
         assert result.enabled is True
@@ -370,7 +404,8 @@ class TestModServiceEnableMod:
         assert state is not None
         assert state.enabled is True
 
-    def test_enable_mod_returns_result(
+    @pytest.mark.asyncio
+    async def test_enable_mod_returns_result(
         self, mod_service: ModService, temp_dirs: tuple[Path, Path]
     ) -> None:
         """enable_mod() returns EnableResult with correct values."""
@@ -385,24 +420,26 @@ class TestModServiceEnableMod:
 
         mod_service.state_manager.sync_state_with_disk()
 
-        result = mod_service.enable_mod("resultmod")
+        result = await mod_service.enable_mod("resultmod")
 
         assert result.slug == "resultmod"
         assert result.enabled is True
         assert result.pending_restart is False  # Server not running
 
-    def test_enable_unknown_mod_raises(self, mod_service: ModService) -> None:
+    @pytest.mark.asyncio
+    async def test_enable_unknown_mod_raises(self, mod_service: ModService) -> None:
         """enable_mod() raises for unknown mod slug."""
         from vintagestory_api.services.mods import ModNotFoundError
 
         with pytest.raises(ModNotFoundError):
-            mod_service.enable_mod("nonexistent")
+            await mod_service.enable_mod("nonexistent")
 
 
 class TestModServiceDisableMod:
     """Tests for disable_mod() function."""
 
-    def test_disable_mod_adds_disabled_suffix(
+    @pytest.mark.asyncio
+    async def test_disable_mod_adds_disabled_suffix(
         self, mod_service: ModService, temp_dirs: tuple[Path, Path]
     ) -> None:
         """disable_mod() renames .zip to .zip.disabled."""
@@ -415,13 +452,14 @@ class TestModServiceDisableMod:
 
         mod_service.state_manager.sync_state_with_disk()
 
-        mod_service.disable_mod("tobedisabled")
+        await mod_service.disable_mod("tobedisabled")
 
         # File should be renamed
         assert (mods_dir / "tobedisabled_1.0.0.zip.disabled").exists()
         assert not (mods_dir / "tobedisabled_1.0.0.zip").exists()
 
-    def test_disable_mod_updates_state(
+    @pytest.mark.asyncio
+    async def test_disable_mod_updates_state(
         self, mod_service: ModService, temp_dirs: tuple[Path, Path]
     ) -> None:
         """disable_mod() updates mod state to enabled=False."""
@@ -437,13 +475,14 @@ class TestModServiceDisableMod:
         assert enabled_state is not None
         assert enabled_state.enabled is True
 
-        mod_service.disable_mod("disableme")
+        await mod_service.disable_mod("disableme")
 
         new_state = mod_service.state_manager.get_mod("disableme_1.0.0.zip.disabled")
         assert new_state is not None
         assert new_state.enabled is False
 
-    def test_disable_mod_sets_pending_restart(
+    @pytest.mark.asyncio
+    async def test_disable_mod_sets_pending_restart(
         self,
         mod_service: ModService,
         temp_dirs: tuple[Path, Path],
@@ -460,12 +499,13 @@ class TestModServiceDisableMod:
         mod_service.state_manager.sync_state_with_disk()
         mod_service.set_server_running(True)
 
-        mod_service.disable_mod("disablerestartmod")
+        await mod_service.disable_mod("disablerestartmod")
 
         assert restart_state.pending_restart is True
         assert "disablerestartmod" in restart_state.pending_changes[0]
 
-    def test_disable_already_disabled_mod_no_op(
+    @pytest.mark.asyncio
+    async def test_disable_already_disabled_mod_no_op(
         self, mod_service: ModService, temp_dirs: tuple[Path, Path]
     ) -> None:
         """disable_mod() on already disabled mod returns success with no state change."""
@@ -481,7 +521,7 @@ class TestModServiceDisableMod:
         mod_service.state_manager.sync_state_with_disk()
 
         # Should return success (idempotent)
-        result = mod_service.disable_mod("alreadydisabled")
+        result = await mod_service.disable_mod("alreadydisabled")
 
         assert result.slug == "alreadydisabled"
         assert result.enabled is False
@@ -491,7 +531,8 @@ class TestModServiceDisableMod:
         assert state is not None
         assert state.enabled is False
 
-    def test_disable_mod_returns_result(
+    @pytest.mark.asyncio
+    async def test_disable_mod_returns_result(
         self, mod_service: ModService, temp_dirs: tuple[Path, Path]
     ) -> None:
         """disable_mod() returns DisableResult with correct values."""
@@ -504,24 +545,53 @@ class TestModServiceDisableMod:
 
         mod_service.state_manager.sync_state_with_disk()
 
-        result = mod_service.disable_mod("disableresultmod")
+        result = await mod_service.disable_mod("disableresultmod")
 
         assert result.slug == "disableresultmod"
         assert result.enabled is False
         assert result.pending_restart is False  # Server not running
 
-    def test_disable_unknown_mod_raises(self, mod_service: ModService) -> None:
+    @pytest.mark.asyncio
+    async def test_disable_unknown_mod_raises(self, mod_service: ModService) -> None:
         """disable_mod() raises for unknown mod slug."""
         from vintagestory_api.services.mods import ModNotFoundError
 
         with pytest.raises(ModNotFoundError):
-            mod_service.disable_mod("nonexistent")
+            await mod_service.disable_mod("nonexistent")
+
+    @pytest.mark.asyncio
+    async def test_concurrent_toggles_are_serialized(
+        self, mod_service: ModService, temp_dirs: tuple[Path, Path]
+    ) -> None:
+        """Concurrent enable/disable calls on one mod apply in order."""
+        import asyncio
+
+        _, mods_dir = temp_dirs
+        create_mod_zip(
+            mods_dir / "togglemod_1.0.0.zip",
+            {"modid": "togglemod", "name": "Toggle Mod", "version": "1.0.0"},
+        )
+        mod_service.state_manager.sync_state_with_disk()
+
+        await asyncio.gather(
+            mod_service.disable_mod("togglemod"),
+            mod_service.enable_mod("togglemod"),
+            mod_service.disable_mod("togglemod"),
+        )
+
+        state = mod_service.state_manager.get_mod_by_slug("togglemod")
+        assert state is not None
+        assert state.enabled is False
+        assert state.filename == "togglemod_1.0.0.zip.disabled"
+        assert (mods_dir / "togglemod_1.0.0.zip.disabled").exists()
+        assert not (mods_dir / "togglemod_1.0.0.zip").exists()
 
 
 class TestModServiceRemoveMod:
     """Tests for remove_mod() function."""
 
-    def test_remove_mod_deletes_enabled_mod(
+    @pytest.mark.asyncio
+    async def test_remove_mod_deletes_enabled_mod(
         self, mod_service: ModService, temp_dirs: tuple[Path, Path]
     ) -> None:
         """remove_mod() deletes an enabled mod file and removes from state."""
@@ -538,7 +608,7 @@ class TestModServiceRemoveMod:
         assert (mods_dir / "removemod_1.0.0.zip").exists()
         assert mod_service.get_mod("removemod") is not None
 
-        result = mod_service.remove_mod("removemod")
+        result = await mod_service.remove_mod("removemod")
 
         # File should be deleted
         assert not (mods_dir / "removemod_1.0.0.zip").exists()
@@ -550,7 +620,8 @@ class TestModServiceRemoveMod:
         assert result.slug == "removemod"
         assert result.pending_restart is False
 
-    def test_remove_mod_deletes_disabled_mod(
+    @pytest.mark.asyncio
+    async def test_remove_mod_deletes_disabled_mod(
         self, mod_service: ModService, temp_dirs: tuple[Path, Path]
     ) -> None:
         """remove_mod() deletes a disabled mod file and removes from state."""
@@ -569,7 +640,7 @@ class TestModServiceRemoveMod:
         # Verify disabled mod exists
         assert (mods_dir / "removedisabled_1.0.0.zip.disabled").exists()
 
-        result = mod_service.remove_mod("removedisabled")
+        result = await mod_service.remove_mod("removedisabled")
 
         # File should be deleted
         assert not (mods_dir / "removedisabled_1.0.0.zip.disabled").exists()
@@ -578,7 +649,8 @@ class TestModServiceRemoveMod:
         assert mod_service.get_mod("removedisabled") is None
         assert result.slug == "removedisabled"
 
-    def test_remove_mod_sets_pending_restart(
+    @pytest.mark.asyncio
+    async def test_remove_mod_sets_pending_restart(
         self,
         mod_service: ModService,
         temp_dirs: tuple[Path, Path],
@@ -595,18 +667,20 @@ class TestModServiceRemoveMod:
         mod_service.state_manager.sync_state_with_disk()
         mod_service.set_server_running(True)
 
-        result = mod_service.remove_mod("removerestartmod")
+        result = await mod_service.remove_mod("removerestartmod")
 
         assert result.pending_restart is True
         assert restart_state.pending_restart is True
         assert "removerestartmod" in restart_state.pending_changes[0]
 
-    def test_remove_mod_unknown_raises(self, mod_service: ModService) -> None:
+    @pytest.mark.asyncio
+    async def test_remove_mod_unknown_raises(self, mod_service: ModService) -> None:
         """remove_mod() raises for unknown mod slug."""
         with pytest.raises(ModNotFoundError):
-            mod_service.remove_mod("nonexistent")
+            await mod_service.remove_mod("nonexistent")
 
-    def test_remove_mod_cleans_up_cached_metadata(
+    @pytest.mark.asyncio
+    async def test_remove_mod_cleans_up_cached_metadata(
         self, mod_service: ModService, temp_dirs: tuple[Path, Path]
     ) -> None:
         """remove_mod() deletes cached metadata directory."""
@@ -623,12 +697,13 @@ class TestModServiceRemoveMod:
         cache_dir = state_dir / "mods" / "removecache"
         assert cache_dir.exists()
 
-        mod_service.remove_mod("removecache")
+        await mod_service.remove_mod("removecache")
 
         # Cache directory should be deleted
         assert not cache_dir.exists()
 
-    def test_remove_mod_handles_already_deleted_file(
+    @pytest.mark.asyncio
+    async def test_remove_mod_handles_already_deleted_file(
         self, mod_service: ModService, temp_dirs: tuple[Path, Path]
     ) -> None:
         """remove_mod() succeeds even if file was already deleted from disk."""
@@ -645,7 +720,7 @@ class TestModServiceRemoveMod:
         (mods_dir / "deletedfile_1.0.0.zip").unlink()
 
         # Should succeed - just removes from state
-        result = mod_service.remove_mod("deletedfile")
+        result = await mod_service.remove_mod("deletedfile")
 
         assert result.slug == "deletedfile"
         assert mod_service.get_mod("deletedfile") is None
@@ -654,6 +729,39 @@ class TestModServiceRemoveMod:
 # --- Task 7: FastAPI integration tests ---
 
 
+class TestModServiceReconcile:
+    """Tests for reconcile_mods()."""
+
+    @pytest.mark.asyncio
+    async def test_reconcile_flags_restart_when_running(
+        self, mod_service: ModService, temp_dirs: tuple[Path, Path]
+    ) -> None:
+        """Mods found on disk while the server runs require a restart."""
+        _, mods_dir = temp_dirs
+        create_mod_zip(
+            mods_dir / "handcopied_1.0.0.zip",
+            {"modid": "handcopied", "name": "Hand Copied", "version": "1.0.0"},
+        )
+        mod_service.set_server_running(True)
+
+        result = await mod_service.reconcile_mods()
+
+        assert result.added == ["handcopied_1.0.0.zip"]
+        assert result.pending_restart is True
+        assert mod_service.restart_state.pending_restart is True
+        assert mod_service.get_mod("handcopied") is not None
+
+    @pytest.mark.asyncio
+    async def test_reconcile_without_changes(self, mod_service: ModService) -> None:
+        """Nothing changed: no restart, nothing reported."""
+        mod_service.set_server_running(True)
+
+        result = await mod_service.reconcile_mods()
+
+        assert (result.added, result.changed, result.removed) == ([], [], [])
+        assert result.pending_restart is False
+
+
 class TestGetModServiceDependency:
     """Tests for get_mod_service() dependency injection."""
 
@@ -979,8 +1087,6 @@ class TestModServiceInstallMod:
         self, install_service: ModService, temp_dirs: tuple[Path, Path]
     ) -> None:
         """install_mod() cleans up temp file if copy fails (e.g., disk full)."""
-        import shutil
-
         import respx
         from httpx import Response
 
@@ -1002,9 +1108,10 @@ class TestModServiceInstallMod:
                 return_value=Response(200, content=mod_zip_content)
             )
 
-            # Mock shutil.copy2 to simulate disk full
-            with patch.object(
-                shutil, "copy2", side_effect=OSError("No space left on device")
+            # Mock the link/copy from the cache to simulate disk full
+            with patch(
+                "vintagestory_api.services.mods.link_or_copy",
+                side_effect=OSError("No space left on device"),
             ):
                 with pytest.raises(OSError, match="No space left on device"):
                     await install_service.install_mod("smithingplus")
@@ -1121,6 +1228,61 @@ class TestModServiceInstallMod:
 
             assert exc_info.value.slug == "nonexistent"
 
+    @pytest.mark.asyncio
+    async def test_watcher_reconcile_waits_for_install(
+        self, install_service: ModService
+    ) -> None:
+        """A watcher reconcile during an install leaves the installed entry alone."""
+        import asyncio
+        import threading
+
+        import respx
+        from httpx import Response
+
+        mod_zip_content = create_mod_zip_bytes(
+            {"modid": "smithingplus", "name": "Smithing Plus", "version": "1.8.3"}
+        )
+        linked = threading.Event()
+        release = threading.Event()
+        import_mod = install_service.state_manager.import_mod
+
+        def slow_import(path: Path) -> Any:
+            linked.set()
+            release.wait(timeout=5)
+            return import_mod(path)
+
+        install_service.set_server_running(True)
+        with (
+            respx.mock,
+            patch.object(install_service.state_manager, "import_mod", slow_import),
+        ):
+            respx.get("https://mods.vintagestory.at/api/mod/smithingplus").mock(
+                return_value=Response(200, json={"statuscode": "200", "mod": SMITHINGPLUS_MOD})
+            )
+            respx.get("https://mods.vintagestory.at/download?fileid=59176").mock(
+                return_value=Response(200, content=mod_zip_content)
+            )
+
+            install = asyncio.create_task(install_service.install_mod("smithingplus"))
+            # The zip is in the mods directory but not yet recorded in the state
+            await asyncio.to_thread(linked.wait, 5)
+            reconcile = asyncio.create_task(
+                install_service.reconcile_mods(["smithingplus_1.8.3.zip"], source="watcher")
+            )
+            await asyncio.sleep(0.05)
+            assert not reconcile.done()
+
+            release.set()
+            await install
+            result = await reconcile
+
+        assert (result.added, result.changed, result.removed) == ([], [], [])
+        assert result.pending_restart is False
+        mod_state = install_service.state_manager.get_mod_by_slug("smithingplus")
+        assert mod_state is not None
+        assert mod_state.sha256 is not None
+
+
 def create_mod_zip_bytes(modinfo: dict[str, object]) -> bytes:
     """Create a mod zip file as bytes for mocking downloads."""
     import io
@@ -1131,6 +1293,440 @@ def create_mod_zip_bytes(modinfo: dict[str, object]) -> bytes:
     return buffer.getvalue()
 
 
+# --- Tests for update tracking and update-all ---
+
+
+class TestModServiceUpdates:
+    """Tests for record_remote_mods() and update_all_mods()."""
+
+    @pytest.fixture
+    def update_service(
+        self,
+        temp_dirs: tuple[Path, Path],
+        restart_state: PendingRestartState,
+    ) -> ModService:
+        """Create a ModService with smithingplus 1.8.2 installed."""
+        state_dir, mods_dir = temp_dirs
+        create_mod_zip(
+            mods_dir / "smithingplus_1.8.2.zip",
+            {"modid": "smithingplus", "name": "Smithing Plus", "version": "1.8.2"},
+        )
+        service = ModService(
+            state_dir=state_dir,
+            mods_dir=mods_dir,
+            cache_dir=state_dir.parent / "cache",
+            restart_state=restart_state,
+            game_version="1.21.3",
+        )
+        service.state_manager.sync_state_with_disk()
+        return service
+
+    @pytest.mark.asyncio
+    async def test_record_remote_mods_flags_update(self, update_service: ModService) -> None:
+        """A newer compatible release is recorded and exposed on ModInfo."""
+        await update_service.record_remote_mods(
+            {"smithingplus": {**SMITHINGPLUS_MOD, "lastreleased": "2025-10-09 21:28:57"}}
+        )
+
+        mod = update_service.get_mod("smithingplus")
+        assert mod is not None
+        assert mod.latest_version == "1.8.3"
+        assert mod.update_available is True
+        assert mod.last_released == "2025-10-09 21:28:57"
+
+        # Persisted to the state file
+        update_service.state_manager.load()
+        state = update_service.state_manager.get_mod_by_slug("smithingplus")
+        assert state is not None
+        assert state.update_available is True
+
+    @pytest.mark.asyncio
+    async def test_record_remote_mods_ignores_incompatible(
+        self, update_service: ModService
+    ) -> None:
+        """Releases incompatible with the game version are not offered."""
+        mod = {
+            **SMITHINGPLUS_MOD,
+            "releases": [
+                {**SMITHINGPLUS_MOD["releases"][0], "tags": ["1.22.0"]},  # type: ignore[index]
+                SMITHINGPLUS_MOD["releases"][1],  # type: ignore[index]
+            ],
+        }
+        await update_service.record_remote_mods({"smithingplus": mod})
+
+        info = update_service.get_mod("smithingplus")
+        assert info is not None
+        assert info.latest_version == "1.8.2"
+        assert info.update_available is False
+
+    @pytest.mark.asyncio
+    async def test_update_all_mods(
+        self,
+        update_service: ModService,
+        temp_dirs: tuple[Path, Path],
+        restart_state: PendingRestartState,
+    ) -> None:
+        """update_all_mods() swaps in the update with one restart flag."""
+        import respx
+        from httpx import Response
+
+        _, mods_dir = temp_dirs
+        await update_service.record_remote_mods({"smithingplus": SMITHINGPLUS_MOD})
+        update_service.set_server_running(True)
+
+        with respx.mock:
+            respx.get("https://mods.vintagestory.at/api/mod/smithingplus").mock(
+                return_value=Response(200, json={"statuscode": "200", "mod": SMITHINGPLUS_MOD})
+            )
+            respx.get("https://mods.vintagestory.at/download?fileid=59176").mock(
+                return_value=Response(
+                    200,
+                    content=create_mod_zip_bytes(
+                        {"modid": "smithingplus", "name": "Smithing Plus", "version": "1.8.3"}
+                    ),
+                )
+            )
+            with patch.object(
+                update_service.state_manager, "save", wraps=update_service.state_manager.save
+            ) as save:
+                result = await update_service.update_all_mods()
+
+        assert [(u.slug, u.from_version, u.to_version) for u in result.updated] == [
+            ("smithingplus", "1.8.2", "1.8.3")
+        ]
+        assert result.failed == []
+        assert result.pending_restart is True
+        assert restart_state.pending_restart is True
+        save.assert_called_once()
+
+        assert (mods_dir / "smithingplus_1.8.3.zip").exists()
+        assert not (mods_dir / "smithingplus_1.8.2.zip").exists()
+        assert not list(mods_dir.glob("*.tmp"))
+        state = update_service.state_manager.get_mod_by_slug("smithingplus")
+        assert state is not None
+        assert state.version == "1.8.3"
+        assert state.update_available is False
+
+    @pytest.mark.asyncio
+    async def test_update_all_mods_then_reconcile_is_unchanged(
+        self,
+        update_service: ModService,
+        restart_state: PendingRestartState,
+    ) -> None:
+        """The swapped-in file is adopted by reconcile, not reported as changed."""
+        import respx
+        from httpx import Response
+
+        # Record the installed file's fingerprint first
+        await update_service.reconcile_mods()
+        await update_service.record_remote_mods({"smithingplus": SMITHINGPLUS_MOD})
+        update_service.set_server_running(True)
+
+        with respx.mock:
+            respx.get("https://mods.vintagestory.at/api/mod/smithingplus").mock(
+                return_value=Response(200, json={"statuscode": "200", "mod": SMITHINGPLUS_MOD})
+            )
+            respx.get("https://mods.vintagestory.at/download?fileid=59176").mock(
+                return_value=Response(
+                    200,
+                    content=create_mod_zip_bytes(
+                        {"modid": "smithingplus", "name": "Smithing Plus", "version": "1.8.3"}
+                    ),
+                )
+            )
+            await update_service.update_all_mods()
+        restart_state.clear_restart()
+
+        result = await update_service.reconcile_mods()
+
+        assert (result.added, result.changed, result.removed) == ([], [], [])
+        assert result.pending_restart is False
+        state = update_service.state_manager.get_mod_by_slug("smithingplus")
+        assert state is not None
+        assert state.sha256 is not None
+        assert state.fingerprint is not None
+
+    async def _update_with(
+        self, service: ModService, during_download: Callable[[], Awaitable[object]]
+    ) -> UpdateAllResult:
+        """Run update_all_mods(), calling during_download before the swap."""
+        import respx
+        from httpx import Response
+
+        original = service._download_and_stage  # pyright: ignore[reportPrivateUsage]
+
+        async def download_then_interfere(*args: Any) -> Any:
+            staged = await original(*args)
+            await during_download()
+            return staged
+
+        with (
+            respx.mock,
+            patch.object(service, "_download_and_stage", download_then_interfere),
+        ):
+            respx.get("https://mods.vintagestory.at/api/mod/smithingplus").mock(
+                return_value=Response(200, json={"statuscode": "200", "mod": SMITHINGPLUS_MOD})
+            )
+            respx.get("https://mods.vintagestory.at/download?fileid=59176").mock(
+                return_value=Response(
+                    200,
+                    content=create_mod_zip_bytes(
+                        {"modid": "smithingplus", "name": "Smithing Plus", "version": "1.8.3"}
+                    ),
+                )
+            )
+            return await service.update_all_mods()
+
+    @pytest.mark.asyncio
+    async def test_update_all_mods_keeps_mod_disabled_meanwhile(
+        self, update_service: ModService, temp_dirs: tuple[Path, Path]
+    ) -> None:
+        """A mod disabled while its update downloads is updated as disabled."""
+        _, mods_dir = temp_dirs
+        await update_service.record_remote_mods({"smithingplus": SMITHINGPLUS_MOD})
+
+        result = await self._update_with(
+            update_service, lambda: update_service.disable_mod("smithingplus")
+        )
+
+        assert [u.filename for u in result.updated] == ["smithingplus_1.8.3.zip.disabled"]
+        assert sorted(p.name for p in mods_dir.iterdir()) == [
+            "smithingplus_1.8.3.zip.disabled"
+        ]
+        [state] = update_service.state_manager.list_mods()
+        assert state.version == "1.8.3"
+        assert state.enabled is False
+
+    @pytest.mark.asyncio
+    async def test_update_all_mods_skips_mod_removed_meanwhile(
+        self, update_service: ModService, temp_dirs: tuple[Path, Path]
+    ) -> None:
+        """A mod removed while its update downloads is not reinstalled."""
+        _, mods_dir = temp_dirs
+        await update_service.record_remote_mods({"smithingplus": SMITHINGPLUS_MOD})
+
+        result = await self._update_with(
+            update_service, lambda: update_service.remove_mod("smithingplus")
+        )
+
+        assert result.updated == []
+        assert [f.error for f in result.failed] == ["Removed during update"]
+        assert list(mods_dir.iterdir()) == []
+        assert update_service.state_manager.list_mods() == []
+
+    @pytest.mark.asyncio
+    async def test_update_all_mods_reports_failures(
+        self, update_service: ModService, temp_dirs: tuple[Path, Path]
+    ) -> None:
+        """A failed download keeps the installed version and is reported."""
+        import respx
+        from httpx import Response
+
+        _, mods_dir = temp_dirs
+        await update_service.record_remote_mods({"smithingplus": SMITHINGPLUS_MOD})
+
+        with respx.mock:
+            respx.get("https://mods.vintagestory.at/api/mod/smithingplus").mock(
+                return_value=Response(200, json={"statuscode": "200", "mod": SMITHINGPLUS_MOD})
+            )
+            respx.get("https://mods.vintagestory.at/download?fileid=59176").mock(
+                return_value=Response(500)
+            )
+            result = await update_service.update_all_mods()
+
+        assert result.updated == []
+        assert [f.slug for f in result.failed] == ["smithingplus"]
+        assert result.pending_restart is False
+        assert (mods_dir / "smithingplus_1.8.2.zip").exists()
+        state = update_service.state_manager.get_mod_by_slug("smithingplus")
+        assert state is not None
+        assert state.version == "1.8.2"
+
+    @pytest.mark.asyncio
+    async def test_update_all_mods_nothing_to_update(self, update_service: ModService) -> None:
+        """With no recorded updates, nothing is downloaded."""
+        result = await update_service.update_all_mods()
+
+        assert result.updated == []
+        assert result.failed == []
+
+
+class TestModServiceInstallMods:
+    """Tests for ModService.install_mods() (bulk / modpack install)."""
+
+    OTHER_MOD = {
+        "modid": 3000,
+        "name": "Other Mod",
+        "urlalias": "othermod",
+        "releases": [
+            {
+                "modversion": "2.0.0",
+                "filename": "othermod_2.0.0.zip",
+                "fileid": 70000,
+                "tags": ["1.21.3"],
+            }
+        ],
+    }
+
+    @pytest.fixture
+    def bulk_service(
+        self,
+        temp_dirs: tuple[Path, Path],
+        restart_state: PendingRestartState,
+    ) -> ModService:
+        """Create a ModService for bulk install tests."""
+        state_dir, mods_dir = temp_dirs
+        return ModService(
+            state_dir=state_dir,
+            mods_dir=mods_dir,
+            cache_dir=state_dir.parent / "cache",
+            restart_state=restart_state,
+            game_version="1.21.3",
+        )
+
+    def _mock_mod(self, slug: str, mod: dict[str, object], content: bytes) -> None:
+        import respx
+        from httpx import Response
+
+        release = mod["releases"][0]  # type: ignore[index]
+        respx.get(f"https://mods.vintagestory.at/api/mod/{slug}").mock(
+            return_value=Response(200, json={"statuscode": "200", "mod": mod})
+        )
+        respx.get(f"https://mods.vintagestory.at/download?fileid={release['fileid']}").mock(
+            return_value=Response(200, content=content)
+        )
+
+    @pytest.mark.asyncio
+    async def test_install_mods_commits_once(
+        self, bulk_service: ModService, temp_dirs: tuple[Path, Path]
+    ) -> None:
+        """All mods are installed with a single state save."""
+        import respx
+
+        from vintagestory_api.models.mods import ModpackEntry
+
+        _, mods_dir = temp_dirs
+        with respx.mock:
+            self._mock_mod(
+                "smithingplus",
+                SMITHINGPLUS_MOD,
+                create_mod_zip_bytes(
+                    {"modid": "smithingplus", "name": "Smithing Plus", "version": "1.8.3"}
+                ),
+            )
+            self._mock_mod(
+                "othermod",
+                self.OTHER_MOD,
+                create_mod_zip_bytes(
+                    {"modid": "othermod", "name": "Other Mod", "version": "2.0.0"}
+                ),
+            )
+            with patch.object(
+                bulk_service.state_manager, "save", wraps=bulk_service.state_manager.save
+            ) as save:
+                result = await bulk_service.install_mods(
+                    [ModpackEntry(slug="smithingplus"), ModpackEntry(slug="othermod")]
+                )
+
+        assert [(m.slug, m.version) for m in result.installed] == [
+            ("smithingplus", "1.8.3"),
+            ("othermod", "2.0.0"),
+        ]
+        assert result.failed == []
+        save.assert_called_once()
+        assert (mods_dir / "smithingplus_1.8.3.zip").exists()
+        assert (mods_dir / "othermod_2.0.0.zip").exists()
+        assert not list(mods_dir.glob("*.tmp"))
+        assert bulk_service.get_mod("othermod") is not None
+
+    @pytest.mark.asyncio
+    async def test_install_links_cached_file_and_records_hash(
+        self, bulk_service: ModService, temp_dirs: tuple[Path, Path]
+    ) -> None:
+        """Installed files are hardlinked from the cache and their SHA-256 recorded."""
+        import hashlib
+
+        import respx
+
+        from vintagestory_api.models.mods import ModpackEntry
+
+        _, mods_dir = temp_dirs
+        content = create_mod_zip_bytes(
+            {"modid": "othermod", "name": "Other Mod", "version": "2.0.0"}
+        )
+        with respx.mock:
+            self._mock_mod("othermod", self.OTHER_MOD, content)
+            await bulk_service.install_mods([ModpackEntry(slug="othermod")])
+
+        sha256 = hashlib.sha256(content).hexdigest()
+        installed = mods_dir / "othermod_2.0.0.zip"
+        cached = bulk_service.cache_eviction.cache_dir / "mods" / f"{sha256}.zip"
+        assert installed.stat().st_ino == cached.stat().st_ino
+        state = bulk_service.state_manager.get_mod_by_slug("othermod")
+        assert state is not None and state.sha256 == sha256
+
+        results = {r.slug: r.status for r in await bulk_service.verify_mods()}
+        assert results == {"othermod": "ok"}
+
+        # Replace the file (breaking the link) with different content
+        installed.unlink()
+        installed.write_bytes(b"tampered")
+        results = {r.slug: r.status for r in await bulk_service.verify_mods()}
+        assert results == {"othermod": "modified"}
+
+    @pytest.mark.asyncio
+    async def test_install_mods_reports_failures_per_item(
+        self,
+        bulk_service: ModService,
+        temp_dirs: tuple[Path, Path],
+    ) -> None:
+        """Bad entries fail individually while the rest install."""
+        import respx
+        from httpx import Response
+
+        from vintagestory_api.models.mods import ModpackEntry
+
+        _, mods_dir = temp_dirs
+        create_mod_zip(
+            mods_dir / "installed_1.0.0.zip",
+            {"modid": "installed", "name": "Installed", "version": "1.0.0"},
+        )
+        bulk_service.state_manager.sync_state_with_disk()
+
+        with respx.mock:
+            self._mock_mod(
+                "smithingplus",
+                SMITHINGPLUS_MOD,
+                create_mod_zip_bytes(
+                    {"modid": "smithingplus", "name": "Smithing Plus", "version": "1.8.3"}
+                ),
+            )
+            self._mock_mod("othermod", self.OTHER_MOD, b"not a zip")
+            respx.get("https://mods.vintagestory.at/api/mod/missing").mock(
+                return_value=Response(200, json={"statuscode": "404"})
+            )
+            result = await bulk_service.install_mods(
+                [
+                    ModpackEntry(slug="smithingplus"),
+                    ModpackEntry(slug="smithingplus"),
+                    ModpackEntry(slug="installed"),
+                    ModpackEntry(slug="missing"),
+                    ModpackEntry(slug="othermod"),
+                    ModpackEntry(slug="bad slug"),
+                ]
+            )
+
+        assert [m.slug for m in result.installed] == ["smithingplus"]
+        errors = {f.slug: f.error for f in result.failed}
+        assert errors["bad slug"].startswith("Invalid mod slug")
+        assert errors["installed"].startswith("Already installed")
+        assert "missing" in errors
+        assert "othermod" in errors
+        assert len(result.failed) == 5  # includes the duplicate entry
+        assert not (mods_dir / "othermod_2.0.0.zip").exists()
+        assert not list(mods_dir.glob("*.tmp"))
+
+
 # --- Tests for ModService.lookup_mod ---
 
 LOOKUP_MOD_COMPATIBLE = {
@@ -5,11 +5,12 @@ import zipfile
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
+from unittest.mock import patch
 
 import pytest
 
 from vintagestory_api.models.mods import ModState
-from vintagestory_api.services.mod_state import ModStateManager
+from vintagestory_api.services.mod_state import ModStateManager, is_safe_zip_path
 from vintagestory_api.services.pending_restart import PendingRestartState
 
 
@@ -517,6 +518,59 @@ class TestModStateManagerGetModBySlug:
         assert result is not None
         assert result.filename == "smithingplus_1.8.3.zip"
 
+    def test_get_mod_by_slug_follows_rename(self, state_manager: ModStateManager) -> None:
+        """The slug index follows a mod through remove + re-add under a new filename."""
+        now = datetime.now(UTC)
+        state = ModState(filename="a.zip", slug="a", version="1.0.0", installed_at=now)
+        state_manager.set_mod_state("a.zip", state)
+
+        state_manager.remove_mod("a.zip")
+        renamed = state.model_copy(update={"filename": "a.zip.disabled", "enabled": False})
+        state_manager.set_mod_state("a.zip.disabled", renamed)
+
+        result = state_manager.get_mod_by_slug("a")
+        assert result is not None
+        assert result.filename == "a.zip.disabled"
+
+    def test_get_mod_by_slug_falls_back_to_duplicate(
+        self, state_manager: ModStateManager
+    ) -> None:
+        """Removing one of two files with the same slug keeps the other findable."""
+        now = datetime.now(UTC)
+        for filename in ("a_1.zip", "a_2.zip"):
+            state_manager.set_mod_state(
+                filename, ModState(filename=filename, slug="a", version="1", installed_at=now)
+            )
+
+        state_manager.remove_mod("a_1.zip")
+
+        result = state_manager.get_mod_by_slug("a")
+        assert result is not None
+        assert result.filename == "a_2.zip"
+
+    def test_get_mod_by_slug_after_load(
+        self, state_manager: ModStateManager, temp_state_dir: Path
+    ) -> None:
+        """The slug index is rebuilt when state is loaded from disk."""
+        (temp_state_dir / "mods.json").write_text(
+            json.dumps(
+                {
+                    "b.zip": {
+                        "filename": "b.zip",
+                        "slug": "b",
+                        "version": "1.0.0",
+                        "installed_at": "2025-01-01T00:00:00Z",
+                    }
+                }
+            )
+        )
+
+        state_manager.load()
+
+        result = state_manager.get_mod_by_slug("b")
+        assert result is not None
+        assert result.filename == "b.zip"
+
 
 # --- Task 3: import_mod and metadata caching tests ---
 
@@ -780,6 +834,44 @@ class TestImportMod:
         assert cache_path.exists()
 
 
+class TestModinfoFingerprintCache:
+    """Tests for reusing extracted modinfo.json for unchanged zips."""
+
+    def test_reimport_of_unchanged_zip_skips_zip(
+        self, state_manager: ModStateManager, temp_mods_dir: Path
+    ) -> None:
+        """A zip with a known fingerprint is not opened again, even when renamed."""
+        zip_path = temp_mods_dir / "cached.zip"
+        create_mod_zip(zip_path, {"modid": "cached", "name": "Cached", "version": "1.0.0"})
+        state_manager.import_mod(zip_path)
+
+        # Renaming (e.g., disabling) keeps the fingerprint
+        disabled = zip_path.rename(temp_mods_dir / "cached.zip.disabled")
+        with patch(
+            "vintagestory_api.services.mod_state.extract_modinfo",
+            side_effect=AssertionError("zip opened"),
+        ):
+            metadata = state_manager.import_mod(disabled)
+            batch = state_manager.extract_metadata(["cached.zip.disabled"])
+
+        assert metadata.modid == "cached"
+        assert batch["cached.zip.disabled"].modid == "cached"
+
+    def test_modified_zip_is_read_again(
+        self, state_manager: ModStateManager, temp_mods_dir: Path
+    ) -> None:
+        """A zip replaced with different content is extracted again."""
+        zip_path = temp_mods_dir / "changing.zip"
+        create_mod_zip(zip_path, {"modid": "changing", "name": "Changing", "version": "1.0.0"})
+        state_manager.import_mod(zip_path)
+
+        replacement = temp_mods_dir / "changing.tmp"
+        create_mod_zip(replacement, {"modid": "changing", "name": "Changing", "version": "2.0.0"})
+        replacement.replace(zip_path)
+
+        assert state_manager.import_mod(zip_path).version == "2.0.0"
+
+
 class TestZipSlipProtection:
     """Tests for zip slip protection via import_mod() (Review Item #3).
 
@@ -893,6 +985,63 @@ class TestZipSlipProtection:
         assert metadata.modid == "dotmod"
         assert metadata.version == "1.2.3"
 
+    def test_root_modinfo_wins_over_nested_asset(
+        self, state_manager: ModStateManager, temp_mods_dir: Path
+    ) -> None:
+        """A modinfo.json nested in the mod's assets is not picked over the root one."""
+        zip_path = temp_mods_dir / "assets.zip"
+        with zipfile.ZipFile(zip_path, "w") as zf:
+            zf.writestr(
+                "assets/other/modinfo.json",
+                json.dumps({"modid": "other", "name": "Other", "version": "9.9.9"}),
+            )
+            zf.writestr(
+                "modinfo.json",
+                json.dumps({"modid": "assets", "name": "Assets", "version": "1.0.0"}),
+            )
+
+        metadata = state_manager.import_mod(zip_path)
+
+        assert metadata.modid == "assets"
+
+    def test_shallowest_nested_modinfo_wins(
+        self, state_manager: ModStateManager, temp_mods_dir: Path
+    ) -> None:
+        """Without a root modinfo.json, the wrapping folder's one is used."""
+        zip_path = temp_mods_dir / "wrapped.zip"
+        with zipfile.ZipFile(zip_path, "w") as zf:
+            zf.writestr(
+                "wrapped/assets/x/modinfo.json",
+                json.dumps({"modid": "other", "name": "Other", "version": "9.9.9"}),
+            )
+            zf.writestr(
+                "wrapped/modinfo.json",
+                json.dumps({"modid": "wrapped", "name": "Wrapped", "version": "1.0.0"}),
+            )
+            zf.writestr("wrapped/notmodinfo.json", "{}")
+
+        metadata = state_manager.import_mod(zip_path)
+
+        assert metadata.modid == "wrapped"
+
+    @pytest.mark.parametrize(
+        ("name", "safe"),
+        [
+            ("modinfo.json", True),
+            ("a/./b/../modinfo.json", True),
+            ("../modinfo.json", False),
+            ("a/../../modinfo.json", False),
+            ("/etc/modinfo.json", False),
+            ("\\windows\\modinfo.json", False),
+            ("..\\modinfo.json", False),
+            ("C:/modinfo.json", False),
+        ],
+    )
+    def test_is_safe_zip_path(self, name: str, safe: bool) -> None:
+        """Paths are validated as strings, without touching the filesystem."""
+        with patch("pathlib.Path.resolve", side_effect=AssertionError("filesystem")):
+            assert is_safe_zip_path(name) is safe
+
 
 class TestCacheModinfo:
     """Tests for _cache_modinfo() function."""
@@ -950,6 +1099,28 @@ class TestCacheModinfo:
         assert not cache_path.exists()
 
 
+    def test_concurrent_import_not_overwritten_by_lookup(
+        self, state_manager: ModStateManager
+    ) -> None:
+        """A lookup that missed the store keeps metadata imported meanwhile."""
+        modinfo = {"modid": "testmod", "name": "Test", "version": "1.0.0"}
+        store = state_manager._store  # pyright: ignore[reportPrivateUsage]
+        read_metadata = store.read_metadata
+
+        def read_while_importing(slug: str, version: str) -> dict[str, object] | None:
+            data = read_metadata(slug, version)
+            # A mod I/O worker finishes importing the mod during the read
+            state_manager._cache_modinfo("testmod", "1.0.0", modinfo)
+            return data
+
+        generation = state_manager.generation
+        with patch.object(store, "read_metadata", read_while_importing):
+            metadata = state_manager.get_cached_metadata("testmod", "1.0.0")
+
+        assert metadata is not None and metadata.name == "Test"
+        assert state_manager.get_cached_metadata("testmod", "1.0.0") == metadata
+        assert state_manager.generation == generation + 1
+
 class TestGetCachedMetadata:
     """Tests for get_cached_metadata() function."""
 
@@ -1025,6 +1196,37 @@ class TestGetCachedMetadata:
         result = state_manager.get_cached_metadata("badcache", "1.0.0")
         assert result is None
 
+    def test_get_cached_metadata_served_from_memory(
+        self, state_manager: ModStateManager, temp_mods_dir: Path
+    ) -> None:
+        """Imported metadata is cached in memory; later reads do not touch disk."""
+        zip_path = temp_mods_dir / "memmod.zip"
+        create_mod_zip(zip_path, {"modid": "memmod", "name": "Mem Mod", "version": "1.0.0"})
+        state_manager.import_mod(zip_path)
+
+        with patch("pathlib.Path.read_text", side_effect=AssertionError("disk read")):
+            metadata = state_manager.get_cached_metadata("memmod", "1.0.0")
+
+        assert metadata is not None
+        assert metadata.name == "Mem Mod"
+
+    def test_forget_metadata(
+        self, state_manager: ModStateManager, temp_mods_dir: Path, temp_state_dir: Path
+    ) -> None:
+        """forget_metadata() drops the in-memory entry so the disk is consulted again."""
+        import shutil
+
+        zip_path = temp_mods_dir / "gonemod.zip"
+        create_mod_zip(zip_path, {"modid": "gonemod", "name": "Gone", "version": "1.0.0"})
+        state_manager.import_mod(zip_path)
+        shutil.rmtree(temp_state_dir / "mods" / "gonemod")
+        generation = state_manager.generation
+
+        state_manager.forget_metadata("gonemod")
+
+        assert state_manager.generation > generation
+        assert state_manager.get_cached_metadata("gonemod", "1.0.0") is None
+
 
 # --- Task 4: mod directory scanner tests ---
 
@@ -1237,6 +1439,144 @@ class TestSyncStateWithDisk:
         assert new_manager.get_mod("persistmod_1.0.0.zip") is not None
 
 
+    def test_sync_skips_unchanged_files(
+        self, state_manager: ModStateManager, temp_mods_dir: Path
+    ) -> None:
+        """Files with an unchanged fingerprint are not opened again."""
+        create_mod_zip(
+            temp_mods_dir / "stable_1.0.0.zip",
+            {"modid": "stable", "name": "Stable", "version": "1.0.0"},
+        )
+        state_manager.sync_state_with_disk()
+
+        with patch(
+            "vintagestory_api.services.mod_state.extract_modinfo",
+            side_effect=AssertionError("zip opened"),
+        ):
+            result = state_manager.reconcile()
+
+        assert result.unchanged == 1
+        assert (result.added, result.changed, result.removed) == ([], [], [])
+
+    def test_sync_reimports_replaced_file(
+        self, state_manager: ModStateManager, temp_mods_dir: Path
+    ) -> None:
+        """A file replaced under the same name is re-imported, keeping install details."""
+        zip_path = temp_mods_dir / "replaced.zip"
+        create_mod_zip(zip_path, {"modid": "replaced", "name": "Replaced", "version": "1.0.0"})
+        state_manager.sync_state_with_disk()
+        original = state_manager.get_mod("replaced.zip")
+        assert original is not None
+
+        replacement = temp_mods_dir / "replacement.tmp"
+        create_mod_zip(
+            replacement, {"modid": "replaced", "name": "Replaced", "version": "2.0.0"}
+        )
+        replacement.replace(zip_path)
+
+        result = state_manager.reconcile()
+
+        assert result.changed == ["replaced.zip"]
+        mod = state_manager.get_mod("replaced.zip")
+        assert mod is not None
+        assert mod.version == "2.0.0"
+        assert mod.installed_at == original.installed_at
+
+    def test_sync_adopts_untracked_fingerprint(
+        self, state_manager: ModStateManager, temp_mods_dir: Path
+    ) -> None:
+        """Entries without a fingerprint (installed via the API) are not re-imported."""
+        create_mod_zip(
+            temp_mods_dir / "apimod.zip",
+            {"modid": "apimod", "name": "API Mod", "version": "1.0.0"},
+        )
+        state_manager.set_mod_state(
+            "apimod.zip",
+            ModState(
+                filename="apimod.zip",
+                slug="apimod",
+                version="1.0.0",
+                installed_at=datetime.now(UTC),
+                sha256="a" * 64,
+            ),
+        )
+
+        with patch(
+            "vintagestory_api.services.mod_state.extract_modinfo",
+            side_effect=AssertionError("zip opened"),
+        ):
+            result = state_manager.reconcile()
+
+        assert result.unchanged == 1
+        mod = state_manager.get_mod("apimod.zip")
+        assert mod is not None
+        assert mod.fingerprint is not None
+        assert mod.sha256 == "a" * 64
+
+    def test_reconcile_only_named_files(
+        self, state_manager: ModStateManager, temp_mods_dir: Path
+    ) -> None:
+        """reconcile(filenames) only looks at the given files."""
+        create_mod_zip(temp_mods_dir / "seen.zip", {"modid": "seen", "name": "S", "version": "1"})
+        create_mod_zip(
+            temp_mods_dir / "unseen.zip", {"modid": "unseen", "name": "U", "version": "1"}
+        )
+
+        result = state_manager.reconcile(["seen.zip", "gone.zip", "notes.txt"])
+
+        assert result.added == ["seen.zip"]
+        assert state_manager.get_mod("unseen.zip") is None
+
+    def test_apply_keeps_entry_recorded_after_scan(
+        self, state_manager: ModStateManager, temp_mods_dir: Path
+    ) -> None:
+        """A file installed via the API between scan and apply keeps its install details."""
+        create_mod_zip(
+            temp_mods_dir / "racing.zip",
+            {"modid": "racing", "name": "Racing", "version": "1.0.0"},
+        )
+        changes = state_manager.scan_changes()
+        assert "racing.zip" in changes.added
+        metadata = state_manager.extract_metadata(changes.to_extract)
+
+        installed = ModState(
+            filename="racing.zip",
+            slug="racing",
+            version="1.0.0",
+            installed_at=datetime(2020, 1, 1, tzinfo=UTC),
+            asset_id=42,
+            sha256="a" * 64,
+        )
+        state_manager.set_mod_state("racing.zip", installed)
+
+        result = state_manager.apply_changes(changes, metadata)
+
+        assert result.added == []
+        assert result.unchanged == 1
+        assert state_manager.get_mod("racing.zip") == installed
+
+    def test_sync_extracts_on_process_pool(
+        self,
+        state_manager: ModStateManager,
+        temp_mods_dir: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Enough new zips are extracted on a process pool with the same result."""
+        from vintagestory_api.services import mod_state
+
+        monkeypatch.setattr(mod_state, "PROCESS_POOL_MIN_FILES", 2)
+        for i in range(3):
+            create_mod_zip(
+                temp_mods_dir / f"pooled{i}.zip",
+                {"modid": f"pooled{i}", "name": f"Pooled {i}", "version": "1.0.0"},
+            )
+
+        result = state_manager.reconcile()
+
+        assert result.added == ["pooled0.zip", "pooled1.zip", "pooled2.zip"]
+        assert state_manager.get_mod_by_slug("pooled2") is not None
+
+
 # --- Task 5: pending restart tracking tests ---
 
 
@@ -0,0 +1,141 @@
+"""Tests for the mod state stores."""
+
+import json
+import sqlite3
+from datetime import UTC, datetime
+from pathlib import Path
+
+import pytest
+
+from vintagestory_api.models.mods import ModState
+from vintagestory_api.services.mod_state import ModStateManager
+from vintagestory_api.services.mod_store import JsonModStore, SqliteModStore
+
+
+def make_state(slug: str, version: str = "1.0.0", enabled: bool = True) -> ModState:
+    return ModState(
+        filename=f"{slug}.zip",
+        slug=slug,
+        version=version,
+        enabled=enabled,
+        installed_at=datetime(2026, 1, 1, tzinfo=UTC),
+    )
+
+
+@pytest.fixture
+def sqlite_manager(tmp_path: Path) -> ModStateManager:
+    manager = ModStateManager(
+        state_dir=tmp_path / "state", mods_dir=tmp_path / "mods", backend="sqlite"
+    )
+    manager.load()
+    return manager
+
+
+def reload(tmp_path: Path) -> ModStateManager:
+    manager = ModStateManager(
+        state_dir=tmp_path / "state", mods_dir=tmp_path / "mods", backend="sqlite"
+    )
+    manager.load()
+    return manager
+
+
+class TestSqliteModStore:
+    """Tests for the SQLite backend through ModStateManager."""
+
+    def test_round_trip(self, sqlite_manager: ModStateManager, tmp_path: Path) -> None:
+        sqlite_manager.set_mod_state("a.zip", make_state("a"))
+        sqlite_manager.set_mod_state("b.zip", make_state("b", enabled=False))
+        sqlite_manager.save()
+        sqlite_manager.close()
+
+        reloaded = reload(tmp_path)
+
+        assert reloaded.get_mod_by_slug("b") == make_state("b", enabled=False)
+        assert len(reloaded.list_mods()) == 2
+        assert not (tmp_path / "state" / "mods.json").exists()
+
+    def test_save_writes_only_changed_rows(
+        self, sqlite_manager: ModStateManager, tmp_path: Path
+    ) -> None:
+        sqlite_manager.set_mod_state("a.zip", make_state("a"))
+        sqlite_manager.set_mod_state("b.zip", make_state("b"))
+        sqlite_manager.save()
+
+        snapshot_before = sqlite_manager.snapshot()
+        sqlite_manager.remove_mod("a.zip")
+        snapshot = sqlite_manager.snapshot()
+        sqlite_manager.save(snapshot)
+
+        assert snapshot_before.dirty == frozenset()
+        assert snapshot.dirty == frozenset({"a.zip"})
+        assert [s.slug for s in reload(tmp_path).list_mods()] == ["b"]
+
+    def test_failed_save_is_retried(
+        self, sqlite_manager: ModStateManager, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+    ) -> None:
+        sqlite_manager.set_mod_state("a.zip", make_state("a"))
+        store = sqlite_manager._store  # type: ignore[attr-defined]
+        original = store.write_states
+
+        def fail(*args: object) -> None:
+            raise sqlite3.OperationalError("disk I/O error")
+
+        monkeypatch.setattr(store, "write_states", fail)
+        with pytest.raises(sqlite3.OperationalError):
+            sqlite_manager.save()
+        monkeypatch.setattr(store, "write_states", original)
+        sqlite_manager.save()
+
+        assert reload(tmp_path).get_mod("a.zip") is not None
+
+    def test_metadata_cached_in_database(
+        self, sqlite_manager: ModStateManager, tmp_path: Path
+    ) -> None:
+        sqlite_manager._cache_modinfo("a", "1.0.0", {"modid": "a", "name": "A", "version": "1.0.0"})
+
+        assert not (tmp_path / "state" / "mods").exists()
+        metadata = reload(tmp_path).get_cached_metadata("a", "1.0.0")
+        assert metadata is not None and metadata.name == "A"
+
+        sqlite_manager.delete_cached_metadata("a")
+        assert reload(tmp_path).get_cached_metadata("a", "1.0.0") is None
+
+    def test_uses_wal_journal(self, sqlite_manager: ModStateManager, tmp_path: Path) -> None:
+        sqlite_manager.set_mod_state("a.zip", make_state("a"))
+        sqlite_manager.save()
+
+        conn = sqlite3.connect(tmp_path / "state" / "mods.db")
+        try:
+            assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        finally:
+            conn.close()
+
+
+class TestJsonMigration:
+    """Tests for migrating the JSON layout into SQLite."""
+
+    def test_migrates_state_and_metadata(self, tmp_path: Path) -> None:
+        state_dir = tmp_path / "state"
+        json_store = JsonModStore(state_dir)
+        json_store.write_states({"a.zip": make_state("a")}, frozenset({"a.zip"}))
+        json_store.write_metadata("a", "1.0.0", {"modid": "a", "name": "A", "version": "1.0.0"})
+
+        manager = reload(tmp_path)
+
+        assert manager.get_mod_by_slug("a") == make_state("a")
+        metadata = manager.get_cached_metadata("a", "1.0.0")
+        assert metadata is not None and metadata.name == "A"
+        assert not (state_dir / "mods.json").exists()
+        assert json.loads((state_dir / "mods.json.migrated").read_text())["a.zip"]
+        assert (state_dir / "mods.migrated" / "a" / "1.0.0" / "modinfo.json").exists()
+
+    def test_migrates_only_once(self, tmp_path: Path) -> None:
+        state_dir = tmp_path / "state"
+        store = SqliteModStore(state_dir)
+        assert store.load_states() == {}
+        store.close()
+
+        # A mods.json appearing later (e.g., restored backup) is not imported
+        JsonModStore(state_dir).write_states({"a.zip": make_state("a")}, frozenset())
+
+        assert reload(tmp_path).list_mods() == []
@@ -0,0 +1,123 @@
+"""Tests for the Mods directory watcher and change feed."""
+
+import asyncio
+import io
+import json
+import zipfile
+from pathlib import Path
+
+import pytest
+
+from vintagestory_api.models.mods import ModReconcileResult
+from vintagestory_api.services.mod_watcher import ModChangeFeed, ModDirectoryWatcher
+from vintagestory_api.services.mods import ModService
+from vintagestory_api.services.pending_restart import PendingRestartState
+
+
+def mod_zip_bytes(modid: str) -> bytes:
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as zf:
+        zf.writestr(
+            "modinfo.json", json.dumps({"modid": modid, "name": modid.title(), "version": "1.0.0"})
+        )
+    return buffer.getvalue()
+
+
+@pytest.fixture
+def mod_service(tmp_path: Path) -> ModService:
+    """Create a ModService with test directories."""
+    (tmp_path / "state").mkdir()
+    (tmp_path / "mods").mkdir()
+    return ModService(
+        state_dir=tmp_path / "state",
+        mods_dir=tmp_path / "mods",
+        cache_dir=tmp_path / "cache",
+        restart_state=PendingRestartState(),
+    )
+
+
+async def wait_for_event(feed: ModChangeFeed, cursor: int = 0) -> list[str]:
+    """Wait for the next change event and return the filenames it added."""
+    events = await feed.wait(cursor, timeout=5)
+    assert events, "no change event published"
+    return events[-1].added
+
+
+class TestModChangeFeed:
+    """Tests for ModChangeFeed."""
+
+    @pytest.mark.asyncio
+    async def test_events_since_cursor(self) -> None:
+        feed = ModChangeFeed()
+        feed.publish("api", ModReconcileResult(added=["a.zip"]))
+        feed.publish("watcher", ModReconcileResult(removed=["a.zip"]))
+
+        events = await feed.wait(1, timeout=0)
+
+        assert [e.sequence for e in events] == [2]
+        assert events[0].removed == ["a.zip"]
+        assert feed.cursor == 2
+
+    @pytest.mark.asyncio
+    async def test_wait_wakes_on_publish(self) -> None:
+        feed = ModChangeFeed()
+
+        async def publish_later() -> None:
+            await asyncio.sleep(0.01)
+            feed.publish("watcher", ModReconcileResult(added=["b.zip"]))
+
+        publisher = asyncio.create_task(publish_later())
+        events = await feed.wait(0, timeout=5)
+        await publisher
+
+        assert [e.added for e in events] == [["b.zip"]]
+
+    @pytest.mark.asyncio
+    async def test_wait_times_out_empty(self) -> None:
+        feed = ModChangeFeed()
+        assert await feed.wait(0, timeout=0.01) == []
+
+
+class TestModDirectoryWatcher:
+    """Tests for ModDirectoryWatcher."""
+
+    @pytest.mark.asyncio
+    async def test_polling_picks_up_new_mod(self, mod_service: ModService) -> None:
+        watcher = ModDirectoryWatcher(mod_service, mode="polling", poll_interval=0.05)
+        watcher.start()
+        try:
+            (watcher.mods_dir / "dropped.zip").write_bytes(mod_zip_bytes("dropped"))
+            added = await wait_for_event(mod_service.change_feed)
+        finally:
+            await watcher.stop()
+
+        assert added == ["dropped.zip"]
+        assert mod_service.get_mod("dropped") is not None
+
+    @pytest.mark.asyncio
+    async def test_inotify_debounces_burst(self, mod_service: ModService) -> None:
+        """A burst of files is reconciled together and flags a restart while running."""
+        pytest.importorskip("watchfiles")
+        mod_service.set_server_running(True)
+        watcher = ModDirectoryWatcher(mod_service, mode="auto", quiet_ms=200)
+        watcher.start()
+        try:
+            await asyncio.sleep(0.2)  # Let the watch get established
+            for i in range(5):
+                (watcher.mods_dir / f"burst{i}.zip").write_bytes(mod_zip_bytes(f"burst{i}"))
+            added = await wait_for_event(mod_service.change_feed)
+            backend = watcher.backend
+        finally:
+            await watcher.stop()
+
+        assert added == [f"burst{i}.zip" for i in range(5)]
+        assert backend == "inotify"
+        assert mod_service.restart_state.pending_restart is True
+
+    @pytest.mark.asyncio
+    async def test_off_does_not_start(self, mod_service: ModService) -> None:
+        watcher = ModDirectoryWatcher(mod_service, mode="off")
+        watcher.start()
+
+        assert watcher.running is False
+        await watcher.stop()
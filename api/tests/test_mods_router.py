@@ -2954,6 +2954,250 @@ class TestInstallModVersionNotFound:
         assert data["detail"]["code"] == "DOWNLOAD_FAILED"
 
 
+class TestUpdateAllModsEndpoint:
+    """Tests for POST /mods/update-all, POST /mods/bulk[/manifest] and update fields."""
+
+    @pytest.fixture
+    def temp_data_dir(self, tmp_path: Path) -> Path:
+        """Create temporary data directory structure."""
+        data_dir = tmp_path / "data"
+        (data_dir / "state").mkdir(parents=True)
+        (data_dir / "mods").mkdir(parents=True)
+        (data_dir / "cache").mkdir(parents=True)
+        return data_dir
+
+    @pytest.fixture
+    def test_settings(self, temp_data_dir: Path) -> Settings:
+        """Create test settings with known API keys."""
+        return Settings(
+            api_key_admin=TEST_ADMIN_KEY,
+            api_key_monitor=TEST_MONITOR_KEY,
+            data_dir=temp_data_dir,
+            debug=True,
+        )
+
+    @pytest.fixture
+    async def mod_service(self, temp_data_dir: Path) -> ModService:
+        """Create a ModService with smithingplus 1.8.2 installed and 1.8.3 available."""
+        mods_dir = temp_data_dir / "mods"
+        (mods_dir / "smithingplus_1.8.2.zip").write_bytes(
+            create_mod_zip_bytes(
+                {"modid": "smithingplus", "name": "Smithing Plus", "version": "1.8.2"}
+            )
+        )
+        service = ModService(
+            state_dir=temp_data_dir / "state",
+            mods_dir=mods_dir,
+            cache_dir=temp_data_dir / "cache",
+            restart_state=PendingRestartState(),
+            game_version="1.21.3",
+        )
+        service.state_manager.sync_state_with_disk()
+        await service.record_remote_mods({"smithingplus": SMITHINGPLUS_MOD})
+        return service
+
+    @pytest.fixture
+    def test_app(
+        self, mod_service: ModService, test_settings: Settings
+    ) -> Generator[FastAPI, None, None]:
+        """Create app with test mod service and settings injected."""
+        app.dependency_overrides[get_mod_service] = lambda: mod_service
+        app.dependency_overrides[get_settings] = lambda: test_settings
+        yield app
+        app.dependency_overrides.clear()
+
+    @pytest.fixture
+    def client(self, test_app: FastAPI) -> TestClient:
+        """Create test client with dependency overrides applied."""
+        return TestClient(test_app)
+
+    def test_list_mods_shows_update(self, client: TestClient) -> None:
+        """GET /mods exposes the latest compatible version and update flag."""
+        response = client.get("/api/v1alpha1/mods", headers={"X-API-Key": TEST_MONITOR_KEY})
+
+        assert response.status_code == 200
+        mod = response.json()["data"]["mods"][0]
+        assert mod["latest_version"] == "1.8.3"
+        assert mod["update_available"] is True
+
+    @respx.mock
+    def test_update_all_success(self, client: TestClient, temp_data_dir: Path) -> None:
+        """POST /mods/update-all installs available updates."""
+        respx.get("https://mods.vintagestory.at/api/mod/smithingplus").mock(
+            return_value=Response(200, json={"statuscode": "200", "mod": SMITHINGPLUS_MOD})
+        )
+        respx.get("https://mods.vintagestory.at/download?fileid=59176").mock(
+            return_value=Response(
+                200,
+                content=create_mod_zip_bytes(
+                    {"modid": "smithingplus", "name": "Smithing Plus", "version": "1.8.3"}
+                ),
+            )
+        )
+
+        response = client.post(
+            "/api/v1alpha1/mods/update-all", headers={"X-API-Key": TEST_ADMIN_KEY}
+        )
+
+        assert response.status_code == 200
+        data = response.json()["data"]
+        assert data["updated"] == [
+            {
+                "slug": "smithingplus",
+                "from_version": "1.8.2",
+                "to_version": "1.8.3",
+                "filename": "smithingplus_1.8.3.zip",
+            }
+        ]
+        assert data["failed"] == []
+        assert data["pending_restart"] is False
+        assert (temp_data_dir / "mods" / "smithingplus_1.8.3.zip").exists()
+
+    @respx.mock
+    def test_bulk_install(self, client: TestClient, temp_data_dir: Path) -> None:
+        """POST /mods/bulk installs listed mods and reports failures per item."""
+        other_mod = {
+            **SMITHINGPLUS_MOD,
+            "urlalias": "othermod",
+            "releases": [
+                {"modversion": "2.0.0", "filename": "othermod_2.0.0.zip", "fileid": 70000}
+            ],
+        }
+        respx.get("https://mods.vintagestory.at/api/mod/othermod").mock(
+            return_value=Response(200, json={"statuscode": "200", "mod": other_mod})
+        )
+        respx.get("https://mods.vintagestory.at/download?fileid=70000").mock(
+            return_value=Response(
+                200, content=create_mod_zip_bytes(
+                    {"modid": "othermod", "name": "Other Mod", "version": "2.0.0"}
+                )
+            )
+        )
+
+        response = client.post(
+            "/api/v1alpha1/mods/bulk",
+            json={"mods": [{"slug": "othermod"}, {"slug": "smithingplus"}]},
+            headers={"X-API-Key": TEST_ADMIN_KEY},
+        )
+
+        assert response.status_code == 200
+        data = response.json()["data"]
+        assert [m["slug"] for m in data["installed"]] == ["othermod"]
+        assert [f["slug"] for f in data["failed"]] == ["smithingplus"]
+        assert (temp_data_dir / "mods" / "othermod_2.0.0.zip").exists()
+
+    def test_bulk_install_manifest_upload(self, client: TestClient) -> None:
+        """POST /mods/bulk/manifest accepts a JSON modpack manifest file."""
+        manifest = {"name": "pack", "mods": [{"slug": "smithingplus"}]}
+
+        response = client.post(
+            "/api/v1alpha1/mods/bulk/manifest",
+            files={"file": ("pack.json", json.dumps(manifest), "application/json")},
+            headers={"X-API-Key": TEST_ADMIN_KEY},
+        )
+
+        assert response.status_code == 200
+        assert response.json()["data"]["failed"][0]["error"].startswith("Already installed")
+
+    def test_bulk_install_invalid_manifest(self, client: TestClient) -> None:
+        """An invalid manifest upload returns 400 INVALID_MODPACK_MANIFEST."""
+        response = client.post(
+            "/api/v1alpha1/mods/bulk/manifest",
+            files={"file": ("pack.json", b'{"mods": []}', "application/json")},
+            headers={"X-API-Key": TEST_ADMIN_KEY},
+        )
+
+        assert response.status_code == 400
+        assert response.json()["detail"]["code"] == "INVALID_MODPACK_MANIFEST"
+
+    def test_resolve_dependencies(self, client: TestClient) -> None:
+        """POST /mods/dependencies returns a plan without installing anything."""
+        response = client.post(
+            "/api/v1alpha1/mods/dependencies",
+            json={"mods": [{"slug": "smithingplus"}]},
+            headers={"X-API-Key": TEST_ADMIN_KEY},
+        )
+
+        assert response.status_code == 200
+        data = response.json()["data"]
+        # Already installed, with no declared dependencies
+        assert data == {"install": [], "satisfied": [], "missing": [], "conflicts": []}
+
+    def test_resolve_dependencies_requires_admin(self, client: TestClient) -> None:
+        """Monitor users cannot resolve dependencies."""
+        response = client.post(
+            "/api/v1alpha1/mods/dependencies",
+            json={"mods": [{"slug": "smithingplus"}]},
+            headers={"X-API-Key": TEST_MONITOR_KEY},
+        )
+
+        assert response.status_code == 403
+
+    def test_verify_mods(self, client: TestClient) -> None:
+        """POST /mods/verify reports unknown for mods without a recorded hash."""
+        response = client.post(
+            "/api/v1alpha1/mods/verify", headers={"X-API-Key": TEST_ADMIN_KEY}
+        )
+
+        assert response.status_code == 200
+        assert [r["status"] for r in response.json()["data"]["mods"]] == ["unknown"]
+
+    def test_reconcile_mods(self, client: TestClient, temp_data_dir: Path) -> None:
+        """POST /mods/reconcile picks up mods copied into the mods directory."""
+        (temp_data_dir / "mods" / "newmod_1.0.0.zip").write_bytes(
+            create_mod_zip_bytes({"modid": "newmod", "name": "New Mod", "version": "1.0.0"})
+        )
+
+        response = client.post(
+            "/api/v1alpha1/mods/reconcile", headers={"X-API-Key": TEST_ADMIN_KEY}
+        )
+
+        assert response.status_code == 200
+        data = response.json()["data"]
+        assert data["added"] == ["newmod_1.0.0.zip"]
+        assert data["removed"] == []
+        assert data["unchanged"] == 1
+
+    def test_mod_events_after_reconcile(self, client: TestClient, temp_data_dir: Path) -> None:
+        """GET /mods/events returns changes found on disk after the cursor."""
+        (temp_data_dir / "mods" / "newmod_1.0.0.zip").write_bytes(
+            create_mod_zip_bytes({"modid": "newmod", "name": "New Mod", "version": "1.0.0"})
+        )
+        client.post("/api/v1alpha1/mods/reconcile", headers={"X-API-Key": TEST_ADMIN_KEY})
+
+        response = client.get(
+            "/api/v1alpha1/mods/events", headers={"X-API-Key": TEST_MONITOR_KEY}
+        )
+
+        assert response.status_code == 200
+        data = response.json()["data"]
+        assert data["cursor"] == 1
+        assert [(e["source"], e["added"]) for e in data["events"]] == [
+            ("api", ["newmod_1.0.0.zip"])
+        ]
+
+        response = client.get(
+            "/api/v1alpha1/mods/events?since=1", headers={"X-API-Key": TEST_MONITOR_KEY}
+        )
+        assert response.json()["data"]["events"] == []
+
+    def test_reconcile_mods_requires_admin(self, client: TestClient) -> None:
+        """POST /mods/reconcile is forbidden for Monitor."""
+        response = client.post(
+            "/api/v1alpha1/mods/reconcile", headers={"X-API-Key": TEST_MONITOR_KEY}
+        )
+
+        assert response.status_code == 403
+
+    def test_update_all_requires_admin(self, client: TestClient) -> None:
+        """POST /mods/update-all is forbidden for Monitor."""
+        response = client.post(
+            "/api/v1alpha1/mods/update-all", headers={"X-API-Key": TEST_MONITOR_KEY}
+        )
+
+        assert response.status_code == 403
+
+
 class TestEnableDisableRemoveInvalidSlug:
     """Test enable/disable/remove with invalid slug."""
 
@@ -0,0 +1,211 @@
+"""Tests for the on-demand sampling CPU profiler."""
+
+import threading
+import time
+from collections import Counter
+from collections.abc import Generator
+
+import pytest
+from conftest import TEST_ADMIN_KEY, TEST_MONITOR_KEY  # type: ignore[import-not-found]
+from fastapi.testclient import TestClient
+
+from vintagestory_api.config import Settings
+from vintagestory_api.main import app
+from vintagestory_api.middleware.auth import get_settings
+from vintagestory_api.services.profiler import (
+    LOOP_THREAD_LABEL,
+    ProfilerBusyError,
+    ProfileResult,
+    SamplingProfiler,
+    get_profiler,
+    reset_profiler,
+)
+
+
+@pytest.fixture(autouse=True)
+def reset_profiler_singleton() -> Generator[None, None, None]:
+    """Reset the profiler singleton before and after each test."""
+    reset_profiler()
+    yield
+    reset_profiler()
+
+
+def _spin_cpu(stop: threading.Event) -> None:
+    """Busy loop until stopped, giving the sampler something to find."""
+    while not stop.is_set():
+        sum(range(1000))
+
+
+def _result(stacks: dict[tuple[str, ...], int]) -> ProfileResult:
+    counter = Counter(stacks)
+    return ProfileResult(
+        duration_seconds=1.0,
+        interval_ms=10.0,
+        sample_rounds=1,
+        total_samples=sum(counter.values()),
+        threads={},
+        stacks=counter,
+        sampling_overhead_ms=0.0,
+    )
+
+
+class TestProfileResult:
+    """Tests for profile aggregation and rendering."""
+
+    def test_collapsed_format_heaviest_first(self) -> None:
+        """Collapsed output is one folded line per stack, heaviest first."""
+        result = _result({("main", "a", "b"): 2, ("main", "a", "c"): 5})
+
+        assert result.collapsed() == "main;a;c 5\nmain;a;b 2"
+
+    def test_top_functions_self_and_total(self) -> None:
+        """Self counts leaf frames; total counts any appearance once per stack."""
+        result = _result(
+            {("t", "outer", "leaf"): 3, ("t", "outer", "outer", "other"): 1}
+        )
+
+        top = {fn.function: fn for fn in result.top_functions()}
+        assert top["leaf"].self_samples == 3
+        assert top["outer"].self_samples == 0
+        assert top["outer"].total_samples == 4
+        assert result.top_functions()[0].function == "leaf"
+
+
+class TestSamplingProfiler:
+    """Tests for SamplingProfiler sampling real threads."""
+
+    def test_samples_busy_thread(self) -> None:
+        """A CPU-bound thread shows up in the collapsed stacks by name."""
+        stop = threading.Event()
+        worker = threading.Thread(target=_spin_cpu, args=(stop,), name="spinner")
+        worker.start()
+        try:
+            result = SamplingProfiler().profile(0.2, interval_ms=5.0)
+        finally:
+            stop.set()
+            worker.join()
+
+        assert result.sample_rounds > 1
+        assert result.threads["spinner"] > 0
+        assert "_spin_cpu" in result.collapsed()
+        assert any(line.startswith("spinner;") for line in result.collapsed().splitlines())
+
+    def test_loop_only_filters_other_threads(self) -> None:
+        """loop_only samples only the designated loop thread."""
+        result = SamplingProfiler().profile(
+            0.05, interval_ms=5.0, loop_thread_id=threading.get_ident(), loop_only=True
+        )
+
+        # The caller is the sampler itself here, so nothing else is sampled
+        assert result.total_samples == 0
+
+    def test_labels_loop_thread(self) -> None:
+        """The loop thread is labelled explicitly in stacks."""
+        result_holder: list[ProfileResult] = []
+        caller_id = threading.get_ident()
+        sampler = threading.Thread(
+            target=lambda: result_holder.append(
+                SamplingProfiler().profile(0.05, interval_ms=5.0, loop_thread_id=caller_id)
+            )
+        )
+        sampler.start()
+        time.sleep(0.1)
+        sampler.join()
+
+        assert LOOP_THREAD_LABEL in result_holder[0].threads
+
+    def test_duration_is_clamped(self) -> None:
+        """Negative durations are clamped to zero and return immediately."""
+        result = SamplingProfiler().profile(-5)
+        assert result.sample_rounds == 0
+
+    def test_concurrent_profile_rejected(self) -> None:
+        """A second profile while one is running raises ProfilerBusyError."""
+        profiler = SamplingProfiler()
+        runner = threading.Thread(target=profiler.profile, args=(0.3,))
+        runner.start()
+        time.sleep(0.05)
+        try:
+            assert profiler.is_running
+            with pytest.raises(ProfilerBusyError):
+                profiler.profile(0.01)
+        finally:
+            runner.join()
+        assert not profiler.is_running
+
+
+class TestProfileEndpoint:
+    """Tests for POST /api/v1alpha1/debug/profile."""
+
+    @pytest.fixture
+    def client(self) -> Generator[TestClient, None, None]:
+        """Create a test client with known API keys."""
+        test_settings = Settings(
+            api_key_admin=TEST_ADMIN_KEY,
+            api_key_monitor=TEST_MONITOR_KEY,
+        )
+        app.dependency_overrides[get_settings] = lambda: test_settings
+        yield TestClient(app)
+        app.dependency_overrides.clear()
+
+    def test_json_profile(self, client: TestClient) -> None:
+        """Admin gets a top-functions table and collapsed stacks."""
+        response = client.post(
+            "/api/v1alpha1/debug/profile?seconds=0.1&interval_ms=5",
+            headers={"X-API-Key": TEST_ADMIN_KEY},
+        )
+
+        assert response.status_code == 200
+        data = response.json()["data"]
+        assert data["sample_rounds"] > 0
+        assert LOOP_THREAD_LABEL in data["threads"]
+        assert data["top_functions"]
+        assert {"function", "self_samples", "total_samples", "self_percent"} <= set(
+            data["top_functions"][0]
+        )
+        assert data["collapsed"]
+
+    def test_collapsed_format(self, client: TestClient) -> None:
+        """format=collapsed returns folded stacks as plain text."""
+        response = client.post(
+            "/api/v1alpha1/debug/profile?seconds=0.05&format=collapsed",
+            headers={"X-API-Key": TEST_ADMIN_KEY},
+        )
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/plain")
+        first_line = response.text.splitlines()[0]
+        assert first_line.rsplit(" ", 1)[1].isdigit()
+
+    def test_duration_bounded(self, client: TestClient) -> None:
+        """Durations above the maximum are rejected."""
+        response = client.post(
+            "/api/v1alpha1/debug/profile?seconds=3600",
+            headers={"X-API-Key": TEST_ADMIN_KEY},
+        )
+        assert response.status_code == 422
+
+    def test_busy_returns_409(self, client: TestClient) -> None:
+        """A request while a profile is running is rejected."""
+        profiler = get_profiler()
+        runner = threading.Thread(target=profiler.profile, args=(0.3,))
+        runner.start()
+        time.sleep(0.05)
+        try:
+            response = client.post(
+                "/api/v1alpha1/debug/profile?seconds=0.05",
+                headers={"X-API-Key": TEST_ADMIN_KEY},
+            )
+        finally:
+            runner.join()
+
+        assert response.status_code == 409
+        assert response.json()["detail"]["code"] == "PROFILER_BUSY"
+
+    def test_monitor_role_forbidden(self, client: TestClient) -> None:
+        """Monitor role cannot run the profiler."""
+        response = client.post(
+            "/api/v1alpha1/debug/profile?seconds=0.05",
+            headers={"X-API-Key": TEST_MONITOR_KEY},
+        )
+        assert response.status_code == 403
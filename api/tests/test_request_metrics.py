@@ -0,0 +1,234 @@
+"""Tests for per-route HTTP request metrics.
+
+Covers the RequestMetrics collector, the RequestContextMiddleware
+integration, and the GET /metrics/http endpoint.
+"""
+
+from collections.abc import Generator
+
+import pytest
+from conftest import TEST_ADMIN_KEY, TEST_MONITOR_KEY  # type: ignore[import-not-found]
+from fastapi import FastAPI
+from fastapi.responses import StreamingResponse
+from fastapi.testclient import TestClient
+
+from vintagestory_api.config import Settings
+from vintagestory_api.main import app
+from vintagestory_api.middleware.auth import get_settings
+from vintagestory_api.middleware.request_context import RequestContextMiddleware
+from vintagestory_api.services.request_metrics import (
+    LATENCY_BUCKETS_MS,
+    UNMATCHED_ROUTE,
+    RequestMetrics,
+    RouteStats,
+    get_request_metrics,
+    reset_request_metrics,
+)
+
+
+@pytest.fixture(autouse=True)
+def reset_metrics() -> Generator[None, None, None]:
+    """Reset request metrics singleton before and after each test."""
+    reset_request_metrics()
+    yield
+    reset_request_metrics()
+
+
+class TestRouteStats:
+    """Tests for the per-route histogram."""
+
+    def test_record_places_sample_in_matching_bucket(self) -> None:
+        """Samples land in the first bucket whose bound is >= the duration."""
+        stats = RouteStats("GET", "/x")
+        stats.record(3.0, 200, 10)
+
+        assert stats.count == 1
+        assert stats.buckets[LATENCY_BUCKETS_MS.index(5.0)] == 1
+        assert stats.status_classes[2] == 1
+        assert stats.response_bytes == 10
+
+    def test_record_overflow_goes_to_inf_bucket(self) -> None:
+        """Durations above the largest bound go to the +Inf bucket."""
+        stats = RouteStats("GET", "/x")
+        stats.record(60_000.0, 500, 0)
+
+        assert stats.buckets[-1] == 1
+        assert stats.status_classes[5] == 1
+        assert stats.max_ms == 60_000.0
+
+    def test_percentile_estimates_from_buckets(self) -> None:
+        """Percentiles report the bucket upper bound containing the quantile."""
+        stats = RouteStats("GET", "/x")
+        for _ in range(98):
+            stats.record(4.0, 200, 0)
+        stats.record(400.0, 200, 0)
+        stats.record(900.0, 200, 0)
+
+        assert stats.percentile(0.5) == 5.0
+        assert stats.percentile(0.99) == 500.0
+        assert stats.percentile(1.0) == 900.0
+
+    def test_percentile_none_without_samples(self) -> None:
+        """No samples yields no percentile."""
+        assert RouteStats("GET", "/x").percentile(0.5) is None
+
+
+class TestRequestMetrics:
+    """Tests for the RequestMetrics collector."""
+
+    def test_in_flight_gauge_tracks_peak(self) -> None:
+        """In-flight gauge increments/decrements and remembers the peak."""
+        metrics = RequestMetrics()
+        metrics.request_started()
+        metrics.request_started()
+        metrics.request_finished()
+
+        assert metrics.in_flight == 1
+        assert metrics.peak_in_flight == 2
+
+    def test_routes_are_keyed_by_method_and_template(self) -> None:
+        """Same template with different methods produces separate stats."""
+        metrics = RequestMetrics()
+        metrics.record("GET", "/mods/{slug}", 200, 1.0, 0, "a")
+        metrics.record("GET", "/mods/{slug}", 200, 1.0, 0, "b")
+        metrics.record("DELETE", "/mods/{slug}", 200, 1.0, 0, "c")
+
+        stats = metrics.get_route_stats()
+        assert [(s.method, s.count) for s in stats] == [("GET", 2), ("DELETE", 1)]
+
+    def test_slow_requests_sorted_slowest_first(self) -> None:
+        """Slow request report returns the N slowest with request IDs."""
+        metrics = RequestMetrics()
+        for i, duration in enumerate([5.0, 50.0, 1.0, 500.0]):
+            metrics.record("GET", "/x", 200, duration, 0, f"req-{i}")
+
+        slow = metrics.get_slow_requests(limit=2)
+        assert [r.request_id for r in slow] == ["req-3", "req-1"]
+        assert slow[0].duration_ms == 500.0
+
+    def test_recent_ring_buffer_is_bounded(self) -> None:
+        """Old requests are evicted from the recent ring buffer."""
+        metrics = RequestMetrics(recent_capacity=3)
+        metrics.record("GET", "/x", 200, 999.0, 0, "old")
+        for i in range(3):
+            metrics.record("GET", "/x", 200, 1.0, 0, f"new-{i}")
+
+        ids = {r.request_id for r in metrics.get_slow_requests(limit=10)}
+        assert "old" not in ids
+        assert len(ids) == 3
+
+    def test_reset_clears_routes(self) -> None:
+        """Reset clears recorded routes and recent requests."""
+        metrics = RequestMetrics()
+        metrics.record("GET", "/x", 200, 1.0, 0, "a")
+        metrics.reset()
+
+        assert metrics.get_route_stats() == []
+        assert metrics.get_slow_requests() == []
+
+
+class TestMiddlewareRecording:
+    """Tests for metrics recorded by RequestContextMiddleware."""
+
+    @pytest.fixture
+    def metrics_client(self) -> TestClient:
+        """Create a minimal app with the request context middleware."""
+        test_app = FastAPI()
+        test_app.add_middleware(RequestContextMiddleware)
+
+        @test_app.get("/items/{item_id}")
+        async def get_item(item_id: str) -> dict[str, str]:  # pyright: ignore[reportUnusedFunction]
+            return {"id": item_id}
+
+        @test_app.get("/stream")
+        async def stream() -> StreamingResponse:  # pyright: ignore[reportUnusedFunction]
+            async def body():
+                yield b"abc"
+                yield b"defg"
+
+            return StreamingResponse(body())
+
+        return TestClient(test_app)
+
+    def test_records_templated_route(self, metrics_client: TestClient) -> None:
+        """Requests are recorded under the route template, not the raw path."""
+        metrics_client.get("/items/1")
+        metrics_client.get("/items/2")
+
+        stats = get_request_metrics().get_route_stats()
+        assert len(stats) == 1
+        assert stats[0].route == "/items/{item_id}"
+        assert stats[0].count == 2
+        assert stats[0].response_bytes > 0
+
+    def test_unmatched_paths_share_one_label(self, metrics_client: TestClient) -> None:
+        """404s for arbitrary paths collapse into the unmatched label."""
+        metrics_client.get("/nope/a")
+        metrics_client.get("/nope/b")
+
+        stats = get_request_metrics().get_route_stats()
+        assert [(s.route, s.count) for s in stats] == [(UNMATCHED_ROUTE, 2)]
+        assert stats[0].status_classes[4] == 2
+
+    def test_streaming_body_bytes_counted(self, metrics_client: TestClient) -> None:
+        """Streaming responses without content-length are counted as sent."""
+        response = metrics_client.get("/stream")
+        assert response.content == b"abcdefg"
+
+        stats = get_request_metrics().get_route_stats()
+        assert stats[0].response_bytes == 7
+
+    def test_in_flight_returns_to_zero(self, metrics_client: TestClient) -> None:
+        """In-flight gauge is decremented after each request."""
+        metrics_client.get("/items/1")
+        assert get_request_metrics().in_flight == 0
+        assert get_request_metrics().peak_in_flight >= 1
+
+
+class TestHttpMetricsEndpoint:
+    """Tests for GET /metrics/http."""
+
+    @pytest.fixture
+    def client(self) -> Generator[TestClient, None, None]:
+        """Create a test client with known API keys."""
+        test_settings = Settings(
+            api_key_admin=TEST_ADMIN_KEY,
+            api_key_monitor=TEST_MONITOR_KEY,
+        )
+        app.dependency_overrides[get_settings] = lambda: test_settings
+        yield TestClient(app)
+        app.dependency_overrides.clear()
+
+    def test_returns_route_metrics_as_admin(self, client: TestClient) -> None:
+        """Admin sees recorded routes, bucket bounds and slow requests."""
+        headers = {"X-API-Key": TEST_ADMIN_KEY}
+        client.get("/healthz")
+        response = client.get("/api/v1alpha1/metrics/http", headers=headers)
+
+        assert response.status_code == 200
+        data = response.json()["data"]
+        assert data["bucketBoundsMs"] == list(LATENCY_BUCKETS_MS)
+        health = next(r for r in data["routes"] if r["route"] == "/healthz")
+        assert health["count"] == 1
+        assert len(health["buckets"]) == len(LATENCY_BUCKETS_MS) + 1
+        assert health["statusClasses"] == {"2xx": 1}
+        assert data["slowRequests"][0]["requestId"]
+        assert data["inFlight"] == 1  # the metrics request itself
+
+    def test_slow_limit_respected(self, client: TestClient) -> None:
+        """slow_limit caps the number of slow requests returned."""
+        headers = {"X-API-Key": TEST_ADMIN_KEY}
+        for _ in range(5):
+            client.get("/healthz")
+        response = client.get(
+            "/api/v1alpha1/metrics/http?slow_limit=2", headers=headers
+        )
+
+        assert len(response.json()["data"]["slowRequests"]) == 2
+
+    def test_requires_admin(self, client: TestClient) -> None:
+        """Monitor role is forbidden."""
+        response = client.get(
+            "/api/v1alpha1/metrics/http", headers={"X-API-Key": TEST_MONITOR_KEY}
+        )
+        assert response.status_code == 403
@@ -0,0 +1,98 @@
+"""Tests for single-flight request coalescing."""
+
+import asyncio
+
+import pytest
+
+from vintagestory_api.services.single_flight import SingleFlight
+
+
+class TestSingleFlight:
+    """Tests for SingleFlight."""
+
+    async def test_concurrent_callers_share_one_call(self) -> None:
+        """Concurrent callers for one key run fn once and share the result."""
+        flight: SingleFlight[str, int] = SingleFlight("test")
+        calls = 0
+
+        async def fetch() -> int:
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return 42
+
+        results = await asyncio.gather(*(flight.do("k", fetch) for _ in range(10)))
+
+        assert results == [42] * 10
+        assert calls == 1
+        assert flight.coalesced == 9
+        assert len(flight) == 0
+
+    async def test_different_keys_run_independently(self) -> None:
+        """Each key gets its own call."""
+        flight: SingleFlight[str, str] = SingleFlight("test")
+
+        async def echo(value: str) -> str:
+            await asyncio.sleep(0)
+            return value
+
+        a, b = await asyncio.gather(
+            flight.do("a", lambda: echo("a")), flight.do("b", lambda: echo("b"))
+        )
+
+        assert (a, b) == ("a", "b")
+        assert flight.started == 2
+
+    async def test_exception_propagates_to_all_waiters(self) -> None:
+        """All waiters see the shared failure, and the key is released."""
+        flight: SingleFlight[str, int] = SingleFlight("test")
+
+        async def fail() -> int:
+            await asyncio.sleep(0.01)
+            raise ValueError("boom")
+
+        results = await asyncio.gather(
+            flight.do("k", fail), flight.do("k", fail), return_exceptions=True
+        )
+
+        assert all(isinstance(r, ValueError) for r in results)
+        assert flight.started == 1
+        assert not flight.in_flight("k")
+
+    async def test_sequential_calls_are_not_cached(self) -> None:
+        """A finished call is released; the next caller starts a new one."""
+        flight: SingleFlight[str, int] = SingleFlight("test")
+        counter = iter(range(10))
+
+        async def next_value() -> int:
+            return next(counter)
+
+        assert await flight.do("k", next_value) == 0
+        assert await flight.do("k", next_value) == 1
+
+    async def test_cancelled_waiter_does_not_cancel_shared_call(self) -> None:
+        """Cancelling one waiter leaves the call running for the others."""
+        flight: SingleFlight[str, str] = SingleFlight("test")
+
+        async def slow() -> str:
+            await asyncio.sleep(0.05)
+            return "done"
+
+        waiter = asyncio.create_task(flight.do("k", slow))
+        other = asyncio.create_task(flight.do("k", slow))
+        await asyncio.sleep(0.01)
+        waiter.cancel()
+
+        assert await other == "done"
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+
+    async def test_cancel_all(self) -> None:
+        """cancel_all() cancels in-flight calls."""
+        flight: SingleFlight[str, None] = SingleFlight("test")
+        task = flight.start("k", lambda: asyncio.sleep(10))
+
+        await flight.cancel_all()
+
+        assert task.cancelled()
+        assert len(flight) == 0
@@ -0,0 +1,92 @@
+"""Tests for the bounded TTL LRU cache."""
+
+from vintagestory_api.services.ttl_cache import TtlLruCache
+
+
+class TestTtlLruCache:
+    """Tests for TtlLruCache."""
+
+    def test_get_missing_returns_none(self) -> None:
+        """get() returns None and counts a miss for unknown keys."""
+        cache: TtlLruCache[str, int] = TtlLruCache("test", max_entries=2)
+
+        assert cache.get("a") is None
+        assert cache.misses == 1
+
+    def test_put_and_get(self) -> None:
+        """A stored value is returned fresh and counted as a hit."""
+        cache: TtlLruCache[str, int] = TtlLruCache("test", max_entries=2)
+        cache.put("a", 1, ttl=60)
+
+        entry = cache.get("a")
+
+        assert entry is not None
+        assert entry.value == 1
+        assert entry.is_fresh()
+        assert cache.hits == 1
+
+    def test_expired_entry_returned_stale(self) -> None:
+        """Entries past their TTL are still returned, marked not fresh."""
+        cache: TtlLruCache[str, int] = TtlLruCache("test", max_entries=2)
+        cache.put("a", 1, ttl=0)
+
+        entry = cache.get("a")
+
+        assert entry is not None
+        assert not entry.is_fresh()
+
+    def test_evicts_least_recently_used(self) -> None:
+        """The least recently used entry is evicted past max_entries."""
+        cache: TtlLruCache[str, int] = TtlLruCache("test", max_entries=2)
+        cache.put("a", 1, ttl=60)
+        cache.put("b", 2, ttl=60)
+        cache.get("a")
+        cache.put("c", 3, ttl=60)
+
+        assert "a" in cache
+        assert "b" not in cache
+        assert "c" in cache
+        assert cache.evictions == 1
+
+    def test_evicts_over_byte_bound(self) -> None:
+        """Entries are evicted until the total size fits max_bytes."""
+        cache: TtlLruCache[str, int] = TtlLruCache("test", max_entries=10, max_bytes=100)
+        cache.put("a", 1, ttl=60, size_bytes=60)
+        cache.put("b", 2, ttl=60, size_bytes=30)
+        cache.put("c", 3, ttl=60, size_bytes=30)
+
+        assert "a" not in cache
+        assert len(cache) == 2
+        assert cache.total_bytes == 60
+
+    def test_oversized_entry_kept(self) -> None:
+        """The newest entry is kept even if it alone exceeds max_bytes."""
+        cache: TtlLruCache[str, int] = TtlLruCache("test", max_entries=10, max_bytes=10)
+        cache.put("a", 1, ttl=60, size_bytes=5)
+        cache.put("b", 2, ttl=60, size_bytes=50)
+
+        assert list(k for k in ("a", "b") if k in cache) == ["b"]
+        assert cache.total_bytes == 50
+
+    def test_replace_updates_size(self) -> None:
+        """Re-putting a key replaces its size instead of adding to it."""
+        cache: TtlLruCache[str, int] = TtlLruCache("test", max_entries=2)
+        cache.put("a", 1, ttl=60, size_bytes=10)
+        cache.put("a", 2, ttl=60, size_bytes=4)
+
+        assert len(cache) == 1
+        assert cache.total_bytes == 4
+
+    def test_pop_and_clear(self) -> None:
+        """pop() and clear() remove entries and their recorded size."""
+        cache: TtlLruCache[str, int] = TtlLruCache("test", max_entries=3)
+        cache.put("a", 1, ttl=60, size_bytes=10)
+        cache.put("b", 2, ttl=60, size_bytes=20)
+
+        popped = cache.pop("a")
+        assert popped is not None and popped.value == 1
+        assert cache.total_bytes == 20
+
+        cache.clear()
+        assert len(cache) == 0
+        assert cache.total_bytes == 0